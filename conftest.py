@@ -1,7 +1,10 @@
 """Main configuration file for pytest."""
 
+import os
 import shutil
 
+import pytest
+
 from tsml_eval.experiments import experiments
 from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
 
@@ -29,10 +32,35 @@ def pytest_addoption(parser):
         help="Keep the unit test output folder after running pytest"
         " (default: %(default)s).",
     )
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="Run the timing benchmarks marked with pytest.mark.benchmark, which are "
+        "skipped by default as timings are noisy on shared machines "
+        "(default: %(default)s).",
+    )
 
 
 def pytest_configure(config):
     """Pytest configuration preamble."""
+    config.addinivalue_line(
+        "markers", "benchmark: timing benchmark, only run with --benchmarks"
+    )
     experiments.MEMRECORD_INTERVAL = config.getoption("--meminterval")
+    # keep the hardware benchmark cache of test runs out of the user cache directory
+    os.environ["TSML_EVAL_BENCHMARK_CACHE"] = (
+        f"{_TEST_OUTPUT_PATH}/benchmark/timing_benchmark.json"
+    )
     global KEEP_PYTEST_OUTPUT
     KEEP_PYTEST_OUTPUT = config.getoption("--keepoutput")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the timing benchmarks unless --benchmarks is set."""
+    if config.getoption("--benchmarks"):
+        return
+
+    skip = pytest.mark.skip(reason="timing benchmark, run with --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -23,6 +23,7 @@ from aeon.transformations.tests.test_transformer_reproduction import _print_resu
 
 
 from aeon.datasets.tsc_data_lists import univariate_equal_length
+from tsml_eval.utils.results_catalogue import ResultsCatalogue
 import os
 import glob
 
@@ -39,24 +40,15 @@ def count_lines(full_path):
     return line_count
 
 def count_complete(root, datasets, algorithms, resamples =30):
-    """Count the number of results files in each directory."""
-    table=[]
-    # Function to count files matching the pattern in a directory
-    for d in datasets:
-        count =0
-        counts = np.zeros(len(algorithms))
-        for r in algorithms:
-            # Creating a table of counts
-
-            directory = f"{root}\\{r}\\Predictions\\{d}"
-            counts[count]= count_files(directory, "TestResample*.csv")
-            count=count+1
-        table.append(counts)
-    df = pd.DataFrame(counts, index =tser_new, columns=algorithms)
-    # Compare each element to expected resample
-    n_resamples = df >= resamples
-    # Sum up the True values in each column
-    counts = n_resamples.sum()
+    """Count the datasets each algorithm has all resamples for.
+
+    Uses a ResultsCatalogue of root, so only directories changed since the last
+    count are listed.
+    """
+    catalogue = ResultsCatalogue(root)
+    catalogue.scan()
+    counts = catalogue.count_complete(algorithms, datasets, resamples)
+    catalogue.close()
     return counts
 
 
@@ -13,8 +13,13 @@ __all__ = [
     "evaluate_forecasters",
     "evaluate_forecasters_from_file",
     "evaluate_forecasters_by_problem",
+    "summarise_experiment_telemetry",
+    "load_scalability_results",
+    "scalability_exponents",
+    "compare_scalability_results",
 ]
 
+from tsml_eval.evaluation.experiment_telemetry import summarise_experiment_telemetry
 from tsml_eval.evaluation.multiple_estimator_evaluation import (
     evaluate_classifiers,
     evaluate_classifiers_by_problem,
@@ -29,3 +34,8 @@ from tsml_eval.evaluation.multiple_estimator_evaluation import (
     evaluate_regressors_by_problem,
     evaluate_regressors_from_file,
 )
+from tsml_eval.evaluation.scalability_evaluation import (
+    compare_scalability_results,
+    load_scalability_results,
+    scalability_exponents,
+)
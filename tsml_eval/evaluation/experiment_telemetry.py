@@ -0,0 +1,138 @@
+"""Summarise the per-phase telemetry files written by experiments."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "summarise_experiment_telemetry",
+]
+
+import json
+import os
+
+import pandas as pd
+
+
+def summarise_experiment_telemetry(
+    results_path,
+    estimator_names=None,
+    dataset_names=None,
+    include_detail=False,
+):
+    """Summarise where time goes across the experiments in a results directory.
+
+    Reads every telemetry JSON file written alongside the predictions files by the
+    run_*_experiment functions (see tsml_eval.utils.telemetry) and totals the wall
+    time and CPU time of each phase for each estimator.
+
+    Parameters
+    ----------
+    results_path : str
+        The directory to search for telemetry files, searched recursively.
+    estimator_names : list of str or None, default=None
+        Only include these estimators. If None, all estimators are included.
+    dataset_names : list of str or None, default=None
+        Only include these datasets. If None, all datasets are included.
+    include_detail : bool, default=False
+        Summarise phases with different details separately, i.e. each data
+        transform or the train and test results writing.
+
+    Returns
+    -------
+    summary : pd.DataFrame
+        One row per estimator and phase (and detail if include_detail), sorted by
+        estimator and decreasing wall time. Columns are "estimator", "phase",
+        ("detail"), "n_experiments", "wall_time" and "cpu_time" (total
+        milliseconds), "wall_time_share" (the fraction of the estimator's total wall
+        time spent in the phase), "mean_wall_time" (milliseconds per experiment)
+        and "max_peak_rss_increase" (bytes).
+
+    Examples
+    --------
+    >>> from tsml_eval.evaluation import summarise_experiment_telemetry
+    >>> from tsml_eval.experiments import run_classification_experiment
+    >>> from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+    >>> from tsml.datasets import load_minimal_chinatown
+    >>> from tsml.dummy import DummyClassifier
+    >>> X_train, y_train = load_minimal_chinatown(split="train")
+    >>> X_test, y_test = load_minimal_chinatown(split="test")
+    >>> results_path = f"{_TEST_OUTPUT_PATH}/telemetry_doctest/"
+    >>> run_classification_experiment(
+    ...     X_train, y_train, X_test, y_test, DummyClassifier(), results_path,
+    ...     dataset_name="MinimalChinatown", resample_id=0, benchmark_time=False,
+    ... )
+    >>> summary = summarise_experiment_telemetry(results_path)
+    >>> "fit" in summary["phase"].values
+    True
+    """
+    group = (
+        ["estimator", "phase", "detail"] if include_detail else ["estimator", "phase"]
+    )
+    rows = []
+    for root, _, files in os.walk(results_path):
+        for file in files:
+            if not file.startswith("telemetry") or not file.endswith(".json"):
+                continue
+
+            try:
+                with open(f"{root}/{file}") as f:
+                    telemetry = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+            estimator = telemetry.get("estimator_name")
+            if estimator_names is not None and estimator not in estimator_names:
+                continue
+            if (
+                dataset_names is not None
+                and telemetry.get("dataset_name") not in dataset_names
+            ):
+                continue
+
+            experiment = f"{root}/{file}"
+            for phase in telemetry.get("phases", []):
+                rows.append(
+                    {
+                        "estimator": estimator,
+                        "phase": phase["phase"],
+                        "detail": phase.get("detail"),
+                        "experiment": experiment,
+                        "wall_time": phase["wall_time"],
+                        "cpu_time": phase["cpu_time"],
+                        "peak_rss_increase": phase["peak_rss_increase"],
+                    }
+                )
+
+    columns = group + [
+        "n_experiments",
+        "wall_time",
+        "cpu_time",
+        "wall_time_share",
+        "mean_wall_time",
+        "max_peak_rss_increase",
+    ]
+    if len(rows) == 0:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.DataFrame(rows)
+    df["detail"] = df["detail"].fillna("")
+    summary = (
+        df.groupby(group, sort=False)
+        .agg(
+            n_experiments=("experiment", "nunique"),
+            wall_time=("wall_time", "sum"),
+            cpu_time=("cpu_time", "sum"),
+            max_peak_rss_increase=("peak_rss_increase", "max"),
+        )
+        .reset_index()
+    )
+
+    estimator_time = summary.groupby("estimator")["wall_time"].transform("sum")
+    summary["wall_time_share"] = summary["wall_time"] / estimator_time.where(
+        estimator_time > 0
+    )
+    summary["mean_wall_time"] = summary["wall_time"] / summary["n_experiments"]
+
+    return (
+        summary.sort_values(["estimator", "wall_time"], ascending=[True, False])
+        .reset_index(drop=True)
+        .loc[:, columns]
+    )
@@ -7,22 +7,16 @@ from datetime import datetime
 
 import numpy as np
 import pandas as pd
-from aeon.benchmarking.stats import wilcoxon_test
-from aeon.visualisation import (
-    create_multi_comparison_matrix,
-    plot_boxplot,
-    plot_critical_difference,
-    plot_pairwise_scatter,
-)
-from matplotlib import pyplot as plt
 
 from tsml_eval.evaluation.storage import (
     ClassifierResults,
     ClustererResults,
     ForecasterResults,
     RegressorResults,
+    load_results_summary,
 )
 from tsml_eval.utils.functions import rank_array, time_to_milliseconds
+from tsml_eval.utils.watchdog import ExperimentTimeoutError
 
 __all__ = [
     "evaluate_classifiers",
@@ -122,9 +116,9 @@ def evaluate_classifiers_from_file(
                     load_path, verify_values=verify_results
                 )
             )
-        except FileNotFoundError:
+        except FileNotFoundError as e:
             if error_on_missing:
-                raise FileNotFoundError(f"Results for {load_path} not found.")
+                raise type(e)(f"Results for {load_path} {_missing_status(e)}.")
 
     evaluate_classifiers(
         classifier_results,
@@ -145,6 +139,8 @@ def evaluate_classifiers_by_problem(
     error_on_missing=True,
     eval_name=None,
     verify_results=True,
+    header_only=False,
+    use_catalogue=False,
     verbose=False,
 ):
     """
@@ -190,6 +186,15 @@ def evaluate_classifiers_by_problem(
         The name of the evaluation, used in save_path.
     verify_results : bool, default=True
         If the verification should be performed on the loaded results values.
+    header_only : bool, default=False
+        If True, only the first three lines of each results file are read. Only the
+        statistics written to the file header are evaluated, i.e. timings, memory
+        usage and the accuracy, and verify_results is ignored.
+    use_catalogue : bool, default=False
+        If True, results files are found using a ResultsCatalogue of each path in
+        load_path instead of checking for each file. The catalogue is stored in the
+        path and updated before loading, listing only the directories which have
+        changed since the last update.
     verbose : bool, default=False
         If verbose output should be printed.
     """
@@ -210,6 +215,13 @@ def evaluate_classifiers_by_problem(
     estimator_eval_names = []
     names = []
     for i, path in enumerate(load_path):
+        catalogue = None
+        if use_catalogue:
+            from tsml_eval.utils.results_catalogue import ResultsCatalogue
+
+            catalogue = ResultsCatalogue(path)
+            catalogue.scan()
+
         found_datasets = np.zeros(len(dataset_names[i]), dtype=bool)
 
         for classifier_name in classifier_names[i]:
@@ -232,11 +244,23 @@ def evaluate_classifiers_by_problem(
                 for resample in resamples:
                     for split in splits:
                         try:
-                            result = ClassifierResults().load_from_file(
-                                f"{path}/{classifier_name}/Predictions/"
-                                f"{dataset_name}/{split}Resample{resample}.csv",
-                                verify_values=verify_results,
-                            )
+                            if catalogue is not None:
+                                file_path = catalogue.results_file(
+                                    classifier_name, dataset_name, split, resample
+                                )
+                            else:
+                                file_path = (
+                                    f"{path}/{classifier_name}/Predictions/"
+                                    f"{dataset_name}/{split}Resample{resample}.csv"
+                                )
+                            if header_only:
+                                result = load_results_summary(
+                                    file_path, task="classification"
+                                )
+                            else:
+                                result = ClassifierResults().load_from_file(
+                                    file_path, verify_values=verify_results
+                                )
                             classifier_results.append(result)
                             names.append(classifier_eval_name)
                             found_estimator = True
@@ -258,19 +282,22 @@ def evaluate_classifiers_by_problem(
                                         f"{dataset_name} from {result.dataset_name}."
                                     )
                                 result.dataset_name = dataset_name
-                        except FileNotFoundError:
+                        except FileNotFoundError as e:
                             msg = (
                                 f"Results for {classifier_eval_name} on {dataset_name} "
-                                f"{split} resample {resample} not found."
+                                f"{split} resample {resample} {_missing_status(e)}."
                             )
                             if error_on_missing:
-                                raise FileNotFoundError(msg)
+                                raise type(e)(msg)
                             elif verbose:
                                 print(msg)  # noqa: T201
 
             if not found_estimator:
                 print(f"Classifier {classifier_eval_name} not found.")  # noqa: T201
 
+        if catalogue is not None:
+            catalogue.close()
+
         missing_datasets = [
             dataset
             for dataset, found in zip(dataset_names[i], found_datasets)
@@ -369,9 +396,9 @@ def evaluate_clusterers_from_file(
                     load_path, verify_values=verify_results
                 )
             )
-        except FileNotFoundError:
+        except FileNotFoundError as e:
             if error_on_missing:
-                raise FileNotFoundError(f"Results for {load_path} not found.")
+                raise type(e)(f"Results for {load_path} {_missing_status(e)}.")
 
     evaluate_clusterers(
         clusterer_results,
@@ -392,6 +419,8 @@ def evaluate_clusterers_by_problem(
     error_on_missing=True,
     eval_name=None,
     verify_results=True,
+    header_only=False,
+    use_catalogue=False,
     verbose=False,
 ):
     """
@@ -437,6 +466,15 @@ def evaluate_clusterers_by_problem(
         The name of the evaluation, used in save_path.
     verify_results : bool, default=True
         If the verification should be performed on the loaded results values.
+    header_only : bool, default=False
+        If True, only the first three lines of each results file are read. Only the
+        statistics written to the file header are evaluated, i.e. timings, memory
+        usage and the clustering accuracy, and verify_results is ignored.
+    use_catalogue : bool, default=False
+        If True, results files are found using a ResultsCatalogue of each path in
+        load_path instead of checking for each file. The catalogue is stored in the
+        path and updated before loading, listing only the directories which have
+        changed since the last update.
     verbose : bool, default=False
         If verbose output should be printed.
     """
@@ -457,6 +495,13 @@ def evaluate_clusterers_by_problem(
     estimator_eval_names = []
     names = []
     for i, path in enumerate(load_path):
+        catalogue = None
+        if use_catalogue:
+            from tsml_eval.utils.results_catalogue import ResultsCatalogue
+
+            catalogue = ResultsCatalogue(path)
+            catalogue.scan()
+
         found_datasets = np.zeros(len(dataset_names[i]), dtype=bool)
 
         for clusterer_name in clusterer_names[i]:
@@ -479,11 +524,23 @@ def evaluate_clusterers_by_problem(
                 for resample in resamples:
                     for split in splits:
                         try:
-                            result = ClustererResults().load_from_file(
-                                f"{path}/{clusterer_name}/Predictions/"
-                                f"{dataset_name}/{split}Resample{resample}.csv",
-                                verify_values=verify_results,
-                            )
+                            if catalogue is not None:
+                                file_path = catalogue.results_file(
+                                    clusterer_name, dataset_name, split, resample
+                                )
+                            else:
+                                file_path = (
+                                    f"{path}/{clusterer_name}/Predictions/"
+                                    f"{dataset_name}/{split}Resample{resample}.csv"
+                                )
+                            if header_only:
+                                result = load_results_summary(
+                                    file_path, task="clustering"
+                                )
+                            else:
+                                result = ClustererResults().load_from_file(
+                                    file_path, verify_values=verify_results
+                                )
                             clusterer_results.append(result)
                             names.append(clusterer_eval_name)
                             found_estimator = True
@@ -505,19 +562,22 @@ def evaluate_clusterers_by_problem(
                                         f"{dataset_name} from {result.dataset_name}."
                                     )
                                 result.dataset_name = dataset_name
-                        except FileNotFoundError:
+                        except FileNotFoundError as e:
                             msg = (
                                 f"Results for {clusterer_eval_name} on {dataset_name} "
-                                f"{split} resample {resample} not found."
+                                f"{split} resample {resample} {_missing_status(e)}."
                             )
                             if error_on_missing:
-                                raise FileNotFoundError(msg)
+                                raise type(e)(msg)
                             elif verbose:
                                 print(msg)  # noqa: T201
 
             if not found_estimator:
                 print(f"Clusterer {clusterer_eval_name} not found.")  # noqa: T201
 
+        if catalogue is not None:
+            catalogue.close()
+
         missing_datasets = [
             dataset
             for dataset, found in zip(dataset_names[i], found_datasets)
@@ -616,9 +676,9 @@ def evaluate_regressors_from_file(
                     load_path, verify_values=verify_results
                 )
             )
-        except FileNotFoundError:
+        except FileNotFoundError as e:
             if error_on_missing:
-                raise FileNotFoundError(f"Results for {load_path} not found.")
+                raise type(e)(f"Results for {load_path} {_missing_status(e)}.")
 
     evaluate_regressors(
         regressor_results,
@@ -639,6 +699,8 @@ def evaluate_regressors_by_problem(
     error_on_missing=True,
     eval_name=None,
     verify_results=True,
+    header_only=False,
+    use_catalogue=False,
     verbose=False,
 ):
     """
@@ -684,6 +746,15 @@ def evaluate_regressors_by_problem(
         The name of the evaluation, used in save_path.
     verify_results : bool, default=True
         If the verification should be performed on the loaded results values.
+    header_only : bool, default=False
+        If True, only the first three lines of each results file are read. Only the
+        statistics written to the file header are evaluated, i.e. timings, memory
+        usage and the mean squared error, and verify_results is ignored.
+    use_catalogue : bool, default=False
+        If True, results files are found using a ResultsCatalogue of each path in
+        load_path instead of checking for each file. The catalogue is stored in the
+        path and updated before loading, listing only the directories which have
+        changed since the last update.
     verbose : bool, default=False
         If verbose output should be printed.
     """
@@ -704,6 +775,13 @@ def evaluate_regressors_by_problem(
     estimator_eval_names = []
     names = []
     for i, path in enumerate(load_path):
+        catalogue = None
+        if use_catalogue:
+            from tsml_eval.utils.results_catalogue import ResultsCatalogue
+
+            catalogue = ResultsCatalogue(path)
+            catalogue.scan()
+
         found_datasets = np.zeros(len(dataset_names[i]), dtype=bool)
 
         for regressor_name in regressor_names[i]:
@@ -726,11 +804,23 @@ def evaluate_regressors_by_problem(
                 for resample in resamples:
                     for split in splits:
                         try:
-                            result = RegressorResults().load_from_file(
-                                f"{path}/{regressor_name}/Predictions/"
-                                f"{dataset_name}/{split}Resample{resample}.csv",
-                                verify_values=verify_results,
-                            )
+                            if catalogue is not None:
+                                file_path = catalogue.results_file(
+                                    regressor_name, dataset_name, split, resample
+                                )
+                            else:
+                                file_path = (
+                                    f"{path}/{regressor_name}/Predictions/"
+                                    f"{dataset_name}/{split}Resample{resample}.csv"
+                                )
+                            if header_only:
+                                result = load_results_summary(
+                                    file_path, task="regression"
+                                )
+                            else:
+                                result = RegressorResults().load_from_file(
+                                    file_path, verify_values=verify_results
+                                )
                             regressor_results.append(result)
                             names.append(regressor_eval_name)
                             found_estimator = True
@@ -752,19 +842,22 @@ def evaluate_regressors_by_problem(
                                         f"{dataset_name} from {result.dataset_name}."
                                     )
                                 result.dataset_name = dataset_name
-                        except FileNotFoundError:
+                        except FileNotFoundError as e:
                             msg = (
                                 f"Results for {regressor_eval_name} on {dataset_name} "
-                                f"{split} resample {resample} not found."
+                                f"{split} resample {resample} {_missing_status(e)}."
                             )
                             if error_on_missing:
-                                raise FileNotFoundError(msg)
+                                raise type(e)(msg)
                             elif verbose:
                                 print(msg)  # noqa: T201
 
             if not found_estimator:
                 print(f"Regressor {regressor_eval_name} not found.")  # noqa: T201
 
+        if catalogue is not None:
+            catalogue.close()
+
         missing_datasets = [
             dataset
             for dataset, found in zip(dataset_names[i], found_datasets)
@@ -863,9 +956,9 @@ def evaluate_forecasters_from_file(
                     load_path, verify_values=verify_results
                 )
             )
-        except FileNotFoundError:
+        except FileNotFoundError as e:
             if error_on_missing:
-                raise FileNotFoundError(f"Results for {load_path} not found.")
+                raise type(e)(f"Results for {load_path} {_missing_status(e)}.")
 
     evaluate_forecasters(
         forecaster_results,
@@ -885,6 +978,8 @@ def evaluate_forecasters_by_problem(
     error_on_missing=True,
     eval_name=None,
     verify_results=True,
+    header_only=False,
+    use_catalogue=False,
     verbose=False,
 ):
     """
@@ -928,6 +1023,15 @@ def evaluate_forecasters_by_problem(
         The name of the evaluation, used in save_path.
     verify_results : bool, default=True
         If the verification should be performed on the loaded results values.
+    header_only : bool, default=False
+        If True, only the first three lines of each results file are read. Only the
+        statistics written to the file header are evaluated, i.e. timings, memory
+        usage and the mean absolute percentage error, and verify_results is ignored.
+    use_catalogue : bool, default=False
+        If True, results files are found using a ResultsCatalogue of each path in
+        load_path instead of checking for each file. The catalogue is stored in the
+        path and updated before loading, listing only the directories which have
+        changed since the last update.
     verbose : bool, default=False
         If verbose output should be printed.
     """
@@ -943,6 +1047,13 @@ def evaluate_forecasters_by_problem(
     estimator_eval_names = []
     names = []
     for i, path in enumerate(load_path):
+        catalogue = None
+        if use_catalogue:
+            from tsml_eval.utils.results_catalogue import ResultsCatalogue
+
+            catalogue = ResultsCatalogue(path)
+            catalogue.scan()
+
         found_datasets = np.zeros(len(dataset_names[i]), dtype=bool)
 
         for forecaster_name in forecaster_names[i]:
@@ -964,11 +1075,21 @@ def evaluate_forecasters_by_problem(
             for n, dataset_name in enumerate(dataset_names[i]):
                 for resample in resamples:
                     try:
-                        result = ForecasterResults().load_from_file(
-                            f"{path}/{forecaster_name}/Predictions/"
-                            f"{dataset_name}/testResample{resample}.csv",
-                            verify_values=verify_results,
-                        )
+                        if catalogue is not None:
+                            file_path = catalogue.results_file(
+                                forecaster_name, dataset_name, "test", resample
+                            )
+                        else:
+                            file_path = (
+                                f"{path}/{forecaster_name}/Predictions/"
+                                f"{dataset_name}/testResample{resample}.csv"
+                            )
+                        if header_only:
+                            result = load_results_summary(file_path, task="forecasting")
+                        else:
+                            result = ForecasterResults().load_from_file(
+                                file_path, verify_values=verify_results
+                            )
                         forecaster_results.append(result)
                         names.append(forecaster_eval_name)
                         found_estimator = True
@@ -990,19 +1111,22 @@ def evaluate_forecasters_by_problem(
                                     f"{dataset_name} from {result.dataset_name}."
                                 )
                             result.dataset_name = dataset_name
-                    except FileNotFoundError:
+                    except FileNotFoundError as e:
                         msg = (
                             f"Results for {forecaster_eval_name} on {dataset_name} "
-                            f"resample {resample} not found."
+                            f"resample {resample} {_missing_status(e)}."
                         )
                         if error_on_missing:
-                            raise FileNotFoundError(msg)
+                            raise type(e)(msg)
                         elif verbose:
                             print(msg)  # noqa: T201
 
             if not found_estimator:
                 print(f"Forecaster {forecaster_eval_name} not found.")  # noqa: T201
 
+        if catalogue is not None:
+            catalogue.close()
+
         missing_datasets = [
             dataset
             for dataset, found in zip(dataset_names[i], found_datasets)
@@ -1024,6 +1148,10 @@ def evaluate_forecasters_by_problem(
     )
 
 
+def _missing_status(error):
+    return "timed out" if isinstance(error, ExperimentTimeoutError) else "not found"
+
+
 def _evaluate_estimators(
     estimator_results,
     statistics,
@@ -1160,6 +1288,13 @@ def _evaluate_estimators(
     print(f"Datasets ({len(datasets)}): {datasets}\n")  # noqa: T201
     print(f"Resamples ({len(resamples)}): {resamples}\n")  # noqa: T201
 
+    # summaries loaded from the file header only hold some of the statistics
+    statistics = {
+        var: v
+        for var, v in statistics.items()
+        if all(var in er.__dict__ for er in estimator_results)
+    }
+
     stats = []
     for var, (stat, ascending, time) in statistics.items():
         for split in splits:
@@ -1246,6 +1381,8 @@ def _create_directory_for_statistic(
         for i, dataset_name in enumerate(datasets):
             file.write(f"{dataset_name},{','.join([str(n) for n in ranks[i]])}\n")
 
+    from aeon.benchmarking.stats import wilcoxon_test
+
     p_values = wilcoxon_test(average_stats, estimators, lower_better=not higher_better)
     with open(
         f"{save_path}/{statistic_name}/{statistic_name.lower()}_p_values.csv", "w"
@@ -1275,6 +1412,15 @@ def _create_directory_for_statistic(
 def _figures_for_statistic(
     scores, estimators, statistic_name, higher_better, save_path, eval_name
 ):
+    # the plotting stack is slow to import, so it is only imported to create figures
+    from aeon.visualisation import (
+        create_multi_comparison_matrix,
+        plot_boxplot,
+        plot_critical_difference,
+        plot_pairwise_scatter,
+    )
+    from matplotlib import pyplot as plt
+
     os.makedirs(f"{save_path}/{statistic_name}/figures/", exist_ok=True)
 
     cd, _ = plot_critical_difference(scores, estimators, lower_better=not higher_better)
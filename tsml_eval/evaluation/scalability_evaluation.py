@@ -0,0 +1,187 @@
+"""Load, summarise and compare the results of scalability experiments."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "load_scalability_results",
+    "scalability_exponents",
+    "compare_scalability_results",
+]
+
+import os
+
+import numpy as np
+import pandas as pd
+
+_SIZE_COLUMNS = ["n_cases", "n_channels", "n_timepoints"]
+_KEY_COLUMNS = ["estimator", "function", "input_type"]
+
+
+def load_scalability_results(results_path, estimator_names=None):
+    """Load the measurements written by run_scalability_experiment.
+
+    Parameters
+    ----------
+    results_path : str
+        The results directory passed to run_scalability_experiment. Measurements are
+        read from <results_path>/<estimator_name>/Scalability/.
+    estimator_names : list of str or None, default=None
+        Only load these estimators. If None, all estimators with scalability results
+        are loaded.
+
+    Returns
+    -------
+    results : pd.DataFrame
+        The measurements of every estimator, in the format returned by
+        run_scalability_experiment.
+    """
+    if estimator_names is None:
+        estimator_names = sorted(
+            d
+            for d in os.listdir(results_path)
+            if os.path.isdir(f"{results_path}/{d}/Scalability/")
+        )
+
+    frames = []
+    for name in estimator_names:
+        path = f"{results_path}/{name}/Scalability/"
+        if not os.path.isdir(path):
+            continue
+
+        for file in sorted(os.listdir(path)):
+            if file.endswith(".csv") and not file.endswith("_exponents.csv"):
+                frames.append(pd.read_csv(f"{path}/{file}"))
+
+    if len(frames) == 0:
+        raise FileNotFoundError(f"No scalability results found in {results_path}.")
+    return pd.concat(frames, ignore_index=True)
+
+
+def scalability_exponents(results):
+    """Fit an empirical complexity exponent for each estimator and dimension.
+
+    For each estimator, function and input type, the log of the mean time of the
+    completed measurements is fitted by least squares as a linear function of the
+    log of each dimension with more than one size. The coefficient of a dimension
+    is its exponent, i.e. a time which grows quadratically with the number of
+    timepoints has an "n_timepoints" exponent of 2.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        Measurements returned by run_scalability_experiment or
+        load_scalability_results.
+
+    Returns
+    -------
+    exponents : pd.DataFrame
+        One row per estimator, function, input type and dimension. Columns are
+        "estimator", "function", "input_type", "dimension", "exponent" and
+        "n_measurements" (the number of completed measurements used in the fit).
+        Dimensions without enough completed measurements to fit are not included.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from tsml_eval.evaluation import scalability_exponents
+    >>> results = pd.DataFrame({
+    ...     "estimator": "A", "function": "fit", "input_type": "collection",
+    ...     "n_cases": 50, "n_channels": 1, "n_timepoints": [100, 200, 400],
+    ...     "status": "completed", "mean_time": [1.0, 4.0, 16.0],
+    ... })
+    >>> scalability_exponents(results)[["dimension", "exponent"]].values.tolist()
+    [['n_timepoints', 2.0]]
+    """
+    rows = []
+    completed = results[(results["status"] == "completed") & (results["mean_time"] > 0)]
+    for key, group in completed.groupby(_KEY_COLUMNS, sort=False):
+        dimensions = [d for d in _SIZE_COLUMNS if group[d].nunique() > 1]
+        if len(dimensions) == 0 or len(group) <= len(dimensions):
+            continue
+
+        design = np.column_stack(
+            [np.ones(len(group))]
+            + [np.log(group[d].to_numpy(float)) for d in dimensions]
+        )
+        coefficients = np.linalg.lstsq(
+            design, np.log(group["mean_time"].to_numpy(float)), rcond=None
+        )[0]
+
+        for dimension, exponent in zip(dimensions, coefficients[1:]):
+            rows.append(
+                {
+                    **dict(zip(_KEY_COLUMNS, key)),
+                    "dimension": dimension,
+                    "exponent": round(exponent, 10),
+                    "n_measurements": len(group),
+                }
+            )
+
+    return pd.DataFrame(
+        rows, columns=_KEY_COLUMNS + ["dimension", "exponent", "n_measurements"]
+    )
+
+
+def compare_scalability_results(baseline, new):
+    """Compare the scalability of estimators between two sets of results.
+
+    Used to compare versions of estimators or packages, i.e. results written before
+    and after a change. Measurements are matched on the estimator, function, input
+    type and data size.
+
+    Parameters
+    ----------
+    baseline : str or pd.DataFrame
+        The results to compare against, either a results directory (see
+        load_scalability_results) or measurements.
+    new : str or pd.DataFrame
+        The results to compare, either a results directory or measurements.
+
+    Returns
+    -------
+    times : pd.DataFrame
+        One row per matched measurement, with the mean time, confidence interval,
+        peak memory and versions of both results (suffixed "_baseline" and "_new"),
+        "time_ratio" and "memory_ratio" (new divided by baseline) and "significant",
+        True if the confidence intervals of the mean times do not overlap.
+    exponents : pd.DataFrame
+        One row per estimator, function, input type and dimension with an exponent
+        in both results, with "exponent_baseline", "exponent_new" and
+        "exponent_difference" (new minus baseline).
+    """
+    if isinstance(baseline, str):
+        baseline = load_scalability_results(baseline)
+    if isinstance(new, str):
+        new = load_scalability_results(new)
+
+    columns = [
+        "mean_time",
+        "ci_lower",
+        "ci_upper",
+        "peak_memory",
+        "status",
+        "version",
+        "tsml_eval_version",
+    ]
+    times = baseline[_KEY_COLUMNS + _SIZE_COLUMNS + columns].merge(
+        new[_KEY_COLUMNS + _SIZE_COLUMNS + columns],
+        on=_KEY_COLUMNS + _SIZE_COLUMNS,
+        suffixes=("_baseline", "_new"),
+    )
+    times["time_ratio"] = times["mean_time_new"] / times["mean_time_baseline"]
+    times["memory_ratio"] = times["peak_memory_new"] / times[
+        "peak_memory_baseline"
+    ].where(times["peak_memory_baseline"] > 0)
+    times["significant"] = (times["ci_lower_new"] > times["ci_upper_baseline"]) | (
+        times["ci_upper_new"] < times["ci_lower_baseline"]
+    )
+
+    exponents = scalability_exponents(baseline).merge(
+        scalability_exponents(new),
+        on=_KEY_COLUMNS + ["dimension"],
+        suffixes=("_baseline", "_new"),
+    )
+    exponents["exponent_difference"] = (
+        exponents["exponent_new"] - exponents["exponent_baseline"]
+    )
+
+    return times, exponents
@@ -5,10 +5,12 @@ __all__ = [
     "ClustererResults",
     "ForecasterResults",
     "RegressorResults",
+    "ResultsSummary",
     "load_classifier_results",
     "load_clusterer_results",
     "load_forecaster_results",
     "load_regressor_results",
+    "load_results_summary",
 ]
 
 from tsml_eval.evaluation.storage.classifier_results import (
@@ -27,3 +29,7 @@ from tsml_eval.evaluation.storage.regressor_results import (
     RegressorResults,
     load_regressor_results,
 )
+from tsml_eval.evaluation.storage.results_summary import (
+    ResultsSummary,
+    load_results_summary,
+)
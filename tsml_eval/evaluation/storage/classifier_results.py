@@ -13,8 +13,13 @@ from sklearn.metrics import (
     roc_auc_score,
 )
 
-from tsml_eval.evaluation.storage.estimator_results import EstimatorResults
+from tsml_eval.evaluation.storage.estimator_results import (
+    EstimatorResults,
+    _check_integer_labels,
+    _read_results_file,
+)
 from tsml_eval.utils.results_writing import write_classification_results
+from tsml_eval.utils.watchdog import _check_timeout_marker
 
 
 class ClassifierResults(EstimatorResults):
@@ -63,12 +68,16 @@ class ClassifierResults(EstimatorResults):
         Total time for building the classifier and estimating error/accuracy on the
         train set. For certain methods this can be different from the sum of fit_time
         and error_estimate_time.
+    compile_time : float, default=-1.0
+        Time taken compiling just-in-time code in a warm-up run before fitting the
+        classifier, not included in fit_time. -1 if there was no warm-up.
     class_labels : array-like or None, default=None
         Actual class labels.
     predictions : array-like or None, default=None
         Predicted class labels.
-    probabilities : array-like or None, default=None
-        Predicted class probabilities.
+    probabilities : array-like, callable or None, default=None
+        Predicted class probabilities. If callable, it is called to load the
+        probabilities when they are first accessed.
     pred_times : array-like or None, default=None
         Prediction times for each case.
     pred_descriptions : list of str or None, default=None
@@ -122,6 +131,7 @@ class ClassifierResults(EstimatorResults):
         error_estimate_method="N/A",
         error_estimate_time=-1.0,
         build_plus_estimate_time=-1.0,
+        compile_time=-1.0,
         class_labels=None,
         predictions=None,
         probabilities=None,
@@ -136,6 +146,7 @@ class ClassifierResults(EstimatorResults):
         self.train_estimate_method = error_estimate_method
         self.train_estimate_time = error_estimate_time
         self.fit_and_estimate_time = build_plus_estimate_time
+        self.compile_time = compile_time
 
         # Results
         self.class_labels = class_labels
@@ -182,7 +193,18 @@ class ClassifierResults(EstimatorResults):
         **EstimatorResults.statistics,
     }
 
-    def save_to_file(self, file_path, full_path=True):
+    @property
+    def probabilities(self):
+        """Predicted class probabilities, loaded on first access if stored lazily."""
+        if callable(self._probabilities):
+            self._probabilities = self._probabilities()
+        return self._probabilities
+
+    @probabilities.setter
+    def probabilities(self, probabilities):
+        self._probabilities = probabilities
+
+    def save_to_file(self, file_path, full_path=True, file_format="csv"):
         """
         Write the classifier results into a file format used by tsml.
 
@@ -195,6 +217,9 @@ class ClassifierResults(EstimatorResults):
             If True, results are written directly to the directory passed in file_path.
             If False, then a standard file structure using the classifier and dataset
             names is created and used to write the results file.
+        file_format : {"csv", "npz"}, default="csv"
+            The format of the results file, either the tsml CSV format or a binary
+            NumPy archive which is faster to load.
         """
         self.infer_size()
 
@@ -223,6 +248,8 @@ class ClassifierResults(EstimatorResults):
             train_estimate_method=self.train_estimate_method,
             train_estimate_time=self.train_estimate_time,
             fit_and_estimate_time=self.fit_and_estimate_time,
+            compile_time=self.compile_time,
+            file_format=file_format,
         )
 
     def load_from_file(self, file_path, verify_values=True):
@@ -237,7 +264,7 @@ class ClassifierResults(EstimatorResults):
         ----------
         file_path : str
             The path to the file from which classifier results should be loaded. The
-            file should be a tsml formatted classifier results file.
+            file should be a tsml formatted classifier results file, either CSV or NPZ.
         verify_values : bool, default=True
             If the method should perform verification of the loaded values.
 
@@ -349,7 +376,9 @@ def load_classifier_results(file_path, calculate_stats=True, verify_values=True)
     ----------
     file_path : str
         The path to the file from which classifier results should be loaded. The file
-        should be a tsml formatted classifier results file.
+        should be a tsml formatted classifier results file, either CSV or NPZ. If the
+        file does not exist, the same results file in the other format is loaded if it
+        exists.
     calculate_stats : bool, default=True
         Whether to calculate performance statistics from the loaded results.
     verify_values : bool, default=True
@@ -360,54 +389,34 @@ def load_classifier_results(file_path, calculate_stats=True, verify_values=True)
     cr : ClassifierResults
         A ClassifierResults object containing the results loaded from the file.
     """
-    with open(file_path) as file:
-        lines = file.readlines()
-
-        line1 = lines[0].split(",")
-        line3 = lines[2].split(",")
-        acc = float(line3[0])
-        n_classes = int(line3[5])
-        n_cases = len(lines) - 3
-
-        line_size = len(lines[3].split(","))
-
-        class_labels = np.zeros(n_cases)
-        predictions = np.zeros(n_cases)
-        probabilities = np.zeros((n_cases, n_classes))
-
-        if line_size > 4 + n_classes:
-            pred_times = np.zeros(n_cases)
-        else:
-            pred_times = None
-
-        if line_size > 6 + n_classes:
-            pred_descriptions = []
-        else:
-            pred_descriptions = None
-
-        for i in range(0, n_cases):
-            line = lines[i + 3].split(",")
-            class_labels[i] = int(line[0])
-            predictions[i] = int(line[1])
-
-            for j in range(0, n_classes):
-                probabilities[i, j] = float(line[3 + j])
-
-            if pred_times is not None:
-                pred_times[i] = float(line[4 + n_classes])
-
-            if pred_descriptions is not None:
-                pred_descriptions.append(",".join(line[6 + n_classes :]).strip())
-
-        # compatability with old results files
-        if len(line3) > 6:
-            error_estimate_method = line3[6]
-            error_estimate_time = float(line3[7])
-            build_plus_estimate_time = float(line3[8])
-        else:
-            error_estimate_method = "N/A"
-            error_estimate_time = -1.0
-            build_plus_estimate_time = -1.0
+    _check_timeout_marker(file_path)
+
+    lines, cases = _read_results_file(file_path, n_probabilities_index=5)
+
+    line1 = lines[0].split(",")
+    line3 = lines[2].split(",")
+    acc = float(line3[0])
+    n_classes = int(line3[5])
+
+    (
+        class_labels,
+        predictions,
+        probabilities,
+        pred_times,
+        pred_descriptions,
+    ) = cases
+    n_cases = len(predictions)
+    _check_integer_labels(class_labels, predictions)
+
+    # compatability with old results files
+    if len(line3) > 6:
+        error_estimate_method = line3[6]
+        error_estimate_time = float(line3[7])
+        build_plus_estimate_time = float(line3[8])
+    else:
+        error_estimate_method = "N/A"
+        error_estimate_time = -1.0
+        build_plus_estimate_time = -1.0
 
     cr = ClassifierResults(
         dataset_name=line1[0],
@@ -425,6 +434,7 @@ def load_classifier_results(file_path, calculate_stats=True, verify_values=True)
         error_estimate_method=error_estimate_method,
         error_estimate_time=error_estimate_time,
         build_plus_estimate_time=build_plus_estimate_time,
+        compile_time=float(line3[9]) if len(line3) > 9 else -1.0,
         class_labels=class_labels,
         predictions=predictions,
         probabilities=probabilities,
@@ -440,7 +450,7 @@ def load_classifier_results(file_path, calculate_stats=True, verify_values=True)
         assert cr.n_cases == n_cases
         assert cr.n_classes == n_classes
 
-        assert_allclose(probabilities.sum(axis=1), 1, rtol=1e-5)
+        assert_allclose(cr.probabilities.sum(axis=1), 1, rtol=1e-5)
 
         if calculate_stats:
             assert cr.accuracy == acc
@@ -1,6 +1,5 @@
 """Class for storing and loading results from a clustering experiment."""
 
-import numpy as np
 from aeon.benchmarking.metrics.clustering import clustering_accuracy_score
 from numpy.testing import assert_allclose
 from sklearn.metrics import (
@@ -11,8 +10,13 @@ from sklearn.metrics import (
     rand_score,
 )
 
-from tsml_eval.evaluation.storage.estimator_results import EstimatorResults
+from tsml_eval.evaluation.storage.estimator_results import (
+    EstimatorResults,
+    _check_integer_labels,
+    _read_results_file,
+)
 from tsml_eval.utils.results_writing import write_clustering_results
+from tsml_eval.utils.watchdog import _check_timeout_marker
 
 
 class ClustererResults(EstimatorResults):
@@ -55,12 +59,16 @@ class ClustererResults(EstimatorResults):
         Number of classes in the dataset.
     n_clusters : int or None, default=None
         Number of clusters generated.
+    compile_time : float, default=-1.0
+        Time taken compiling just-in-time code in a warm-up run before fitting the
+        clusterer, not included in fit_time. -1 if there was no warm-up.
     class_labels : array-like or None, default=None
         Actual class labels.
     predictions : array-like or None, default=None
         Predicted cluster labels.
-    probabilities : array-like or None, default=None
-        Predicted cluster probabilities.
+    probabilities : array-like, callable or None, default=None
+        Predicted cluster probabilities. If callable, it is called to load the
+        probabilities when they are first accessed.
     pred_times : array-like or None, default=None
         Prediction times for each case.
     pred_descriptions : list of str or None, default=None
@@ -110,6 +118,7 @@ class ClustererResults(EstimatorResults):
         memory_usage=-1.0,
         n_classes=None,
         n_clusters=None,
+        compile_time=-1.0,
         class_labels=None,
         predictions=None,
         probabilities=None,
@@ -122,6 +131,7 @@ class ClustererResults(EstimatorResults):
         # Line 3
         self.n_classes = n_classes
         self.n_clusters = n_clusters
+        self.compile_time = compile_time
 
         # Results
         self.class_labels = class_labels
@@ -164,7 +174,18 @@ class ClustererResults(EstimatorResults):
         **EstimatorResults.statistics,
     }
 
-    def save_to_file(self, file_path, full_path=True):
+    @property
+    def probabilities(self):
+        """Predicted cluster probabilities, loaded on first access if stored lazily."""
+        if callable(self._probabilities):
+            self._probabilities = self._probabilities()
+        return self._probabilities
+
+    @probabilities.setter
+    def probabilities(self, probabilities):
+        self._probabilities = probabilities
+
+    def save_to_file(self, file_path, full_path=True, file_format="csv"):
         """
         Write the clusterer results into a file format used by tsml.
 
@@ -177,6 +198,9 @@ class ClustererResults(EstimatorResults):
             If True, results are written directly to the directory passed in file_path.
             If False, then a standard file structure using the clusterer and dataset
             names is created and used to write the results file.
+        file_format : {"csv", "npz"}, default="csv"
+            The format of the results file, either the tsml CSV format or a binary
+            NumPy archive which is faster to load.
         """
         self.infer_size()
 
@@ -205,6 +229,8 @@ class ClustererResults(EstimatorResults):
             memory_usage=self.memory_usage,
             n_classes=self.n_classes,
             n_clusters=self.n_clusters,
+            compile_time=self.compile_time,
+            file_format=file_format,
         )
 
     def load_from_file(self, file_path, verify_values=True):
@@ -218,8 +244,8 @@ class ClustererResults(EstimatorResults):
         Parameters
         ----------
         file_path : str
-            The path to the file from which clusterer results should be loaded. The
-            file should be a tsml formatted clusterer results file.
+            The path to the file from which clusterer results should be loaded. The file
+            should be a tsml formatted clusterer results file, either CSV or NPZ.
         verify_values : bool, default=True
             If the method should perform verification of the loaded values.
 
@@ -301,7 +327,9 @@ def load_clusterer_results(file_path, calculate_stats=True, verify_values=True):
     ----------
     file_path : str
         The path to the file from which clusterer results should be loaded. The file
-        should be a tsml formatted clusterer results file.
+        should be a tsml formatted clusterer results file, either CSV or NPZ. If the
+        file does not exist, the same results file in the other format is loaded if it
+        exists.
     calculate_stats : bool, default=True
         Whether to calculate performance statistics from the loaded results.
     verify_values : bool, default=True
@@ -312,44 +340,24 @@ def load_clusterer_results(file_path, calculate_stats=True, verify_values=True):
     cr : ClustererResults
         A ClustererResults object containing the results loaded from the file.
     """
-    with open(file_path) as file:
-        lines = file.readlines()
-
-        line1 = lines[0].split(",")
-        line3 = lines[2].split(",")
-        cl_acc = float(line3[0])
-        n_clusters = int(line3[6])
-        n_cases = len(lines) - 3
-
-        line_size = len(lines[3].split(","))
-
-        class_labels = np.zeros(n_cases)
-        cluster = np.zeros(n_cases)
-        probabilities = np.zeros((n_cases, n_clusters))
-
-        if line_size > 4 + n_clusters:
-            pred_times = np.zeros(n_cases)
-        else:
-            pred_times = None
-
-        if line_size > 6 + n_clusters:
-            pred_descriptions = []
-        else:
-            pred_descriptions = None
-
-        for i in range(0, n_cases):
-            line = lines[i + 3].split(",")
-            class_labels[i] = int(line[0])
-            cluster[i] = int(line[1])
+    _check_timeout_marker(file_path)
 
-            for j in range(0, n_clusters):
-                probabilities[i, j] = float(line[3 + j])
+    lines, cases = _read_results_file(file_path, n_probabilities_index=6)
 
-            if pred_times is not None:
-                pred_times[i] = float(line[4 + n_clusters])
+    line1 = lines[0].split(",")
+    line3 = lines[2].split(",")
+    cl_acc = float(line3[0])
+    n_clusters = int(line3[6])
 
-            if pred_descriptions is not None:
-                pred_descriptions.append(",".join(line[6 + n_clusters :]).strip())
+    (
+        class_labels,
+        cluster,
+        probabilities,
+        pred_times,
+        pred_descriptions,
+    ) = cases
+    n_cases = len(cluster)
+    _check_integer_labels(class_labels, cluster)
 
     cr = ClustererResults(
         dataset_name=line1[0],
@@ -365,6 +373,7 @@ def load_clusterer_results(file_path, calculate_stats=True, verify_values=True):
         memory_usage=float(line3[4]),
         n_classes=int(line3[5]),
         n_clusters=n_clusters,
+        compile_time=float(line3[7]) if len(line3) > 7 else -1.0,
         class_labels=class_labels,
         predictions=cluster,
         probabilities=probabilities,
@@ -380,7 +389,7 @@ def load_clusterer_results(file_path, calculate_stats=True, verify_values=True):
         assert cr.n_cases == n_cases
         assert cr.n_clusters == n_clusters
 
-        assert_allclose(probabilities.sum(axis=1), 1, rtol=1e-6)
+        assert_allclose(cr.probabilities.sum(axis=1), 1, rtol=1e-6)
 
         if calculate_stats:
             assert cr.clustering_accuracy == cl_acc
@@ -1,6 +1,12 @@
 """Abstract class for storing and loading results from an experiment."""
 
+import io
+import os
+import re
 from abc import ABC, abstractmethod
+from functools import partial
+
+import numpy as np
 
 
 class EstimatorResults(ABC):
@@ -136,3 +142,174 @@ class EstimatorResults(ABC):
             If the function should overwrite the current values when they are not None.
         """
         pass
+
+
+def _results_file_path(file_path):
+    """Return the path of a results file, or its counterpart in the other format.
+
+    If file_path does not exist but the same results file in the other format does,
+    i.e. testResample0.npz for testResample0.csv, the path of that file is returned.
+    Otherwise, file_path is returned unchanged.
+    """
+    if os.path.exists(file_path):
+        return file_path
+
+    root, ext = os.path.splitext(file_path)
+    other_path = root + (".csv" if ext == ".npz" else ".npz")
+    return other_path if os.path.exists(other_path) else file_path
+
+
+def _read_results_header(file_path):
+    """Read the first three lines of a CSV or NPZ results file."""
+    file_path = _results_file_path(file_path)
+
+    if file_path.endswith(".npz"):
+        with np.load(file_path) as npz:
+            return [str(line) + "\n" for line in npz["header"]]
+
+    with open(file_path) as file:
+        return [file.readline() for _ in range(3)]
+
+
+def _read_results_file(file_path, n_probabilities_index=None):
+    """Read the header lines and the values of each case from a results file.
+
+    Results files can be tsml CSV files or NumPy archives written with
+    file_format="npz". If file_path does not exist, the same results file in the
+    other format is read if it exists. Probabilities in NumPy archives are not read
+    until they are first used.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the results file.
+    n_probabilities_index : int or None, default=None
+        The index of the value in the third line which holds the number of
+        probabilities written for each case. If None, cases have no probabilities
+        column, i.e. for regression.
+
+    Returns
+    -------
+    lines : list of str
+        The first three lines of the file.
+    cases : tuple
+        The labels, predictions, probabilities, prediction times and prediction
+        descriptions of each case, see _read_results_cases. For NumPy archives,
+        probabilities is a callable which loads them.
+    """
+    file_path = _results_file_path(file_path)
+
+    if file_path.endswith(".npz"):
+        with np.load(file_path) as npz:
+            lines = [str(line) + "\n" for line in npz["header"]]
+            cases = (
+                npz["labels"],
+                npz["predictions"],
+                (
+                    partial(_load_npz_array, file_path, "probabilities")
+                    if "probabilities" in npz.files
+                    else None
+                ),
+                npz["pred_times"] if "pred_times" in npz.files else None,
+                (
+                    npz["pred_descriptions"].tolist()
+                    if "pred_descriptions" in npz.files
+                    else None
+                ),
+            )
+        return lines, cases
+
+    with open(file_path) as file:
+        lines = [file.readline() for _ in range(3)]
+        n_probabilities = (
+            None
+            if n_probabilities_index is None
+            else int(lines[2].split(",")[n_probabilities_index])
+        )
+        return lines, _read_results_cases(file, n_probabilities=n_probabilities)
+
+
+def _load_npz_array(file_path, key):
+    """Load a single array from a NumPy archive."""
+    with np.load(file_path) as npz:
+        return npz[key]
+
+
+def _read_results_cases(file, n_probabilities=None):
+    """Read the values of each case from the lines of a results file after line 3.
+
+    The numeric values are parsed by np.loadtxt rather than line by line in Python.
+    Only the free-text prediction descriptions, which can contain commas, are
+    split from each line in Python.
+
+    Parameters
+    ----------
+    file : file-like
+        An open results file, read up to the end of the third line.
+    n_probabilities : int or None, default=None
+        The number of probabilities written for each case. If None, cases have no
+        probabilities column, i.e. for regression.
+
+    Returns
+    -------
+    labels : np.ndarray
+        The label of each case, NaN if the label is missing ("?").
+    predictions : np.ndarray
+        The prediction for each case.
+    probabilities : np.ndarray or None
+        The probabilities for each case, None if n_probabilities is None.
+    pred_times : np.ndarray or None
+        The prediction time for each case, None if not in the file.
+    pred_descriptions : list of str or None
+        The prediction description for each case, None if not in the file.
+    """
+    body = file.read()
+
+    # the index of the last value before the optional prediction time column
+    offset = 2 if n_probabilities is None else 3 + n_probabilities
+    line_size = body.split("\n", 1)[0].count(",") + 1
+    has_times = line_size > offset + 1
+    has_descriptions = line_size > offset + 3
+
+    pred_descriptions = None
+    if has_descriptions:
+        lines = [line.split(",", offset + 3) for line in body.splitlines()]
+        pred_descriptions = [line[-1].strip() for line in lines]
+        body = "\n".join([",".join(line[:-1]) for line in lines])
+
+    if "?" in body:
+        body = re.sub(r"^\?,", "nan,", body, flags=re.MULTILINE)
+
+    columns = [0, 1]
+    if n_probabilities is not None:
+        columns += list(range(3, 3 + n_probabilities))
+    if has_times:
+        columns.append(offset + 1)
+
+    if body.strip() == "":
+        values = np.zeros((0, len(columns)))
+    else:
+        values = np.loadtxt(
+            io.StringIO(body), delimiter=",", usecols=columns, ndmin=2, comments=None
+        )
+
+    return (
+        values[:, 0].copy(),
+        values[:, 1].copy(),
+        (
+            None
+            if n_probabilities is None
+            else values[:, 2 : 2 + n_probabilities].copy()
+        ),
+        values[:, -1].copy() if has_times else None,
+        pred_descriptions,
+    )
+
+
+def _check_integer_labels(labels, predictions):
+    """Check class labels and predictions read from a results file are integers."""
+    labels = labels[~np.isnan(labels)]
+    if not np.array_equal(labels, np.round(labels)) or not np.array_equal(
+        predictions, np.round(predictions)
+    ):
+        raise ValueError("Class labels and predictions must be integers.")
@@ -1,10 +1,13 @@
 """Class for storing and loading results from a forecasting experiment."""
 
-import numpy as np
 from sklearn.metrics import mean_absolute_percentage_error, mean_squared_error
 
-from tsml_eval.evaluation.storage.estimator_results import EstimatorResults
+from tsml_eval.evaluation.storage.estimator_results import (
+    EstimatorResults,
+    _read_results_file,
+)
 from tsml_eval.utils.results_writing import write_forecasting_results
+from tsml_eval.utils.watchdog import _check_timeout_marker
 
 
 class ForecasterResults(EstimatorResults):
@@ -125,7 +128,7 @@ class ForecasterResults(EstimatorResults):
         **EstimatorResults.statistics,
     }
 
-    def save_to_file(self, file_path, full_path=True):
+    def save_to_file(self, file_path, full_path=True, file_format="csv"):
         """
         Write the forecaster results into a file format used by tsml.
 
@@ -138,6 +141,9 @@ class ForecasterResults(EstimatorResults):
             If True, results are written directly to the directory passed in file_path.
             If False, then a standard file structure using the forecaster and dataset
             names is created and used to write the results file.
+        file_format : {"csv", "npz"}, default="csv"
+            The format of the results file, either the tsml CSV format or a binary
+            NumPy archive which is faster to load.
         """
         self.infer_size()
 
@@ -168,6 +174,9 @@ class ForecasterResults(EstimatorResults):
             predict_time=self.predict_time,
             benchmark_time=self.benchmark_time,
             memory_usage=self.memory_usage,
+            pred_times=self.pred_times,
+            pred_descriptions=self.pred_descriptions,
+            file_format=file_format,
         )
 
     def load_from_file(self, file_path, verify_values=True):
@@ -182,7 +191,7 @@ class ForecasterResults(EstimatorResults):
         ----------
         file_path : str
             The path to the file from which forecaster results should be loaded. The
-            file should be a tsml formatted forecaster results file.
+            file should be a tsml formatted forecaster results file, either CSV or NPZ.
         verify_values : bool, default=True
             If the method should perform verification of the loaded values.
 
@@ -213,7 +222,7 @@ class ForecasterResults(EstimatorResults):
             self.mean_absolute_percentage_error = mean_absolute_percentage_error(
                 self.target_labels, self.predictions
             )
-        
+
         if self.mean_absolute_squared_error is None or overwrite:
             self.mean_absolute_squared_error = mean_squared_error(
                 self.target_labels, self.predictions
@@ -247,7 +256,9 @@ def load_forecaster_results(file_path, calculate_stats=True, verify_values=True)
     ----------
     file_path : str
         The path to the file from which forecaster results should be loaded. The file
-        should be a tsml formatted forecaster results file.
+        should be a tsml formatted forecaster results file, either CSV or NPZ. If the
+        file does not exist, the same results file in the other format is loaded if it
+        exists.
     calculate_stats : bool, default=True
         Whether to calculate performance statistics from the loaded results.
     verify_values : bool, default=True
@@ -258,39 +269,24 @@ def load_forecaster_results(file_path, calculate_stats=True, verify_values=True)
     fr : ForecasterResults
         A ForecasterResults object containing the results loaded from the file.
     """
-    with open(file_path) as file:
-        lines = file.readlines()
-
-        line1 = lines[0].split(",")
-        line3 = lines[2].split(",")
-        mape = float(line3[0])
-        fh = len(lines) - 3
-
-        line_size = len(lines[3].split(","))
-
-        target_labels = np.zeros(fh)
-        predictions = np.zeros(fh)
-
-        if line_size > 3:
-            pred_times = np.zeros(fh)
-        else:
-            pred_times = None
-
-        if line_size > 5:
-            pred_descriptions = []
-        else:
-            pred_descriptions = None
+    _check_timeout_marker(file_path)
 
-        for i in range(0, fh):
-            line = lines[i + 3].split(",")
-            target_labels[i] = float(line[0])
-            predictions[i] = float(line[1])
+    lines, cases = _read_results_file(file_path)
 
-            if pred_times is not None:
-                pred_times[i] = float(line[3])
+    line1 = lines[0].split(",")
+    line3 = lines[2].split(",")
+    mape = float(line3[0])
+    # write_forecasting_results also writes the squared error after the MAPE
+    t = 2 if len(line3) > 5 else 1
 
-            if pred_descriptions is not None:
-                pred_descriptions.append(",".join(line[5:]).strip())
+    (
+        target_labels,
+        predictions,
+        _,
+        pred_times,
+        pred_descriptions,
+    ) = cases
+    fh = len(predictions)
 
     fr = ForecasterResults(
         dataset_name=line1[0],
@@ -300,10 +296,10 @@ def load_forecaster_results(file_path, calculate_stats=True, verify_values=True)
         time_unit=line1[4].lower(),
         description=",".join(line1[5:]).strip(),
         parameters=lines[1].strip(),
-        fit_time=float(line3[1]),
-        predict_time=float(line3[2]),
-        benchmark_time=float(line3[3]),
-        memory_usage=float(line3[4]),
+        fit_time=float(line3[t]),
+        predict_time=float(line3[t + 1]),
+        benchmark_time=float(line3[t + 2]),
+        memory_usage=float(line3[t + 3]),
         target_labels=target_labels,
         predictions=predictions,
         pred_times=pred_times,
@@ -1,6 +1,5 @@
 """Class for storing and loading results from a regression experiment."""
 
-import numpy as np
 from sklearn.metrics import (
     mean_absolute_error,
     mean_absolute_percentage_error,
@@ -9,8 +8,12 @@ from sklearn.metrics import (
     root_mean_squared_error,
 )
 
-from tsml_eval.evaluation.storage.estimator_results import EstimatorResults
+from tsml_eval.evaluation.storage.estimator_results import (
+    EstimatorResults,
+    _read_results_file,
+)
 from tsml_eval.utils.results_writing import write_regression_results
+from tsml_eval.utils.watchdog import _check_timeout_marker
 
 
 class RegressorResults(EstimatorResults):
@@ -57,6 +60,9 @@ class RegressorResults(EstimatorResults):
         Total time for building the regressor and estimating error/accuracy on the
         train set. For certain methods this can be different from the sum of fit_time
         and error_estimate_time.
+    compile_time : float, default=-1.0
+        Time taken compiling just-in-time code in a warm-up run before fitting the
+        regressor, not included in fit_time. -1 if there was no warm-up.
     target_labels : array-like or None, default=None
         Actual target labels.
     predictions : array-like or None, default=None
@@ -109,6 +115,7 @@ class RegressorResults(EstimatorResults):
         error_estimate_method="N/A",
         error_estimate_time=-1.0,
         build_plus_estimate_time=-1.0,
+        compile_time=-1.0,
         target_labels=None,
         predictions=None,
         pred_times=None,
@@ -121,6 +128,7 @@ class RegressorResults(EstimatorResults):
         self.train_estimate_method = error_estimate_method
         self.train_estimate_time = error_estimate_time
         self.fit_and_estimate_time = build_plus_estimate_time
+        self.compile_time = compile_time
 
         # Results
         self.target_labels = target_labels
@@ -160,7 +168,7 @@ class RegressorResults(EstimatorResults):
         **EstimatorResults.statistics,
     }
 
-    def save_to_file(self, file_path, full_path=True):
+    def save_to_file(self, file_path, full_path=True, file_format="csv"):
         """
         Write the regressor results into a file format used by tsml.
 
@@ -173,6 +181,9 @@ class RegressorResults(EstimatorResults):
             If True, results are written directly to the directory passed in file_path.
             If False, then a standard file structure using the regressor and dataset
             names is created and used to write the results file.
+        file_format : {"csv", "npz"}, default="csv"
+            The format of the results file, either the tsml CSV format or a binary
+            NumPy archive which is faster to load.
         """
         self.infer_size()
 
@@ -201,6 +212,8 @@ class RegressorResults(EstimatorResults):
             train_estimate_method=self.train_estimate_method,
             train_estimate_time=self.train_estimate_time,
             fit_and_estimate_time=self.fit_and_estimate_time,
+            compile_time=self.compile_time,
+            file_format=file_format,
         )
 
     def load_from_file(self, file_path, verify_values=True):
@@ -214,8 +227,8 @@ class RegressorResults(EstimatorResults):
         Parameters
         ----------
         file_path : str
-            The path to the file from which regressor results should be loaded. The
-            file should be a tsml formatted regressor results file.
+            The path to the file from which regressor results should be loaded. The file
+            should be a tsml formatted regressor results file, either CSV or NPZ.
         verify_values : bool, default=True
             If the method should perform verification of the loaded values.
 
@@ -289,7 +302,9 @@ def load_regressor_results(file_path, calculate_stats=True, verify_values=True):
     ----------
     file_path : str
         The path to the file from which regressor results should be loaded. The file
-        should be a tsml formatted regressor results file.
+        should be a tsml formatted regressor results file, either CSV or NPZ. If the
+        file does not exist, the same results file in the other format is loaded if it
+        exists.
     calculate_stats : bool, default=True
         Whether to calculate performance statistics from the loaded results.
     verify_values : bool, default=True
@@ -300,39 +315,22 @@ def load_regressor_results(file_path, calculate_stats=True, verify_values=True):
     rr : RegressorResults
         A RegressorResults object containing the results loaded from the file.
     """
-    with open(file_path) as file:
-        lines = file.readlines()
-
-        line1 = lines[0].split(",")
-        line3 = lines[2].split(",")
-        mse = float(line3[0])
-        n_cases = len(lines) - 3
-
-        line_size = len(lines[3].split(","))
-
-        target_labels = np.zeros(n_cases)
-        predictions = np.zeros(n_cases)
-
-        if line_size > 3:
-            pred_times = np.zeros(n_cases)
-        else:
-            pred_times = None
-
-        if line_size > 5:
-            pred_descriptions = []
-        else:
-            pred_descriptions = None
+    _check_timeout_marker(file_path)
 
-        for i in range(0, n_cases):
-            line = lines[i + 3].split(",")
-            target_labels[i] = float(line[0])
-            predictions[i] = float(line[1])
+    lines, cases = _read_results_file(file_path)
 
-            if pred_times is not None:
-                pred_times[i] = float(line[3])
+    line1 = lines[0].split(",")
+    line3 = lines[2].split(",")
+    mse = float(line3[0])
 
-            if pred_descriptions is not None:
-                pred_descriptions.append(",".join(line[5:]).strip())
+    (
+        target_labels,
+        predictions,
+        _,
+        pred_times,
+        pred_descriptions,
+    ) = cases
+    n_cases = len(predictions)
 
     rr = RegressorResults(
         dataset_name=line1[0],
@@ -349,6 +347,7 @@ def load_regressor_results(file_path, calculate_stats=True, verify_values=True):
         error_estimate_method=line3[5],
         error_estimate_time=float(line3[6]),
         build_plus_estimate_time=float(line3[7]),
+        compile_time=float(line3[8]) if len(line3) > 8 else -1.0,
         target_labels=target_labels,
         predictions=predictions,
         pred_times=pred_times,
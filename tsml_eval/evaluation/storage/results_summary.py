@@ -0,0 +1,232 @@
+"""Class for summaries of results files read from their header lines."""
+
+from tsml_eval.evaluation.storage.estimator_results import (
+    EstimatorResults,
+    _read_results_header,
+)
+from tsml_eval.utils.results_validation import (
+    _check_classification_third_line,
+    _check_clustering_third_line,
+    _check_forecasting_third_line,
+    _check_regression_third_line,
+)
+from tsml_eval.utils.watchdog import _check_timeout_marker
+
+
+class ResultsSummary:
+    """
+    A summary of a results file, read from its first three lines only.
+
+    Holds the information written to the header lines of a results file: the first
+    line, parameter information, timings, memory usage and the performance statistic
+    of the learning task, i.e. accuracy for classification. Predictions are not
+    loaded, so statistics which require them are not available. Can be evaluated in
+    place of EstimatorResults objects for the statistics available, i.e. timings and
+    memory usage.
+
+    Parameters
+    ----------
+    task : str
+        The learning task of the results, one of "classification", "regression",
+        "clustering" or "forecasting".
+    dataset_name : str, default="N/A"
+        Name of the dataset used.
+    estimator_name : str, default="N/A"
+        Name of the estimator used.
+    split : str, default="N/A"
+        Type of data split used, i.e. "train" or "test".
+    resample_id : int or None, default=None
+        Random seed used for the data resample, with 0 usually being the original data.
+    time_unit : str, default="nanoseconds"
+        Time measurement used for other fields.
+    description : str, default=""
+        Additional description of the experiment from the first line of the file.
+    parameters : str, default="No parameter info"
+        Information about parameters used in the estimator from the second line of
+        the file.
+    fit_time : float, default=-1.0
+        Time taken fitting the model.
+    predict_time : float, default=-1.0
+        Time taken making predictions.
+    benchmark_time : float, default=-1.0
+        Time taken to run a benchmark function.
+    memory_usage : float, default=-1.0
+        Memory usage during the experiment.
+    **header_values
+        The remaining values of the third line, named as in the results class of the
+        task, i.e. "accuracy" and "n_classes" for classification.
+
+    Examples
+    --------
+    >>> from tsml_eval.evaluation.storage import load_results_summary
+    >>> from tsml_eval.testing.testing_utils import _TEST_RESULTS_PATH
+    >>> rs = load_results_summary(
+    ...     _TEST_RESULTS_PATH +
+    ...     "/classification/ROCKET/Predictions/MinimalChinatown/testResample0.csv"
+    ... )
+    >>> rs.task, rs.accuracy
+    ('classification', 0.9)
+    """
+
+    # var_name: (display_name, higher is better, is timing) of the performance
+    # statistic written to the third line of results files for each task
+    task_statistics = {
+        "classification": {"accuracy": ("Accuracy", True, False)},
+        "regression": {"mean_squared_error": ("MSE", False, False)},
+        "clustering": {"clustering_accuracy": ("CLAcc", True, False)},
+        "forecasting": {"mean_absolute_percentage_error": ("MAPE", False, False)},
+    }
+
+    def __init__(
+        self,
+        task,
+        dataset_name="N/A",
+        estimator_name="N/A",
+        split="N/A",
+        resample_id=None,
+        time_unit="nanoseconds",
+        description="",
+        parameters="No parameter info",
+        fit_time=-1.0,
+        predict_time=-1.0,
+        benchmark_time=-1.0,
+        memory_usage=-1.0,
+        **header_values,
+    ):
+        if task not in self.task_statistics:
+            raise ValueError(f"Unknown learning task {task}.")
+        self.task = task
+
+        # Line 1
+        self.dataset_name = dataset_name
+        self.estimator_name = estimator_name
+        self.split = split
+        self.resample_id = resample_id
+        self.time_unit = time_unit
+        self.description = description
+
+        # Line 2
+        self.parameter_info = parameters
+
+        # Line 3
+        self.fit_time = fit_time
+        self.predict_time = predict_time
+        self.benchmark_time = benchmark_time
+        self.memory_usage = memory_usage
+        self.__dict__.update(header_values)
+
+    @property
+    def statistics(self):
+        """The statistics available from the header lines of the results file."""
+        return {**self.task_statistics[self.task], **EstimatorResults.statistics}
+
+    def calculate_statistics(self, overwrite=False):
+        """
+        Do nothing, the statistics of a summary are read from the results file.
+
+        Present so summaries can be evaluated in place of EstimatorResults objects.
+
+        Parameters
+        ----------
+        overwrite : bool, default=False
+            Unused.
+        """
+
+
+def load_results_summary(file_path, task=None):
+    """
+    Load a summary of a results file from its first three lines.
+
+    The predictions in the rest of the file are not read. Files can be in the tsml CSV
+    or NPZ format.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the results file to summarise. The file should be a tsml
+        formatted results file, either CSV or NPZ. If the file does not exist, the
+        same results file in the other format is summarised if it exists.
+    task : str or None, default=None
+        The learning task of the results, one of "classification", "regression",
+        "clustering" or "forecasting". If None, the task is determined from the
+        third line of the file.
+
+    Returns
+    -------
+    rs : ResultsSummary
+        A ResultsSummary object containing the header values of the file.
+    """
+    _check_timeout_marker(file_path)
+    return _summary_from_header(_read_results_header(file_path), task=task)
+
+
+def _summary_from_header(lines, task=None):
+    """Create a ResultsSummary from the first three lines of a results file."""
+    if task is None:
+        task = _results_task(lines[2])
+
+    line1 = lines[0].split(",")
+    line3 = lines[2].split(",")
+
+    # fit, predict and benchmark time and memory usage follow the task statistic
+    t = 1
+    if task == "classification":
+        header_values = {
+            "accuracy": float(line3[0]),
+            "n_classes": int(line3[5]),
+            "error_estimate_method": line3[6] if len(line3) > 6 else "N/A",
+            "error_estimate_time": float(line3[7]) if len(line3) > 6 else -1.0,
+            "build_plus_estimate_time": float(line3[8]) if len(line3) > 6 else -1.0,
+            "compile_time": float(line3[9]) if len(line3) > 9 else -1.0,
+        }
+    elif task == "regression":
+        header_values = {
+            "mean_squared_error": float(line3[0]),
+            "error_estimate_method": line3[5],
+            "error_estimate_time": float(line3[6]),
+            "build_plus_estimate_time": float(line3[7]),
+            "compile_time": float(line3[8]) if len(line3) > 8 else -1.0,
+        }
+    elif task == "clustering":
+        header_values = {
+            "clustering_accuracy": float(line3[0]),
+            "n_classes": int(line3[5]),
+            "n_clusters": int(line3[6]),
+            "compile_time": float(line3[7]) if len(line3) > 7 else -1.0,
+        }
+    elif task == "forecasting":
+        header_values = {"mean_absolute_percentage_error": float(line3[0])}
+        # write_forecasting_results also writes the squared error after the MAPE
+        if len(line3) > 5:
+            header_values["mean_squared_error"] = float(line3[1])
+            t = 2
+    else:
+        raise ValueError(f"Unknown learning task {task}.")
+
+    return ResultsSummary(
+        task,
+        dataset_name=line1[0],
+        estimator_name=line1[1],
+        split=line1[2],
+        resample_id=None if line1[3] == "None" else int(line1[3]),
+        time_unit=line1[4].lower(),
+        description=",".join(line1[5:]).strip(),
+        parameters=lines[1].strip(),
+        fit_time=float(line3[t]),
+        predict_time=float(line3[t + 1]),
+        benchmark_time=float(line3[t + 2]),
+        memory_usage=float(line3[t + 3]),
+        **header_values,
+    )
+
+
+def _results_task(line3):
+    if _check_classification_third_line(line3):
+        return "classification"
+    elif _check_clustering_third_line(line3):
+        return "clustering"
+    elif _check_regression_third_line(line3):
+        return "regression"
+    elif _check_forecasting_third_line(line3):
+        return "forecasting"
+    raise ValueError("Unable to determine the type of results file.")
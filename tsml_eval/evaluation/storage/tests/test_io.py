@@ -1,15 +1,32 @@
 """Tests for the results IO functionality."""
 
 import os
+import time
 
+import numpy as np
 import pytest
 
+from tsml_eval.evaluation.storage import (
+    load_classifier_results,
+    load_clusterer_results,
+    load_forecaster_results,
+    load_regressor_results,
+    load_results_summary,
+)
 from tsml_eval.evaluation.storage.classifier_results import ClassifierResults
 from tsml_eval.evaluation.storage.clusterer_results import ClustererResults
 from tsml_eval.evaluation.storage.forecaster_results import ForecasterResults
 from tsml_eval.evaluation.storage.regressor_results import RegressorResults
 from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH, _TEST_RESULTS_PATH
+from tsml_eval.utils.results_conversion import convert_results_file
+from tsml_eval.utils.results_loading import load_estimator_results
 from tsml_eval.utils.results_validation import validate_results_file
+from tsml_eval.utils.results_writing import (
+    write_classification_results,
+    write_clustering_results,
+    write_forecasting_results,
+    write_regression_results,
+)
 
 
 def test_classifier_results():
@@ -127,3 +144,297 @@ def test_invalid_tasks_fail_to_load(type, path):
     for invalid_type in invalid_types:
         with pytest.raises((ValueError, IndexError, AssertionError)):
             invalid_type().load_from_file(path)
+
+
+# allowed time of the results loaders relative to parsing each line in Python.
+# Loose, as the benchmarks only need to catch the loaders becoming much slower
+LOAD_TIME_RATIO = 2.0
+NPZ_LOAD_TIME_RATIO = 1.0
+RESULTS_TASKS = ["classification", "regression", "clustering", "forecasting"]
+
+
+def _read_results_cases_by_line(file_path, n_probabilities=None):
+    """Read the cases of a results file line by line, as the loaders used to."""
+    with open(file_path) as file:
+        lines = file.readlines()[3:]
+
+    offset = 2 if n_probabilities is None else 3 + n_probabilities
+    line_size = len(lines[0].split(","))
+    labels = np.zeros(len(lines))
+    predictions = np.zeros(len(lines))
+    probabilities = (
+        None if n_probabilities is None else np.zeros((len(lines), n_probabilities))
+    )
+    pred_times = np.zeros(len(lines)) if line_size > offset + 1 else None
+    pred_descriptions = [] if line_size > offset + 3 else None
+
+    for i, line in enumerate(lines):
+        line = line.split(",")
+        labels[i] = float(line[0])
+        predictions[i] = float(line[1])
+        if probabilities is not None:
+            for j in range(n_probabilities):
+                probabilities[i, j] = float(line[3 + j])
+        if pred_times is not None:
+            pred_times[i] = float(line[offset + 1])
+        if pred_descriptions is not None:
+            pred_descriptions.append(",".join(line[offset + 3 :]).strip())
+
+    return labels, predictions, probabilities, pred_times, pred_descriptions
+
+
+def _write_task_results(
+    task,
+    n_cases,
+    n_classes=3,
+    pred_descriptions=True,
+    random_state=0,
+    directory="results_loading",
+):
+    """Write a results file for a task and return its path and loader.
+
+    Tests which modify the file should use their own directory, as tests run in
+    parallel.
+    """
+    rng = np.random.RandomState(random_state)
+    file_path = f"{_TEST_OUTPUT_PATH}/{directory}/{task}/{n_cases}/"
+    pred_times = rng.randint(0, 10**9, n_cases)
+    if pred_descriptions:
+        pred_descriptions = [f"Case {i}, seed {random_state}." for i in range(n_cases)]
+    else:
+        pred_descriptions = None
+
+    if task in ("classification", "clustering"):
+        labels = rng.randint(0, n_classes, n_cases)
+        probabilities = rng.dirichlet(np.ones(n_classes), n_cases)
+        predictions = probabilities.argmax(axis=1)
+        if task == "classification":
+            write_classification_results(
+                predictions,
+                probabilities,
+                labels,
+                "Test",
+                "Test",
+                file_path,
+                n_classes=n_classes,
+            )
+            load = load_classifier_results
+        else:
+            write_clustering_results(
+                predictions,
+                probabilities,
+                labels,
+                "Test",
+                "Test",
+                file_path,
+                n_classes=n_classes,
+                n_clusters=n_classes,
+            )
+            load = load_clusterer_results
+        return f"{file_path}/results.csv", load, n_classes
+
+    labels = rng.normal(size=n_cases) * 10.0 ** rng.randint(-8, 20, n_cases)
+    predictions = labels + rng.normal(size=n_cases)
+    if task == "regression":
+        write_regression_results(predictions, labels, "Test", "Test", file_path)
+        load = load_regressor_results
+    else:
+        write_forecasting_results(
+            predictions,
+            labels,
+            "Test",
+            "Test",
+            file_path,
+            pred_times=pred_times,
+            pred_descriptions=pred_descriptions,
+        )
+        load = load_forecaster_results
+    return f"{file_path}/results.csv", load, None
+
+
+@pytest.mark.parametrize("task", RESULTS_TASKS)
+def test_load_results_identical(task):
+    """Test the loaded cases are identical to parsing each line in Python."""
+    file_path, load, n_probabilities = _write_task_results(task, 50)
+    results = load(file_path, verify_values=False)
+    labels, predictions, probabilities, pred_times, pred_descriptions = (
+        _read_results_cases_by_line(file_path, n_probabilities=n_probabilities)
+    )
+
+    if n_probabilities is None:
+        np.testing.assert_array_equal(results.target_labels, labels)
+    else:
+        np.testing.assert_array_equal(results.class_labels, labels)
+        np.testing.assert_array_equal(results.probabilities, probabilities)
+    np.testing.assert_array_equal(results.predictions, predictions)
+    if pred_times is None:
+        assert results.pred_times is None
+    else:
+        np.testing.assert_array_equal(results.pred_times, pred_times)
+    assert results.pred_descriptions == pred_descriptions
+
+
+def test_load_results_missing_labels():
+    """Test missing clustering labels are loaded as NaN."""
+    file_path = f"{_TEST_OUTPUT_PATH}/results_loading/missing_labels/"
+    write_clustering_results(
+        np.array([0, 1, 1]),
+        np.array([[1.0, 0.0], [0.0, 1.0], [0.0, 1.0]]),
+        np.array([0, np.nan, 1]),
+        "Test",
+        "Test",
+        file_path,
+        n_clusters=2,
+    )
+
+    cr = load_clusterer_results(
+        f"{file_path}/results.csv", calculate_stats=False, verify_values=False
+    )
+    np.testing.assert_array_equal(cr.class_labels, [0, np.nan, 1])
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("task", RESULTS_TASKS)
+def test_load_results_benchmark(task):
+    """Benchmark the results loaders against parsing each line in Python.
+
+    Fails if loading a results file takes more than LOAD_TIME_RATIO times the time
+    to read its cases line by line. Prediction descriptions are not written, as they
+    are split from each line in Python by both. Only run with pytest --benchmarks.
+    """
+    file_path, load, n_probabilities = _write_task_results(
+        task, 20000, n_classes=10, pred_descriptions=False
+    )
+
+    load_times = []
+    by_line_times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        load(file_path, calculate_stats=False, verify_values=False)
+        load_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        _read_results_cases_by_line(file_path, n_probabilities=n_probabilities)
+        by_line_times.append(time.perf_counter() - start)
+
+    assert min(load_times) <= min(by_line_times) * LOAD_TIME_RATIO, (
+        f"Loading {task} results took {min(load_times):.3f}s, more than "
+        f"{LOAD_TIME_RATIO} times the {min(by_line_times):.3f}s to parse each line."
+    )
+
+
+@pytest.mark.parametrize(
+    "task,path",
+    [
+        (
+            "classification",
+            "/classification/ROCKET/Predictions/MinimalChinatown/testResample0.csv",
+        ),
+        (
+            "clustering",
+            "/clustering/KMeans/Predictions/MinimalChinatown/trainResample0.csv",
+        ),
+        (
+            "regression",
+            "/regression/ROCKET/Predictions/MinimalGasPrices/testResample0.csv",
+        ),
+        (
+            "forecasting",
+            "/forecasting/NaiveForecaster/Predictions/ShampooSales/testResample0.csv",
+        ),
+    ],
+)
+def test_load_results_summary(task, path):
+    """Test header only loading matches the header values of the full results."""
+    rs = load_estimator_results(_TEST_RESULTS_PATH + path, header_only=True)
+    er = load_estimator_results(_TEST_RESULTS_PATH + path)
+
+    assert rs.task == task
+    assert not hasattr(rs, "predictions")
+    for var in ["dataset_name", "estimator_name", "split", "resample_id"]:
+        assert rs.__dict__[var] == er.__dict__[var]
+    for var in rs.statistics:
+        assert rs.__dict__[var] == pytest.approx(er.__dict__[var], rel=1e-4)
+
+    assert load_results_summary(_TEST_RESULTS_PATH + path, task=task).statistics == (
+        rs.statistics
+    )
+
+
+@pytest.mark.parametrize("task", RESULTS_TASKS)
+def test_npz_results_identical(task):
+    """Test results converted to NPZ and back load and write the same values."""
+    file_path, load, _ = _write_task_results(task, 50, directory="npz_results")
+    with open(file_path) as f:
+        csv_text = f.read()
+
+    npz_path = convert_results_file(file_path, remove_original=True)
+    assert not os.path.exists(file_path)
+    npz_results = load(npz_path, verify_values=False)
+
+    csv_path = convert_results_file(npz_path, file_format="csv")
+    with open(csv_path) as f:
+        assert f.read() == csv_text
+    csv_results = load(csv_path, verify_values=False)
+
+    for var in csv_results.__dict__:
+        var = "probabilities" if var == "_probabilities" else var
+        if isinstance(getattr(csv_results, var), np.ndarray):
+            np.testing.assert_array_equal(
+                getattr(npz_results, var), getattr(csv_results, var)
+            )
+        else:
+            assert getattr(npz_results, var) == getattr(csv_results, var)
+
+
+def test_npz_results_lazy_probabilities():
+    """Test saving results to NPZ and loading probabilities when first used."""
+    cr = ClassifierResults().load_from_file(
+        _TEST_RESULTS_PATH
+        + "/classification/ROCKET/Predictions/MinimalChinatown/testResample0.csv"
+    )
+    cr.save_to_file(
+        _TEST_OUTPUT_PATH + "/classification/results_npz/", file_format="npz"
+    )
+    npz_path = _TEST_OUTPUT_PATH + "/classification/results_npz/testResample0.npz"
+
+    lazy = load_classifier_results(npz_path, calculate_stats=False, verify_values=False)
+    assert callable(lazy._probabilities)
+    np.testing.assert_array_equal(lazy.probabilities, cr.probabilities)
+    assert not callable(lazy._probabilities)
+
+    # the path of the CSV file loads the NPZ file if it is the only one present
+    npz_cr = load_classifier_results(npz_path.replace(".npz", ".csv"))
+    assert npz_cr.accuracy == cr.accuracy
+    assert load_results_summary(npz_path).accuracy == cr.accuracy
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("task", RESULTS_TASKS)
+def test_npz_load_benchmark(task):
+    """Benchmark loading NPZ results files against loading CSV results files.
+
+    Fails if loading a NPZ results file takes more than NPZ_LOAD_TIME_RATIO times the
+    time to load the same results from a CSV file. Only run with pytest
+    --benchmarks.
+    """
+    file_path, load, _ = _write_task_results(
+        task, 20000, n_classes=10, pred_descriptions=False, directory="npz_benchmark"
+    )
+    npz_path = convert_results_file(file_path)
+
+    csv_times = []
+    npz_times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        load(file_path, calculate_stats=False, verify_values=False)
+        csv_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        load(npz_path, calculate_stats=False, verify_values=False)
+        npz_times.append(time.perf_counter() - start)
+
+    assert min(npz_times) <= min(csv_times) * NPZ_LOAD_TIME_RATIO, (
+        f"Loading {task} NPZ results took {min(npz_times):.3f}s, more than "
+        f"{NPZ_LOAD_TIME_RATIO} times the {min(csv_times):.3f}s to load CSV results."
+    )
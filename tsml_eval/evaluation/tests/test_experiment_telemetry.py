@@ -0,0 +1,48 @@
+"""Tests for summarising experiment telemetry."""
+
+import numpy as np
+
+from tsml_eval.evaluation.experiment_telemetry import summarise_experiment_telemetry
+from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+from tsml_eval.utils.telemetry import ExperimentTelemetry, telemetry_file_path
+
+
+def test_summarise_experiment_telemetry():
+    """Test summarising telemetry files across estimators and datasets."""
+    results_path = f"{_TEST_OUTPUT_PATH}/telemetry_summary/"
+
+    for estimator in ["EstA", "EstB"]:
+        for dataset in ["Data1", "Data2"]:
+            for resample in range(2):
+                telemetry = ExperimentTelemetry()
+                for phase in ["fit", "predict"]:
+                    with telemetry.phase(phase):
+                        pass
+                with telemetry.phase("data_transform", detail="Normalizer"):
+                    pass
+                telemetry.write(
+                    telemetry_file_path(results_path, estimator, dataset, resample),
+                    estimator_name=estimator,
+                    dataset_name=dataset,
+                    resample_id=resample,
+                )
+
+    summary = summarise_experiment_telemetry(results_path)
+    assert len(summary) == 6
+    assert set(summary["phase"]) == {"fit", "predict", "data_transform"}
+    assert (summary["n_experiments"] == 4).all()
+    for estimator in ["EstA", "EstB"]:
+        share = summary[summary["estimator"] == estimator]["wall_time_share"]
+        assert np.isclose(share.sum(), 1)
+
+    summary = summarise_experiment_telemetry(
+        results_path, estimator_names=["EstA"], dataset_names=["Data1"]
+    )
+    assert set(summary["estimator"]) == {"EstA"}
+    assert (summary["n_experiments"] == 2).all()
+
+    summary = summarise_experiment_telemetry(results_path, include_detail=True)
+    assert "Normalizer" in summary["detail"].values
+
+    summary = summarise_experiment_telemetry(f"{results_path}/EmptyDir/")
+    assert len(summary) == 0
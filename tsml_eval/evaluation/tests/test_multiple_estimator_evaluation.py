@@ -1,5 +1,7 @@
 """Tests for the multiple estimator evaluation functionality."""
 
+import os
+
 from tsml_eval.evaluation.multiple_estimator_evaluation import (
     evaluate_classifiers_by_problem,
     evaluate_clusterers_by_problem,
@@ -72,3 +74,22 @@ def test_evaluate_forecasters_by_problem():
         resamples=resamples,
         eval_name="test0",
     )
+
+
+def test_evaluate_by_problem_header_only():
+    """Test the evaluation of header statistics without loading predictions."""
+    evaluate_classifiers_by_problem(
+        _TEST_RESULTS_PATH + "/classification/",
+        ["ROCKET", "TSF", "1NN-DTW"],
+        ["Chinatown", "ItalyPowerDemand", "Trace"],
+        _TEST_OUTPUT_PATH + "/eval/classification/",
+        resamples=3,
+        eval_name="header_only",
+        header_only=True,
+    )
+
+    assert sorted(
+        d
+        for d in os.listdir(_TEST_OUTPUT_PATH + "/eval/classification/header_only/")
+        if os.path.isdir(f"{_TEST_OUTPUT_PATH}/eval/classification/header_only/{d}")
+    ) == ["Accuracy", "FitTime", "MemoryUsage", "PredictTime"]
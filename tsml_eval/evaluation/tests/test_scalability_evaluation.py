@@ -0,0 +1,51 @@
+"""Tests for the scalability evaluation functions."""
+
+import numpy as np
+import pandas as pd
+
+from tsml_eval.evaluation import compare_scalability_results, scalability_exponents
+
+
+def _results(scale, exponent):
+    n_cases, n_timepoints = np.meshgrid([10, 20, 40], [100, 200])
+    n_cases, n_timepoints = n_cases.flatten(), n_timepoints.flatten()
+    mean_time = scale * n_cases * n_timepoints**exponent
+    return pd.DataFrame(
+        {
+            "estimator": "Test",
+            "function": "fit",
+            "input_type": "collection",
+            "n_cases": n_cases,
+            "n_channels": 1,
+            "n_timepoints": n_timepoints,
+            "status": "completed",
+            "mean_time": mean_time,
+            "ci_lower": mean_time * 0.95,
+            "ci_upper": mean_time * 1.05,
+            "peak_memory": 1000,
+            "version": "1.0",
+            "tsml_eval_version": "0.6.0",
+        }
+    )
+
+
+def test_scalability_exponents():
+    """Test fitting the exponent of each dimension of a multi-dimensional grid."""
+    exponents = scalability_exponents(_results(0.01, 2))
+    exponents = dict(zip(exponents["dimension"], exponents["exponent"]))
+    np.testing.assert_almost_equal(exponents["n_cases"], 1)
+    np.testing.assert_almost_equal(exponents["n_timepoints"], 2)
+
+
+def test_compare_scalability_results():
+    """Test comparing results where the new version is faster and scales better."""
+    times, exponents = compare_scalability_results(_results(0.01, 2), _results(0.01, 1))
+
+    assert len(times) == 6
+    assert (times["time_ratio"] <= 1).all()
+    assert times["significant"].sum() == 6
+    np.testing.assert_array_equal(times["memory_ratio"], 1)
+
+    difference = exponents.set_index("dimension")["exponent_difference"]
+    np.testing.assert_almost_equal(difference["n_cases"], 0)
+    np.testing.assert_almost_equal(difference["n_timepoints"], -1)
@@ -12,6 +12,8 @@ __all__ = [
     "get_regressor_by_name",
     "get_data_transform_by_name",
     "run_timing_experiment",
+    "run_scalability_experiment",
+    "run_batch_experiments",
     "classification_cross_validation",
     "classification_cross_validation_folds",
     "regression_cross_validation",
@@ -22,6 +24,7 @@ from tsml_eval.experiments._get_classifier import get_classifier_by_name
 from tsml_eval.experiments._get_clusterer import get_clusterer_by_name
 from tsml_eval.experiments._get_data_transform import get_data_transform_by_name
 from tsml_eval.experiments._get_regressor import get_regressor_by_name
+from tsml_eval.experiments.batch_experiments import run_batch_experiments
 from tsml_eval.experiments.cross_validation import (
     classification_cross_validation,
     classification_cross_validation_folds,
@@ -36,4 +39,7 @@ from tsml_eval.experiments.experiments import (
     run_clustering_experiment,
     run_regression_experiment,
 )
-from tsml_eval.experiments.scalability import run_timing_experiment
+from tsml_eval.experiments.scalability import (
+    run_scalability_experiment,
+    run_timing_experiment,
+)
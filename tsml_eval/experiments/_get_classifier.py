@@ -2,7 +2,9 @@
 
 __maintainer__ = ["TonyBagnall", "MatthewMiddlehurst"]
 
-from tsml_eval.utils.functions import str_in_nested_list
+from functools import lru_cache
+
+from tsml_eval.utils.functions import nested_list_index
 
 convolution_based_classifiers = [
     ["rocketclassifier", "rocket"],
@@ -153,49 +155,31 @@ def get_classifier_by_name(
     """
     c = classifier_name.casefold()
 
-    if str_in_nested_list(convolution_based_classifiers, c):
-        return _set_classifier_convolution_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(deep_learning_classifiers, c):
-        return _set_classifier_deep_learning(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(dictionary_based_classifiers, c):
-        return _set_classifier_dictionary_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(distance_based_classifiers, c):
-        return _set_classifier_distance_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(feature_based_classifiers, c):
-        return _set_classifier_feature_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(hybrid_classifiers, c):
-        return _set_classifier_hybrid(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(interval_based_classifiers, c):
-        return _set_classifier_interval_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(other_classifiers, c):
-        return _set_classifier_other(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(shapelet_based_classifiers, c):
-        return _set_classifier_shapelet_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(vector_classifiers, c):
-        return _set_classifier_vector(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    else:
+    set_classifier = _classifier_index().get(c)
+    if set_classifier is None:
         raise ValueError(f"UNKNOWN CLASSIFIER: {c} in get_classifier_by_name")
 
+    return set_classifier(c, random_state, n_jobs, fit_contract, checkpoint, kwargs)
+
+
+@lru_cache(maxsize=None)
+def _classifier_index():
+    """Map each classifier name to the function which creates it, built on first use."""
+    return nested_list_index(
+        [
+            (convolution_based_classifiers, _set_classifier_convolution_based),
+            (deep_learning_classifiers, _set_classifier_deep_learning),
+            (dictionary_based_classifiers, _set_classifier_dictionary_based),
+            (distance_based_classifiers, _set_classifier_distance_based),
+            (feature_based_classifiers, _set_classifier_feature_based),
+            (hybrid_classifiers, _set_classifier_hybrid),
+            (interval_based_classifiers, _set_classifier_interval_based),
+            (other_classifiers, _set_classifier_other),
+            (shapelet_based_classifiers, _set_classifier_shapelet_based),
+            (vector_classifiers, _set_classifier_vector),
+        ]
+    )
+
 
 def _set_classifier_convolution_based(
     c, random_state, n_jobs, fit_contract, checkpoint, kwargs
@@ -2,22 +2,12 @@
 
 __maintainer__ = ["TonyBagnall", "MatthewMiddlehurst"]
 
+from functools import lru_cache
+
 import numpy as np
-from aeon.clustering import (
-    ElasticSOM,
-    KSpectralCentroid,
-    TimeSeriesCLARA,
-    TimeSeriesCLARANS,
-    TimeSeriesKernelKMeans,
-    TimeSeriesKMeans,
-    TimeSeriesKMedoids,
-    TimeSeriesKShape,
-)
-from aeon.transformations.collection import Normalizer
-from sklearn.cluster import KMeans
 
 from tsml_eval.utils.datasets import load_experiment_data
-from tsml_eval.utils.functions import str_in_nested_list
+from tsml_eval.utils.functions import nested_list_index
 
 deep_learning_clusterers = [
     ["aefcnclusterer", "aefcn"],
@@ -191,12 +181,11 @@ def get_clusterer_by_name(
     """
     c = clusterer_name.lower()
 
-    if str_in_nested_list(deep_learning_clusterers, c):
-        return _set_clusterer_deep_learning(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(distance_based_clusterers, c):
-        return _set_clusterer_distance_based(
+    set_clusterer = _clusterer_index().get(c)
+    if set_clusterer is None:
+        raise ValueError(f"UNKNOWN CLUSTERER: {c} in get_clusterer_by_name")
+    elif set_clusterer is _set_clusterer_distance_based:
+        return set_clusterer(
             c,
             random_state,
             n_jobs,
@@ -206,26 +195,29 @@ def get_clusterer_by_name(
             row_normalise,
             kwargs,
         )
-    elif str_in_nested_list(feature_based_clusterers, c):
-        return _set_clusterer_feature_based(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(other_clusterers, c):
-        return _set_clusterer_other(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(vector_clusterers, c):
-        return _set_clusterer_vector(
-            c, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
     else:
-        raise ValueError(f"UNKNOWN CLUSTERER: {c} in get_clusterer_by_name")
+        return set_clusterer(c, random_state, n_jobs, fit_contract, checkpoint, kwargs)
+
+
+@lru_cache(maxsize=None)
+def _clusterer_index():
+    """Map each clusterer name to the function which creates it, built on first use."""
+    return nested_list_index(
+        [
+            (deep_learning_clusterers, _set_clusterer_deep_learning),
+            (distance_based_clusterers, _set_clusterer_distance_based),
+            (feature_based_clusterers, _set_clusterer_feature_based),
+            (other_clusterers, _set_clusterer_other),
+            (vector_clusterers, _set_clusterer_vector),
+        ]
+    )
 
 
 def _set_clusterer_deep_learning(
     c, random_state, n_jobs, fit_contract, checkpoint, kwargs
 ):
     if c == "aefcnclusterer" or c == "aefcn":
+        from aeon.clustering import TimeSeriesKMeans
         from aeon.clustering.deep_learning import AEFCNClusterer
 
         return AEFCNClusterer(
@@ -234,6 +226,7 @@ def _set_clusterer_deep_learning(
             **kwargs,
         )
     elif c == "aeresnetclusterer" or c == "aeresnet":
+        from aeon.clustering import TimeSeriesKMeans
         from aeon.clustering.deep_learning import AEResNetClusterer
 
         return AEResNetClusterer(
@@ -242,6 +235,7 @@ def _set_clusterer_deep_learning(
             **kwargs,
         )
     elif c == "aeattentionbigruclusterer" or c == "aeattentionbigru":
+        from aeon.clustering import TimeSeriesKMeans
         from aeon.clustering.deep_learning import AEAttentionBiGRUClusterer
 
         return AEAttentionBiGRUClusterer(
@@ -250,6 +244,7 @@ def _set_clusterer_deep_learning(
             **kwargs,
         )
     elif c == "aebigruclusterer" or c == "aebigru":
+        from aeon.clustering import TimeSeriesKMeans
         from aeon.clustering.deep_learning import AEBiGRUClusterer
 
         return AEBiGRUClusterer(
@@ -258,6 +253,7 @@ def _set_clusterer_deep_learning(
             **kwargs,
         )
     elif c == "aedcnnclusterer" or c == "aedcnn":
+        from aeon.clustering import TimeSeriesKMeans
         from aeon.clustering.deep_learning import AEDCNNClusterer
 
         return AEDCNNClusterer(
@@ -266,6 +262,7 @@ def _set_clusterer_deep_learning(
             **kwargs,
         )
     elif c == "aedrnnclusterer" or c == "aedrnn":
+        from aeon.clustering import TimeSeriesKMeans
         from aeon.clustering.deep_learning import AEDRNNClusterer
 
         return AEDRNNClusterer(
@@ -307,6 +304,8 @@ def _set_clusterer_distance_based(
         )
 
     if "kmeans" in c or "timeserieskmeans" in c:
+        from aeon.clustering import TimeSeriesKMeans
+
         if "average_params" in kwargs:
             average_params = kwargs["average_params"]
         else:
@@ -353,6 +352,8 @@ def _set_clusterer_distance_based(
                 **kwargs,
             )
     elif "kmedoids" in c or "timeserieskmedoids" in c:
+        from aeon.clustering import TimeSeriesKMedoids
+
         return TimeSeriesKMedoids(
             max_iter=50,
             n_init=10,
@@ -364,6 +365,8 @@ def _set_clusterer_distance_based(
             **kwargs,
         )
     elif "pam" in c or "timeseriespam" in c:
+        from aeon.clustering import TimeSeriesKMedoids
+
         return TimeSeriesKMedoids(
             max_iter=50,
             n_init=10,
@@ -375,6 +378,8 @@ def _set_clusterer_distance_based(
             **kwargs,
         )
     elif "clarans" in c or "timeseriesclarans" in c:
+        from aeon.clustering import TimeSeriesCLARANS
+
         return TimeSeriesCLARANS(
             n_init=10,
             init=init_algorithm,
@@ -384,6 +389,8 @@ def _set_clusterer_distance_based(
             **kwargs,
         )
     elif "clara" in c or "timeseriesclara" in c:
+        from aeon.clustering import TimeSeriesCLARA
+
         return TimeSeriesCLARA(
             max_iter=50,
             init=init_algorithm,
@@ -393,6 +400,8 @@ def _set_clusterer_distance_based(
             **kwargs,
         )
     elif "som" in c or "elasticsom" in c:
+        from aeon.clustering import ElasticSOM
+
         return ElasticSOM(
             distance=distance,
             init="random",
@@ -407,6 +416,8 @@ def _set_clusterer_distance_based(
             verbose=False,
         )
     elif "ksc" in c or "kspectralcentroid" in c:
+        from aeon.clustering import KSpectralCentroid
+
         return KSpectralCentroid(
             # Max shift set to n_timepoints when max_shift is None
             max_shift=None,
@@ -417,6 +428,8 @@ def _set_clusterer_distance_based(
             **kwargs,
         )
     elif "kshape" in c:
+        from aeon.clustering import TimeSeriesKShape
+
         return TimeSeriesKShape(
             init=init_algorithm,
             max_iter=50,
@@ -426,6 +439,8 @@ def _set_clusterer_distance_based(
             **kwargs,
         )
     elif "timeserieskernelkmeans" in c:
+        from aeon.clustering import TimeSeriesKernelKMeans
+
         return TimeSeriesKernelKMeans(
             max_iter=50,
             n_init=10,
@@ -458,6 +473,8 @@ def _get_distance_default_params(
             # cant handle unequal length series
             if isinstance(X_train, np.ndarray):
                 if row_normalise:
+                    from aeon.transformations.collection import Normalizer
+
                     scaler = Normalizer()
                     X_train = scaler.fit_transform(X_train)
 
@@ -485,18 +502,21 @@ def _set_clusterer_feature_based(
 ):
     if c == "catch22" or c == "catch22clusterer":
         from aeon.clustering.feature_based import Catch22Clusterer
+        from sklearn.cluster import KMeans
 
         return Catch22Clusterer(
             estimator=KMeans(), random_state=random_state, n_jobs=n_jobs, **kwargs
         )
     elif c == "tsfresh" or c == "tsfreshclusterer":
         from aeon.clustering.feature_based import TSFreshClusterer
+        from sklearn.cluster import KMeans
 
         return TSFreshClusterer(
             estimator=KMeans(), random_state=random_state, n_jobs=n_jobs, **kwargs
         )
     elif c == "summary" or c == "summaryclusterer":
         from aeon.clustering.feature_based import SummaryClusterer
+        from sklearn.cluster import KMeans
 
         return SummaryClusterer(
             estimator=KMeans(), random_state=random_state, n_jobs=n_jobs, **kwargs
@@ -513,6 +533,8 @@ def _set_clusterer_other(c, random_state, n_jobs, fit_contract, checkpoint, kwar
 
         return DummyClusterer(strategy="random", random_state=random_state, **kwargs)
     elif c == "dummyclusterer-sklearn":
+        from sklearn.cluster import KMeans
+
         return KMeans(
             n_init=1,
             init="random",
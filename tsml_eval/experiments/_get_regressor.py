@@ -2,9 +2,11 @@
 
 __maintainer__ = ["TonyBagnall", "MatthewMiddlehurst"]
 
+from functools import lru_cache
+
 import numpy as np
 
-from tsml_eval.utils.functions import str_in_nested_list
+from tsml_eval.utils.functions import nested_list_index
 
 convolution_based_regressors = [
     ["rocketregressor", "rocket"],
@@ -128,45 +130,30 @@ def get_regressor_by_name(
     """
     r = regressor_name.lower()
 
-    if str_in_nested_list(convolution_based_regressors, r):
-        return _set_regressor_convolution_based(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(deep_learning_regressors, r):
-        return _set_regressor_deep_learning(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(distance_based_regressors, r):
-        return _set_regressor_distance_based(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(feature_based_regressors, r):
-        return _set_regressor_feature_based(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(hybrid_regressors, r):
-        return _set_regressor_hybrid(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(interval_based_regressors, r):
-        return _set_regressor_interval_based(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(other_regressors, r):
-        return _set_regressor_other(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(shapelet_based_regressors, r):
-        return _set_regressor_shapelet_based(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    elif str_in_nested_list(vector_regressors, r):
-        return _set_regressor_vector(
-            r, random_state, n_jobs, fit_contract, checkpoint, kwargs
-        )
-    else:
+    set_regressor = _regressor_index().get(r)
+    if set_regressor is None:
         raise ValueError(f"UNKNOWN REGRESSOR: {r} in get_regressor_by_name")
 
+    return set_regressor(r, random_state, n_jobs, fit_contract, checkpoint, kwargs)
+
+
+@lru_cache(maxsize=None)
+def _regressor_index():
+    """Map each regressor name to the function which creates it, built on first use."""
+    return nested_list_index(
+        [
+            (convolution_based_regressors, _set_regressor_convolution_based),
+            (deep_learning_regressors, _set_regressor_deep_learning),
+            (distance_based_regressors, _set_regressor_distance_based),
+            (feature_based_regressors, _set_regressor_feature_based),
+            (hybrid_regressors, _set_regressor_hybrid),
+            (interval_based_regressors, _set_regressor_interval_based),
+            (other_regressors, _set_regressor_other),
+            (shapelet_based_regressors, _set_regressor_shapelet_based),
+            (vector_regressors, _set_regressor_vector),
+        ]
+    )
+
 
 def _set_regressor_convolution_based(
     r, random_state, n_jobs, fit_contract, checkpoint, kwargs
@@ -0,0 +1,704 @@
+"""Batch Experiments: run a grid of experiments on a single node using a process pool.
+
+Each worker process is kept alive for the whole batch, so imports, numba JIT caches
+and other per-process setup costs are paid once per worker rather than once per job.
+Jobs are handed out one at a time as workers become free, so long and short jobs are
+balanced across the pool. Jobs can be ordered longest first and limited to a memory
+budget using costs predicted from existing results. Results are written in a standard
+tsml format.
+"""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "experiment_job_grid",
+    "load_job_manifest",
+    "run_batch_experiments",
+]
+
+import os
+import sys
+
+# Do these before any other imports in i.e. numpy. This includes imports from other
+# files. Parallelism is handled by the process pool.
+if __name__ == "__main__":
+    os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["MKL_NUM_THREADS"] = "1"
+    os.environ["MPI_NUM_THREADS"] = "1"
+    os.environ["OPENBLAS_NUM_THREADS"] = "1"
+    os.environ["NUMEXPR_NUM_THREADS"] = "1"
+    os.environ["LOKY_MAX_CPU_COUNT"] = "1"
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    os.environ["TF_NUM_INTRAOP_THREADS"] = "1"
+
+import itertools
+import multiprocessing
+import time
+import traceback
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from tsml_eval.experiments.scheduling import estimate_job_costs, longest_first_order
+from tsml_eval.utils.data_transform_cache import DataTransformCache
+from tsml_eval.utils.datasets import ExperimentDataset
+from tsml_eval.utils.experiments import (
+    _init_worker,
+    _results_present,
+    _single_threaded,
+    _start_method,
+    cached_timing_benchmark,
+)
+
+_TASKS = ["classification", "regression", "clustering", "forecasting"]
+
+# the most recently used dataset of a worker process, kept so consecutive resamples
+# of the same dataset do not reload the files
+_WORKER_DATASET = {}
+
+
+def experiment_job_grid(estimator_names, dataset_names, resample_ids):
+    """Create the cartesian product of estimators, datasets and resamples.
+
+    Parameters
+    ----------
+    estimator_names : str or list of str
+        The names of the estimators to run. Passed to the relevant get_*_by_name
+        function.
+    dataset_names : str or list of str
+        The names of the datasets to run. If a string, it is the path to a file
+        containing the names of the datasets, one per line.
+    resample_ids : int or list of int
+        The resample IDs to run. If an int, resamples 0 to resample_ids-1 are used.
+
+    Returns
+    -------
+    jobs : list of tuple
+        List of (estimator_name, dataset_name, resample_id) tuples.
+
+    Examples
+    --------
+    >>> from tsml_eval.experiments.batch_experiments import experiment_job_grid
+    >>> experiment_job_grid(["ROCKET", "DrCIF"], ["Chinatown"], 2)
+    [('ROCKET', 'Chinatown', 0), ('ROCKET', 'Chinatown', 1), \
+('DrCIF', 'Chinatown', 0), ('DrCIF', 'Chinatown', 1)]
+    """
+    if isinstance(estimator_names, str):
+        estimator_names = [estimator_names]
+
+    if isinstance(dataset_names, str):
+        with open(dataset_names) as f:
+            dataset_names = [d.strip() for d in f.readlines() if d.strip() != ""]
+
+    if isinstance(resample_ids, int):
+        resample_ids = list(range(resample_ids))
+
+    return [
+        (e, d, int(r))
+        for e, d, r in itertools.product(estimator_names, dataset_names, resample_ids)
+    ]
+
+
+def load_job_manifest(file_path):
+    """Load a list of experiment jobs from a manifest file.
+
+    Each non-empty line of the file should contain a comma separated estimator name,
+    dataset name and resample ID i.e. "ROCKET,Chinatown,0". Lines starting with "#"
+    are ignored.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the manifest file.
+
+    Returns
+    -------
+    jobs : list of tuple
+        List of (estimator_name, dataset_name, resample_id) tuples.
+    """
+    jobs = []
+    with open(file_path) as f:
+        for n, line in enumerate(f):
+            line = line.strip()
+            if line == "" or line.startswith("#"):
+                continue
+
+            job = [s.strip() for s in line.split(",")]
+            if len(job) != 3:
+                raise ValueError(
+                    f"Invalid job on line {n + 1} of {file_path}: {line}. Expected "
+                    "'estimator_name,dataset_name,resample_id'."
+                )
+            jobs.append((job[0], job[1], int(job[2])))
+    return jobs
+
+
+def run_batch_experiments(
+    data_path,
+    results_path,
+    jobs,
+    task="classification",
+    n_jobs=-1,
+    train_fold=False,
+    checkpoint_train=False,
+    test_fold=False,
+    random_seed=None,
+    data_transform_name=None,
+    transform_train_only=False,
+    row_normalise=False,
+    n_clusters=-1,
+    write_attributes=False,
+    att_max_shape=0,
+    benchmark_time=True,
+    overwrite=False,
+    predefined_resample=False,
+    use_data_cache=False,
+    transform_cache_path=None,
+    longest_first=False,
+    max_memory=None,
+    dataset_sizes=None,
+    predict_max_memory=None,
+    warm_up=False,
+    phase_budget=None,
+    use_catalogue=False,
+    kwargs=None,
+    verbose=True,
+):
+    """Run a batch of experiments on a pool of worker processes.
+
+    Jobs which already have results present are skipped before being sent to the
+    pool. Failed jobs do not stop the batch, their tracebacks are returned instead.
+
+    Parameters
+    ----------
+    data_path : str
+        Location of problem files, full path.
+    results_path : str
+        Location of where to write results. Any required directories will be created.
+    jobs : list of tuple or str
+        The (estimator_name, dataset_name, resample_id) jobs to run, see
+        experiment_job_grid. If a string, it is the path to a job manifest file, see
+        load_job_manifest.
+    task : str, default="classification"
+        The learning task, one of "classification", "regression", "clustering" or
+        "forecasting".
+    n_jobs : int, default=-1
+        The number of worker processes. -1 uses all CPUs available to this process.
+        If 1, jobs are run sequentially in the current process.
+    train_fold : bool, default=False
+        Write a results file for the training data in the classification and
+        regression task.
+    checkpoint_train : bool, default=False
+        Save the output of each train data cross-validation fold so a restarted
+        batch only runs the missing folds of unfinished jobs.
+    test_fold : bool, default=False
+        Write a results file for the test data in the clustering task.
+    random_seed : int or None, default=None
+        Use a different random seed than the resample ID for estimators. If None, the
+        resample ID is used.
+    data_transform_name : str, list of str or None, default=None
+        Passed to get_data_transform_by_name to create the data transforms used.
+    transform_train_only : bool, default=False
+        If the data_transforms are limited to the training data only.
+        Classification only.
+    row_normalise : bool, default=False
+        Whether to normalise the data rows (time series) prior to fitting and
+        predicting.
+    n_clusters : int, default=-1
+        The number of clusters to find for clusterers. If -1, the number of classes in
+        the dataset is used.
+    write_attributes : bool, default=False
+        Write the estimator attributes to file.
+    att_max_shape : int, default=0
+        The max estimator collections shape allowed when writing attributes.
+    benchmark_time : bool, default=True
+        Whether to benchmark the hardware used with a simple function and write the
+        results.
+    overwrite : bool, default=False
+        If set to False, this will only build results if there is not a result file
+        already present. If True, it will overwrite anything already there.
+    predefined_resample : bool, default=False
+        Read a predefined resample from file instead of performing a resample.
+    use_data_cache : bool, default=False
+        Load datasets through a binary cache stored alongside the .ts files, see
+        tsml_eval.utils.datasets.load_cached_ts_file. Workers loading the same
+        dataset share the memory mapped cache files.
+    transform_cache_path : str or None, default=None
+        If not None, the output of the data transforms is cached in this directory
+        and shared between jobs using the same dataset, resample and transforms, see
+        tsml_eval.utils.data_transform_cache.DataTransformCache.
+    longest_first : bool, default=False
+        Run the jobs with the longest predicted runtime first, so a long job started
+        at the end of the batch does not leave the other workers idle. Runtimes are
+        predicted from existing results files in results_path, see
+        tsml_eval.experiments.scheduling.estimate_job_costs. If False, jobs are run
+        in the input order.
+    max_memory : int or None, default=None
+        The memory budget in bytes for the jobs running at the same time. A job is
+        only started when the sum of the predicted memory usage of the running jobs
+        and itself fits in the budget, otherwise the next job in order which fits
+        is started. Jobs with unknown memory usage are always started and a job
+        larger than the budget is run once no other jobs are running. Predictions
+        do not include the base memory of each worker process. If None, memory
+        usage is not limited.
+    dataset_sizes : dict, list of dict or None, default=None
+        Dataset sizes used to predict job costs on datasets an estimator has no
+        results for, see estimate_job_costs. If None, the size of the dataset files
+        is used.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for each job to predict its test data in chunks,
+        see tsml_eval.experiments.run_classification_experiment.
+    warm_up : bool, default=False
+        Whether each job compiles JIT code before its timed fit, see
+        tsml_eval.experiments.run_classification_experiment.
+    phase_budget : float, dict or None, default=None
+        A wall-clock budget in seconds for each phase of each job, see
+        tsml_eval.experiments.load_and_run_classification_experiment. Jobs which
+        exceed the budget write timeout markers and count as completed, and are
+        skipped by later batches unless overwriting. Not used for forecasting.
+    use_catalogue : bool, default=False
+        Find the jobs with results present using a ResultsCatalogue of results_path
+        instead of checking for each results file, see
+        tsml_eval.utils.results_catalogue. The catalogue is stored in results_path
+        and is updated before the batch starts and after it completes, only listing
+        the directories which have changed. Each experiment also checks the
+        catalogue for its existing results files.
+    kwargs : dict or None, default=None
+        Additional keyword arguments to pass to each estimator.
+    verbose : bool, default=True
+        Print the progress and throughput of the batch as jobs complete.
+
+    Returns
+    -------
+    job_status : dict
+        Dictionary with (estimator_name, dataset_name, resample_id) keys. Values are
+        "skipped", "completed" or the traceback of the raised error as a str.
+    """
+    if task not in _TASKS:
+        raise ValueError(f"Unknown task: {task}. Must be one of {_TASKS}.")
+
+    if isinstance(jobs, str):
+        jobs = load_job_manifest(jobs)
+
+    if task == "classification" or task == "regression":
+        split = "BOTH" if train_fold else "TEST"
+    elif task == "clustering":
+        split = "BOTH" if test_fold else "TRAIN"
+    else:
+        split = "TEST"
+
+    catalogue = None
+    if use_catalogue:
+        from tsml_eval.utils.results_catalogue import ResultsCatalogue
+
+        catalogue = ResultsCatalogue(results_path)
+        catalogue.scan()
+
+    job_status = {}
+    pending = []
+    for job in jobs:
+        job = (job[0], job[1], int(job[2]))
+        if job in job_status:
+            continue
+
+        if not overwrite and _results_present(
+            results_path,
+            job[0],
+            job[1],
+            resample_id=job[2],
+            split=split,
+            catalogue=catalogue,
+        ):
+            job_status[job] = "skipped"
+        else:
+            job_status[job] = None
+            pending.append(job)
+
+    settings = {
+        "data_path": data_path,
+        "results_path": results_path,
+        "train_fold": train_fold,
+        "checkpoint_train": checkpoint_train,
+        "test_fold": test_fold,
+        "random_seed": random_seed,
+        "data_transform_name": data_transform_name,
+        "transform_train_only": transform_train_only,
+        "row_normalise": row_normalise,
+        "n_clusters": n_clusters,
+        "write_attributes": write_attributes,
+        "att_max_shape": att_max_shape,
+        "benchmark_time": benchmark_time,
+        "overwrite": overwrite,
+        "predefined_resample": predefined_resample,
+        "use_data_cache": use_data_cache,
+        "transform_cache_path": transform_cache_path,
+        "predict_max_memory": predict_max_memory,
+        "warm_up": warm_up,
+        "phase_budget": phase_budget,
+        "results_catalogue": catalogue,
+        "kwargs": {} if kwargs is None else kwargs,
+    }
+
+    job_costs = {}
+    if longest_first or max_memory is not None:
+        job_costs = estimate_job_costs(
+            pending,
+            results_path,
+            task=task,
+            dataset_sizes=dataset_sizes,
+            data_path=data_path,
+            benchmark_time=cached_timing_benchmark()[0] if benchmark_time else None,
+        )
+        if longest_first:
+            pending = longest_first_order(job_costs)
+
+    n_jobs = min(_available_cpus() if n_jobs < 0 else n_jobs, max(len(pending), 1))
+    if verbose:
+        print(
+            f"Batch of {len(job_status)} {task} jobs, "
+            f"{len(job_status) - len(pending)} already present, {len(pending)} to run "
+            f"on {n_jobs} worker(s)."
+        )
+
+    start = time.perf_counter()
+    n_failed = 0
+    if n_jobs == 1:
+        # the jobs run in this process, so its thread limits are restored after
+        with _single_threaded():
+            for n, job in enumerate(pending):
+                job_status[job] = _run_batch_job(task, job, settings)
+                n_failed += job_status[job] != "completed"
+                if verbose:
+                    _print_batch_progress(job, n + 1, len(pending), n_failed, start)
+        _WORKER_DATASET.clear()
+    else:
+        # forking a process which has already started numba/OpenMP threads can
+        # deadlock, so workers are started from a clean server process
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context(_start_method()),
+            initializer=_init_worker,
+        ) as executor:
+            # jobs are submitted as workers become free so the order and memory
+            # budget are kept
+            queue = list(pending)
+            running = {}
+            n_done = 0
+            while len(queue) > 0 or len(running) > 0:
+                while len(queue) > 0 and len(running) < n_jobs:
+                    job = _next_job(queue, running.values(), job_costs, max_memory)
+                    if job is None:
+                        break
+                    queue.remove(job)
+                    running[executor.submit(_run_batch_job, task, job, settings)] = job
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        job_status[job] = future.result()
+                    except Exception:  # worker died i.e. killed by the OS
+                        job_status[job] = traceback.format_exc()
+                    n_done += 1
+                    n_failed += job_status[job] != "completed"
+                    if verbose:
+                        _print_batch_progress(
+                            job, n_done, len(pending), n_failed, start
+                        )
+
+    if catalogue is not None:
+        catalogue.scan()
+        catalogue.close()
+
+    return job_status
+
+
+def _available_cpus():
+    """Return the number of CPUs this process can use, respecting affinity masks."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()  # pragma: no cover
+
+
+def _next_job(queue, running, job_costs, max_memory):
+    """Return the first queued job which fits in the memory budget, if any."""
+    if max_memory is None:
+        return queue[0]
+
+    memory = [job_costs.get(job, (None, None))[1] for job in running]
+    memory_free = max_memory - sum(m for m in memory if m is not None)
+    for job in queue:
+        job_memory = job_costs.get(job, (None, None))[1]
+        if job_memory is None or job_memory <= memory_free:
+            return job
+
+    # nothing fits, run the next job alone rather than never running it
+    return queue[0] if len(memory) == 0 else None
+
+
+def _print_batch_progress(job, n_done, n_total, n_failed, start):
+    elapsed = time.perf_counter() - start
+    rate = n_done / elapsed * 3600 if elapsed > 0 else 0
+    print(
+        f"[{n_done}/{n_total}] {job[0]}/{job[1]}/{job[2]} finished. "
+        f"{n_failed} failed, {rate:.1f} jobs/hour."
+    )
+
+
+def _run_batch_job(task, job, settings):
+    """Run a single experiment job, returning its status."""
+    from tsml_eval.experiments import experiments, get_data_transform_by_name
+
+    estimator_name, dataset_name, resample_id = job
+    random_state = (
+        resample_id if settings["random_seed"] is None else settings["random_seed"]
+    )
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            if task == "forecasting":
+                from tsml_eval.experiments._get_forecaster import (
+                    get_forecaster_by_name,
+                )
+
+                experiments.load_and_run_forecasting_experiment(
+                    settings["data_path"],
+                    settings["results_path"],
+                    dataset_name,
+                    get_forecaster_by_name(
+                        estimator_name,
+                        random_state=random_state,
+                        n_jobs=1,
+                        **settings["kwargs"],
+                    ),
+                    forecaster_name=estimator_name,
+                    random_seed=random_state,
+                    write_attributes=settings["write_attributes"],
+                    att_max_shape=settings["att_max_shape"],
+                    benchmark_time=settings["benchmark_time"],
+                    overwrite=settings["overwrite"],
+                    results_catalogue=settings["results_catalogue"],
+                )
+                return "completed"
+
+            # datasets are loaded once per worker and resamples taken from indices
+            problem_path = _get_worker_dataset(
+                settings["data_path"],
+                dataset_name,
+                settings["predefined_resample"],
+                task != "regression",
+                settings["use_data_cache"],
+            )
+
+            data_transforms = get_data_transform_by_name(
+                settings["data_transform_name"],
+                row_normalise=settings["row_normalise"],
+                random_state=random_state,
+                n_jobs=1,
+            )
+            transform_cache = (
+                DataTransformCache(settings["transform_cache_path"])
+                if settings["transform_cache_path"] is not None
+                and data_transforms is not None
+                else None
+            )
+
+            if task == "classification":
+                from tsml_eval.experiments import get_classifier_by_name
+
+                experiments.load_and_run_classification_experiment(
+                    problem_path,
+                    settings["results_path"],
+                    dataset_name,
+                    get_classifier_by_name(
+                        estimator_name,
+                        random_state=random_state,
+                        n_jobs=1,
+                        **settings["kwargs"],
+                    ),
+                    classifier_name=estimator_name,
+                    resample_id=resample_id,
+                    data_transforms=data_transforms,
+                    transform_cache=transform_cache,
+                    transform_train_only=settings["transform_train_only"],
+                    build_train_file=settings["train_fold"],
+                    checkpoint_train_estimate=settings["checkpoint_train"],
+                    write_attributes=settings["write_attributes"],
+                    att_max_shape=settings["att_max_shape"],
+                    benchmark_time=settings["benchmark_time"],
+                    overwrite=settings["overwrite"],
+                    results_catalogue=settings["results_catalogue"],
+                    predefined_resample=settings["predefined_resample"],
+                    predict_max_memory=settings["predict_max_memory"],
+                    warm_up=settings["warm_up"],
+                    phase_budget=settings["phase_budget"],
+                )
+            elif task == "regression":
+                from tsml_eval.experiments import get_regressor_by_name
+
+                experiments.load_and_run_regression_experiment(
+                    problem_path,
+                    settings["results_path"],
+                    dataset_name,
+                    get_regressor_by_name(
+                        estimator_name,
+                        random_state=random_state,
+                        n_jobs=1,
+                        **settings["kwargs"],
+                    ),
+                    regressor_name=estimator_name,
+                    resample_id=resample_id,
+                    data_transforms=data_transforms,
+                    transform_cache=transform_cache,
+                    build_train_file=settings["train_fold"],
+                    checkpoint_train_estimate=settings["checkpoint_train"],
+                    write_attributes=settings["write_attributes"],
+                    att_max_shape=settings["att_max_shape"],
+                    benchmark_time=settings["benchmark_time"],
+                    overwrite=settings["overwrite"],
+                    results_catalogue=settings["results_catalogue"],
+                    predefined_resample=settings["predefined_resample"],
+                    predict_max_memory=settings["predict_max_memory"],
+                    warm_up=settings["warm_up"],
+                    phase_budget=settings["phase_budget"],
+                )
+            else:
+                from tsml_eval.experiments import get_clusterer_by_name
+
+                experiments.load_and_run_clustering_experiment(
+                    problem_path,
+                    settings["results_path"],
+                    dataset_name,
+                    get_clusterer_by_name(
+                        estimator_name,
+                        random_state=random_state,
+                        n_jobs=1,
+                        data_vars=[
+                            settings["data_path"],
+                            dataset_name,
+                            resample_id,
+                            settings["predefined_resample"],
+                        ],
+                        row_normalise=settings["row_normalise"],
+                        **settings["kwargs"],
+                    ),
+                    n_clusters=settings["n_clusters"],
+                    clusterer_name=estimator_name,
+                    resample_id=resample_id,
+                    data_transforms=data_transforms,
+                    transform_cache=transform_cache,
+                    build_test_file=settings["test_fold"],
+                    write_attributes=settings["write_attributes"],
+                    att_max_shape=settings["att_max_shape"],
+                    benchmark_time=settings["benchmark_time"],
+                    overwrite=settings["overwrite"],
+                    results_catalogue=settings["results_catalogue"],
+                    predefined_resample=settings["predefined_resample"],
+                    predict_max_memory=settings["predict_max_memory"],
+                    warm_up=settings["warm_up"],
+                    phase_budget=settings["phase_budget"],
+                )
+    except Exception:
+        return traceback.format_exc()
+
+    return "completed"
+
+
+def _get_worker_dataset(
+    data_path, dataset_name, predefined_resample, stratify, use_cache
+):
+    """Keep the most recently used dataset loaded in the worker process."""
+    key = (data_path, dataset_name, predefined_resample, stratify, use_cache)
+    if key not in _WORKER_DATASET:
+        _WORKER_DATASET.clear()
+        _WORKER_DATASET[key] = ExperimentDataset(
+            data_path,
+            dataset_name,
+            predefined_resample=predefined_resample,
+            stratify=stratify,
+            use_cache=use_cache,
+        )
+    return _WORKER_DATASET[key]
+
+
+def run_experiment(args):
+    """Run a batch of experiments from command line arguments.
+
+    See parse_batch_args for the available arguments.
+    """
+    from tsml_eval.utils.arguments import parse_batch_args
+
+    print("Input args = ", args)
+    args = parse_batch_args(args)
+
+    if args.refresh_benchmark:
+        cached_timing_benchmark(refresh=True)
+
+    if args.manifest is not None:
+        jobs = load_job_manifest(args.manifest)
+    else:
+        if (
+            args.estimator_names is None
+            or args.dataset_names is None
+            or args.resamples is None
+        ):
+            raise ValueError(
+                "Either --manifest or all of --estimator_names, --dataset_names and "
+                "--resamples must be provided."
+            )
+
+        dataset_names = (
+            args.dataset_names[0]
+            if len(args.dataset_names) == 1 and os.path.isfile(args.dataset_names[0])
+            else args.dataset_names
+        )
+        jobs = experiment_job_grid(
+            args.estimator_names,
+            dataset_names,
+            list(range(args.resamples[0], args.resamples[1])),
+        )
+
+    job_status = run_batch_experiments(
+        args.data_path,
+        args.results_path,
+        jobs,
+        task=args.task,
+        n_jobs=args.n_jobs,
+        train_fold=args.train_fold,
+        checkpoint_train=args.checkpoint_train,
+        test_fold=args.test_fold,
+        random_seed=args.random_seed,
+        data_transform_name=args.data_transform_name,
+        transform_train_only=args.transform_train_only,
+        row_normalise=args.row_normalise,
+        n_clusters=args.n_clusters,
+        write_attributes=args.write_attributes,
+        att_max_shape=args.att_max_shape,
+        benchmark_time=args.benchmark_time,
+        overwrite=args.overwrite,
+        predefined_resample=args.predefined_resample,
+        use_data_cache=args.data_cache,
+        transform_cache_path=args.transform_cache,
+        longest_first=args.longest_first,
+        max_memory=args.max_memory,
+        predict_max_memory=args.predict_max_memory,
+        warm_up=args.warm_up,
+        phase_budget=args.phase_budget,
+        dataset_sizes=args.dataset_sizes,
+        use_catalogue=args.use_catalogue,
+        kwargs=args.kwargs,
+    )
+
+    for job, status in job_status.items():
+        if status not in ("completed", "skipped"):
+            print(f"Job {job} failed:\n{status}")
+
+    return job_status
+
+
+if __name__ == "__main__":
+    """
+    Example usage, with arguments input via script.
+    """
+    print("Running batch_experiments.py main")
+    run_experiment(sys.argv[1:])
@@ -8,13 +8,20 @@ __all__ = [
     "regression_cross_validation_folds",
 ]
 
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+from sklearn.base import clone
 from sklearn.model_selection import KFold, StratifiedKFold
 
 from tsml_eval.experiments.experiments import (
     run_classification_experiment,
     run_regression_experiment,
 )
+from tsml_eval.utils.datasets import _SharedArray
+from tsml_eval.utils.experiments import _init_worker, _start_method
 
 
 def classification_cross_validation(
@@ -32,6 +39,8 @@ def classification_cross_validation(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    n_jobs=1,
+    executor=None,
 ):
     """Run a classification experiment using cross-validation.
 
@@ -72,7 +81,26 @@ def classification_cross_validation(
         todo
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    n_jobs : int, default=1
+        The number of folds to run in parallel in a pool of worker processes. Equal
+        length X is placed in shared memory once, and each fold is sent the indices
+        of its train and test cases rather than a copy of the data. The written
+        results are the same as running the folds one after another, apart from
+        timings.
+    executor : concurrent.futures.Executor or None, default=None
+        An executor to run the folds with instead of creating a process pool of
+        n_jobs workers, i.e. to share a pool between calls. Worker processes must be
+        able to attach to shared memory created by this process.
+
+    Returns
+    -------
+    report : dict
+        A throughput report for the folds run. Contains "n_folds", "n_jobs",
+        "wall_time" (seconds to run all folds), "fold_time" (total seconds spent
+        running folds in workers), "speedup" (fold_time divided by wall_time) and
+        "folds_per_hour".
     """
     if cv is None:
         cv_size = 10
@@ -96,27 +124,31 @@ def classification_cross_validation(
     else:
         fold_ids = list(range(len(folds)))
 
-    for fold, (train, test) in enumerate(folds):
-        if fold not in fold_ids:
-            continue
-
-        run_classification_experiment(
-            X[train],
-            y[train],
-            X[test],
-            y[test],
-            estimator,
-            results_path,
-            classifier_name=classifier_name,
-            dataset_name=dataset_name,
-            resample_id=fold,
-            build_test_file=build_test_file,
-            build_train_file=build_train_file,
-            ignore_custom_train_estimate=ignore_custom_train_estimate,
-            attribute_file_path=attribute_file_path,
-            att_max_shape=att_max_shape,
-            benchmark_time=benchmark_time,
-        )
+    return _run_folds(
+        run_classification_experiment,
+        "classifier",
+        X,
+        y,
+        [
+            (fold, train, test)
+            for fold, (train, test) in enumerate(folds)
+            if fold in fold_ids
+        ],
+        {
+            "classifier": estimator,
+            "results_path": results_path,
+            "classifier_name": classifier_name,
+            "dataset_name": dataset_name,
+            "build_test_file": build_test_file,
+            "build_train_file": build_train_file,
+            "ignore_custom_train_estimate": ignore_custom_train_estimate,
+            "attribute_file_path": attribute_file_path,
+            "att_max_shape": att_max_shape,
+            "benchmark_time": benchmark_time,
+        },
+        n_jobs,
+        executor,
+    )
 
 
 def classification_cross_validation_folds(X, y, cv=None):
@@ -161,6 +193,8 @@ def regression_cross_validation(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    n_jobs=1,
+    executor=None,
 ):
     """Run a regression experiment using cross-validation.
 
@@ -201,7 +235,26 @@ def regression_cross_validation(
         todo
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    n_jobs : int, default=1
+        The number of folds to run in parallel in a pool of worker processes. Equal
+        length X is placed in shared memory once, and each fold is sent the indices
+        of its train and test cases rather than a copy of the data. The written
+        results are the same as running the folds one after another, apart from
+        timings.
+    executor : concurrent.futures.Executor or None, default=None
+        An executor to run the folds with instead of creating a process pool of
+        n_jobs workers, i.e. to share a pool between calls. Worker processes must be
+        able to attach to shared memory created by this process.
+
+    Returns
+    -------
+    report : dict
+        A throughput report for the folds run. Contains "n_folds", "n_jobs",
+        "wall_time" (seconds to run all folds), "fold_time" (total seconds spent
+        running folds in workers), "speedup" (fold_time divided by wall_time) and
+        "folds_per_hour".
     """
     if cv is None:
         cv = KFold(n_splits=10, shuffle=True, random_state=0)
@@ -215,27 +268,31 @@ def regression_cross_validation(
     else:
         fold_ids = list(range(len(folds)))
 
-    for fold, (train, test) in enumerate(folds):
-        if fold not in fold_ids:
-            continue
-
-        run_regression_experiment(
-            X[train],
-            y[train],
-            X[test],
-            y[test],
-            estimator,
-            results_path,
-            regressor_name=regressor_name,
-            dataset_name=dataset_name,
-            resample_id=fold,
-            build_test_file=build_test_file,
-            build_train_file=build_train_file,
-            ignore_custom_train_estimate=ignore_custom_train_estimate,
-            attribute_file_path=attribute_file_path,
-            att_max_shape=att_max_shape,
-            benchmark_time=benchmark_time,
-        )
+    return _run_folds(
+        run_regression_experiment,
+        "regressor",
+        X,
+        y,
+        [
+            (fold, train, test)
+            for fold, (train, test) in enumerate(folds)
+            if fold in fold_ids
+        ],
+        {
+            "regressor": estimator,
+            "results_path": results_path,
+            "regressor_name": regressor_name,
+            "dataset_name": dataset_name,
+            "build_test_file": build_test_file,
+            "build_train_file": build_train_file,
+            "ignore_custom_train_estimate": ignore_custom_train_estimate,
+            "attribute_file_path": attribute_file_path,
+            "att_max_shape": att_max_shape,
+            "benchmark_time": benchmark_time,
+        },
+        n_jobs,
+        executor,
+    )
 
 
 def regression_cross_validation_folds(X, y, cv=None):
@@ -253,3 +310,79 @@ def regression_cross_validation_folds(X, y, cv=None):
     if cv is None:
         cv = KFold(n_splits=10, shuffle=True, random_state=0)
     return list(cv.split(X, y))
+
+
+def _run_folds(run, estimator_param, X, y, folds, kwargs, n_jobs, executor):
+    """Run the experiment for each fold, in parallel if n_jobs > 1 or an executor.
+
+    Each fold is run with a clone of the estimator in kwargs[estimator_param]. Returns
+    a throughput report, see classification_cross_validation.
+    """
+    start = time.perf_counter()
+    fold_kwargs = [
+        {**kwargs, estimator_param: clone(kwargs[estimator_param])} for _ in folds
+    ]
+
+    if executor is None and n_jobs <= 1:
+        fold_times = [
+            _run_fold(run, X, y, fold, train, test, kwargs)
+            for (fold, train, test), kwargs in zip(folds, fold_kwargs)
+        ]
+    else:
+        data = _SharedArray.from_array(X) if isinstance(X, np.ndarray) else X
+        try:
+            if executor is None:
+                # forking a process which has already started numba/OpenMP threads
+                # can deadlock, so workers are started from a clean server process
+                with ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    mp_context=multiprocessing.get_context(_start_method()),
+                    initializer=_init_worker,
+                ) as pool:
+                    fold_times = _submit_folds(pool, run, data, y, folds, fold_kwargs)
+            else:
+                fold_times = _submit_folds(executor, run, data, y, folds, fold_kwargs)
+        finally:
+            if isinstance(data, _SharedArray):
+                data.close()
+
+    wall_time = time.perf_counter() - start
+    fold_time = sum(fold_times)
+    return {
+        "n_folds": len(folds),
+        "n_jobs": n_jobs if executor is None else -1,
+        "wall_time": wall_time,
+        "fold_time": fold_time,
+        "speedup": fold_time / wall_time if wall_time > 0 else 0,
+        "folds_per_hour": len(folds) / wall_time * 3600 if wall_time > 0 else 0,
+    }
+
+
+def _submit_folds(executor, run, data, y, folds, fold_kwargs):
+    futures = [
+        executor.submit(_run_fold, run, data, y, fold, train, test, kwargs)
+        for (fold, train, test), kwargs in zip(folds, fold_kwargs)
+    ]
+    return [future.result() for future in futures]
+
+
+def _run_fold(run, X, y, fold, train, test, kwargs):
+    """Run the experiment for a fold, returning the time taken in seconds."""
+    shared = None
+    if isinstance(X, _SharedArray):
+        shared, X = X, X.array
+
+    try:
+        start = time.perf_counter()
+        if isinstance(X, np.ndarray):
+            X_train, X_test = X[train], X[test]
+        else:
+            X_train, X_test = [X[i] for i in train], [X[i] for i in test]
+
+        run(X_train, y[train], X_test, y[test], resample_id=fold, **kwargs)
+        return time.perf_counter() - start
+    finally:
+        # detach from the block in worker processes, the creator unlinks it
+        if shared is not None and not shared._owner:
+            X = None
+            shared.close()
@@ -12,46 +12,46 @@ __all__ = [
     "run_classification_experiment",
     "load_and_run_clustering_experiment",
     "run_forecasting_experiment",
+    "run_rolling_origin_forecasting_experiment",
     "load_and_run_forecasting_experiment",
 ]
 
+import hashlib
 import os
+import shutil
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
 from aeon.benchmarking.metrics.clustering import clustering_accuracy_score
-from aeon.classification import BaseClassifier
-from aeon.clustering import BaseClusterer
-from aeon.forecasting import BaseForecaster
-from aeon.regression.base import BaseRegressor
-from aeon.utils.validation import get_n_cases
+from aeon.utils.validation import check_n_jobs, get_n_cases
+from joblib import Parallel, delayed
 from sklearn import preprocessing
-from sklearn.base import BaseEstimator, is_classifier, is_regressor
+from sklearn.base import BaseEstimator, clone, is_classifier, is_regressor
 from sklearn.metrics import (
     accuracy_score,
     mean_absolute_percentage_error,
     mean_squared_error,
 )
-from sklearn.model_selection import cross_val_predict
+from sklearn.model_selection import check_cv
 from tsml.base import BaseTimeSeriesEstimator
 from tsml.utils.validation import is_clusterer
 
-from tsml_eval.estimators import (
-    SklearnToTsmlClassifier,
-    SklearnToTsmlClusterer,
-    SklearnToTsmlRegressor,
-)
-from tsml_eval.utils.datasets import load_experiment_data
+from tsml_eval.experiments._get_classifier import get_classifier_by_name
+from tsml_eval.experiments._get_clusterer import get_clusterer_by_name
+from tsml_eval.experiments._get_regressor import get_regressor_by_name
+from tsml_eval.utils.datasets import ExperimentDataset, load_experiment_data
 from tsml_eval.utils.experiments import (
     _check_existing_results,
+    cached_timing_benchmark,
     estimator_attributes_to_file,
-    timing_benchmark,
 )
 from tsml_eval.utils.memory_recorder import record_max_memory
+from tsml_eval.utils.profiling import ExperimentProfiler, profile_path
 from tsml_eval.utils.resampling import resample_data, stratified_resample_data
 from tsml_eval.utils.results_writing import (
     write_classification_results,
@@ -59,12 +59,24 @@ from tsml_eval.utils.results_writing import (
     write_forecasting_results,
     write_regression_results,
 )
+from tsml_eval.utils.telemetry import ExperimentTelemetry, telemetry_file_path
+from tsml_eval.utils.watchdog import run_with_watchdog, write_timeout_marker
 
 MEMRECORD_ENV = os.getenv("MEMRECORD_INTERVAL")
 if isinstance(MEMRECORD_ENV, str):  # pragma: no cover
     MEMRECORD_INTERVAL = float(MEMRECORD_ENV)
 else:
-    MEMRECORD_INTERVAL = 5.0
+    # the recorder returns as soon as the function finishes, so a short interval
+    # only costs the sampling itself
+    MEMRECORD_INTERVAL = 0.05
+
+# one of "sampling", "ru_maxrss" or "tracemalloc", see record_max_memory
+MEMRECORD_METHOD = os.getenv("MEMRECORD_METHOD", "sampling")
+
+# the number of cases predicted to estimate the memory usage per case when
+# predicting in chunks, see _chunked_predict
+_PREDICT_PROBE_SIZE = 16
+_WARM_UP_SIZE = 10
 
 
 def run_classification_experiment(
@@ -85,6 +97,13 @@ def run_classification_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    n_jobs=1,
+    checkpoint_train_estimate=False,
+    transform_cache=None,
+    predict_max_memory=None,
+    telemetry=None,
+    profile=False,
+    warm_up=False,
 ):
     """Run a classification experiment and save the results to file.
 
@@ -123,6 +142,9 @@ def run_classification_experiment(
         If a list, the transformers are applied in order.
         If None, no transformation is applied.
         Calls fit_transform on the training data and transform on the test data.
+    transform_cache : DataTransformCache or None, default=None
+        A cache to load the output of the data_transforms from, or store it in if
+        not present. See tsml_eval.utils.data_transform_cache.DataTransformCache.
     transform_train_only : bool, default=False
         if True, the data_transforms are limited to the training data only.
     build_test_file : bool, default=True:
@@ -140,7 +162,43 @@ def run_classification_experiment(
         todo
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    n_jobs : int, default=1
+        The number of jobs available to the experiment. When estimating the train
+        data using cross-validation, folds are run in parallel and each fold
+        estimator's n_jobs parameter, if present, receives an even share of the
+        remaining jobs. If the folds are not run in parallel, the estimator's own
+        n_jobs is kept. -1 uses all available CPUs.
+    checkpoint_train_estimate : bool, default=False
+        Whether to save the output of each cross-validation fold used to estimate
+        the train data to the Workspace directory of the results path. If the
+        experiment is restarted only the missing folds are run. The saved folds are
+        deleted once the train file is written.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for predicting the test data. If not None, the
+        data is streamed through the classifier in chunks sized so each chunk fits in
+        the budget, using the memory usage per case of predicting a small first
+        chunk. The written predict time is the total across all chunks. If None,
+        the data is predicted at once.
+    telemetry : ExperimentTelemetry or None, default=None
+        Records the wall time, CPU time and memory usage of each phase of the
+        experiment, i.e. data transforms, fit, predict and results writing, which are
+        written to a JSON file alongside the predictions (see
+        tsml_eval.utils.telemetry). An ExperimentTelemetry can be passed to include
+        phases recorded before the experiment, such as data loading. If None, a new
+        one is created.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases with cProfile and a call stack
+        sampler. The profiles are written to the Workspace directory of the results
+        path (see tsml_eval.utils.profiling). Profiling slows down the profiled
+        code, so increases the written fit and predict times.
+    warm_up : bool, default=False
+        Whether to fit and predict a clone of the classifier on a few training cases
+        before the timed fit (and train estimate), so just-in-time compilation of
+        numba functions is not included in the fit time. The time taken is written
+        as a separate compile time field at the end of the third line of the
+        results files.
     """
     if not build_test_file and not build_train_file:
         raise ValueError(
@@ -151,6 +209,15 @@ def run_classification_experiment(
     if classifier_name is None:
         classifier_name = type(classifier).__name__
 
+    if telemetry is None:
+        telemetry = ExperimentTelemetry()
+    profiler = ExperimentProfiler(enabled=profile)
+
+    # imported here so the package imports quickly for short experiment processes
+    from aeon.classification import BaseClassifier
+
+    from tsml_eval.estimators import SklearnToTsmlClassifier
+
     use_fit_predict = False
     if isinstance(classifier, BaseClassifier):
         if not ignore_custom_train_estimate and classifier.get_tag(
@@ -172,38 +239,24 @@ def run_classification_experiment(
     else:
         raise TypeError("classifier must be a tsml, aeon or sklearn classifier.")
 
-    n_cases_test = get_n_cases(X_test)
     if data_transforms is not None:
-        if not isinstance(data_transforms, list):
-            data_transforms = [data_transforms]
-
-        for transform in data_transforms:
-            transform_results = transform.fit_transform(X_train, y_train)
-            if isinstance(transform_results, tuple) and len(transform_results) == 2:
-                # If the transformer returns a tuple of length 2, assume it is (X, y)
-                X_train, y_train = transform_results
-            else:
-                X_train = transform_results
-
-            if not transform_train_only:
-                transform_results = transform.transform(X_test, y_test)
-                if isinstance(transform_results, tuple) and len(transform_results) == 2:
-                    X_test, y_test = transform_results
-                else:
-                    X_test = transform_results
-
-                # If we have edited the number of cases in test something has gone
-                # wrong i.e. we have applied SMOTE to the test set
-                new_n_cases_test = get_n_cases(X_test)
-                assert new_n_cases_test == n_cases_test, (
-                    f"Error: X_test sample size changed from {n_cases_test} to "
-                    f"{new_n_cases_test} after transformation "
-                    f"{transform.__class__.__name__}"
-                )
+        X_train, y_train, X_test, y_test = _transform_data(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            not transform_train_only,
+            transform_cache,
+            dataset_name,
+            resample_id,
+            telemetry=telemetry,
+        )
 
-    le = preprocessing.LabelEncoder()
-    y_train = le.fit_transform(y_train)
-    y_test = le.transform(y_test)
+    with telemetry.phase("label_encoding"):
+        le = preprocessing.LabelEncoder()
+        y_train = le.fit_transform(y_train)
+        y_test = le.transform(y_test)
 
     encoder_dict = {label: i for i, label in enumerate(le.classes_)}
     n_classes = len(np.unique(y_train))
@@ -212,120 +265,179 @@ def run_classification_experiment(
     fit_time = -1
     mem_usage = -1
     benchmark = -1
+    benchmark_cached = False
     train_time = -1
     fit_and_train_time = -1
 
     if benchmark_time:
-        benchmark = timing_benchmark(random_state=resample_id)
+        with telemetry.phase("benchmark"):
+            benchmark, benchmark_cached = cached_timing_benchmark()
+
+    compile_time = -1
+    if warm_up:
+        with telemetry.phase("warm_up"):
+            compile_time = _jit_warm_up(classifier, X_train, y_train, ["predict_proba"])
 
     first_comment = (
         "Generated by run_classification_experiment on "
         f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}. "
-        f"Encoder dictionary: {str(encoder_dict)}"
+        f"Encoder dictionary: {str(encoder_dict)}. "
+        f"Memory usage method: {MEMRECORD_METHOD}. "
+        f"Benchmark time cached: {benchmark_cached}"
     )
 
     second = str(classifier.get_params()).replace("\n", " ").replace("\r", " ")
 
     if build_train_file:
+        train_comment = first_comment
+        checkpoint_path = None
         cv_size = 10
-        start = int(round(time.time() * 1000))
-        if use_fit_predict:
-            train_probs = classifier.fit_predict_proba(X_train, y_train)
-            needs_fit = False
-            fit_and_train_time = int(round(time.time() * 1000)) - start
-        else:
-            _, counts = np.unique(y_train, return_counts=True)
-            min_class = max(2, np.min(counts))
-            if min_class < cv_size:
-                cv_size = min_class
+        with telemetry.phase("train_estimate"):
+            start = int(round(time.time() * 1000))
+            if use_fit_predict:
+                train_probs = classifier.fit_predict_proba(X_train, y_train)
+                needs_fit = False
+                fit_and_train_time = int(round(time.time() * 1000)) - start
+            else:
+                _, counts = np.unique(y_train, return_counts=True)
+                min_class = max(2, np.min(counts))
+                if min_class < cv_size:
+                    cv_size = min_class
 
-            train_probs = cross_val_predict(
-                classifier, X_train, y=y_train, cv=cv_size, method="predict_proba"
-            )
-            train_time = int(round(time.time() * 1000)) - start
+                if checkpoint_train_estimate:
+                    checkpoint_path = (
+                        f"{results_path}/{classifier_name}/Workspace/{dataset_name}/"
+                        f"trainEstimateResample{resample_id}/"
+                    )
 
-        train_preds = np.unique(y_train)[np.argmax(train_probs, axis=1)]
-        train_acc = accuracy_score(y_train, train_preds)
+                (
+                    train_probs,
+                    train_time,
+                    fold_fit_times,
+                    fold_mem_usage,
+                ) = _cross_validate_train_data(
+                    classifier,
+                    X_train,
+                    y_train,
+                    cv_size,
+                    "predict_proba",
+                    n_jobs,
+                    checkpoint_path=checkpoint_path,
+                )
+                train_comment = (
+                    f"{first_comment}. Fold fit times: {fold_fit_times}. "
+                    f"Fold memory usage: {fold_mem_usage}"
+                )
 
-        write_classification_results(
-            train_preds,
-            train_probs,
-            y_train,
-            classifier_name,
-            dataset_name,
-            results_path,
-            full_path=False,
-            first_line_classifier_name=(
-                f"{classifier_name} ({type(classifier).__name__})"
-            ),
-            split="TRAIN",
-            resample_id=resample_id,
-            time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
-            parameter_info=second,
-            accuracy=train_acc,
-            fit_time=fit_time,
-            predict_time=-1,
-            benchmark_time=benchmark,
-            memory_usage=mem_usage,
-            n_classes=n_classes,
-            train_estimate_method="Custom" if use_fit_predict else f"{cv_size}F-CV",
-            train_estimate_time=train_time,
-            fit_and_estimate_time=fit_and_train_time,
-        )
+        with telemetry.phase("metrics", detail="train"):
+            train_preds = np.unique(y_train)[np.argmax(train_probs, axis=1)]
+            train_acc = accuracy_score(y_train, train_preds)
+
+        with telemetry.phase("results_writing", detail="train"):
+            write_classification_results(
+                train_preds,
+                train_probs,
+                y_train,
+                classifier_name,
+                dataset_name,
+                results_path,
+                full_path=False,
+                first_line_classifier_name=(
+                    f"{classifier_name} ({type(classifier).__name__})"
+                ),
+                split="TRAIN",
+                resample_id=resample_id,
+                time_unit="MILLISECONDS",
+                first_line_comment=train_comment,
+                parameter_info=second,
+                accuracy=train_acc,
+                fit_time=fit_time,
+                predict_time=-1,
+                benchmark_time=benchmark,
+                memory_usage=mem_usage,
+                n_classes=n_classes,
+                train_estimate_method="Custom" if use_fit_predict else f"{cv_size}F-CV",
+                train_estimate_time=train_time,
+                fit_and_estimate_time=fit_and_train_time,
+                compile_time=compile_time,
+            )
+
+        # the train file is written, so the saved folds are no longer needed
+        if checkpoint_path is not None:
+            shutil.rmtree(checkpoint_path, ignore_errors=True)
 
     if build_test_file:
         if needs_fit:
-            mem_usage, fit_time = record_max_memory(
-                classifier.fit,
-                args=(X_train, y_train),
-                interval=MEMRECORD_INTERVAL,
-                return_func_time=True,
-            )
-            fit_time += int(round(getattr(classifier, "_fit_time_milli", 0)))
+            with telemetry.phase("fit"), profiler.phase("fit"):
+                mem_usage, fit_time = record_max_memory(
+                    classifier.fit,
+                    args=(X_train, y_train),
+                    interval=MEMRECORD_INTERVAL,
+                    method=MEMRECORD_METHOD,
+                    return_func_time=True,
+                )
+                fit_time += int(round(getattr(classifier, "_fit_time_milli", 0)))
 
         if attribute_file_path is not None:
-            estimator_attributes_to_file(
-                classifier, attribute_file_path, max_list_shape=att_max_shape
-            )
+            with telemetry.phase("attribute_writing"):
+                estimator_attributes_to_file(
+                    classifier, attribute_file_path, max_list_shape=att_max_shape
+                )
 
-        start = int(round(time.time() * 1000))
-        test_probs = classifier.predict_proba(X_test)
-        test_time = (
-            int(round(time.time() * 1000))
-            - start
-            + int(round(getattr(classifier, "_predict_time_milli", 0)))
-        )
+        with telemetry.phase("predict"), profiler.phase("predict"):
+            start = int(round(time.time() * 1000))
+            test_probs = _chunked_predict(
+                classifier.predict_proba, X_test, predict_max_memory
+            )
+            test_time = (
+                int(round(time.time() * 1000))
+                - start
+                + int(round(getattr(classifier, "_predict_time_milli", 0)))
+            )
 
-        test_preds = classifier.classes_[np.argmax(test_probs, axis=1)]
-        test_acc = accuracy_score(y_test, test_preds)
+        with telemetry.phase("metrics", detail="test"):
+            test_preds = classifier.classes_[np.argmax(test_probs, axis=1)]
+            test_acc = accuracy_score(y_test, test_preds)
+
+        with telemetry.phase("results_writing", detail="test"):
+            write_classification_results(
+                test_preds,
+                test_probs,
+                y_test,
+                classifier_name,
+                dataset_name,
+                results_path,
+                full_path=False,
+                first_line_classifier_name=(
+                    f"{classifier_name} ({type(classifier).__name__})"
+                ),
+                split="TEST",
+                resample_id=resample_id,
+                time_unit="MILLISECONDS",
+                first_line_comment=first_comment,
+                parameter_info=second,
+                accuracy=test_acc,
+                fit_time=fit_time,
+                predict_time=test_time,
+                benchmark_time=benchmark,
+                memory_usage=mem_usage,
+                n_classes=n_classes,
+                train_estimate_method="N/A",
+                train_estimate_time=-1,
+                fit_and_estimate_time=fit_and_train_time,
+                compile_time=compile_time,
+            )
 
-        write_classification_results(
-            test_preds,
-            test_probs,
-            y_test,
-            classifier_name,
-            dataset_name,
-            results_path,
-            full_path=False,
-            first_line_classifier_name=(
-                f"{classifier_name} ({type(classifier).__name__})"
-            ),
-            split="TEST",
-            resample_id=resample_id,
-            time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
-            parameter_info=second,
-            accuracy=test_acc,
-            fit_time=fit_time,
-            predict_time=test_time,
-            benchmark_time=benchmark,
-            memory_usage=mem_usage,
-            n_classes=n_classes,
-            train_estimate_method="N/A",
-            train_estimate_time=-1,
-            fit_and_estimate_time=fit_and_train_time,
-        )
+    profiler.write(
+        profile_path(results_path, classifier_name, dataset_name, resample_id)
+    )
+    telemetry.write(
+        telemetry_file_path(results_path, classifier_name, dataset_name, resample_id),
+        task="classification",
+        estimator_name=classifier_name,
+        dataset_name=dataset_name,
+        resample_id=resample_id,
+    )
 
 
 def load_and_run_classification_experiment(
@@ -343,6 +455,15 @@ def load_and_run_classification_experiment(
     benchmark_time=True,
     overwrite=False,
     predefined_resample=False,
+    n_jobs=1,
+    checkpoint_train_estimate=False,
+    transform_cache=None,
+    concurrent_estimators=False,
+    predict_max_memory=None,
+    profile=False,
+    warm_up=False,
+    phase_budget=None,
+    results_catalogue=None,
 ):
     """Load a dataset and run a classification experiment.
 
@@ -352,18 +473,26 @@ def load_and_run_classification_experiment(
 
     Parameters
     ----------
-    problem_path : str
-        Location of problem files, full path.
+    problem_path : str or ExperimentDataset
+        Location of problem files, full path. An ExperimentDataset can be passed
+        instead to take the resample from data which has already been loaded, in which
+        case predefined_resample is ignored.
     results_path : str
         Location of where to write results. Any required directories will be created.
     dataset : str
         Name of problem. Files must be <problem_path>/<dataset>/<dataset>+"_TRAIN.ts",
         same for "_TEST.ts".
-    classifier : BaseClassifier
-        Classifier to be used in the experiment.
-    classifier_name : str or None, default=None
+    classifier : BaseClassifier, str or list
+        Classifier to be used in the experiment. A str is used to create the
+        classifier using get_classifier_by_name with the resample_id as the
+        random_state. If a list of classifiers and/or names, the data is loaded,
+        resampled and transformed once and each classifier is run on it in turn,
+        writing results under its own name. Classifiers with existing results are
+        skipped unless overwrite is True.
+    classifier_name : str, list of str or None, default=None
         Name of classifier used in writing results. If None, the name is taken from
-        the classifier.
+        the classifier, or is the classifier str. If a list, must be the same length
+        as the classifier list.
     resample_id : int, default=0
         Seed for resampling. If set to 0, the default train/test split from file is
         used. Also used in output file name.
@@ -372,6 +501,9 @@ def load_and_run_classification_experiment(
         If a list, the transformers are applied in order.
         If None, no transformation is applied.
         Calls fit_transform on the training data and transform on the test data.
+    transform_cache : DataTransformCache or None, default=None
+        A cache to load the output of the data_transforms from, or store it in if
+        not present. See tsml_eval.utils.data_transform_cache.DataTransformCache.
     transform_train_only : bool, default=False
         if the data_transforms are limited to the training data only.
     build_train_file : bool, default=False
@@ -380,7 +512,8 @@ def load_and_run_classification_experiment(
         own estimates, those are used instead.
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
     overwrite : bool, default=False
         If set to False, this will only build results if there is not a result file
         already present. If True, it will overwrite anything already there.
@@ -388,56 +521,159 @@ def load_and_run_classification_experiment(
         Read a predefined resample from file instead of performing a resample. If True
         the file format must include the resample_id at the end of the dataset name i.e.
         <problem_path>/<dataset>/<dataset>+<resample_id>+"_TRAIN.ts".
+    n_jobs : int, default=1
+        The number of jobs available to the experiment. Used to run the folds of the
+        train data cross-validation in parallel, see run_classification_experiment.
+    checkpoint_train_estimate : bool, default=False
+        Whether to save the output of each train data cross-validation fold so a
+        restarted experiment only runs the missing folds, see
+        run_classification_experiment.
+    concurrent_estimators : bool, default=False
+        If True and multiple estimators are input, run the estimators concurrently
+        in threads. The n_jobs budget is split between the concurrently running
+        estimators, i.e. 8 jobs and 4 estimators runs 4 estimators with 2 jobs each.
+        Memory usage is recorded for the whole process, so the recorded memory of
+        concurrently run estimators includes the others running at the same time.
+        If False, estimators are run in sequence, each using all n_jobs.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for predicting the test data in chunks, see
+        run_classification_experiment.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases, see
+        run_classification_experiment.
+    warm_up : bool, default=False
+        Whether to compile JIT code before the timed fit, see
+        run_classification_experiment.
+    phase_budget : float, dict or None, default=None
+        A wall-clock budget in seconds for each telemetry phase of the experiment,
+        i.e. "data_loading", "fit", "predict" and "results_writing". A float applies
+        to every phase. If not None, the experiment is run in a child process which
+        is killed as soon as a phase exceeds its budget, and a timeout marker file is
+        written in place of each results file which was not written (see
+        tsml_eval.utils.watchdog). A dict maps phase names to budgets, and phases
+        not in the dict have no budget.
+    results_catalogue : ResultsCatalogue or None, default=None
+        A catalogue of results_path (see tsml_eval.utils.results_catalogue) used to
+        find existing results files without checking for each file. Results missing
+        from the catalogue are still checked for on disk.
     """
-    if classifier_name is None:
-        classifier_name = type(classifier).__name__
+    jobs = []
+    for estimator, name in _experiment_estimators(classifier, classifier_name):
+        build_test, build_train = _check_existing_results(
+            results_path,
+            name,
+            dataset,
+            resample_id,
+            overwrite,
+            True,
+            build_train_file,
+            catalogue=results_catalogue,
+        )
+        if build_test or build_train:
+            jobs.append((estimator, name, build_test, build_train))
 
-    build_test_file, build_train_file = _check_existing_results(
-        results_path,
-        classifier_name,
+    if len(jobs) == 0:
+        warnings.warn("All files exist and not overwriting, skipping.", stacklevel=1)
+        return
+
+    if phase_budget is not None:
+        _run_with_phase_budget(
+            load_and_run_classification_experiment,
+            dict(
+                problem_path=problem_path,
+                results_path=results_path,
+                dataset=dataset,
+                classifier=classifier,
+                classifier_name=classifier_name,
+                resample_id=resample_id,
+                data_transforms=data_transforms,
+                transform_train_only=transform_train_only,
+                build_train_file=build_train_file,
+                write_attributes=write_attributes,
+                att_max_shape=att_max_shape,
+                benchmark_time=benchmark_time,
+                overwrite=overwrite,
+                predefined_resample=predefined_resample,
+                n_jobs=n_jobs,
+                checkpoint_train_estimate=checkpoint_train_estimate,
+                transform_cache=transform_cache,
+                concurrent_estimators=concurrent_estimators,
+                predict_max_memory=predict_max_memory,
+                profile=profile,
+                warm_up=warm_up,
+            ),
+            phase_budget,
+            results_path,
+            dataset,
+            resample_id,
+            jobs,
+        )
+        return
+
+    telemetry = ExperimentTelemetry()
+    X_train, y_train, X_test, y_test = _load_experiment_resample(
+        problem_path,
         dataset,
         resample_id,
-        overwrite,
+        predefined_resample,
         True,
-        build_train_file,
+        telemetry=telemetry,
     )
 
-    if not build_test_file and not build_train_file:
-        warnings.warn("All files exist and not overwriting, skipping.", stacklevel=1)
-        return
+    # transform the data once for all estimators rather than once each
+    if len(jobs) > 1 and data_transforms is not None:
+        X_train, y_train, X_test, y_test = _transform_data(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            not transform_train_only,
+            transform_cache,
+            dataset,
+            resample_id,
+            telemetry=telemetry,
+        )
+        data_transforms = None
 
-    X_train, y_train, X_test, y_test, resample = load_experiment_data(
-        problem_path, dataset, resample_id, predefined_resample
-    )
+    def run(estimator, name, build_test, build_train, estimator_n_jobs):
+        if isinstance(estimator, str):
+            estimator = get_classifier_by_name(
+                estimator, random_state=resample_id, n_jobs=estimator_n_jobs
+            )
 
-    if resample:
-        X_train, y_train, X_test, y_test = stratified_resample_data(
-            X_train, y_train, X_test, y_test, random_state=resample_id
-        )
+        if write_attributes:
+            attribute_file_path = f"{results_path}/{name}/Workspace/{dataset}/"
+        else:
+            attribute_file_path = None
 
-    if write_attributes:
-        attribute_file_path = f"{results_path}/{classifier_name}/Workspace/{dataset}/"
-    else:
-        attribute_file_path = None
+        run_classification_experiment(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            estimator,
+            results_path,
+            classifier_name=name,
+            dataset_name=dataset,
+            resample_id=resample_id,
+            data_transforms=data_transforms,
+            transform_cache=transform_cache,
+            transform_train_only=transform_train_only,
+            build_test_file=build_test,
+            build_train_file=build_train,
+            attribute_file_path=attribute_file_path,
+            att_max_shape=att_max_shape,
+            benchmark_time=benchmark_time,
+            predict_max_memory=predict_max_memory,
+            telemetry=telemetry.copy(),
+            profile=profile,
+            warm_up=warm_up,
+            n_jobs=estimator_n_jobs,
+            checkpoint_train_estimate=checkpoint_train_estimate,
+        )
 
-    run_classification_experiment(
-        X_train,
-        y_train,
-        X_test,
-        y_test,
-        classifier,
-        results_path,
-        classifier_name=classifier_name,
-        dataset_name=dataset,
-        resample_id=resample_id,
-        data_transforms=data_transforms,
-        transform_train_only=transform_train_only,
-        build_test_file=build_test_file,
-        build_train_file=build_train_file,
-        attribute_file_path=attribute_file_path,
-        att_max_shape=att_max_shape,
-        benchmark_time=benchmark_time,
-    )
+    _run_estimator_jobs(jobs, run, n_jobs, concurrent_estimators)
 
 
 def run_regression_experiment(
@@ -457,6 +693,13 @@ def run_regression_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    n_jobs=1,
+    checkpoint_train_estimate=False,
+    transform_cache=None,
+    predict_max_memory=None,
+    telemetry=None,
+    profile=False,
+    warm_up=False,
 ):
     """Run a regression experiment and save the results to file.
 
@@ -495,6 +738,9 @@ def run_regression_experiment(
         If a list, the transformers are applied in order.
         If None, no transformation is applied.
         Calls fit_transform on the training data and transform on the test data.
+    transform_cache : DataTransformCache or None, default=None
+        A cache to load the output of the data_transforms from, or store it in if
+        not present. See tsml_eval.utils.data_transform_cache.DataTransformCache.
     build_test_file : bool, default=True:
         Whether to generate test files or not. If the regressor can generate its own
         train predictions, the classifier will be built but no file will be output.
@@ -510,7 +756,43 @@ def run_regression_experiment(
         todo
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    n_jobs : int, default=1
+        The number of jobs available to the experiment. When estimating the train
+        data using cross-validation, folds are run in parallel and each fold
+        estimator's n_jobs parameter, if present, receives an even share of the
+        remaining jobs. If the folds are not run in parallel, the estimator's own
+        n_jobs is kept. -1 uses all available CPUs.
+    checkpoint_train_estimate : bool, default=False
+        Whether to save the output of each cross-validation fold used to estimate
+        the train data to the Workspace directory of the results path. If the
+        experiment is restarted only the missing folds are run. The saved folds are
+        deleted once the train file is written.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for predicting the test data. If not None, the
+        data is streamed through the regressor in chunks sized so each chunk fits in
+        the budget, using the memory usage per case of predicting a small first
+        chunk. The written predict time is the total across all chunks. If None,
+        the data is predicted at once.
+    telemetry : ExperimentTelemetry or None, default=None
+        Records the wall time, CPU time and memory usage of each phase of the
+        experiment, i.e. data transforms, fit, predict and results writing, which are
+        written to a JSON file alongside the predictions (see
+        tsml_eval.utils.telemetry). An ExperimentTelemetry can be passed to include
+        phases recorded before the experiment, such as data loading. If None, a new
+        one is created.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases with cProfile and a call stack
+        sampler. The profiles are written to the Workspace directory of the results
+        path (see tsml_eval.utils.profiling). Profiling slows down the profiled
+        code, so increases the written fit and predict times.
+    warm_up : bool, default=False
+        Whether to fit and predict a clone of the regressor on a few training cases
+        before the timed fit (and train estimate), so just-in-time compilation of
+        numba functions is not included in the fit time. The time taken is written
+        as a separate compile time field at the end of the third line of the
+        results files.
     """
     if not build_test_file and not build_train_file:
         raise ValueError(
@@ -521,6 +803,15 @@ def run_regression_experiment(
     if regressor_name is None:
         regressor_name = type(regressor).__name__
 
+    if telemetry is None:
+        telemetry = ExperimentTelemetry()
+    profiler = ExperimentProfiler(enabled=profile)
+
+    # imported here so the package imports quickly for short experiment processes
+    from aeon.regression.base import BaseRegressor
+
+    from tsml_eval.estimators import SklearnToTsmlRegressor
+
     use_fit_predict = False
     if isinstance(regressor, BaseRegressor):
         if not ignore_custom_train_estimate and regressor.get_tag(
@@ -543,111 +834,182 @@ def run_regression_experiment(
         raise TypeError("regressor must be a tsml, aeon or sklearn regressor.")
 
     if data_transforms is not None:
-        if not isinstance(data_transforms, list):
-            data_transforms = [data_transforms]
-
-        for transform in data_transforms:
-            X_train = transform.fit_transform(X_train, y_train)
-            X_test = transform.transform(X_test, y_test)
+        X_train, y_train, X_test, y_test = _transform_data(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            True,
+            transform_cache,
+            dataset_name,
+            resample_id,
+            telemetry=telemetry,
+        )
 
     needs_fit = True
     fit_time = -1
     mem_usage = -1
     benchmark = -1
+    benchmark_cached = False
     train_time = -1
     fit_and_train_time = -1
 
     if benchmark_time:
-        benchmark = timing_benchmark(random_state=resample_id)
+        with telemetry.phase("benchmark"):
+            benchmark, benchmark_cached = cached_timing_benchmark()
+
+    compile_time = -1
+    if warm_up:
+        with telemetry.phase("warm_up"):
+            compile_time = _jit_warm_up(
+                regressor, X_train, y_train, ["predict"], stratify=False
+            )
 
     first_comment = (
         "Generated by run_regression_experiment on "
-        f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}"
+        f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}. "
+        f"Memory usage method: {MEMRECORD_METHOD}. "
+        f"Benchmark time cached: {benchmark_cached}"
     )
 
     second = str(regressor.get_params()).replace("\n", " ").replace("\r", " ")
 
     if build_train_file:
+        train_comment = first_comment
+        checkpoint_path = None
         cv_size = min(10, len(y_train))
-        start = int(round(time.time() * 1000))
-        if use_fit_predict:
-            train_preds = regressor.fit_predict(X_train, y_train)
-            needs_fit = False
-            fit_and_train_time = int(round(time.time() * 1000)) - start
-        else:
-            train_preds = cross_val_predict(regressor, X_train, y=y_train, cv=cv_size)
-            train_time = int(round(time.time() * 1000)) - start
+        with telemetry.phase("train_estimate"):
+            start = int(round(time.time() * 1000))
+            if use_fit_predict:
+                train_preds = regressor.fit_predict(X_train, y_train)
+                needs_fit = False
+                fit_and_train_time = int(round(time.time() * 1000)) - start
+            else:
+                if checkpoint_train_estimate:
+                    checkpoint_path = (
+                        f"{results_path}/{regressor_name}/Workspace/{dataset_name}/"
+                        f"trainEstimateResample{resample_id}/"
+                    )
 
-        train_mse = mean_squared_error(y_train, train_preds)
+                (
+                    train_preds,
+                    train_time,
+                    fold_fit_times,
+                    fold_mem_usage,
+                ) = _cross_validate_train_data(
+                    regressor,
+                    X_train,
+                    y_train,
+                    cv_size,
+                    "predict",
+                    n_jobs,
+                    checkpoint_path=checkpoint_path,
+                )
+                train_comment = (
+                    f"{first_comment}. Fold fit times: {fold_fit_times}. "
+                    f"Fold memory usage: {fold_mem_usage}"
+                )
 
-        write_regression_results(
-            train_preds,
-            y_train,
-            regressor_name,
-            dataset_name,
-            results_path,
-            full_path=False,
-            first_line_regressor_name=f"{regressor_name} ({type(regressor).__name__})",
-            split="TRAIN",
-            resample_id=resample_id,
-            time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
-            parameter_info=second,
-            mse=train_mse,
-            fit_time=fit_time,
-            predict_time=-1,
-            benchmark_time=benchmark,
-            memory_usage=mem_usage,
-            train_estimate_method="Custom" if use_fit_predict else f"{cv_size}F-CV",
-            train_estimate_time=train_time,
-            fit_and_estimate_time=fit_and_train_time,
-        )
+        with telemetry.phase("metrics", detail="train"):
+            train_mse = mean_squared_error(y_train, train_preds)
+
+        with telemetry.phase("results_writing", detail="train"):
+            write_regression_results(
+                train_preds,
+                y_train,
+                regressor_name,
+                dataset_name,
+                results_path,
+                full_path=False,
+                first_line_regressor_name=(
+                    f"{regressor_name} ({type(regressor).__name__})"
+                ),
+                split="TRAIN",
+                resample_id=resample_id,
+                time_unit="MILLISECONDS",
+                first_line_comment=train_comment,
+                parameter_info=second,
+                mse=train_mse,
+                fit_time=fit_time,
+                predict_time=-1,
+                benchmark_time=benchmark,
+                memory_usage=mem_usage,
+                train_estimate_method="Custom" if use_fit_predict else f"{cv_size}F-CV",
+                train_estimate_time=train_time,
+                fit_and_estimate_time=fit_and_train_time,
+                compile_time=compile_time,
+            )
+
+        # the train file is written, so the saved folds are no longer needed
+        if checkpoint_path is not None:
+            shutil.rmtree(checkpoint_path, ignore_errors=True)
 
     if build_test_file:
         if needs_fit:
-            mem_usage, fit_time = record_max_memory(
-                regressor.fit,
-                args=(X_train, y_train),
-                interval=MEMRECORD_INTERVAL,
-                return_func_time=True,
-            )
-            fit_time += int(round(getattr(regressor, "_fit_time_milli", 0)))
+            with telemetry.phase("fit"), profiler.phase("fit"):
+                mem_usage, fit_time = record_max_memory(
+                    regressor.fit,
+                    args=(X_train, y_train),
+                    interval=MEMRECORD_INTERVAL,
+                    method=MEMRECORD_METHOD,
+                    return_func_time=True,
+                )
+                fit_time += int(round(getattr(regressor, "_fit_time_milli", 0)))
 
         if attribute_file_path is not None:
-            estimator_attributes_to_file(
-                regressor, attribute_file_path, max_list_shape=att_max_shape
-            )
+            with telemetry.phase("attribute_writing"):
+                estimator_attributes_to_file(
+                    regressor, attribute_file_path, max_list_shape=att_max_shape
+                )
 
-        start = int(round(time.time() * 1000))
-        test_preds = regressor.predict(X_test)
-        test_time = (int(round(time.time() * 1000)) - start) + int(
-            round(getattr(regressor, "_predict_time_milli", 0))
-        )
+        with telemetry.phase("predict"), profiler.phase("predict"):
+            start = int(round(time.time() * 1000))
+            test_preds = _chunked_predict(regressor.predict, X_test, predict_max_memory)
+            test_time = (int(round(time.time() * 1000)) - start) + int(
+                round(getattr(regressor, "_predict_time_milli", 0))
+            )
 
-        test_mse = mean_squared_error(y_test, test_preds)
+        with telemetry.phase("metrics", detail="test"):
+            test_mse = mean_squared_error(y_test, test_preds)
+
+        with telemetry.phase("results_writing", detail="test"):
+            write_regression_results(
+                test_preds,
+                y_test,
+                regressor_name,
+                dataset_name,
+                results_path,
+                full_path=False,
+                first_line_regressor_name=(
+                    f"{regressor_name} ({type(regressor).__name__})"
+                ),
+                split="TEST",
+                resample_id=resample_id,
+                time_unit="MILLISECONDS",
+                first_line_comment=first_comment,
+                parameter_info=second,
+                mse=test_mse,
+                fit_time=fit_time,
+                predict_time=test_time,
+                benchmark_time=benchmark,
+                memory_usage=mem_usage,
+                train_estimate_method="N/A",
+                train_estimate_time=-1,
+                fit_and_estimate_time=fit_and_train_time,
+                compile_time=compile_time,
+            )
 
-        write_regression_results(
-            test_preds,
-            y_test,
-            regressor_name,
-            dataset_name,
-            results_path,
-            full_path=False,
-            first_line_regressor_name=f"{regressor_name} ({type(regressor).__name__})",
-            split="TEST",
-            resample_id=resample_id,
-            time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
-            parameter_info=second,
-            mse=test_mse,
-            fit_time=fit_time,
-            predict_time=test_time,
-            benchmark_time=benchmark,
-            memory_usage=mem_usage,
-            train_estimate_method="N/A",
-            train_estimate_time=-1,
-            fit_and_estimate_time=fit_and_train_time,
-        )
+    profiler.write(
+        profile_path(results_path, regressor_name, dataset_name, resample_id)
+    )
+    telemetry.write(
+        telemetry_file_path(results_path, regressor_name, dataset_name, resample_id),
+        task="regression",
+        estimator_name=regressor_name,
+        dataset_name=dataset_name,
+        resample_id=resample_id,
+    )
 
 
 def load_and_run_regression_experiment(
@@ -664,6 +1026,15 @@ def load_and_run_regression_experiment(
     benchmark_time=True,
     overwrite=False,
     predefined_resample=False,
+    n_jobs=1,
+    checkpoint_train_estimate=False,
+    transform_cache=None,
+    concurrent_estimators=False,
+    predict_max_memory=None,
+    profile=False,
+    warm_up=False,
+    phase_budget=None,
+    results_catalogue=None,
 ):
     """Load a dataset and run a regression experiment.
 
@@ -673,18 +1044,26 @@ def load_and_run_regression_experiment(
 
     Parameters
     ----------
-    problem_path : str
-        Location of problem files, full path.
+    problem_path : str or ExperimentDataset
+        Location of problem files, full path. An ExperimentDataset can be passed
+        instead to take the resample from data which has already been loaded, in which
+        case predefined_resample is ignored.
     results_path : str
         Location of where to write results. Any required directories will be created.
     dataset : str
         Name of problem. Files must be <problem_path>/<dataset>/<dataset>+"_TRAIN.ts",
         same for "_TEST.ts".
-    regressor : BaseRegressor
-        Regressor to be used in the experiment.
-    regressor_name : str or None, default=None
+    regressor : BaseRegressor, str or list
+        Regressor to be used in the experiment. A str is used to create the
+        regressor using get_regressor_by_name with the resample_id as the
+        random_state. If a list of regressors and/or names, the data is loaded,
+        resampled and transformed once and each regressor is run on it in turn,
+        writing results under its own name. Regressors with existing results are
+        skipped unless overwrite is True.
+    regressor_name : str, list of str or None, default=None
         Name of regressor used in writing results. If None, the name is taken from
-        the regressor.
+        the regressor, or is the regressor str. If a list, must be the same length
+        as the regressor list.
     resample_id : int, default=0
         Seed for resampling. If set to 0, the default train/test split from file is
         used. Also used in output file name.
@@ -693,13 +1072,17 @@ def load_and_run_regression_experiment(
         If a list, the transformers are applied in order.
         If None, no transformation is applied.
         Calls fit_transform on the training data and transform on the test data.
+    transform_cache : DataTransformCache or None, default=None
+        A cache to load the output of the data_transforms from, or store it in if
+        not present. See tsml_eval.utils.data_transform_cache.DataTransformCache.
     build_train_file : bool, default=False
         Whether to generate train files or not. If true, it performs a 10-fold
         cross-validation on the train data and saves. If the regressor can produce its
         own estimates, those are used instead.
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
     overwrite : bool, default=False
         If set to False, this will only build results if there is not a result file
         already present. If True, it will overwrite anything already there.
@@ -707,59 +1090,161 @@ def load_and_run_regression_experiment(
         Read a predefined resample from file instead of performing a resample. If True
         the file format must include the resample_id at the end of the dataset name i.e.
         <problem_path>/<dataset>/<dataset>+<resample_id>+"_TRAIN.ts".
+    n_jobs : int, default=1
+        The number of jobs available to the experiment. Used to run the folds of the
+        train data cross-validation in parallel, see run_regression_experiment.
+    checkpoint_train_estimate : bool, default=False
+        Whether to save the output of each train data cross-validation fold so a
+        restarted experiment only runs the missing folds, see
+        run_regression_experiment.
+    concurrent_estimators : bool, default=False
+        If True and multiple estimators are input, run the estimators concurrently
+        in threads. The n_jobs budget is split between the concurrently running
+        estimators, i.e. 8 jobs and 4 estimators runs 4 estimators with 2 jobs each.
+        Memory usage is recorded for the whole process, so the recorded memory of
+        concurrently run estimators includes the others running at the same time.
+        If False, estimators are run in sequence, each using all n_jobs.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for predicting the test data in chunks, see
+        run_regression_experiment.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases, see
+        run_regression_experiment.
+    warm_up : bool, default=False
+        Whether to compile JIT code before the timed fit, see
+        run_regression_experiment.
+    phase_budget : float, dict or None, default=None
+        A wall-clock budget in seconds for each telemetry phase of the experiment,
+        i.e. "data_loading", "fit", "predict" and "results_writing". A float applies
+        to every phase. If not None, the experiment is run in a child process which
+        is killed as soon as a phase exceeds its budget, and a timeout marker file is
+        written in place of each results file which was not written (see
+        tsml_eval.utils.watchdog). A dict maps phase names to budgets, and phases
+        not in the dict have no budget.
+    results_catalogue : ResultsCatalogue or None, default=None
+        A catalogue of results_path (see tsml_eval.utils.results_catalogue) used to
+        find existing results files without checking for each file. Results missing
+        from the catalogue are still checked for on disk.
     """
-    if regressor_name is None:
-        regressor_name = type(regressor).__name__
-
-    build_test_file, build_train_file = _check_existing_results(
-        results_path,
-        regressor_name,
-        dataset,
-        resample_id,
-        overwrite,
-        True,
-        build_train_file,
-    )
+    jobs = []
+    for estimator, name in _experiment_estimators(regressor, regressor_name):
+        build_test, build_train = _check_existing_results(
+            results_path,
+            name,
+            dataset,
+            resample_id,
+            overwrite,
+            True,
+            build_train_file,
+            catalogue=results_catalogue,
+        )
+        if build_test or build_train:
+            jobs.append((estimator, name, build_test, build_train))
 
-    if not build_test_file and not build_train_file:
+    if len(jobs) == 0:
         warnings.warn("All files exist and not overwriting, skipping.", stacklevel=1)
         return
 
-    X_train, y_train, X_test, y_test, resample = load_experiment_data(
-        problem_path, dataset, resample_id, predefined_resample
-    )
-
-    if resample:
-        X_train, y_train, X_test, y_test = resample_data(
-            X_train, y_train, X_test, y_test, random_state=resample_id
+    if phase_budget is not None:
+        _run_with_phase_budget(
+            load_and_run_regression_experiment,
+            dict(
+                problem_path=problem_path,
+                results_path=results_path,
+                dataset=dataset,
+                regressor=regressor,
+                regressor_name=regressor_name,
+                resample_id=resample_id,
+                data_transforms=data_transforms,
+                build_train_file=build_train_file,
+                write_attributes=write_attributes,
+                att_max_shape=att_max_shape,
+                benchmark_time=benchmark_time,
+                overwrite=overwrite,
+                predefined_resample=predefined_resample,
+                n_jobs=n_jobs,
+                checkpoint_train_estimate=checkpoint_train_estimate,
+                transform_cache=transform_cache,
+                concurrent_estimators=concurrent_estimators,
+                predict_max_memory=predict_max_memory,
+                profile=profile,
+                warm_up=warm_up,
+            ),
+            phase_budget,
+            results_path,
+            dataset,
+            resample_id,
+            jobs,
         )
+        return
 
-    if write_attributes:
-        attribute_file_path = f"{results_path}/{regressor_name}/Workspace/{dataset}/"
-    else:
-        attribute_file_path = None
+    telemetry = ExperimentTelemetry()
+    X_train, y_train, X_test, y_test = _load_experiment_resample(
+        problem_path,
+        dataset,
+        resample_id,
+        predefined_resample,
+        False,
+        telemetry=telemetry,
+    )
 
     # Ensure labels are floats
     y_train = y_train.astype(float)
     y_test = y_test.astype(float)
 
-    run_regression_experiment(
-        X_train,
-        y_train,
-        X_test,
-        y_test,
-        regressor,
-        results_path,
-        regressor_name=regressor_name,
-        dataset_name=dataset,
-        resample_id=resample_id,
-        data_transforms=data_transforms,
-        build_test_file=build_test_file,
-        build_train_file=build_train_file,
-        attribute_file_path=attribute_file_path,
-        att_max_shape=att_max_shape,
-        benchmark_time=benchmark_time,
-    )
+    # transform the data once for all estimators rather than once each
+    if len(jobs) > 1 and data_transforms is not None:
+        X_train, y_train, X_test, y_test = _transform_data(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            True,
+            transform_cache,
+            dataset,
+            resample_id,
+            telemetry=telemetry,
+        )
+        data_transforms = None
+
+    def run(estimator, name, build_test, build_train, estimator_n_jobs):
+        if isinstance(estimator, str):
+            estimator = get_regressor_by_name(
+                estimator, random_state=resample_id, n_jobs=estimator_n_jobs
+            )
+
+        if write_attributes:
+            attribute_file_path = f"{results_path}/{name}/Workspace/{dataset}/"
+        else:
+            attribute_file_path = None
+
+        run_regression_experiment(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            estimator,
+            results_path,
+            regressor_name=name,
+            dataset_name=dataset,
+            resample_id=resample_id,
+            data_transforms=data_transforms,
+            transform_cache=transform_cache,
+            build_test_file=build_test,
+            build_train_file=build_train,
+            attribute_file_path=attribute_file_path,
+            att_max_shape=att_max_shape,
+            benchmark_time=benchmark_time,
+            predict_max_memory=predict_max_memory,
+            telemetry=telemetry.copy(),
+            profile=profile,
+            warm_up=warm_up,
+            n_jobs=estimator_n_jobs,
+            checkpoint_train_estimate=checkpoint_train_estimate,
+        )
+
+    _run_estimator_jobs(jobs, run, n_jobs, concurrent_estimators)
 
 
 def run_clustering_experiment(
@@ -779,6 +1264,11 @@ def run_clustering_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    transform_cache=None,
+    predict_max_memory=None,
+    telemetry=None,
+    profile=False,
+    warm_up=False,
 ):
     """Run a clustering experiment and save the results to file.
 
@@ -827,6 +1317,9 @@ def run_clustering_experiment(
         If a list, the transformers are applied in order.
         If None, no transformation is applied.
         Calls fit_transform on the training data and transform on the test data.
+    transform_cache : DataTransformCache or None, default=None
+        A cache to load the output of the data_transforms from, or store it in if
+        not present. See tsml_eval.utils.data_transform_cache.DataTransformCache.
     build_test_file : bool, default=False:
         Whether to generate test files or not. If True, X_test and y_test must be
         provided.
@@ -835,7 +1328,32 @@ def run_clustering_experiment(
         regardless of input.
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for predicting the train and test data. If not
+        None, the data is streamed through the clusterer in chunks sized so each
+        chunk fits in the budget, using the memory usage per case of predicting a
+        small first chunk. The written predict time is the total across all chunks.
+        If None, the data is predicted at once.
+    telemetry : ExperimentTelemetry or None, default=None
+        Records the wall time, CPU time and memory usage of each phase of the
+        experiment, i.e. data transforms, fit, predict and results writing, which are
+        written to a JSON file alongside the predictions (see
+        tsml_eval.utils.telemetry). An ExperimentTelemetry can be passed to include
+        phases recorded before the experiment, such as data loading. If None, a new
+        one is created.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases with cProfile and a call stack
+        sampler. The profiles are written to the Workspace directory of the results
+        path (see tsml_eval.utils.profiling). Profiling slows down the profiled
+        code, so increases the written fit and predict times.
+    warm_up : bool, default=False
+        Whether to fit and predict a clone of the clusterer on a few training cases
+        before the timed fit (and train estimate), so just-in-time compilation of
+        numba functions is not included in the fit time. The time taken is written
+        as a separate compile time field at the end of the third line of the
+        results files.
     """
     if not build_test_file and not build_train_file:
         raise ValueError(
@@ -846,6 +1364,15 @@ def run_clustering_experiment(
     if clusterer_name is None:
         clusterer_name = type(clusterer).__name__
 
+    if telemetry is None:
+        telemetry = ExperimentTelemetry()
+    profiler = ExperimentProfiler(enabled=profile)
+
+    # imported here so the package imports quickly for short experiment processes
+    from aeon.clustering import BaseClusterer
+
+    from tsml_eval.estimators import SklearnToTsmlClusterer
+
     if isinstance(clusterer, BaseClusterer) or (
         isinstance(clusterer, BaseTimeSeriesEstimator) and is_clusterer(clusterer)
     ):
@@ -867,30 +1394,40 @@ def run_clustering_experiment(
         raise ValueError("Test data and labels not provided, cannot build test file.")
 
     if data_transforms is not None:
-        if not isinstance(data_transforms, list):
-            data_transforms = [data_transforms]
-
-        for transform in data_transforms:
-            X_train = transform.fit_transform(X_train, y_train)
-            if build_test_file:
-                X_test = transform.transform(X_test, y_test)
+        X_train, y_train, X_test, y_test = _transform_data(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            build_test_file,
+            transform_cache,
+            dataset_name,
+            resample_id,
+            telemetry=telemetry,
+        )
 
-    le = preprocessing.LabelEncoder()
-    y_train = le.fit_transform(y_train)
-    if build_test_file:
-        y_test = le.transform(y_test)
+    with telemetry.phase("label_encoding"):
+        le = preprocessing.LabelEncoder()
+        y_train = le.fit_transform(y_train)
+        if build_test_file:
+            y_test = le.transform(y_test)
 
     encoder_dict = {label: i for i, label in enumerate(le.classes_)}
     n_classes = len(np.unique(y_train))
 
     benchmark = -1
+    benchmark_cached = False
     if benchmark_time:
-        benchmark = timing_benchmark(random_state=resample_id)
+        with telemetry.phase("benchmark"):
+            benchmark, benchmark_cached = cached_timing_benchmark()
 
     first_comment = (
         "Generated by run_clustering_experiment on "
         f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}. "
-        f"Encoder dictionary: {str(encoder_dict)}"
+        f"Encoder dictionary: {str(encoder_dict)}. "
+        f"Memory usage method: {MEMRECORD_METHOD}. "
+        f"Benchmark time cached: {benchmark_cached}"
     )
 
     # set n_clusters for clusterer and any contained estimators
@@ -908,110 +1445,154 @@ def run_clustering_experiment(
     elif n_clusters is not None:
         raise ValueError("n_clusters must be an int or None.")
 
-    second = str(clusterer.get_params()).replace("\n", " ").replace("\r", " ")
-
-    mem_usage, fit_time = record_max_memory(
-        clusterer.fit,
-        args=(X_train,),
-        interval=MEMRECORD_INTERVAL,
-        return_func_time=True,
-    )
-    fit_time += int(round(getattr(clusterer, "_fit_time_milli", 0)))
-
-    if attribute_file_path is not None:
-        estimator_attributes_to_file(
-            clusterer, attribute_file_path, max_list_shape=att_max_shape
-        )
-
-    start = int(round(time.time() * 1000))
-    if callable(getattr(clusterer, "predict_proba", None)):
-        train_probs = clusterer.predict_proba(X_train)
-        train_preds = np.argmax(train_probs, axis=1)
-    else:
-        train_preds = (
-            clusterer.labels_
-            if hasattr(clusterer, "labels_")
-            else clusterer.predict(X_train)
+    compile_time = -1
+    if warm_up:
+        predict_methods = (
+            ["predict_proba"]
+            if callable(getattr(clusterer, "predict_proba", None))
+            else ["predict"]
         )
-        train_probs = np.zeros(
-            (
-                len(train_preds),
-                len(np.unique(train_preds)),
+        with telemetry.phase("warm_up"):
+            compile_time = _jit_warm_up(
+                clusterer, X_train, y_train, predict_methods, supervised=False
             )
-        )
-        train_probs[np.arange(len(train_preds)), train_preds] = 1
-    train_time = int(round(time.time() * 1000)) - start
 
-    if build_train_file:
-        train_acc = clustering_accuracy_score(y_train, train_preds)
+    second = str(clusterer.get_params()).replace("\n", " ").replace("\r", " ")
 
-        write_clustering_results(
-            train_preds,
-            train_probs,
-            y_train,
-            clusterer_name,
-            dataset_name,
-            results_path,
-            full_path=False,
-            first_line_clusterer_name=f"{clusterer_name} ({type(clusterer).__name__})",
-            split="TRAIN",
-            resample_id=resample_id,
-            time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
-            parameter_info=second,
-            clustering_accuracy=train_acc,
-            fit_time=fit_time,
-            predict_time=train_time,
-            benchmark_time=benchmark,
-            memory_usage=mem_usage,
-            n_classes=n_classes,
-            n_clusters=len(train_probs[0]),
+    with telemetry.phase("fit"), profiler.phase("fit"):
+        mem_usage, fit_time = record_max_memory(
+            clusterer.fit,
+            args=(X_train,),
+            interval=MEMRECORD_INTERVAL,
+            method=MEMRECORD_METHOD,
+            return_func_time=True,
         )
+        fit_time += int(round(getattr(clusterer, "_fit_time_milli", 0)))
 
-    if build_test_file:
+    if attribute_file_path is not None:
+        with telemetry.phase("attribute_writing"):
+            estimator_attributes_to_file(
+                clusterer, attribute_file_path, max_list_shape=att_max_shape
+            )
+
+    with telemetry.phase("predict", detail="train"), profiler.phase("predict"):
         start = int(round(time.time() * 1000))
         if callable(getattr(clusterer, "predict_proba", None)):
-            test_probs = clusterer.predict_proba(X_test)
-            test_preds = np.argmax(test_probs, axis=1)
+            train_probs = _chunked_predict(
+                clusterer.predict_proba, X_train, predict_max_memory
+            )
+            train_preds = np.argmax(train_probs, axis=1)
         else:
-            test_preds = clusterer.predict(X_test)
-            test_probs = np.zeros(
+            train_preds = (
+                clusterer.labels_
+                if hasattr(clusterer, "labels_")
+                else _chunked_predict(clusterer.predict, X_train, predict_max_memory)
+            )
+            train_probs = np.zeros(
                 (
-                    len(test_preds),
+                    len(train_preds),
                     len(np.unique(train_preds)),
                 )
             )
-            test_probs[np.arange(len(test_preds)), test_preds] = 1
-        test_time = (
-            int(round(time.time() * 1000))
-            - start
-            + int(round(getattr(clusterer, "_predict_time_milli", 0)))
-        )
-
-        test_acc = clustering_accuracy_score(y_test, test_preds)
-
-        write_clustering_results(
-            test_preds,
-            test_probs,
-            y_test,
-            clusterer_name,
-            dataset_name,
-            results_path,
-            full_path=False,
-            first_line_clusterer_name=f"{clusterer_name} ({type(clusterer).__name__})",
-            split="TEST",
-            resample_id=resample_id,
-            time_unit="MILLISECONDS",
-            first_line_comment=first_comment,
-            parameter_info=second,
-            clustering_accuracy=test_acc,
-            fit_time=fit_time,
-            predict_time=test_time,
-            benchmark_time=benchmark,
-            memory_usage=mem_usage,
-            n_classes=n_classes,
-            n_clusters=len(test_probs[0]),
-        )
+            train_probs[np.arange(len(train_preds)), train_preds] = 1
+        train_time = int(round(time.time() * 1000)) - start
+
+    if build_train_file:
+        with telemetry.phase("metrics", detail="train"):
+            train_acc = clustering_accuracy_score(y_train, train_preds)
+
+        with telemetry.phase("results_writing", detail="train"):
+            write_clustering_results(
+                train_preds,
+                train_probs,
+                y_train,
+                clusterer_name,
+                dataset_name,
+                results_path,
+                full_path=False,
+                first_line_clusterer_name=(
+                    f"{clusterer_name} ({type(clusterer).__name__})"
+                ),
+                split="TRAIN",
+                resample_id=resample_id,
+                time_unit="MILLISECONDS",
+                first_line_comment=first_comment,
+                parameter_info=second,
+                clustering_accuracy=train_acc,
+                fit_time=fit_time,
+                predict_time=train_time,
+                benchmark_time=benchmark,
+                memory_usage=mem_usage,
+                n_classes=n_classes,
+                n_clusters=len(train_probs[0]),
+                compile_time=compile_time,
+            )
+
+    if build_test_file:
+        with telemetry.phase("predict", detail="test"), profiler.phase("predict"):
+            start = int(round(time.time() * 1000))
+            if callable(getattr(clusterer, "predict_proba", None)):
+                test_probs = _chunked_predict(
+                    clusterer.predict_proba, X_test, predict_max_memory
+                )
+                test_preds = np.argmax(test_probs, axis=1)
+            else:
+                test_preds = _chunked_predict(
+                    clusterer.predict, X_test, predict_max_memory
+                )
+                test_probs = np.zeros(
+                    (
+                        len(test_preds),
+                        len(np.unique(train_preds)),
+                    )
+                )
+                test_probs[np.arange(len(test_preds)), test_preds] = 1
+            test_time = (
+                int(round(time.time() * 1000))
+                - start
+                + int(round(getattr(clusterer, "_predict_time_milli", 0)))
+            )
+
+        with telemetry.phase("metrics", detail="test"):
+            test_acc = clustering_accuracy_score(y_test, test_preds)
+
+        with telemetry.phase("results_writing", detail="test"):
+            write_clustering_results(
+                test_preds,
+                test_probs,
+                y_test,
+                clusterer_name,
+                dataset_name,
+                results_path,
+                full_path=False,
+                first_line_clusterer_name=(
+                    f"{clusterer_name} ({type(clusterer).__name__})"
+                ),
+                split="TEST",
+                resample_id=resample_id,
+                time_unit="MILLISECONDS",
+                first_line_comment=first_comment,
+                parameter_info=second,
+                clustering_accuracy=test_acc,
+                fit_time=fit_time,
+                predict_time=test_time,
+                benchmark_time=benchmark,
+                memory_usage=mem_usage,
+                n_classes=n_classes,
+                n_clusters=len(test_probs[0]),
+                compile_time=compile_time,
+            )
+
+    profiler.write(
+        profile_path(results_path, clusterer_name, dataset_name, resample_id)
+    )
+    telemetry.write(
+        telemetry_file_path(results_path, clusterer_name, dataset_name, resample_id),
+        task="clustering",
+        estimator_name=clusterer_name,
+        dataset_name=dataset_name,
+        resample_id=resample_id,
+    )
 
 
 def load_and_run_clustering_experiment(
@@ -1030,6 +1611,14 @@ def load_and_run_clustering_experiment(
     overwrite=False,
     predefined_resample=False,
     combine_train_test_split=False,
+    transform_cache=None,
+    n_jobs=1,
+    concurrent_estimators=False,
+    predict_max_memory=None,
+    profile=False,
+    warm_up=False,
+    phase_budget=None,
+    results_catalogue=None,
 ):
     """Load a dataset and run a clustering experiment.
 
@@ -1039,15 +1628,22 @@ def load_and_run_clustering_experiment(
 
     Parameters
     ----------
-    problem_path : str
-        Location of problem files, full path.
+    problem_path : str or ExperimentDataset
+        Location of problem files, full path. An ExperimentDataset can be passed
+        instead to take the resample from data which has already been loaded, in which
+        case predefined_resample is ignored.
     results_path : str
         Location of where to write results. Any required directories will be created.
     dataset : str
         Name of problem. Files must be <problem_path>/<dataset>/<dataset>+"_TRAIN.ts",
         same for "_TEST.ts".
-    clusterer : BaseClusterer
-        Clusterer to be used in the experiment.
+    clusterer : BaseClusterer, str or list
+        Clusterer to be used in the experiment. A str is used to create the
+        clusterer using get_clusterer_by_name with the resample_id as the
+        random_state. If a list of clusterers and/or names, the data is loaded,
+        resampled and transformed once and each clusterer is run on it in turn,
+        writing results under its own name. Clusterers with existing results are
+        skipped unless overwrite is True.
     n_clusters : int or None, default=None
         Number of clusters to use if the clusterer has an `n_clusters` parameter.
         If None, the clusterers default is used. If -1, the number of classes in the
@@ -1055,9 +1651,10 @@ def load_and_run_clustering_experiment(
 
         The `n_clusters` parameter for attributes which are estimators will also be
         set to this value if it exists.
-    clusterer_name : str or None, default=None
+    clusterer_name : str, list of str or None, default=None
         Name of clusterer used in writing results. If None, the name is taken from
-        the clusterer.
+        the clusterer, or is the clusterer str. If a list, must be the same length
+        as the clusterer list.
     resample_id : int, default=0
         Seed for resampling. If set to 0, the default train/test split from file is
         used. Also used in output file name.
@@ -1066,12 +1663,16 @@ def load_and_run_clustering_experiment(
         If a list, the transformers are applied in order.
         If None, no transformation is applied.
         Calls fit_transform on the training data and transform on the test data.
+    transform_cache : DataTransformCache or None, default=None
+        A cache to load the output of the data_transforms from, or store it in if
+        not present. See tsml_eval.utils.data_transform_cache.DataTransformCache.
     build_test_file : bool, default=False
         Whether to generate test files or not. If true, the clusterer will assign
         clusters to the loaded test data.
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
     overwrite : bool, default=False
         If set to False, this will only build results if there is not a result file
         already present. If True, it will overwrite anything already there.
@@ -1083,40 +1684,103 @@ def load_and_run_clustering_experiment(
         Whether the train/test split should be combined. If True then
         the train/test split is combined into a single train set. If False then the
         train/test split is used as normal.
+    n_jobs : int, default=1
+        The number of jobs available to the experiment. Used to create clusterers
+        input as a str and to run multiple clusterers concurrently.
+    concurrent_estimators : bool, default=False
+        If True and multiple estimators are input, run the estimators concurrently
+        in threads. The n_jobs budget is split between the concurrently running
+        estimators, i.e. 8 jobs and 4 estimators runs 4 estimators with 2 jobs each.
+        Memory usage is recorded for the whole process, so the recorded memory of
+        concurrently run estimators includes the others running at the same time.
+        If False, estimators are run in sequence, each using all n_jobs.
+    predict_max_memory : int or None, default=None
+        A memory budget in bytes for predicting the test data in chunks, see
+        run_clustering_experiment.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases, see
+        run_clustering_experiment.
+    warm_up : bool, default=False
+        Whether to compile JIT code before the timed fit, see
+        run_clustering_experiment.
+    phase_budget : float, dict or None, default=None
+        A wall-clock budget in seconds for each telemetry phase of the experiment,
+        i.e. "data_loading", "fit", "predict" and "results_writing". A float applies
+        to every phase. If not None, the experiment is run in a child process which
+        is killed as soon as a phase exceeds its budget, and a timeout marker file is
+        written in place of each results file which was not written (see
+        tsml_eval.utils.watchdog). A dict maps phase names to budgets, and phases
+        not in the dict have no budget.
+    results_catalogue : ResultsCatalogue or None, default=None
+        A catalogue of results_path (see tsml_eval.utils.results_catalogue) used to
+        find existing results files without checking for each file. Results missing
+        from the catalogue are still checked for on disk.
     """
-    if clusterer_name is None:
-        clusterer_name = type(clusterer).__name__
-
     if combine_train_test_split:
         build_test_file = False
 
-    build_test_file, build_train_file = _check_existing_results(
-        results_path,
-        clusterer_name,
-        dataset,
-        resample_id,
-        overwrite,
-        build_test_file,
-        True,
-    )
+    jobs = []
+    for estimator, name in _experiment_estimators(clusterer, clusterer_name):
+        build_test, build_train = _check_existing_results(
+            results_path,
+            name,
+            dataset,
+            resample_id,
+            overwrite,
+            build_test_file,
+            True,
+            catalogue=results_catalogue,
+        )
+        if build_test or build_train:
+            jobs.append((estimator, name, build_test, build_train))
 
-    if not build_test_file and not build_train_file:
+    if len(jobs) == 0:
         warnings.warn("All files exist and not overwriting, skipping.", stacklevel=1)
         return
 
-    X_train, y_train, X_test, y_test, resample = load_experiment_data(
-        problem_path, dataset, resample_id, predefined_resample
-    )
-
-    if resample:
-        X_train, y_train, X_test, y_test = stratified_resample_data(
-            X_train, y_train, X_test, y_test, random_state=resample_id
+    if phase_budget is not None:
+        _run_with_phase_budget(
+            load_and_run_clustering_experiment,
+            dict(
+                problem_path=problem_path,
+                results_path=results_path,
+                dataset=dataset,
+                clusterer=clusterer,
+                n_clusters=n_clusters,
+                clusterer_name=clusterer_name,
+                resample_id=resample_id,
+                data_transforms=data_transforms,
+                build_test_file=build_test_file,
+                write_attributes=write_attributes,
+                att_max_shape=att_max_shape,
+                benchmark_time=benchmark_time,
+                overwrite=overwrite,
+                predefined_resample=predefined_resample,
+                combine_train_test_split=combine_train_test_split,
+                transform_cache=transform_cache,
+                n_jobs=n_jobs,
+                concurrent_estimators=concurrent_estimators,
+                predict_max_memory=predict_max_memory,
+                profile=profile,
+                warm_up=warm_up,
+            ),
+            phase_budget,
+            results_path,
+            dataset,
+            resample_id,
+            jobs,
         )
+        return
 
-    if write_attributes:
-        attribute_file_path = f"{results_path}/{clusterer_name}/Workspace/{dataset}/"
-    else:
-        attribute_file_path = None
+    telemetry = ExperimentTelemetry()
+    X_train, y_train, X_test, y_test = _load_experiment_resample(
+        problem_path,
+        dataset,
+        resample_id,
+        predefined_resample,
+        True,
+        telemetry=telemetry,
+    )
 
     if combine_train_test_split:
         y_train = np.concatenate((y_train, y_test), axis=None)
@@ -1128,24 +1792,481 @@ def load_and_run_clustering_experiment(
         X_test = None
         y_test = None
 
-    run_clustering_experiment(
-        X_train,
-        y_train,
-        clusterer,
-        results_path,
-        X_test=X_test,
-        y_test=y_test,
-        n_clusters=n_clusters,
-        clusterer_name=clusterer_name,
-        dataset_name=dataset,
-        resample_id=resample_id,
-        data_transforms=data_transforms,
-        build_train_file=build_train_file,
-        build_test_file=build_test_file,
-        attribute_file_path=attribute_file_path,
-        att_max_shape=att_max_shape,
-        benchmark_time=benchmark_time,
+    # transform the data once for all estimators rather than once each
+    if len(jobs) > 1 and data_transforms is not None:
+        X_train, y_train, X_test, y_test = _transform_data(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            any(job[2] for job in jobs),
+            transform_cache,
+            dataset,
+            resample_id,
+            telemetry=telemetry,
+        )
+        data_transforms = None
+
+    def run(estimator, name, build_test, build_train, estimator_n_jobs):
+        if isinstance(estimator, str):
+            estimator = get_clusterer_by_name(
+                estimator,
+                random_state=resample_id,
+                n_jobs=estimator_n_jobs,
+                data_vars=[problem_path, dataset, resample_id, predefined_resample],
+            )
+
+        if write_attributes:
+            attribute_file_path = f"{results_path}/{name}/Workspace/{dataset}/"
+        else:
+            attribute_file_path = None
+
+        run_clustering_experiment(
+            X_train,
+            y_train,
+            estimator,
+            results_path,
+            X_test=X_test,
+            y_test=y_test,
+            n_clusters=n_clusters,
+            clusterer_name=name,
+            dataset_name=dataset,
+            resample_id=resample_id,
+            data_transforms=data_transforms,
+            transform_cache=transform_cache,
+            build_train_file=build_train,
+            build_test_file=build_test,
+            attribute_file_path=attribute_file_path,
+            att_max_shape=att_max_shape,
+            benchmark_time=benchmark_time,
+            predict_max_memory=predict_max_memory,
+            telemetry=telemetry.copy(),
+            profile=profile,
+            warm_up=warm_up,
+        )
+
+    _run_estimator_jobs(jobs, run, n_jobs, concurrent_estimators)
+
+
+def _run_with_phase_budget(
+    load_and_run, kwargs, phase_budget, results_path, dataset, resample_id, jobs
+):
+    """Run a load_and_run experiment under a watchdog and mark timed out files."""
+    timeout = run_with_watchdog(load_and_run, kwargs=kwargs, phase_budget=phase_budget)
+    if timeout is None:
+        return
+
+    resample_str = "Results" if resample_id is None else f"Resample{resample_id}"
+    for _, name, build_test, build_train in jobs:
+        for split, build in (("test", build_test), ("train", build_train)):
+            file_path = (
+                f"{results_path}/{name}/Predictions/{dataset}/{split}{resample_str}.csv"
+            )
+            if build and not os.path.exists(file_path):
+                write_timeout_marker(file_path, timeout)
+
+    warnings.warn(
+        f"Experiment on {dataset} resample {resample_id} exceeded the "
+        f"{timeout['budget']}s budget of its {timeout['phase']} phase and was "
+        "stopped, writing timeout markers for the missing results.",
+        stacklevel=2,
+    )
+
+
+def _experiment_estimators(estimators, estimator_names):
+    """Pair each estimator for a load_and_run experiment with its results name."""
+    if not isinstance(estimators, list):
+        estimators = [estimators]
+    if estimator_names is None:
+        estimator_names = [None] * len(estimators)
+    elif not isinstance(estimator_names, list):
+        estimator_names = [estimator_names]
+
+    if len(estimators) != len(estimator_names):
+        raise ValueError(
+            f"The number of estimator names ({len(estimator_names)}) must match the "
+            f"number of estimators ({len(estimators)})."
+        )
+
+    pairs = []
+    for estimator, name in zip(estimators, estimator_names):
+        if name is None:
+            name = estimator if isinstance(estimator, str) else type(estimator).__name__
+        pairs.append((estimator, name))
+
+    names = [name for _, name in pairs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Estimator names must be unique, found {names}.")
+
+    return pairs
+
+
+def _run_estimator_jobs(jobs, run, n_jobs, concurrent_estimators):
+    """Run the estimators of a load_and_run experiment within the n_jobs budget."""
+    n_jobs = check_n_jobs(n_jobs)
+
+    if not concurrent_estimators or n_jobs == 1 or len(jobs) == 1:
+        for job in jobs:
+            run(*job, n_jobs)
+        return
+
+    # split the budget between concurrent estimators and the threads of each
+    n_workers = min(n_jobs, len(jobs))
+    estimator_n_jobs = max(1, n_jobs // n_workers)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(run, *job, estimator_n_jobs) for job in jobs]
+        # raise any exceptions from the experiments
+        for future in futures:
+            future.result()
+
+
+def _load_experiment_resample(
+    problem_path, dataset, resample_id, predefined_resample, stratify, telemetry=None
+):
+    """Load the train/test split for a resample from file or an ExperimentDataset.
+
+    If telemetry is not None, "data_loading" and "resampling" phases are recorded.
+    """
+    if telemetry is None:
+        telemetry = ExperimentTelemetry()
+
+    if isinstance(problem_path, ExperimentDataset):
+        with telemetry.phase("resampling"):
+            return problem_path.get_resample(resample_id)
+
+    with telemetry.phase("data_loading"):
+        X_train, y_train, X_test, y_test, resample = load_experiment_data(
+            problem_path, dataset, resample_id, predefined_resample
+        )
+
+    with telemetry.phase("resampling"):
+        if resample and stratify:
+            X_train, y_train, X_test, y_test = stratified_resample_data(
+                X_train, y_train, X_test, y_test, random_state=resample_id
+            )
+        elif resample:
+            X_train, y_train, X_test, y_test = resample_data(
+                X_train, y_train, X_test, y_test, random_state=resample_id
+            )
+
+    return X_train, y_train, X_test, y_test
+
+
+def _transform_data(
+    data_transforms,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    transform_test,
+    transform_cache,
+    dataset_name,
+    resample_id,
+    telemetry=None,
+):
+    """Fit and apply data transforms, using the transform cache if provided.
+
+    If telemetry is not None, a "data_transform" phase is recorded for each
+    transform, or for loading the transformed data from the cache.
+    """
+    if telemetry is None:
+        telemetry = ExperimentTelemetry()
+
+    if not isinstance(data_transforms, list):
+        data_transforms = [data_transforms]
+
+    if transform_cache is not None:
+        key = transform_cache.key(
+            data_transforms,
+            X_train,
+            y_train,
+            X_test if transform_test else None,
+            y_test if transform_test else None,
+            dataset_name=dataset_name,
+            resample_id=resample_id,
+        )
+        with telemetry.phase("data_transform", detail="cache"):
+            cached = transform_cache.get(key)
+        if cached is not None:
+            if transform_test:
+                return cached
+            return cached[0], cached[1], X_test, y_test
+
+    n_cases_test = get_n_cases(X_test) if transform_test else None
+    for transform in data_transforms:
+        with telemetry.phase("data_transform", detail=type(transform).__name__):
+            transform_results = transform.fit_transform(X_train, y_train)
+            if isinstance(transform_results, tuple) and len(transform_results) == 2:
+                # If the transformer returns a tuple of length 2, assume it is (X, y)
+                X_train, y_train = transform_results
+            else:
+                X_train = transform_results
+
+            if transform_test:
+                transform_results = transform.transform(X_test, y_test)
+                if isinstance(transform_results, tuple) and len(transform_results) == 2:
+                    X_test, y_test = transform_results
+                else:
+                    X_test = transform_results
+
+                # If we have edited the number of cases in test something has gone
+                # wrong i.e. we have applied SMOTE to the test set
+                new_n_cases_test = get_n_cases(X_test)
+                assert new_n_cases_test == n_cases_test, (
+                    f"Error: X_test sample size changed from {n_cases_test} to "
+                    f"{new_n_cases_test} after transformation "
+                    f"{transform.__class__.__name__}"
+                )
+
+    if transform_cache is not None:
+        transform_cache.put(
+            key,
+            X_train,
+            y_train,
+            X_test if transform_test else None,
+            y_test if transform_test else None,
+        )
+
+    return X_train, y_train, X_test, y_test
+
+
+def _jit_warm_up(estimator, X, y, predict_methods, supervised=True, stratify=True):
+    """Fit and predict a clone of the estimator on a few cases to compile JIT code.
+
+    Numba compiles functions for the types of their arguments on the first call, so
+    running the estimator on a small subset of X (at least two cases of each class in
+    y if stratify) compiles the functions used in the timed fit and predict. Returns
+    the time taken in milliseconds. If the estimator cannot be run on the subset, a
+    warning is raised and the time taken until the failure is returned.
+    """
+    if stratify:
+        indices = np.concatenate([np.flatnonzero(y == c)[:2] for c in np.unique(y)])
+    else:
+        indices = np.zeros(0, dtype=int)
+    remaining = np.setdiff1d(np.arange(len(y)), indices)
+    indices = np.sort(
+        np.concatenate([indices, remaining[: max(0, _WARM_UP_SIZE - len(indices))]])
+    )
+
+    X = X[indices] if isinstance(X, np.ndarray) else [X[i] for i in indices]
+    y = y[indices]
+
+    start = time.perf_counter()
+    try:
+        estimator = clone(estimator)
+        if supervised:
+            estimator.fit(X, y)
+        else:
+            estimator.fit(X)
+        for method in predict_methods:
+            getattr(estimator, method)(X)
+    except Exception as e:
+        warnings.warn(
+            f"JIT warm-up failed for {type(estimator).__name__}, the fit time may "
+            f"include compilation: {e}",
+            stacklevel=2,
+        )
+    return int(round((time.perf_counter() - start) * 1000))
+
+
+def _chunked_predict(predict, X, max_memory):
+    """Predict X in chunks sized so each chunk fits in a memory budget.
+
+    The first chunk is a small probe whose peak allocation is traced to estimate the
+    memory used per case, which sets the size of the remaining chunks. The estimate
+    is at least the size of a case of X. Returns the concatenated output of predict
+    for every chunk. If max_memory is None, all of X is predicted at once.
+    """
+    n_cases = get_n_cases(X)
+    if max_memory is None or n_cases <= _PREDICT_PROBE_SIZE:
+        return predict(X)
+
+    outputs = []
+    # sampling the process memory misses short-lived allocations in a probe this
+    # small, so the peak traced allocation is used. Probes of estimators run in other
+    # threads wait for each other, and their other allocations can only make the
+    # estimate larger and the chunks smaller
+    probe_memory = record_max_memory(
+        lambda: outputs.append(predict(X[:_PREDICT_PROBE_SIZE])),
+        method="tracemalloc",
     )
+    case_memory = max(probe_memory / _PREDICT_PROBE_SIZE, _case_nbytes(X), 1)
+    chunk_size = max(1, int(max_memory // case_memory))
+
+    for i in range(_PREDICT_PROBE_SIZE, n_cases, chunk_size):
+        outputs.append(predict(X[i : i + chunk_size]))
+
+    return np.concatenate(outputs, axis=0)
+
+
+def _case_nbytes(X):
+    """Return the size in bytes of the largest case of X."""
+    if isinstance(X, np.ndarray):
+        return X[0].nbytes
+    return max(np.asarray(x).nbytes for x in X)
+
+
+def _cross_validate_train_data(
+    estimator, X, y, cv_size, method, n_jobs, checkpoint_path=None
+):
+    """Estimate the train data using cross-validation with folds run in parallel.
+
+    The n_jobs budget is split between the folds and the n_jobs parameter of each
+    fold's estimator. Returns the predictions for each case, the total train estimate
+    time (milliseconds) and the fit time (milliseconds) and maximum memory usage
+    (bytes) of each fold.
+
+    If checkpoint_path is not None, the output of each fold is saved there when it
+    finishes, and folds with a valid saved output are loaded instead of being run
+    again. The time taken by loaded folds is added to the train estimate time.
+    """
+    start = time.perf_counter()
+
+    cv = check_cv(cv_size, y, classifier=is_classifier(estimator))
+    splits = list(cv.split(X, y))
+
+    checkpoint_key = None
+    fold_results = [None] * len(splits)
+    if checkpoint_path is not None:
+        os.makedirs(checkpoint_path, exist_ok=True)
+        checkpoint_key = _fold_checkpoint_key(estimator, X, y, method)
+        for i, (_, test) in enumerate(splits):
+            fold_results[i] = _load_fold_checkpoint(
+                f"{checkpoint_path}/fold{i}.npz", checkpoint_key, test
+            )
+
+    restored_time = sum(r[4] for r in fold_results if r is not None)
+    run_folds = [i for i, r in enumerate(fold_results) if r is None]
+
+    estimator, fold_jobs = _fold_estimator(estimator, n_jobs, len(run_folds))
+
+    # memory is recorded per process, so folds are run in separate processes
+    new_results = Parallel(n_jobs=fold_jobs, backend="loky")(
+        delayed(_fit_predict_fold)(
+            clone(estimator),
+            X,
+            y,
+            splits[i][0],
+            splits[i][1],
+            method,
+            MEMRECORD_INTERVAL,
+            MEMRECORD_METHOD,
+            (
+                None
+                if checkpoint_path is None
+                else (f"{checkpoint_path}/fold{i}.npz", checkpoint_key)
+            ),
+        )
+        for i in run_folds
+    )
+    for i, result in zip(run_folds, new_results):
+        fold_results[i] = result
+
+    if method == "predict_proba":
+        predictions = np.zeros((len(y), len(np.unique(y))))
+    else:
+        predictions = np.zeros(len(y))
+
+    for (_, test), (fold_preds, classes, _, _, _) in zip(splits, fold_results):
+        if method == "predict_proba":
+            # a fold may not contain every class in its train data
+            predictions[np.ix_(test, classes)] = fold_preds
+        else:
+            predictions[test] = fold_preds
+
+    train_time = int(round((time.perf_counter() - start) * 1000)) + restored_time
+    return (
+        predictions,
+        train_time,
+        [int(r[2]) for r in fold_results],
+        [int(r[3]) for r in fold_results],
+    )
+
+
+def _fold_estimator(estimator, n_jobs, n_folds):
+    """Return the estimator to clone for each fold and the number of parallel folds.
+
+    The n_jobs parameter of the estimator is only set if the folds are run in
+    parallel, to its share of the jobs. Otherwise it is left as the user set it. The
+    estimator is cloned, so the final fit on the full train data is unchanged.
+    """
+    fold_jobs = max(1, min(check_n_jobs(n_jobs), n_folds))
+    estimator = clone(estimator)
+    if fold_jobs > 1 and "n_jobs" in estimator.get_params(deep=False):
+        estimator.set_params(n_jobs=max(1, check_n_jobs(n_jobs) // fold_jobs))
+    return estimator, fold_jobs
+
+
+def _fit_predict_fold(
+    estimator, X, y, train, test, method, mem_interval, mem_method, checkpoint=None
+):
+    """Fit an estimator on a cross-validation fold and predict its test cases."""
+    start = time.perf_counter()
+
+    if isinstance(X, np.ndarray):
+        X_train, X_test = X[train], X[test]
+    else:
+        X_train, X_test = [X[i] for i in train], [X[i] for i in test]
+
+    mem_usage, fit_time = record_max_memory(
+        estimator.fit,
+        args=(X_train, y[train]),
+        interval=mem_interval,
+        method=mem_method,
+        return_func_time=True,
+    )
+    fit_time += int(round(getattr(estimator, "_fit_time_milli", 0)))
+
+    preds = getattr(estimator, method)(X_test)
+    classes = getattr(estimator, "classes_", None)
+    fold_time = int(round((time.perf_counter() - start) * 1000))
+
+    if checkpoint is not None:
+        file_path, key = checkpoint
+        # saved to a temporary file and renamed so a preempted job never leaves a
+        # partial checkpoint
+        tmp_file = f"{file_path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_file,
+            key=key,
+            test=test,
+            preds=preds,
+            classes=np.array([]) if classes is None else np.asarray(classes),
+            times=np.array([fit_time, mem_usage, fold_time]),
+        )
+        os.replace(tmp_file, file_path)
+
+    return preds, classes, fit_time, mem_usage, fold_time
+
+
+def _fold_checkpoint_key(estimator, X, y, method):
+    """Return a key identifying the estimator, data and method of a train estimate.
+
+    The data is hashed so saved folds are not used after the data or its transforms
+    have changed.
+    """
+    h = hashlib.sha1()
+    h.update(f"{type(estimator).__name__}{estimator.get_params()}{method}".encode())
+    for x in [X] if isinstance(X, np.ndarray) else X:
+        x = np.ascontiguousarray(x)
+        h.update(f"{x.shape}{x.dtype.str}".encode())
+        h.update(x.data)
+    h.update(np.ascontiguousarray(y).data)
+    return h.hexdigest()
+
+
+def _load_fold_checkpoint(file_path, key, test):
+    """Load a saved fold output, returning None if it is missing or does not match."""
+    try:
+        with np.load(file_path, allow_pickle=False) as f:
+            if str(f["key"]) != key or not np.array_equal(f["test"], test):
+                return None
+            classes = f["classes"] if len(f["classes"]) > 0 else None
+            fit_time, mem_usage, fold_time = f["times"]
+            return f["preds"], classes, fit_time, mem_usage, int(fold_time)
+    except (OSError, ValueError, KeyError):
+        return None
 
 
 def run_forecasting_experiment(
@@ -1159,6 +2280,7 @@ def run_forecasting_experiment(
     attribute_file_path=None,
     att_max_shape=0,
     benchmark_time=True,
+    profile=False,
 ):
     """Run a forecasting experiment and save the results to file.
 
@@ -1186,46 +2308,64 @@ def run_forecasting_experiment(
         used for the results file name.
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases with cProfile and a call stack
+        sampler. The profiles are written to the Workspace directory of the results
+        path (see tsml_eval.utils.profiling). Profiling slows down the profiled
+        code, so increases the written fit and predict times.
     """
+    from aeon.forecasting import BaseForecaster
+
     if not isinstance(forecaster, BaseForecaster):
         raise TypeError("forecaster must be an aeon forecaster.")
 
     if forecaster_name is None:
         forecaster_name = type(forecaster).__name__
 
+    profiler = ExperimentProfiler(enabled=profile)
+
     benchmark = -1
+    benchmark_cached = False
     if benchmark_time:
-        benchmark = timing_benchmark(random_state=random_seed)
+        benchmark, benchmark_cached = cached_timing_benchmark()
 
     first_comment = (
         "Generated by run_forecasting_experiment on "
-        f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}"
+        f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}. "
+        f"Memory usage method: {MEMRECORD_METHOD}. "
+        f"Benchmark time cached: {benchmark_cached}"
     )
 
     second = str(forecaster.get_params()).replace("\n", " ").replace("\r", " ")
 
-    mem_usage, fit_time = record_max_memory(
-        forecaster.fit,
-        args=(train,),
-        interval=MEMRECORD_INTERVAL,
-        return_func_time=True,
-    )
-    fit_time += int(round(getattr(forecaster, "_fit_time_milli", 0)))
+    with profiler.phase("fit"):
+        mem_usage, fit_time = record_max_memory(
+            forecaster.fit,
+            args=(train,),
+            interval=MEMRECORD_INTERVAL,
+            method=MEMRECORD_METHOD,
+            return_func_time=True,
+        )
+        fit_time += int(round(getattr(forecaster, "_fit_time_milli", 0)))
 
     if attribute_file_path is not None:
         estimator_attributes_to_file(
             forecaster, attribute_file_path, max_list_shape=att_max_shape
         )
 
-    start = int(round(time.time() * 1000))
-    test_preds = forecaster.predict(test)
-    test_time = (
-        int(round(time.time() * 1000))
-        - start
-        + int(round(getattr(forecaster, "_predict_time_milli", 0)))
-    )
-    test_preds = test_preds.flatten()[:-1]  # Remove last value as we have no actual data for it
+    with profiler.phase("predict"):
+        start = int(round(time.time() * 1000))
+        test_preds = forecaster.predict(test)
+        test_time = (
+            int(round(time.time() * 1000))
+            - start
+            + int(round(getattr(forecaster, "_predict_time_milli", 0)))
+        )
+    test_preds = test_preds.flatten()[
+        :-1
+    ]  # Remove last value as we have no actual data for it
 
     test_mape = mean_absolute_percentage_error(test, test_preds)
 
@@ -1249,6 +2389,188 @@ def run_forecasting_experiment(
         memory_usage=mem_usage,
     )
 
+    profiler.write(
+        profile_path(results_path, forecaster_name, dataset_name, random_seed)
+    )
+
+
+def run_rolling_origin_forecasting_experiment(
+    series,
+    forecaster,
+    results_path,
+    initial_window,
+    window_length=None,
+    step=1,
+    refit_interval=1,
+    n_jobs=1,
+    forecaster_name=None,
+    dataset_name="N/A",
+    random_seed=None,
+    benchmark_time=True,
+):
+    """Run a rolling-origin forecasting experiment and save the results to file.
+
+    Evaluates the forecaster at a series of forecast origins (cutoffs), starting
+    after initial_window values and moving forward step values at a time. At each
+    origin, the forecaster predicts the value horizon steps ahead from the window
+    of values before the origin, which either grows from the start of the series
+    (expanding window) or has a fixed length (sliding window). Windows are views of
+    the series, so no data is copied for each origin.
+
+    The forecaster is refit on the window every refit_interval origins. At the
+    other origins the fitted forecaster is updated with the latest values by
+    passing the window to predict, without refitting.
+
+    Each origin is a line of the results file, with the actual value, the
+    prediction, the time taken to fit (if refit) and predict at the origin, and a
+    description containing the origin and the absolute error of the prediction.
+    The fit and predict times in the third line are the total over all origins.
+
+    Parameters
+    ----------
+    series : np.ndarray or pd.Series
+        The univariate series to evaluate the forecaster on.
+    forecaster : BaseForecaster
+        Forecaster to be used in the experiment.
+    results_path : str
+        Location of where to write results. Any required directories will be created.
+    initial_window : int
+        The number of values before the first forecast origin.
+    window_length : int or None, default=None
+        The length of the sliding window used to fit and predict at each origin.
+        Must not be greater than initial_window. If None, an expanding window
+        containing every value before the origin is used.
+    step : int, default=1
+        The number of values between forecast origins.
+    refit_interval : int, default=1
+        Refit the forecaster every refit_interval origins. If 0, the forecaster is
+        only fit at the first origin, and updated at every other origin.
+    n_jobs : int, default=1
+        The number of processes to spread the origins over. Each process evaluates
+        a contiguous block of origins and fits the forecaster at the first origin of
+        its block. -1 means using all processors.
+    forecaster_name : str or None, default=None
+        Name of forecaster used in writing results. If None, the name is taken from
+        the forecaster.
+    dataset_name : str, default="N/A"
+        Name of dataset.
+    random_seed : int or None, default=None
+        Indicates what random seed was used as a random_state for the forecaster. Only
+        used for the results file name.
+    benchmark_time : bool, default=True
+        Whether to benchmark the hardware used with a simple function and write the
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
+    """
+    from aeon.forecasting import BaseForecaster
+
+    if not isinstance(forecaster, BaseForecaster):
+        raise TypeError("forecaster must be an aeon forecaster.")
+
+    if forecaster_name is None:
+        forecaster_name = type(forecaster).__name__
+
+    series = np.asarray(series, dtype=float).flatten()
+    horizon = getattr(forecaster, "horizon", 1)
+    if window_length is not None and not 0 < window_length <= initial_window:
+        raise ValueError(
+            "window_length must be greater than 0 and not greater than "
+            "initial_window."
+        )
+    if step < 1:
+        raise ValueError("step must be greater than 0.")
+    if refit_interval < 0:
+        raise ValueError("refit_interval must be 0 or greater.")
+
+    origins = np.arange(initial_window, len(series) - horizon + 1, step)
+    if len(origins) == 0:
+        raise ValueError(
+            "The series is too short to forecast horizon steps ahead after the "
+            "initial window."
+        )
+
+    benchmark = -1
+    benchmark_cached = False
+    if benchmark_time:
+        benchmark, benchmark_cached = cached_timing_benchmark()
+
+    first_comment = (
+        "Generated by run_rolling_origin_forecasting_experiment on "
+        f"{datetime.now().strftime('%m/%d/%Y, %H:%M:%S')}. "
+        f"Memory usage method: {MEMRECORD_METHOD}. "
+        f"Benchmark time cached: {benchmark_cached}. "
+        f"Window: {'expanding' if window_length is None else window_length}. "
+        f"Origins: {len(origins)}. Step: {step}. Refit interval: {refit_interval}"
+    )
+
+    second = str(forecaster.get_params()).replace("\n", " ").replace("\r", " ")
+
+    n_jobs = check_n_jobs(n_jobs)
+    blocks = np.array_split(np.arange(len(origins)), min(n_jobs, len(origins)))
+    if len(blocks) == 1:
+        block_results = [
+            _rolling_origin_block(
+                forecaster,
+                series,
+                origins,
+                0,
+                window_length,
+                refit_interval,
+                MEMRECORD_INTERVAL,
+                MEMRECORD_METHOD,
+            )
+        ]
+    else:
+        # memory is recorded per process, so blocks are run in separate processes
+        block_results = Parallel(n_jobs=len(blocks), backend="loky")(
+            delayed(_rolling_origin_block)(
+                clone(forecaster),
+                series,
+                origins[block],
+                block[0],
+                window_length,
+                refit_interval,
+                MEMRECORD_INTERVAL,
+                MEMRECORD_METHOD,
+            )
+            for block in blocks
+        )
+
+    preds = np.concatenate([r[0] for r in block_results])
+    fit_times = np.concatenate([r[1] for r in block_results])
+    predict_times = np.concatenate([r[2] for r in block_results])
+    mem_usage = max(r[3] for r in block_results)
+
+    labels = series[origins + horizon - 1]
+    errors = np.abs(labels - preds)
+    descriptions = [
+        f"Origin: {origin}. Refit: {fit_time >= 0}. Absolute error: {error}"
+        for origin, fit_time, error in zip(origins, fit_times, errors)
+    ]
+
+    write_forecasting_results(
+        preds,
+        labels,
+        forecaster_name,
+        dataset_name,
+        results_path,
+        full_path=False,
+        first_line_forecaster_name=f"{forecaster_name} ({type(forecaster).__name__})",
+        split="TEST",
+        random_seed=random_seed,
+        time_unit="MILLISECONDS",
+        first_line_comment=first_comment,
+        parameter_info=second,
+        mape=mean_absolute_percentage_error(labels, preds),
+        mase=mean_squared_error(labels, preds),
+        fit_time=int(round(fit_times[fit_times >= 0].sum())),
+        predict_time=int(round(predict_times.sum())),
+        benchmark_time=benchmark,
+        memory_usage=mem_usage,
+        pred_times=np.round(np.maximum(fit_times, 0) + predict_times, 3),
+        pred_descriptions=descriptions,
+    )
+
 
 def load_and_run_forecasting_experiment(
     problem_path,
@@ -1261,6 +2583,12 @@ def load_and_run_forecasting_experiment(
     att_max_shape=0,
     benchmark_time=True,
     overwrite=False,
+    profile=False,
+    rolling_origin=False,
+    window_length=None,
+    refit_interval=1,
+    n_jobs=1,
+    results_catalogue=None,
 ):
     """Load a dataset and run a regression experiment.
 
@@ -1287,10 +2615,29 @@ def load_and_run_forecasting_experiment(
         used for the results file name.
     benchmark_time : bool, default=True
         Whether to benchmark the hardware used with a simple function and write the
-        results. This will typically take ~2 seconds, but is hardware dependent.
+        results. The benchmark is cached per host (see cached_timing_benchmark), so
+        only takes ~2 seconds the first time it is run on a host.
     overwrite : bool, default=False
         If set to False, this will only build results if there is not a result file
         already present. If True, it will overwrite anything already there.
+    profile : bool, default=False
+        Whether to profile the fit and predict phases, see
+        run_forecasting_experiment. Not used if rolling_origin is True.
+    rolling_origin : bool, default=False
+        If True, evaluate the forecaster at every value of the test series using
+        run_rolling_origin_forecasting_experiment, with the train series as the
+        initial window. If False, fit the forecaster once on the train series.
+    window_length : int or None, default=None
+        The sliding window length for rolling_origin. If None, use an expanding
+        window.
+    refit_interval : int, default=1
+        Refit the forecaster every refit_interval origins for rolling_origin.
+    n_jobs : int, default=1
+        The number of processes to spread the origins over for rolling_origin.
+    results_catalogue : ResultsCatalogue or None, default=None
+        A catalogue of results_path (see tsml_eval.utils.results_catalogue) used to
+        find existing results files without checking for each file. Results missing
+        from the catalogue are still checked for on disk.
     """
     if forecaster_name is None:
         forecaster_name = type(forecaster).__name__
@@ -1303,6 +2650,7 @@ def load_and_run_forecasting_experiment(
         overwrite,
         True,
         False,
+        catalogue=results_catalogue,
     )
 
     if not build_test_file:
@@ -1323,6 +2671,22 @@ def load_and_run_forecasting_experiment(
     )
     test = test.astype(float).to_numpy()
 
+    if rolling_origin:
+        run_rolling_origin_forecasting_experiment(
+            np.concatenate((train, test)),
+            forecaster,
+            results_path,
+            len(train),
+            window_length=window_length,
+            refit_interval=refit_interval,
+            n_jobs=n_jobs,
+            forecaster_name=forecaster_name,
+            dataset_name=dataset,
+            random_seed=random_seed,
+            benchmark_time=benchmark_time,
+        )
+        return
+
     run_forecasting_experiment(
         train,
         test,
@@ -1334,4 +2698,56 @@ def load_and_run_forecasting_experiment(
         attribute_file_path=attribute_file_path,
         att_max_shape=att_max_shape,
         benchmark_time=benchmark_time,
+        profile=profile,
+    )
+
+
+def _rolling_origin_block(
+    forecaster,
+    series,
+    origins,
+    first_index,
+    window_length,
+    refit_interval,
+    memrecord_interval,
+    memrecord_method,
+):
+    """Fit and predict the forecaster at a contiguous block of forecast origins.
+
+    first_index is the position of the first origin of the block in all origins of
+    the experiment, used to keep refits at the same origins however the origins are
+    split. The forecaster is always fit at the first origin of the block. Returns
+    the prediction, fit time (milliseconds, -1 if not refit) and predict time
+    (milliseconds) at each origin and the maximum memory usage (bytes) of the block.
+    """
+    if window_length is not None:
+        windows = np.lib.stride_tricks.sliding_window_view(series, window_length)
+
+    preds = np.zeros(len(origins))
+    fit_times = np.full(len(origins), -1.0)
+    predict_times = np.zeros(len(origins))
+
+    def _run_block():
+        for i, origin in enumerate(origins):
+            y = (
+                series[:origin]
+                if window_length is None
+                else windows[origin - window_length]
+            )
+
+            if i == 0 or (
+                refit_interval > 0 and (first_index + i) % refit_interval == 0
+            ):
+                start = time.perf_counter()
+                forecaster.fit(y)
+                fit_times[i] = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            # the last value is the one horizon steps ahead of the origin
+            preds[i] = np.ravel(forecaster.predict(y))[-1]
+            predict_times[i] = (time.perf_counter() - start) * 1000
+
+    mem_usage = record_max_memory(
+        _run_block, interval=memrecord_interval, method=memrecord_method
     )
+    return preds, fit_times, predict_times, mem_usage
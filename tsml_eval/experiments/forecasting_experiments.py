@@ -33,7 +33,12 @@ from tsml_eval.experiments.experiments import load_and_run_forecasting_experimen
 from tsml_eval.experiments.tests import _FORECASTER_RESULTS_PATH
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH
 from tsml_eval.utils.arguments import parse_args
-from tsml_eval.utils.experiments import _results_present, assign_gpu
+from tsml_eval.utils.experiments import (
+    _results_present,
+    assign_gpu,
+    cached_timing_benchmark,
+)
+from tsml_eval.utils.import_time import ImportTimeRecorder
 
 
 def run_experiment(args, overwrite=False):
@@ -60,6 +65,13 @@ def run_experiment(args, overwrite=False):
         print("Input args = ", args)
         args = parse_args(args)
 
+        if args.refresh_benchmark:
+            cached_timing_benchmark(refresh=True)
+
+        recorder = ImportTimeRecorder()
+        if args.import_time:
+            recorder.start()
+
         # this is also checked in load_and_run, but doing a quick check here so can
         # print a message and make sure data is not loaded
         if not overwrite and _results_present(
@@ -93,7 +105,13 @@ def run_experiment(args, overwrite=False):
                 att_max_shape=args.att_max_shape,
                 benchmark_time=args.benchmark_time,
                 overwrite=args.overwrite,
+                profile=args.profile,
+                rolling_origin=args.rolling_origin,
             )
+
+        if args.import_time:
+            recorder.stop()
+            print(recorder.report())
     # local run (no args)
     else:
         # These are example parameters, change as required for local runs
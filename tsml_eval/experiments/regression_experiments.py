@@ -31,7 +31,12 @@ from tsml_eval.experiments import (
 from tsml_eval.experiments.tests import _REGRESSOR_RESULTS_PATH
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH
 from tsml_eval.utils.arguments import parse_args
-from tsml_eval.utils.experiments import _results_present, assign_gpu
+from tsml_eval.utils.experiments import (
+    _results_present,
+    assign_gpu,
+    cached_timing_benchmark,
+)
+from tsml_eval.utils.import_time import ImportTimeRecorder
 
 
 def run_experiment(args):
@@ -62,6 +67,13 @@ def run_experiment(args):
         print("Input args = ", args)
         args = parse_args(args)
 
+        if args.refresh_benchmark:
+            cached_timing_benchmark(refresh=True)
+
+        recorder = ImportTimeRecorder()
+        if args.import_time:
+            recorder.start()
+
         # this is also checked in load_and_run, but doing a quick check here so can
         # print a message and make sure data is not loaded
         if not args.overwrite and _results_present(
@@ -102,12 +114,21 @@ def run_experiment(args):
                     n_jobs=1,
                 ),
                 build_train_file=args.train_fold,
+                checkpoint_train_estimate=args.checkpoint_train,
                 write_attributes=args.write_attributes,
                 att_max_shape=args.att_max_shape,
                 benchmark_time=args.benchmark_time,
+                predict_max_memory=args.predict_max_memory,
+                profile=args.profile,
+                warm_up=args.warm_up,
+                phase_budget=args.phase_budget,
                 overwrite=args.overwrite,
                 predefined_resample=args.predefined_resample,
             )
+
+        if args.import_time:
+            recorder.stop()
+            print(recorder.report())
     # local run (no args)
     else:
         # These are example parameters, change as required for local runs
@@ -1,15 +1,34 @@
 """Functions to run algorithm scalability experiments."""
 
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "run_timing_experiment",
+    "run_scalability_experiment",
+]
+
+import itertools
+import multiprocessing
+import os
+import sys
 import time
+import traceback
 
 import numpy as np
+import pandas as pd
 from aeon.base._base import _clone_estimator
 from aeon.testing.data_generation import (
     make_example_2d_numpy_series,
     make_example_3d_numpy,
 )
+from scipy import stats
 from sklearn.utils import check_random_state
 
+import tsml_eval
+from tsml_eval.utils.memory_recorder import record_max_memory
+
+# the size of dimensions not in the grid of a scalability experiment
+_DEFAULT_SIZES = {"n_cases": 50, "n_channels": 1, "n_timepoints": 100}
+
 
 def run_timing_experiment(
     estimators,
@@ -128,12 +147,329 @@ def run_timing_experiment(
     return timings
 
 
+def run_scalability_experiment(
+    estimators,
+    grid=None,
+    results_path=None,
+    estimator_names=None,
+    input_type="collection",
+    function="fit",
+    n_repeats=5,
+    n_warm_up=1,
+    confidence=0.95,
+    timeout=None,
+    isolate=True,
+    random_state=None,
+):
+    """Measure how the run time and memory usage of estimators scale with data size.
+
+    Each estimator is measured at every point of a grid of data sizes. For each
+    measurement, randomly generated data of the grid point's size is created and the
+    function is first run once on a fresh clone of the estimator to record its peak
+    memory usage, then n_warm_up times untimed (i.e. to compile numba functions) and
+    n_repeats times timed using time.perf_counter.
+
+    An empirical complexity exponent is fitted for each estimator and grid dimension
+    with more than one size, see scalability_exponents in tsml_eval.evaluation.
+
+    Parameters
+    ----------
+    estimators : list
+        List of estimators to be evaluated.
+    grid : dict or None, default=None
+        The sizes to measure for each dimension, i.e. {"n_cases": [50, 100, 200],
+        "n_timepoints": [100, 200]}. Every combination of sizes is measured.
+        Dimensions can be "n_cases", "n_channels" and "n_timepoints", dimensions not
+        in the grid use a size of 50 cases, 1 channel or 100 timepoints. "n_cases" is
+        only valid for input_type="collection". If None, {"n_timepoints": [100, 200,
+        400, 800]} is used.
+    results_path : str or None, default=None
+        Location of where to write results. If not None, the measurements and
+        complexity exponents of each estimator are written to
+        <results_path>/<estimator_name>/Scalability/<input_type>_<function>.csv and
+        <input_type>_<function>_exponents.csv. Any required directories will be
+        created.
+    estimator_names : list of str or None, default=None
+        Names of the estimators used in the results. If None, the class names of the
+        estimators are used.
+    input_type : str, default="collection"
+        Type of input data to be generated. Options are "collection" or "series".
+    function : str, default="fit"
+        Function to be timed. Options are "fit", "predict", "fit_predict",
+        "predict_proba", "fit_predict_proba", "transform", or "fit_transform".
+
+        For "predict", "predict_proba" and "transform" the function will be timed
+        after the estimator has been fitted.
+    n_repeats : int, default=5
+        The number of timed runs of the function for each measurement.
+    n_warm_up : int, default=1
+        The number of untimed runs of the function before the timed runs.
+    confidence : float, default=0.95
+        The confidence level of the interval for the mean time.
+    timeout : float or None, default=None
+        The time limit in seconds for each measurement, including starting the
+        process, data generation, fitting and warm-up. Measurements which exceed
+        it are stopped and recorded with the status "timeout". Only used if isolate
+        is True.
+    isolate : bool, default=True
+        Whether to run each measurement in a new process. This isolates the peak
+        memory usage and any state left by other measurements, and allows a timeout.
+        If False, measurements are run in the calling process.
+    random_state : int or None, default=None
+        Random state to be used for data generation and estimator cloning.
+
+    Returns
+    -------
+    results : pd.DataFrame
+        One row per estimator and grid point. Columns are "estimator", "function",
+        "input_type", "n_cases", "n_channels", "n_timepoints", "status"
+        ("completed", "timeout" or "failed"), "n_repeats", "mean_time", "std_time",
+        "ci_lower", "ci_upper" and "min_time" (milliseconds), "peak_memory"
+        (bytes allocated by Python and libraries which report to tracemalloc, i.e.
+        numpy), "error" (the traceback of failed measurements), "version" (of the
+        package the estimator is from) and "tsml_eval_version".
+
+    Examples
+    --------
+    >>> from tsml_eval.experiments import run_scalability_experiment
+    >>> from tsml.dummy import DummyClassifier
+    >>> results = run_scalability_experiment(
+    ...     [DummyClassifier()], grid={"n_cases": [10, 20]}, n_repeats=2,
+    ...     isolate=False, random_state=0,
+    ... )
+    >>> results[["estimator", "n_cases", "status"]].values.tolist()
+    [['DummyClassifier', 10, 'completed'], ['DummyClassifier', 20, 'completed']]
+    """
+    if grid is None:
+        grid = {"n_timepoints": [100, 200, 400, 800]}
+    for dimension in grid:
+        if dimension not in _DEFAULT_SIZES or (
+            input_type == "series" and dimension == "n_cases"
+        ):
+            raise ValueError(f"Invalid dimension {dimension}")
+    if input_type not in ["collection", "series"]:
+        raise ValueError(f"Invalid input_type {input_type}")
+    if function not in _TIMED_FUNCTIONS:
+        raise ValueError(f"Invalid function {function}")
+    if n_repeats < 1:
+        raise ValueError("n_repeats must be greater than 0.")
+
+    if estimator_names is None:
+        estimator_names = [type(estimator).__name__ for estimator in estimators]
+    elif len(estimator_names) != len(estimators):
+        raise ValueError("estimator_names must be the same length as estimators.")
+
+    rng = check_random_state(random_state)
+    dimensions = list(grid)
+    points = []
+    for sizes in itertools.product(*grid.values()):
+        point = dict(_DEFAULT_SIZES)
+        point.update(zip(dimensions, sizes))
+        if input_type == "series":
+            point["n_cases"] = 1
+        points.append(point)
+
+    rows = []
+    for point in points:
+        data_seed = rng.randint(np.iinfo(np.int32).max)
+        for estimator, name in zip(estimators, estimator_names):
+            args = (
+                estimator,
+                rng.randint(np.iinfo(np.int32).max),
+                input_type,
+                point,
+                data_seed,
+                function,
+                n_warm_up,
+                n_repeats,
+            )
+            if isolate:
+                status, times, peak_memory, error = _isolated_measurement(args, timeout)
+            else:
+                status, times, peak_memory, error = _measurement(*args)
+
+            rows.append(
+                {
+                    "estimator": name,
+                    "function": function,
+                    "input_type": input_type,
+                    **point,
+                    "status": status,
+                    **_time_statistics(times, confidence),
+                    "peak_memory": peak_memory,
+                    "error": error,
+                    "version": _estimator_version(estimator),
+                    "tsml_eval_version": tsml_eval.__version__,
+                }
+            )
+
+    results = pd.DataFrame(rows)
+
+    if results_path is not None:
+        from tsml_eval.evaluation.scalability_evaluation import scalability_exponents
+
+        exponents = scalability_exponents(results)
+        for name in dict.fromkeys(estimator_names):
+            path = f"{results_path}/{name}/Scalability/"
+            os.makedirs(path, exist_ok=True)
+            results[results["estimator"] == name].to_csv(
+                f"{path}/{input_type}_{function}.csv", index=False
+            )
+            exponents[exponents["estimator"] == name].to_csv(
+                f"{path}/{input_type}_{function}_exponents.csv", index=False
+            )
+
+    return results
+
+
 def _time_function(function, loops, *args):
     """Time a function and return the time taken."""
     t = 0
     for i in range(loops + 1):
-        start = time.time()
+        start = time.perf_counter()
         function(*args)
         if i != 0:
-            t += (time.time() - start) * 1000
+            t += (time.perf_counter() - start) * 1000
     return t / loops
+
+
+_TIMED_FUNCTIONS = [
+    "fit",
+    "predict",
+    "fit_predict",
+    "predict_proba",
+    "fit_predict_proba",
+    "transform",
+    "fit_transform",
+]
+
+
+def _measurement(
+    estimator,
+    estimator_seed,
+    input_type,
+    point,
+    data_seed,
+    function,
+    n_warm_up,
+    n_repeats,
+):
+    """Time a function of the estimator on generated data of the given size.
+
+    Returns the status, the time of each repeat in milliseconds, the peak memory
+    usage in bytes and the traceback if the measurement failed.
+    """
+    try:
+        if input_type == "collection":
+            X, y = make_example_3d_numpy(
+                n_cases=point["n_cases"],
+                n_channels=point["n_channels"],
+                n_timepoints=point["n_timepoints"],
+                random_state=data_seed,
+            )
+        else:
+            X = make_example_2d_numpy_series(
+                n_channels=point["n_channels"],
+                n_timepoints=point["n_timepoints"],
+                random_state=data_seed,
+            )
+            y = None
+
+        estimator = _clone_estimator(estimator, random_state=estimator_seed)
+        if function in ["predict", "predict_proba", "transform"]:
+            estimator.fit(X, y)
+            method = getattr(estimator, function)
+            args = (X,)
+        else:
+            method = getattr(estimator, function)
+            args = (X, y)
+
+        # the first run on the fresh clone, before the allocator and any caches are
+        # warm. tracemalloc records the peak allocation rather than sampling the
+        # process, which misses short-lived allocations
+        peak_memory = record_max_memory(method, args=args, method="tracemalloc")
+
+        for _ in range(n_warm_up):
+            method(*args)
+
+        times = []
+        for _ in range(n_repeats):
+            start = time.perf_counter()
+            method(*args)
+            times.append((time.perf_counter() - start) * 1000)
+    except Exception:
+        return "failed", [], -1, traceback.format_exc()
+
+    return "completed", times, peak_memory, None
+
+
+def _isolated_measurement(args, timeout):
+    """Run _measurement in a new process, stopping it after timeout seconds."""
+    from tsml_eval.utils.experiments import _start_method
+
+    context = multiprocessing.get_context(_start_method())
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measurement_process, args=(sender, args))
+    process.start()
+    sender.close()
+
+    result = None
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:  # the process died, i.e. killed by the OS
+            result = None
+    else:
+        process.terminate()
+        process.join()
+        receiver.close()
+        return "timeout", [], -1, None
+
+    process.join()
+    receiver.close()
+    if result is None:
+        return (
+            "failed",
+            [],
+            -1,
+            f"Measurement process exited with code {process.exitcode}.",
+        )
+    return result
+
+
+def _measurement_process(sender, args):
+    sender.send(_measurement(*args))
+    sender.close()
+
+
+def _time_statistics(times, confidence):
+    """Return the mean and spread of repeat times with a t confidence interval."""
+    n = len(times)
+    if n == 0:
+        return {
+            "n_repeats": 0,
+            "mean_time": np.nan,
+            "std_time": np.nan,
+            "ci_lower": np.nan,
+            "ci_upper": np.nan,
+            "min_time": np.nan,
+        }
+
+    mean = np.mean(times)
+    std = np.std(times, ddof=1) if n > 1 else 0.0
+    half_width = (
+        stats.t.ppf((1 + confidence) / 2, n - 1) * std / np.sqrt(n) if n > 1 else 0.0
+    )
+    return {
+        "n_repeats": n,
+        "mean_time": mean,
+        "std_time": std,
+        "ci_lower": mean - half_width,
+        "ci_upper": mean + half_width,
+        "min_time": np.min(times),
+    }
+
+
+def _estimator_version(estimator):
+    package = type(estimator).__module__.split(".")[0]
+    return getattr(sys.modules.get(package), "__version__", "N/A")
@@ -0,0 +1,249 @@
+"""Predict the cost of experiment jobs from historical results to schedule them."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "estimate_job_costs",
+    "longest_first_order",
+]
+
+import os
+from collections import defaultdict
+
+import numpy as np
+
+from tsml_eval.utils.functions import time_to_milliseconds
+
+_RESULTS_FILE_PREFIX = {
+    "classification": "test",
+    "regression": "test",
+    "clustering": "train",
+    "forecasting": "test",
+}
+
+
+def estimate_job_costs(
+    jobs,
+    results_path,
+    task="classification",
+    dataset_sizes=None,
+    data_path=None,
+    benchmark_time=None,
+):
+    """Predict the runtime and memory usage of experiment jobs from past results.
+
+    The fit time, predict time, memory usage and benchmark time are read from the
+    third line of the existing results files of each estimator in results_path.
+
+    - If the estimator has results on the job dataset (i.e. other resamples), the
+      median of its recorded values is used.
+    - Otherwise, if the estimator has results on other datasets, the median of its
+      runtime and memory usage per unit of dataset size is scaled by the size of the
+      job dataset. This assumes costs grow linearly with the dataset size, which
+      underestimates estimators which scale worse than linearly.
+    - Otherwise, the job cost is unknown.
+
+    Parameters
+    ----------
+    jobs : list of tuple
+        The (estimator_name, dataset_name, resample_id) jobs to predict costs for.
+    results_path : str
+        Location of existing results files, in the standard tsml layout.
+    task : str, default="classification"
+        The learning task of the jobs, one of "classification", "regression",
+        "clustering" or "forecasting". Determines which results file is read.
+    dataset_sizes : dict, list of dict or None, default=None
+        Dictionaries of dataset name to a size, in the style of
+        tsml_eval/datasets/_test_data/_data_sizes.py. If a list, the sizes for each
+        dataset are summed, i.e. [DATA_TRAIN_SIZES, DATA_TEST_SIZES] gives the total
+        number of cases. Datasets missing from any dictionary have an unknown size.
+        If None, the size in bytes of the dataset files in data_path is used.
+    data_path : str or None, default=None
+        Location of problem files, used to find dataset sizes if dataset_sizes is
+        None. If both are None, costs are only predicted for datasets with results.
+    benchmark_time : float or None, default=None
+        The timing benchmark of the machine the jobs will run on, see
+        tsml_eval.utils.experiments.timing_benchmark. If given, historical runtimes
+        are scaled by the ratio of this to the benchmark recorded in the results
+        file, so results from faster or slower machines can be used.
+
+    Returns
+    -------
+    job_costs : dict
+        Dictionary with job keys and (runtime, memory_usage) tuple values, with the
+        runtime in milliseconds and memory usage in bytes. Either value is None if
+        it could not be predicted.
+
+    Examples
+    --------
+    >>> from tsml_eval.experiments.scheduling import estimate_job_costs
+    >>> from tsml_eval.testing.testing_utils import _TEST_RESULTS_PATH
+    >>> costs = estimate_job_costs(
+    ...     [("ROCKET", "Chinatown", 1), ("ROCKET", "UnknownDataset", 0)],
+    ...     f"{_TEST_RESULTS_PATH}/classification/",
+    ... )
+    >>> costs[("ROCKET", "Chinatown", 1)][0] > 0
+    True
+    >>> costs[("ROCKET", "UnknownDataset", 0)]
+    (None, None)
+    """
+    if task not in _RESULTS_FILE_PREFIX:
+        raise ValueError(
+            f"Unknown task: {task}. Must be one of {list(_RESULTS_FILE_PREFIX)}."
+        )
+
+    if isinstance(dataset_sizes, dict):
+        dataset_sizes = [dataset_sizes]
+
+    size_cache = {}
+
+    def size(dataset):
+        if dataset not in size_cache:
+            size_cache[dataset] = _dataset_size(dataset, dataset_sizes, data_path)
+        return size_cache[dataset]
+
+    history = {}
+    job_costs = {}
+    for job in jobs:
+        estimator, dataset = job[0], job[1]
+        if estimator not in history:
+            history[estimator] = _read_estimator_history(
+                results_path, estimator, task, benchmark_time
+            )
+        estimator_history = history[estimator]
+
+        runtimes, memory = estimator_history.get(dataset, ([], []))
+        if len(runtimes) > 0:
+            job_costs[job] = (_median(runtimes), _median(memory))
+            continue
+
+        job_size = size(dataset)
+        if job_size is None:
+            job_costs[job] = (None, None)
+            continue
+
+        runtime_rates = []
+        memory_rates = []
+        for other, (runtimes, memory) in estimator_history.items():
+            other_size = size(other)
+            if other_size is None or other_size <= 0:
+                continue
+            if len(runtimes) > 0:
+                runtime_rates.append(_median(runtimes) / other_size)
+            if len(memory) > 0:
+                memory_rates.append(_median(memory) / other_size)
+
+        job_costs[job] = (
+            _median(runtime_rates) * job_size if len(runtime_rates) > 0 else None,
+            _median(memory_rates) * job_size if len(memory_rates) > 0 else None,
+        )
+
+    return job_costs
+
+
+def longest_first_order(job_costs):
+    """Order jobs by decreasing predicted runtime.
+
+    Starting the longest jobs first stops a long job which is started last from
+    dominating the total runtime of a batch. Jobs with an unknown runtime are placed
+    first, as they may be the longest. Ties keep their input order.
+
+    Parameters
+    ----------
+    job_costs : dict
+        Dictionary with job keys and (runtime, memory_usage) tuple values, see
+        estimate_job_costs.
+
+    Returns
+    -------
+    jobs : list of tuple
+        The jobs of job_costs, longest first.
+
+    Examples
+    --------
+    >>> from tsml_eval.experiments.scheduling import longest_first_order
+    >>> costs = {("A", "D", 0): (10, 0), ("B", "D", 0): (None, None)}
+    >>> costs[("C", "D", 0)] = (20, 0)
+    >>> longest_first_order(costs)
+    [('B', 'D', 0), ('C', 'D', 0), ('A', 'D', 0)]
+    """
+    return sorted(
+        job_costs,
+        key=lambda job: (-np.inf if job_costs[job][0] is None else -job_costs[job][0]),
+    )
+
+
+def _read_estimator_history(results_path, estimator, task, benchmark_time):
+    """Read the runtimes and memory usage of an estimator's results files."""
+    prefix = _RESULTS_FILE_PREFIX[task]
+    history = defaultdict(lambda: ([], []))
+
+    predictions_path = f"{results_path}/{estimator}/Predictions/"
+    if not os.path.isdir(predictions_path):
+        return history
+
+    for dataset_dir in os.scandir(predictions_path):
+        if not dataset_dir.is_dir():
+            continue
+
+        for file in os.scandir(dataset_dir.path):
+            name = file.name
+            if not (name.startswith(f"{prefix}Resample") and name.endswith(".csv")):
+                continue
+
+            costs = _read_results_costs(file.path, task, benchmark_time)
+            if costs is None:
+                continue
+
+            runtime, memory = costs
+            runtimes, memory_usage = history[dataset_dir.name]
+            if runtime is not None:
+                runtimes.append(runtime)
+            if memory is not None:
+                memory_usage.append(memory)
+
+    return history
+
+
+def _read_results_costs(file_path, task, benchmark_time):
+    """Read the runtime and memory usage from the header of a results file."""
+    from tsml_eval.evaluation.storage.estimator_results import _read_results_header
+    from tsml_eval.evaluation.storage.results_summary import _summary_from_header
+
+    try:
+        rs = _summary_from_header(_read_results_header(file_path), task=task)
+    except (OSError, IndexError, ValueError):
+        return None
+
+    runtime = None
+    if rs.fit_time >= 0:
+        runtime = time_to_milliseconds(rs.fit_time, rs.time_unit)
+        if rs.predict_time >= 0:
+            runtime += time_to_milliseconds(rs.predict_time, rs.time_unit)
+
+    if runtime is not None and benchmark_time is not None and rs.benchmark_time > 0:
+        runtime *= benchmark_time / rs.benchmark_time
+
+    return runtime, rs.memory_usage if rs.memory_usage >= 0 else None
+
+
+def _dataset_size(dataset, dataset_sizes, data_path):
+    if dataset_sizes is not None:
+        if not all(dataset in sizes for sizes in dataset_sizes):
+            return None
+        return sum(sizes[dataset] for sizes in dataset_sizes)
+
+    if data_path is None:
+        return None
+
+    size = 0
+    dataset_path = f"{data_path}/{dataset}/"
+    if not os.path.isdir(dataset_path):
+        return None
+    for file in os.scandir(dataset_path):
+        if file.is_file() and file.name.startswith(dataset):
+            size += file.stat().st_size
+    return size if size > 0 else None
+
+
+def _median(values):
+    return float(np.median(values)) if len(values) > 0 else None
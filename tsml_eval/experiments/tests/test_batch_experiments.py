@@ -0,0 +1,164 @@
+"""Tests for batch experiments."""
+
+import os
+
+import numba
+import pytest
+
+from tsml_eval.experiments import batch_experiments
+from tsml_eval.experiments.batch_experiments import (
+    experiment_job_grid,
+    load_job_manifest,
+    run_batch_experiments,
+)
+from tsml_eval.experiments.tests import (
+    _CLASSIFIER_RESULTS_PATH,
+    _REGRESSOR_RESULTS_PATH,
+)
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.tests.test_results_writing import (
+    _check_classification_file_format,
+    _check_regression_file_format,
+)
+
+
+def test_experiment_job_grid():
+    """Test the creation of a job grid from a dataset list file."""
+    jobs = experiment_job_grid(
+        ["DummyClassifier", "ROCKET"],
+        f"{_TEST_DATA_PATH}/_test_data/test_datalist.txt",
+        2,
+    )
+
+    assert len(jobs) == 8
+    assert jobs[0] == ("DummyClassifier", "MinimalChinatown", 0)
+    assert jobs[-1] == ("ROCKET", "MinimalGasPrices", 1)
+
+
+def test_load_job_manifest():
+    """Test loading jobs from a manifest file."""
+    path = f"{_TEST_OUTPUT_PATH}/batch/manifest.csv"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("# estimator,dataset,resample\n")
+        f.write("DummyClassifier,MinimalChinatown,0\n\n")
+        f.write("DummyClassifier, MinimalChinatown, 3\n")
+
+    jobs = load_job_manifest(path)
+    assert jobs == [
+        ("DummyClassifier", "MinimalChinatown", 0),
+        ("DummyClassifier", "MinimalChinatown", 3),
+    ]
+
+    with open(path, "w") as f:
+        f.write("DummyClassifier,MinimalChinatown\n")
+    with pytest.raises(ValueError, match="Invalid job on line 1"):
+        load_job_manifest(path)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_run_batch_classification_experiments(n_jobs):
+    """Test running a batch of classification experiments."""
+    jobs = experiment_job_grid(
+        ["DummyClassifier-tsml"], ["MinimalChinatown", "EqualMinimalJapaneseVowels"], 2
+    )
+    results_path = f"{_CLASSIFIER_RESULTS_PATH}/batch{n_jobs}/"
+
+    status = run_batch_experiments(
+        _TEST_DATA_PATH,
+        results_path,
+        jobs,
+        n_jobs=n_jobs,
+        train_fold=True,
+        benchmark_time=False,
+        verbose=False,
+    )
+
+    assert len(status) == 4
+    assert all(s == "completed" for s in status.values())
+    # the thread limits of workers are not left on the calling process
+    assert numba.get_num_threads() == numba.config.NUMBA_NUM_THREADS
+    for _, dataset, resample in jobs:
+        for split in ["test", "train"]:
+            file = (
+                f"{results_path}/DummyClassifier-tsml/Predictions/{dataset}/"
+                f"{split}Resample{resample}.csv"
+            )
+            assert os.path.exists(file)
+            _check_classification_file_format(file)
+
+    # finished jobs are skipped
+    status = run_batch_experiments(
+        _TEST_DATA_PATH, results_path, jobs, n_jobs=n_jobs, train_fold=True
+    )
+    assert all(s == "skipped" for s in status.values())
+
+
+def test_run_batch_experiments_failures():
+    """Test that failed jobs are reported without stopping the batch."""
+    jobs = [
+        ("DummyRegressor", "MinimalGasPrices", 0),
+        ("DummyRegressor", "NotADataset", 0),
+        ("NotARegressor", "MinimalGasPrices", 0),
+    ]
+
+    status = run_batch_experiments(
+        _TEST_DATA_PATH,
+        _REGRESSOR_RESULTS_PATH,
+        jobs,
+        task="regression",
+        n_jobs=1,
+        benchmark_time=False,
+    )
+
+    assert status[jobs[0]] == "completed"
+    assert "FileNotFoundError" in status[jobs[1]]
+    assert "UNKNOWN REGRESSOR" in status[jobs[2]]
+
+    test_file = (
+        f"{_REGRESSOR_RESULTS_PATH}/DummyRegressor/Predictions/MinimalGasPrices/"
+        "testResample0.csv"
+    )
+    _check_regression_file_format(test_file)
+    os.remove(test_file)
+
+    with pytest.raises(ValueError, match="Unknown task"):
+        run_batch_experiments(_TEST_DATA_PATH, _REGRESSOR_RESULTS_PATH, [], task="a")
+
+
+def test_run_batch_experiments_main():
+    """Test running a batch of experiments from command line arguments."""
+    args = [
+        _TEST_DATA_PATH,
+        f"{_REGRESSOR_RESULTS_PATH}/batch_main/",
+        "-t",
+        "regression",
+        "-en",
+        "DummyRegressor",
+        "-dn",
+        f"{_TEST_DATA_PATH}/_test_data/test_datalist.txt",
+        "-r",
+        "0",
+        "2",
+        "-nj",
+        "1",
+    ]
+
+    status = batch_experiments.run_experiment(args)
+    assert len(status) == 4
+    assert all(s == "completed" for s in status.values())
+
+    sizes_path = f"{_TEST_OUTPUT_PATH}/batch/dataset_sizes.csv"
+    os.makedirs(os.path.dirname(sizes_path), exist_ok=True)
+    with open(sizes_path, "w") as f:
+        f.write("# dataset,size\nMinimalChinatown,20\nMinimalGasPrices,20\n")
+    status = batch_experiments.run_experiment(
+        args + ["-ds", sizes_path, sizes_path, "-lf", "-uc"]
+    )
+    assert all(s == "skipped" for s in status.values())
+    assert os.path.exists(
+        f"{_REGRESSOR_RESULTS_PATH}/batch_main/results_catalogue.sqlite"
+    )
+
+    with pytest.raises(ValueError, match="Either --manifest"):
+        batch_experiments.run_experiment(args[:4])
@@ -1,11 +1,14 @@
 """Tests for cross-validation functions."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from aeon.classification import DummyClassifier
+from aeon.classification.distance_based import KNeighborsTimeSeriesClassifier
 from aeon.datasets import load_covid_3month, load_unit_test
 from aeon.regression import DummyRegressor
+from sklearn.model_selection import KFold, StratifiedKFold
 
 from tsml_eval.experiments.cross_validation import (
     classification_cross_validation,
@@ -75,3 +78,72 @@ def test_regression_cross_validation():
     assert len(folds[0]) == 2
     assert isinstance(folds[0][0], np.ndarray)
     assert isinstance(folds[0][1], np.ndarray)
+
+
+def test_parallel_cross_validation():
+    """Test folds run in parallel write the same results as the sequential run."""
+    X, y = load_unit_test()
+    X = X.astype(np.float64)
+
+    results = []
+    for n_jobs in [1, 2]:
+        report = classification_cross_validation(
+            X,
+            y,
+            KNeighborsTimeSeriesClassifier(),
+            _CLASSIFIER_RESULTS_PATH,
+            cv=StratifiedKFold(n_splits=4, shuffle=True, random_state=0),
+            fold_ids=[0, 2, 3],
+            classifier_name=f"KNNParallelCV{n_jobs}",
+            benchmark_time=False,
+            n_jobs=n_jobs,
+        )
+
+        assert report["n_folds"] == 3
+        assert report["n_jobs"] == n_jobs
+        assert report["wall_time"] > 0 and report["fold_time"] > 0
+        assert report["folds_per_hour"] > 0
+
+        lines = []
+        for i in [0, 2, 3]:
+            test_file = (
+                f"{_CLASSIFIER_RESULTS_PATH}/KNNParallelCV{n_jobs}/Predictions/"
+                f"testResample{i}.csv"
+            )
+            with open(test_file) as f:
+                lines.append(f.readlines()[3:])
+        assert not os.path.exists(
+            f"{_CLASSIFIER_RESULTS_PATH}/KNNParallelCV{n_jobs}/Predictions/"
+            "testResample1.csv"
+        )
+        results.append(lines)
+
+    assert results[0] == results[1]
+
+
+def test_cross_validation_executor():
+    """Test running the folds of unequal length data with a passed executor."""
+    X, y = load_covid_3month()
+    X = [x for x in X]
+    regressor = DummyRegressor()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report = regression_cross_validation(
+            X,
+            y,
+            regressor,
+            _REGRESSOR_RESULTS_PATH,
+            cv=KFold(n_splits=3),
+            regressor_name="DummyRegressorExecutorCV",
+            benchmark_time=False,
+            executor=executor,
+        )
+
+    assert report["n_folds"] == 3
+    # each fold is run with a clone rather than the shared estimator
+    assert not regressor.is_fitted
+    for i in range(3):
+        _check_regression_file_format(
+            f"{_REGRESSOR_RESULTS_PATH}/DummyRegressorExecutorCV/Predictions/"
+            f"testResample{i}.csv"
+        )
@@ -1,15 +1,39 @@
 """General tests for the experiments module."""
 
 import os
+import shutil
 
+import numpy as np
+import pytest
 from aeon.classification import DummyClassifier
+from aeon.classification.distance_based import KNeighborsTimeSeriesClassifier
+from aeon.forecasting import RegressionForecaster
+from aeon.regression.distance_based import KNeighborsTimeSeriesRegressor
+from aeon.transformations.collection import Normalizer
+from sklearn.model_selection import cross_val_predict
+from sklearn.preprocessing import LabelEncoder
 
+from tsml_eval.evaluation.storage import (
+    load_classifier_results,
+    load_forecaster_results,
+)
 from tsml_eval.experiments import (
     classification_experiments,
     load_and_run_classification_experiment,
+    run_classification_experiment,
+    run_regression_experiment,
+)
+from tsml_eval.experiments.experiments import (
+    _chunked_predict,
+    _cross_validate_train_data,
+    _fold_estimator,
+    load_and_run_forecasting_experiment,
+    run_rolling_origin_forecasting_experiment,
 )
 from tsml_eval.experiments.tests import _CLASSIFIER_RESULTS_PATH
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.datasets import load_experiment_data
+from tsml_eval.utils.results_validation import validate_results_file
 from tsml_eval.utils.tests.test_results_writing import _check_classification_file_format
 
 
@@ -70,3 +94,352 @@ def test_experiments_predefined_resample_data_loading():
     _check_classification_file_format(test_file)
 
     os.remove(test_file)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_cross_validate_train_data(n_jobs):
+    """Test the parallel cross-validation train estimate matches cross_val_predict."""
+    X_train, y_train, _, _, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 0, False
+    )
+    y_train = LabelEncoder().fit_transform(y_train)
+    classifier = KNeighborsTimeSeriesClassifier(distance="euclidean")
+
+    probs, train_time, fit_times, mem_usage = _cross_validate_train_data(
+        classifier, X_train, y_train, 5, "predict_proba", n_jobs
+    )
+
+    expected = cross_val_predict(
+        classifier, X_train, y=y_train, cv=5, method="predict_proba"
+    )
+    np.testing.assert_array_almost_equal(probs, expected)
+    assert len(fit_times) == 5 and len(mem_usage) == 5
+    assert all(t >= 0 for t in fit_times) and train_time >= 0
+
+    regressor = KNeighborsTimeSeriesRegressor(distance="euclidean")
+    preds, _, _, _ = _cross_validate_train_data(
+        regressor, X_train, y_train.astype(float), 5, "predict", n_jobs
+    )
+    expected = cross_val_predict(regressor, X_train, y=y_train.astype(float), cv=5)
+    np.testing.assert_array_almost_equal(preds, expected)
+
+
+def test_cross_validate_train_data_checkpoint():
+    """Test saved cross-validation folds are loaded rather than run again."""
+    X_train, y_train, _, _, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 0, False
+    )
+    y_train = LabelEncoder().fit_transform(y_train)
+    classifier = KNeighborsTimeSeriesClassifier(distance="euclidean")
+    checkpoint_path = f"{_TEST_OUTPUT_PATH}/fold_checkpoint/"
+    shutil.rmtree(checkpoint_path, ignore_errors=True)
+
+    probs, _, fit_times, _ = _cross_validate_train_data(
+        classifier, X_train, y_train, 5, "predict_proba", 1, checkpoint_path
+    )
+    assert len(os.listdir(checkpoint_path)) == 5
+
+    # replace the output of fold 0 and delete fold 1 to simulate a restart
+    with np.load(f"{checkpoint_path}/fold0.npz") as f:
+        fold0 = dict(f)
+    fold0["preds"] = np.full(fold0["preds"].shape, 0.5)
+    np.savez(f"{checkpoint_path}/fold0.npz", **fold0)
+    os.remove(f"{checkpoint_path}/fold1.npz")
+
+    probs2, _, fit_times2, _ = _cross_validate_train_data(
+        classifier, X_train, y_train, 5, "predict_proba", 1, checkpoint_path
+    )
+    assert np.all(probs2[fold0["test"]] == 0.5)
+    mask = np.ones(len(y_train), dtype=bool)
+    mask[fold0["test"]] = False
+    np.testing.assert_array_almost_equal(probs2[mask], probs[mask])
+    assert fit_times2[2:] == fit_times[2:]
+
+    # checkpoints for a different estimator are not used
+    probs3, _, _, _ = _cross_validate_train_data(
+        KNeighborsTimeSeriesClassifier(distance="dtw"),
+        X_train,
+        y_train,
+        5,
+        "predict_proba",
+        1,
+        checkpoint_path,
+    )
+    assert not np.all(probs3[fold0["test"]] == 0.5)
+
+    # checkpoints for different data are not used
+    probs, _, _, _ = _cross_validate_train_data(
+        classifier, X_train, y_train, 5, "predict_proba", 1, checkpoint_path
+    )
+    np.savez(f"{checkpoint_path}/fold0.npz", **fold0)
+    probs4, _, _, _ = _cross_validate_train_data(
+        classifier, X_train * 2, y_train, 5, "predict_proba", 1, checkpoint_path
+    )
+    assert not np.all(probs4[fold0["test"]] == 0.5)
+
+
+def test_checkpoint_train_estimate():
+    """Test saved folds are removed after the train file is written."""
+    load_and_run_classification_experiment(
+        _TEST_DATA_PATH,
+        _CLASSIFIER_RESULTS_PATH,
+        "MinimalChinatown",
+        KNeighborsTimeSeriesClassifier(distance="euclidean"),
+        classifier_name="CheckpointKNN",
+        build_train_file=True,
+        checkpoint_train_estimate=True,
+        benchmark_time=False,
+        overwrite=True,
+    )
+
+    path = f"{_CLASSIFIER_RESULTS_PATH}/CheckpointKNN/"
+    train_file = f"{path}/Predictions/MinimalChinatown/trainResample0.csv"
+    _check_classification_file_format(train_file)
+    assert not os.path.exists(
+        f"{path}/Workspace/MinimalChinatown/trainEstimateResample0/"
+    )
+    shutil.rmtree(path)
+
+
+@pytest.mark.parametrize("concurrent_estimators", [False, True])
+def test_load_and_run_multiple_estimators(concurrent_estimators):
+    """Test running multiple estimators on a single load of the data."""
+    names = ["DummyClassifier-tsml", "MultiDummy"]
+    for name in names:
+        shutil.rmtree(f"{_CLASSIFIER_RESULTS_PATH}/{name}/", ignore_errors=True)
+
+    load_and_run_classification_experiment(
+        _TEST_DATA_PATH,
+        _CLASSIFIER_RESULTS_PATH,
+        "MinimalChinatown",
+        ["DummyClassifier-tsml", DummyClassifier()],
+        classifier_name=[None, "MultiDummy"],
+        data_transforms=[Normalizer()],
+        benchmark_time=False,
+        n_jobs=2,
+        concurrent_estimators=concurrent_estimators,
+    )
+
+    for name in names:
+        test_file = (
+            f"{_CLASSIFIER_RESULTS_PATH}/{name}/Predictions/MinimalChinatown/"
+            "testResample0.csv"
+        )
+        _check_classification_file_format(test_file)
+
+    # estimators with existing results are skipped
+    with pytest.warns(UserWarning, match="All files exist"):
+        load_and_run_classification_experiment(
+            _TEST_DATA_PATH,
+            _CLASSIFIER_RESULTS_PATH,
+            "MinimalChinatown",
+            ["DummyClassifier-tsml", DummyClassifier()],
+            classifier_name=[None, "MultiDummy"],
+        )
+
+    for name in names:
+        shutil.rmtree(f"{_CLASSIFIER_RESULTS_PATH}/{name}/")
+
+    with pytest.raises(ValueError, match="must match the number of estimators"):
+        load_and_run_classification_experiment(
+            _TEST_DATA_PATH,
+            _CLASSIFIER_RESULTS_PATH,
+            "MinimalChinatown",
+            ["DummyClassifier-tsml", DummyClassifier()],
+            classifier_name=["MultiDummy"],
+        )
+
+
+@pytest.mark.parametrize("dataset", ["MinimalChinatown", "UnequalMinimalChinatown"])
+def test_chunked_predict(dataset):
+    """Test predicting in chunks matches predicting all cases at once."""
+    X_train, y_train, X_test, _, _ = load_experiment_data(
+        _TEST_DATA_PATH, dataset, 0, False
+    )
+    classifier = KNeighborsTimeSeriesClassifier(distance="euclidean")
+    classifier.fit(X_train, y_train)
+
+    expected = classifier.predict_proba(X_test)
+    # a budget of 1 byte predicts one case per chunk after the first
+    for max_memory in [None, 1, 1024**3]:
+        probs = _chunked_predict(classifier.predict_proba, X_test, max_memory)
+        np.testing.assert_array_almost_equal(probs, expected)
+
+    preds = _chunked_predict(classifier.predict, X_test, 1)
+    np.testing.assert_array_equal(preds, classifier.predict(X_test))
+
+
+def test_chunked_predict_chunk_sizes():
+    """Test the chunk sizes used to predict in chunks fit the memory budget."""
+    case_memory = 2 * 1024**2
+    chunk_sizes = []
+
+    def predict(X):
+        chunk_sizes.append(len(X))
+        # a short-lived allocation of around case_memory per case
+        np.ones((len(X), case_memory // 8)).sum()
+        return np.zeros(len(X))
+
+    X = np.zeros((2000, 1, 10))
+    preds = _chunked_predict(predict, X, 100 * 1024**2)
+
+    assert len(preds) == 2000
+    assert sum(chunk_sizes) == 2000
+    assert chunk_sizes[0] == 16
+    assert 1 < len(chunk_sizes)
+    assert all(n <= 50 for n in chunk_sizes)
+
+
+def test_predict_max_memory():
+    """Test experiments predicting in chunks write the same predictions."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalGasPrices", 0, False
+    )
+
+    results = []
+    for i, predict_max_memory in enumerate([None, 1]):
+        results_path = f"{_TEST_OUTPUT_PATH}/predict_max_memory{i}/"
+        run_regression_experiment(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            KNeighborsTimeSeriesRegressor(distance="euclidean"),
+            results_path,
+            dataset_name="MinimalGasPrices",
+            resample_id=0,
+            benchmark_time=False,
+            predict_max_memory=predict_max_memory,
+        )
+
+        with open(
+            f"{results_path}/KNeighborsTimeSeriesRegressor/Predictions/"
+            "MinimalGasPrices/testResample0.csv"
+        ) as f:
+            results.append(f.readlines()[3:])
+
+    assert results[0] == results[1]
+
+
+def test_jit_warm_up():
+    """Test the warm-up compile time is written separately to the results files."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 0, False
+    )
+    results_path = f"{_TEST_OUTPUT_PATH}/warm_up/"
+
+    run_classification_experiment(
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        KNeighborsTimeSeriesClassifier(distance="msm"),
+        results_path,
+        classifier_name="WarmUpKNN",
+        dataset_name="MinimalChinatown",
+        resample_id=0,
+        build_train_file=True,
+        benchmark_time=False,
+        warm_up=True,
+    )
+
+    for split in ["train", "test"]:
+        file_path = (
+            f"{results_path}/WarmUpKNN/Predictions/MinimalChinatown/"
+            f"{split}Resample0.csv"
+        )
+        assert validate_results_file(file_path)
+        _check_classification_file_format(file_path)
+
+        with open(file_path) as f:
+            line3 = f.readlines()[2].split(",")
+        assert len(line3) == 10
+
+        cr = load_classifier_results(file_path)
+        assert cr.compile_time == float(line3[9]) and cr.compile_time >= 0
+
+
+@pytest.mark.parametrize("window_length", [None, 8])
+def test_rolling_origin_forecasting(window_length):
+    """Test rolling-origin forecasting with origins spread over processes."""
+    y = np.sin(np.arange(60) / 3) + 2
+    results_path = f"{_TEST_OUTPUT_PATH}/rolling_origin/"
+
+    preds = []
+    for n_jobs in [1, 2]:
+        run_rolling_origin_forecasting_experiment(
+            y,
+            RegressionForecaster(window=4),
+            results_path,
+            40,
+            window_length=window_length,
+            refit_interval=3,
+            n_jobs=n_jobs,
+            dataset_name="Sine",
+            random_seed=0,
+            benchmark_time=False,
+        )
+
+        fr = load_forecaster_results(
+            f"{results_path}/RegressionForecaster/Predictions/Sine/testResample0.csv"
+        )
+        assert len(fr.predictions) == 20
+        np.testing.assert_array_equal(fr.target_labels, y[40:])
+        assert fr.fit_time >= 0 and fr.predict_time >= 0
+        assert len(fr.pred_times) == 20
+        assert fr.pred_descriptions[0].startswith("Origin: 40. Refit: True.")
+        assert fr.pred_descriptions[1].startswith("Origin: 41. Refit: False.")
+        # the second process fits at the first origin of its block
+        refit = [d.split(". ")[1] == "Refit: True" for d in fr.pred_descriptions]
+        assert refit[10] == (n_jobs == 2)
+        preds.append(fr.predictions)
+
+    # refits stay at the same origins for the first block
+    np.testing.assert_allclose(preds[0][:10], preds[1][:10])
+
+    shutil.rmtree(results_path)
+
+
+def test_load_and_run_rolling_origin_forecasting():
+    """Test the test series is evaluated with the train series as initial window."""
+    data_path = f"{_TEST_OUTPUT_PATH}/rolling_origin_data/"
+    results_path = f"{_TEST_OUTPUT_PATH}/load_rolling_origin/"
+    y = np.sin(np.arange(50) / 3) + 2
+    os.makedirs(f"{data_path}/Sine/", exist_ok=True)
+    np.savetxt(f"{data_path}/Sine/Sine_TRAIN.csv", y[:35], header="y", comments="")
+    np.savetxt(f"{data_path}/Sine/Sine_TEST.csv", y[35:], header="y", comments="")
+
+    load_and_run_forecasting_experiment(
+        data_path,
+        results_path,
+        "Sine",
+        RegressionForecaster(window=4),
+        random_seed=0,
+        benchmark_time=False,
+        rolling_origin=True,
+        window_length=20,
+    )
+
+    fr = load_forecaster_results(
+        f"{results_path}/RegressionForecaster/Predictions/Sine/testResample0.csv"
+    )
+    assert len(fr.predictions) == 15
+    assert all(d.split(". ")[1] == "Refit: True" for d in fr.pred_descriptions)
+    np.testing.assert_allclose(fr.target_labels, y[35:])
+
+    shutil.rmtree(data_path)
+    shutil.rmtree(results_path)
+
+
+def test_fold_estimator_n_jobs():
+    """Test the n_jobs of fold estimators is only set when folds run in parallel."""
+    classifier = KNeighborsTimeSeriesClassifier(n_jobs=3)
+
+    estimator, fold_jobs = _fold_estimator(classifier, 1, 10)
+    assert fold_jobs == 1 and estimator.n_jobs == 3
+    estimator, fold_jobs = _fold_estimator(classifier, 4, 1)
+    assert fold_jobs == 1 and estimator.n_jobs == 3
+
+    estimator, fold_jobs = _fold_estimator(classifier, 8, 4)
+    assert fold_jobs == 4 and estimator.n_jobs == 2
+    assert classifier.n_jobs == 3
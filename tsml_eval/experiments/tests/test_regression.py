@@ -2,6 +2,7 @@
 
 __maintainer__ = ["MatthewMiddlehurst"]
 
+import json
 import os
 import runpy
 
@@ -20,6 +21,7 @@ from tsml_eval.experiments import (
 from tsml_eval.experiments.tests import _REGRESSOR_RESULTS_PATH
 from tsml_eval.testing.testing_utils import (
     _TEST_DATA_PATH,
+    _TEST_OUTPUT_PATH,
     _check_set_method,
     _check_set_method_results,
 )
@@ -96,6 +98,30 @@ def test_run_regression_experiment_main():
     os.remove(test_file)
 
 
+def test_run_regression_experiment_refresh_benchmark(monkeypatch):
+    """Test the cached timing benchmark is refreshed from the command line."""
+    cache_path = f"{_TEST_OUTPUT_PATH}/benchmark/refresh_benchmark.json"
+    monkeypatch.setenv("TSML_EVAL_BENCHMARK_CACHE", cache_path)
+
+    args = [
+        _TEST_DATA_PATH,
+        f"{_TEST_OUTPUT_PATH}/refresh_benchmark/",
+        "DummyRegressor-tsml",
+        "MinimalGasPrices",
+        "0",
+        "-ow",
+        "-bt",
+    ]
+
+    timestamps = []
+    for extra_args in [[], [], ["-rb"]]:
+        regression_experiments.run_experiment(args + extra_args)
+        with open(cache_path) as f:
+            timestamps.append(list(json.load(f).values())[0]["timestamp"])
+
+    assert timestamps[0] == timestamps[1] < timestamps[2]
+
+
 def test_run_threaded_regression_experiment():
     """Test threaded regression experiments with test data and regressor."""
     regressor = "ROCKET"
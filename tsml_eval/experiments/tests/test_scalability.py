@@ -0,0 +1,127 @@
+"""Tests for scalability experiments."""
+
+import time
+
+import numpy as np
+import pytest
+from aeon.classification import DummyClassifier as AeonDummyClassifier
+from tsml.dummy import DummyClassifier
+
+from tsml_eval.evaluation import load_scalability_results
+from tsml_eval.experiments import run_scalability_experiment, run_timing_experiment
+from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+
+
+class SlowClassifier(DummyClassifier):
+    """Dummy classifier which takes a long time to fit."""
+
+    def fit(self, X, y):
+        """Sleep then fit the dummy classifier."""
+        time.sleep(30)
+        return super().fit(X, y)
+
+
+class MemoryClassifier(DummyClassifier):
+    """Dummy classifier which allocates 1MB per case when fitting."""
+
+    def fit(self, X, y):
+        """Allocate memory for each case then fit the dummy classifier."""
+        np.ones((len(X), 2**17)).sum()
+        return super().fit(X, y)
+
+
+class FailingClassifier(DummyClassifier):
+    """Dummy classifier which fails to fit."""
+
+    def fit(self, X, y):
+        """Raise an error."""
+        raise ValueError("FailingClassifier cannot be fit.")
+
+
+def test_run_timing_experiment():
+    """Test the timing experiment returns a time for each size."""
+    timings = run_timing_experiment(
+        [DummyClassifier()], dimension="n_cases", random_state=0
+    )
+    assert len(timings) == 10
+    assert all(t >= 0 for t in timings.values())
+
+
+def test_run_scalability_experiment():
+    """Test a multi-dimensional grid is measured and written to file."""
+    results_path = f"{_TEST_OUTPUT_PATH}/scalability/"
+    results = run_scalability_experiment(
+        [AeonDummyClassifier(), AeonDummyClassifier(strategy="uniform")],
+        grid={"n_cases": [10, 20, 40], "n_timepoints": [20, 40]},
+        results_path=results_path,
+        estimator_names=["DummyPrior", "DummyUniform"],
+        function="fit_predict",
+        n_repeats=3,
+        isolate=False,
+        random_state=0,
+    )
+
+    assert len(results) == 12
+    assert (results["status"] == "completed").all()
+    assert (results["n_repeats"] == 3).all()
+    assert (results["ci_lower"] <= results["mean_time"]).all()
+    assert (results["mean_time"] <= results["ci_upper"]).all()
+    assert (results["peak_memory"] >= 0).all()
+
+    loaded = load_scalability_results(results_path)
+    assert len(loaded) == 12
+    assert set(loaded["estimator"]) == {"DummyPrior", "DummyUniform"}
+    exponents = np.loadtxt(
+        f"{results_path}/DummyPrior/Scalability/collection_fit_predict_exponents.csv",
+        delimiter=",",
+        skiprows=1,
+        usecols=4,
+    )
+    assert len(exponents) == 2
+
+
+def test_run_scalability_experiment_timeout():
+    """Test measurements in separate processes and stopping them at the timeout."""
+    results = run_scalability_experiment(
+        [DummyClassifier(), SlowClassifier()],
+        grid={"n_cases": [10]},
+        n_repeats=2,
+        timeout=10,
+        random_state=0,
+    )
+
+    assert results["status"].tolist() == ["completed", "timeout"]
+    assert results["n_repeats"].tolist() == [2, 0]
+    assert np.isnan(results["mean_time"].iloc[1])
+
+
+def test_run_scalability_experiment_memory():
+    """Test the peak memory follows the allocations and failures are recorded."""
+    results = run_scalability_experiment(
+        [MemoryClassifier(), FailingClassifier()],
+        grid={"n_cases": [10, 40]},
+        n_repeats=2,
+        isolate=False,
+        random_state=0,
+    )
+
+    memory = results[results["estimator"] == "MemoryClassifier"]
+    assert memory["status"].tolist() == ["completed", "completed"]
+    assert memory["error"].isna().all()
+    peak = memory["peak_memory"].tolist()
+    assert peak[0] >= 10 * 2**20 and peak[1] >= 40 * 2**20
+    assert peak[1] > 3 * peak[0]
+
+    failed = results[results["estimator"] == "FailingClassifier"]
+    assert failed["status"].tolist() == ["failed", "failed"]
+    assert failed["error"].str.contains("FailingClassifier cannot be fit").all()
+
+
+def test_run_scalability_experiment_invalid():
+    """Test invalid scalability experiment settings."""
+    with pytest.raises(ValueError, match="Invalid dimension"):
+        run_scalability_experiment(
+            [DummyClassifier()], grid={"n_cases": [10]}, input_type="series"
+        )
+    with pytest.raises(ValueError, match="Invalid function"):
+        run_scalability_experiment([DummyClassifier()], function="score")
@@ -0,0 +1,116 @@
+"""Tests for scheduling experiment jobs."""
+
+import os
+import shutil
+
+import pytest
+
+from tsml_eval.experiments.batch_experiments import _next_job, run_batch_experiments
+from tsml_eval.experiments.scheduling import estimate_job_costs, longest_first_order
+from tsml_eval.experiments.tests import _CLASSIFIER_RESULTS_PATH
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+
+
+def _write_results_third_line(path, dataset, resample_id, line3, unit="MILLISECONDS"):
+    os.makedirs(f"{path}/Predictions/{dataset}/", exist_ok=True)
+    with open(f"{path}/Predictions/{dataset}/testResample{resample_id}.csv", "w") as f:
+        f.write(f"{dataset},Estimator,TEST,{resample_id},{unit},PREDICTIONS,\n")
+        f.write("{}\n")
+        f.write(f"{line3},2\n")
+
+
+def test_estimate_job_costs():
+    """Test predicting job costs from existing results files."""
+    results_path = f"{_TEST_OUTPUT_PATH}/scheduling/"
+    shutil.rmtree(results_path, ignore_errors=True)
+    path = f"{results_path}/Estimator/"
+    # accuracy, fit time, predict time, benchmark time, memory usage, n_classes
+    _write_results_third_line(path, "DatasetA", 0, "0.9,100,20,1000,4000")
+    _write_results_third_line(path, "DatasetA", 1, "0.9,200,40,1000,8000")
+    _write_results_third_line(path, "DatasetA", 2, "0.9,1000,200,4000,6000")
+    _write_results_third_line(path, "DatasetB", 0, "0.9,2,1,-1,-1", unit="SECONDS")
+
+    jobs = [
+        ("Estimator", "DatasetA", 3),
+        ("Estimator", "DatasetB", 1),
+        ("Estimator", "DatasetC", 0),
+        ("Estimator", "DatasetD", 0),
+        ("NotAnEstimator", "DatasetA", 0),
+    ]
+
+    costs = estimate_job_costs(jobs, results_path)
+    assert costs[jobs[0]] == (240, 6000)
+    assert costs[jobs[1]] == (3000, None)
+    assert costs[jobs[2]] == (None, None)
+    assert costs[jobs[4]] == (None, None)
+
+    # scaled by dataset size using the results of each other dataset
+    sizes = {"DatasetA": 10, "DatasetB": 20, "DatasetC": 20}
+    sizes2 = {"DatasetA": 10, "DatasetB": 0, "DatasetC": 10}
+    costs = estimate_job_costs(jobs, results_path, dataset_sizes=[sizes, sizes2])
+    # median of 12 and 150 ms per unit of size
+    assert costs[jobs[2]][0] == pytest.approx(81 * 30)
+    assert costs[jobs[2]][1] == pytest.approx(300 * 30)
+    assert costs[jobs[3]] == (None, None)
+
+    # scaled by the hardware benchmark
+    costs = estimate_job_costs(jobs[:1], results_path, benchmark_time=2000)
+    assert costs[jobs[0]][0] == pytest.approx(480)
+
+    with pytest.raises(ValueError, match="Unknown task"):
+        estimate_job_costs(jobs, results_path, task="invalid")
+
+
+def test_longest_first_order():
+    """Test ordering jobs by predicted runtime."""
+    costs = {
+        ("A", "D", 0): (10, None),
+        ("B", "D", 0): (30, None),
+        ("C", "D", 0): (None, None),
+        ("D", "D", 0): (20, None),
+        ("E", "D", 0): (30, None),
+    }
+    assert [job[0] for job in longest_first_order(costs)] == ["C", "B", "E", "D", "A"]
+
+
+def test_next_job_memory_budget():
+    """Test selecting the next job to run within a memory budget."""
+    costs = {("A", "D", 0): (1, 60), ("B", "D", 0): (1, 50), ("C", "D", 0): (1, 30)}
+    queue = list(costs)
+
+    assert _next_job(queue, [], costs, None) == ("A", "D", 0)
+    assert _next_job(queue, [], costs, 100) == ("A", "D", 0)
+    # only C fits alongside A
+    assert _next_job(queue[1:], [("A", "D", 0)], costs, 100) == ("C", "D", 0)
+    assert _next_job(queue[1:2], [("A", "D", 0)], costs, 100) is None
+    # jobs larger than the budget run alone
+    assert _next_job(queue, [], costs, 10) == ("A", "D", 0)
+    # jobs with unknown memory usage always run
+    assert _next_job([("E", "D", 0)], [("A", "D", 0)], costs, 10) == ("E", "D", 0)
+
+
+def test_run_batch_experiments_longest_first():
+    """Test running a batch longest first within a memory budget."""
+    results_path = f"{_CLASSIFIER_RESULTS_PATH}/batch_longest_first/"
+    jobs = [
+        ("DummyClassifier-tsml", "MinimalChinatown", 0),
+        ("DummyClassifier-tsml", "UnequalMinimalChinatown", 0),
+        ("DummyClassifier-aeon", "MinimalChinatown", 0),
+    ]
+
+    status = run_batch_experiments(
+        _TEST_DATA_PATH,
+        results_path,
+        jobs,
+        n_jobs=2,
+        benchmark_time=False,
+        longest_first=True,
+        max_memory=1024**3,
+        verbose=False,
+    )
+
+    assert all(s == "completed" for s in status.values())
+    for estimator, dataset, _ in jobs:
+        assert os.path.exists(
+            f"{results_path}/{estimator}/Predictions/{dataset}/testResample0.csv"
+        )
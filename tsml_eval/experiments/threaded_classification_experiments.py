@@ -16,7 +16,8 @@ from tsml_eval.experiments import (
 from tsml_eval.experiments.tests import _CLASSIFIER_RESULTS_PATH
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH
 from tsml_eval.utils.arguments import parse_args
-from tsml_eval.utils.experiments import _results_present
+from tsml_eval.utils.experiments import _results_present, cached_timing_benchmark
+from tsml_eval.utils.import_time import ImportTimeRecorder
 
 
 def run_experiment(args):
@@ -33,6 +34,13 @@ def run_experiment(args):
         print("Input args = ", args)
         args = parse_args(args)
 
+        if args.refresh_benchmark:
+            cached_timing_benchmark(refresh=True)
+
+        recorder = ImportTimeRecorder()
+        if args.import_time:
+            recorder.start()
+
         # this is also checked in load_and_run, but doing a quick check here so can
         # print a message and make sure data is not loaded
         if not args.overwrite and _results_present(
@@ -73,12 +81,22 @@ def run_experiment(args):
                     n_jobs=args.n_jobs,
                 ),
                 build_train_file=args.train_fold,
+                checkpoint_train_estimate=args.checkpoint_train,
                 write_attributes=args.write_attributes,
                 att_max_shape=args.att_max_shape,
                 benchmark_time=args.benchmark_time,
+                predict_max_memory=args.predict_max_memory,
+                profile=args.profile,
+                warm_up=args.warm_up,
+                phase_budget=args.phase_budget,
                 overwrite=args.overwrite,
                 predefined_resample=args.predefined_resample,
+                n_jobs=args.n_jobs,
             )
+
+        if args.import_time:
+            recorder.stop()
+            print(recorder.report())
     # local run (no args)
     else:
         # These are example parameters, change as required for local runs
@@ -131,6 +149,7 @@ def run_experiment(args):
             benchmark_time=benchmark_time,
             overwrite=overwrite,
             predefined_resample=predefined_resample,
+            n_jobs=n_jobs,
         )
 
 
@@ -0,0 +1,76 @@
+"""Tests that the experiments package imports quickly for short experiment jobs."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+# modules only needed for some experiments or for evaluation, which should be
+# imported when used rather than when the experiments package is imported
+DEFERRED_MODULES = [
+    "gpustat",
+    "matplotlib",
+    "aeon.visualisation",
+    "aeon.classification",
+    "aeon.regression",
+    "aeon.forecasting",
+    "tsml_eval.estimators",
+    "tsml_eval.evaluation",
+]
+
+# the dependencies the experiments package cannot avoid importing
+REFERENCE_IMPORT = "import aeon.datasets, aeon.transformations.collection"
+
+# allowed import time of the experiments package relative to the reference. Loose,
+# as the benchmark only needs to catch slow imports added to the package
+STARTUP_TIME_RATIO = 2.0
+
+
+def _import_time(statement, repeats=3):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("package", ["tsml_eval", "tsml_eval.experiments"])
+def test_deferred_imports(package):
+    """Test importing the package does not import deferred modules."""
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {package}; "
+            f"print(*[m for m in {DEFERRED_MODULES} if m in sys.modules])",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+
+    assert out == [], f"Importing {package} imported: {out}"
+
+
+@pytest.mark.benchmark
+def test_experiments_startup_time():
+    """Benchmark the time of python -c "import tsml_eval.experiments".
+
+    The time is compared to importing the dependencies the package cannot avoid, so
+    the test is independent of the speed of the machine and filesystem. Fails if
+    the package takes more than STARTUP_TIME_RATIO times the reference time. Only
+    run with pytest --benchmarks.
+    """
+    # warm the filesystem cache and any compiled file caches first
+    _import_time("import tsml_eval.experiments", repeats=1)
+
+    reference = _import_time(REFERENCE_IMPORT)
+    experiments = _import_time("import tsml_eval.experiments")
+
+    assert experiments <= reference * STARTUP_TIME_RATIO, (
+        f"import tsml_eval.experiments took {experiments:.2f}s, more than "
+        f"{STARTUP_TIME_RATIO} times the {reference:.2f}s to {REFERENCE_IMPORT}. "
+        f"Defer imports which are only needed by some experiments."
+    )
@@ -4,6 +4,7 @@ __maintainer__ = ["MatthewMiddlehurst"]
 
 __all__ = [
     "parse_args",
+    "parse_batch_args",
 ]
 
 import argparse
@@ -17,8 +18,11 @@ def parse_args(args):
     The following is the --help output for tsml_eval:
 
     usage: tsml_eval [-h] [--version] [-ow] [-pr] [-rs RANDOM_SEED] [-nj N_JOBS]
-                     [-tr] [-te] [-fc FIT_CONTRACT] [-ch] [-rn] [-nc N_CLUSTERS]
-                     [-kw KEY VALUE TYPE]
+                     [-tr] [-ctr] [-te] [-fc FIT_CONTRACT] [-ch]
+                     [-dtn DATA_TRANSFORM_NAME] [-tto] [-rn] [-nc N_CLUSTERS]
+                     [-ctts] [-bt] [-rb] [-wa] [-ams ATT_MAX_SHAPE]
+                     [-pmm PREDICT_MAX_MEMORY] [-pf] [-wu] [-it] [-ro]
+                     [-pb PHASE_BUDGET] [-kw KEY VALUE TYPE]
                      data_path results_path estimator_name dataset_name
                      resample_id
 
@@ -56,6 +60,11 @@ def parse_args(args):
                             threading (default: 1).
       -tr, --train_fold     write a results file for the training data in the
                             classification and regression task (default: False).
+      -ctr, --checkpoint_train
+                            save the output of each cross-validation fold used
+                            to write the training data results file, so a
+                            restarted experiment only runs the missing folds
+                            (default: False).
       -te, --test_fold      write a results file for the test data in the
                             clustering task (default: False).
       -fc FIT_CONTRACT, --fit_contract FIT_CONTRACT
@@ -91,6 +100,10 @@ def parse_args(args):
       -bt, --benchmark_time
                             run a benchmark function and save the time spent in the
                             results file (default: False).
+      -rb, --refresh_benchmark
+                            run the benchmark function again and update the value
+                            cached for this host before running, rather than using
+                            a cached value for --benchmark_time (default: False).
       -wa, --write_attributes
                             write the estimator attributes to file when running
                             experiments. Will recursively write the attributes of
@@ -100,6 +113,36 @@ def parse_args(args):
                             writing attributes, at 0 no estimators in collections
                             will be written, at 1 estimators in one-dimensional
                             lists will be written etc. (default: 0).
+      -pmm PREDICT_MAX_MEMORY, --predict_max_memory PREDICT_MAX_MEMORY
+                            a memory budget in GB for predicting the test data.
+                            If set, the data is predicted in chunks sized to fit
+                            the budget. Converted to bytes when parsed
+                            (default: None).
+      -pf, --profile        profile the estimator fit and predict with cProfile
+                            and a call stack sampler. The .pstats files and a
+                            collapsed stack file for flame graphs are written to
+                            the results Workspace directory (default: False).
+      -wu, --warm_up        fit and predict the estimator on a few training cases
+                            before the timed fit to compile numba functions. The
+                            compile time is written to the results file separately
+                            from the fit time (default: False).
+      -it, --import_time    print the process startup time and the time spent
+                            importing each module during the experiment, i.e.
+                            the estimator module (default: False).
+      -ro, --rolling_origin
+                            evaluate forecasters at every value of the test series
+                            with an expanding window rolling-origin evaluation,
+                            refitting at each origin. Only used for forecasting
+                            (default: False).
+      -pb PHASE_BUDGET, --phase_budget PHASE_BUDGET
+                            a wall-clock budget in minutes for every telemetry
+                            phase of the experiment, i.e. data_loading, fit,
+                            predict and results_writing. If set, the experiment
+                            runs in a child process which is killed when a phase
+                            exceeds the budget, and timeout markers are written
+                            in place of the missing results files. Not used for
+                            forecasting. Converted to seconds when parsed
+                            (default: None).
       -kw KEY VALUE TYPE, --kwargs KEY VALUE TYPE, --kwarg KEY VALUE TYPE
                             additional keyword arguments to pass to the estimator.
                             Should contain the parameter to set, the parameter
@@ -185,6 +228,14 @@ def parse_args(args):
         help="write a results file for the training data in the classification and "
         "regression task (default: %(default)s).",
     )
+    parser.add_argument(
+        "-ctr",
+        "--checkpoint_train",
+        action="store_true",
+        help="save the output of each cross-validation fold used to write the "
+        "training data results file, so a restarted experiment only runs the missing "
+        "folds (default: %(default)s).",
+    )
     parser.add_argument(
         "-te",
         "--test_fold",
@@ -256,6 +307,14 @@ def parse_args(args):
         help="run a benchmark function and save the time spent in the results file "
         "(default: %(default)s).",
     )
+    parser.add_argument(
+        "-rb",
+        "--refresh_benchmark",
+        action="store_true",
+        help="run the benchmark function again and update the value cached for this "
+        "host before running, rather than using a cached value for --benchmark_time "
+        "(default: %(default)s).",
+    )
     parser.add_argument(
         "-wa",
         "--write_attributes",
@@ -273,6 +332,57 @@ def parse_args(args):
         "0 no estimators in collections will be written, at 1 estimators in "
         "one-dimensional lists will be written etc. (default: %(default)s).",
     )
+    parser.add_argument(
+        "-pmm",
+        "--predict_max_memory",
+        type=float,
+        help="a memory budget in GB for predicting the test data. If set, the data is "
+        "predicted in chunks sized to fit the budget. Converted to bytes when parsed "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-pf",
+        "--profile",
+        action="store_true",
+        help="profile the estimator fit and predict with cProfile and a call stack "
+        "sampler. The .pstats files and a collapsed stack file for flame graphs are "
+        "written to the results Workspace directory (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-wu",
+        "--warm_up",
+        action="store_true",
+        help="fit and predict the estimator on a few training cases before the timed "
+        "fit to compile numba functions. The compile time is written to the results "
+        "file separately from the fit time (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-it",
+        "--import_time",
+        action="store_true",
+        help="print the process startup time and the time spent importing each "
+        "module during the experiment, i.e. the estimator module "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-ro",
+        "--rolling_origin",
+        action="store_true",
+        help="evaluate forecasters at every value of the test series with an "
+        "expanding window rolling-origin evaluation, refitting at each origin. Only "
+        "used for forecasting (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-pb",
+        "--phase_budget",
+        type=float,
+        help="a wall-clock budget in minutes for every telemetry phase of the "
+        "experiment, i.e. data_loading, fit, predict and results_writing. If set, the "
+        "experiment runs in a child process which is killed when a phase exceeds the "
+        "budget, and timeout markers are written in place of the missing results "
+        "files. Not used for forecasting. Converted to seconds when parsed "
+        "(default: %(default)s).",
+    )
     parser.add_argument(
         "-kw",
         "--kwargs",
@@ -287,10 +397,394 @@ def parse_args(args):
         "Can be used multiple times (default: %(default)s).",
     )
     args = parser.parse_args(args=args)
+    args.kwargs = _parse_kwargs(args.kwargs)
+    args.predict_max_memory = _gb_to_bytes(args.predict_max_memory)
+    args.phase_budget = _minutes_to_seconds(args.phase_budget)
+
+    return args
+
+
+def parse_batch_args(args):
+    """Parse the command line arguments for a tsml_eval batch of experiments.
+
+    The following is the --help output for tsml_eval_batch:
 
+    usage: tsml_eval_batch [-h] [--version] [-t TASK] [-m MANIFEST]
+                           [-en ESTIMATOR_NAMES [ESTIMATOR_NAMES ...]]
+                           [-dn DATASET_NAMES [DATASET_NAMES ...]]
+                           [-r START END] [-ow] [-pr] [-dc]
+                           [-tc TRANSFORM_CACHE] [-lf] [-mm MAX_MEMORY]
+                           [-ds DATASET_SIZES [DATASET_SIZES ...]] [-uc]
+                           [-rs RANDOM_SEED]
+                           [-nj N_JOBS] [-tr] [-ctr] [-te]
+                           [-dtn DATA_TRANSFORM_NAME]
+                           [-tto] [-rn] [-nc N_CLUSTERS] [-bt] [-rb] [-wa]
+                           [-ams ATT_MAX_SHAPE] [-pmm PREDICT_MAX_MEMORY] [-wu]
+                           [-pb PHASE_BUDGET] [-kw KEY VALUE TYPE]
+                           data_path results_path
+
+    positional arguments:
+      data_path             the path to the directory storing dataset files.
+      results_path          the path to the directory where results files are
+                            written to.
+
+    options:
+      -h, --help            show this help message and exit
+      --version             show program's version number and exit
+      -t TASK, --task TASK  the learning task to run experiments for, one of
+                            {classification, regression, clustering,
+                            forecasting} (default: classification).
+      -m MANIFEST, --manifest MANIFEST
+                            path to a job manifest file with one
+                            {estimator_name,dataset_name,resample_id} job per
+                            line. Replaces --estimator_names, --dataset_names and
+                            --resamples (default: None).
+      -en ESTIMATOR_NAMES [ESTIMATOR_NAMES ...], --estimator_names ...
+                            the names of the estimators to run (default: None).
+      -dn DATASET_NAMES [DATASET_NAMES ...], --dataset_names ...
+                            the names of the datasets to load, or the path to a
+                            file containing one dataset name per line
+                            (default: None).
+      -r START END, --resamples START END
+                            the range of resample IDs to run, from START up to
+                            but not including END (default: None).
+      -nj N_JOBS, --n_jobs N_JOBS
+                            the number of worker processes to run jobs on. -1
+                            uses all available CPUs (default: -1).
+      -dc, --data_cache     load datasets through a binary memory mapped cache
+                            stored alongside the .ts files. The cache is created
+                            on first use and rebuilt if the .ts file changes
+                            (default: False).
+      -tc TRANSFORM_CACHE, --transform_cache TRANSFORM_CACHE
+                            the path to a directory to cache the output of data
+                            transforms in, shared by jobs using the same
+                            dataset, resample and transforms (default: None).
+      -lf, --longest_first  run the jobs with the longest runtime predicted from
+                            existing results first (default: False).
+      -mm MAX_MEMORY, --max_memory MAX_MEMORY
+                            the memory budget in GB for jobs running at the same
+                            time, using memory usage predicted from existing
+                            results. If None, memory usage is not limited.
+                            Converted to bytes when parsed (default: None).
+      -ds DATASET_SIZES [DATASET_SIZES ...], --dataset_sizes ...
+                            paths to files with one {dataset_name,size} pair per
+                            line, used to predict the runtime and memory usage of
+                            datasets without existing results. Sizes in multiple
+                            files are summed. If None, the size of the dataset
+                            files is used (default: None).
+      -uc, --use_catalogue  find existing results using a catalogue of the
+                            results directory, updated before and after the
+                            batch, instead of checking for each results file
+                            (default: False).
+
+      The remaining options match the options of parse_args and are applied to
+      every job in the batch.
+
+    Parameters
+    ----------
+    args : list
+        List of command line arguments to parse.
+
+    Returns
+    -------
+    args : argparse.Namespace
+        The parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="tsml_eval_batch")
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {tsml_eval.__version__}"
+    )
+    parser.add_argument(
+        "data_path", help="the path to the directory storing dataset files."
+    )
+    parser.add_argument(
+        "results_path",
+        help="the path to the directory where results files are written to.",
+    )
+    parser.add_argument(
+        "-t",
+        "--task",
+        default="classification",
+        choices=["classification", "regression", "clustering", "forecasting"],
+        help="the learning task to run experiments for (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        help="path to a job manifest file with one "
+        "{estimator_name,dataset_name,resample_id} job per line. Replaces "
+        "--estimator_names, --dataset_names and --resamples (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-en",
+        "--estimator_names",
+        nargs="+",
+        help="the names of the estimators to run (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-dn",
+        "--dataset_names",
+        nargs="+",
+        help="the names of the datasets to load, or the path to a file containing "
+        "one dataset name per line (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-r",
+        "--resamples",
+        type=int,
+        nargs=2,
+        metavar=("START", "END"),
+        help="the range of resample IDs to run, from START up to but not including "
+        "END (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-ow",
+        "--overwrite",
+        action="store_true",
+        help="overwrite existing results files. If False, existing results files "
+        "will be skipped (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-pr",
+        "--predefined_resample",
+        action="store_true",
+        help="load a dataset file with a predefined resample. The dataset file must "
+        "follow the naming format '{dataset_name}{resample_id}.ts' "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-dc",
+        "--data_cache",
+        action="store_true",
+        help="load datasets through a binary memory mapped cache stored alongside the "
+        ".ts files. The cache is created on first use and rebuilt if the .ts file "
+        "changes (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-tc",
+        "--transform_cache",
+        help="the path to a directory to cache the output of data transforms in, "
+        "shared by jobs using the same dataset, resample and transforms "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-lf",
+        "--longest_first",
+        action="store_true",
+        help="run the jobs with the longest runtime predicted from existing results "
+        "first (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-mm",
+        "--max_memory",
+        type=float,
+        help="the memory budget in GB for jobs running at the same time, using memory "
+        "usage predicted from existing results. If None, memory usage is not limited. "
+        "Converted to bytes when parsed (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-ds",
+        "--dataset_sizes",
+        nargs="+",
+        help="paths to files with one {dataset_name,size} pair per line, used to "
+        "predict the runtime and memory usage of datasets without existing results. "
+        "Sizes in multiple files are summed. If None, the size of the dataset files "
+        "is used (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-uc",
+        "--use_catalogue",
+        action="store_true",
+        help="find existing results using a catalogue of the results directory, "
+        "updated before and after the batch, instead of checking for each results "
+        "file (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-rs",
+        "--random_seed",
+        type=int,
+        help="use a different random seed than the resample ID. If None use the "
+        "{resample_id} (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-nj",
+        "--n_jobs",
+        type=int,
+        default=-1,
+        help="the number of worker processes to run jobs on. -1 uses all available "
+        "CPUs (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-tr",
+        "--train_fold",
+        action="store_true",
+        help="write a results file for the training data in the classification and "
+        "regression task (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-ctr",
+        "--checkpoint_train",
+        action="store_true",
+        help="save the output of each cross-validation fold used to write the "
+        "training data results file, so a restarted experiment only runs the missing "
+        "folds (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-te",
+        "--test_fold",
+        action="store_true",
+        help="write a results file for the test data in the clustering task "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-dtn",
+        "--data_transform_name",
+        action="append",
+        help="str to pass to get_data_transform_by_name to apply a transformation "
+        "to the data prior to running the experiment. By default no transform "
+        "is applied. Can be used multiple times (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-tto",
+        "--transform_train_only",
+        action="store_true",
+        help="if set, transformations will be applied only to the training dataset, "
+        "leaving the test dataset unchanged (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-rn",
+        "--row_normalise",
+        action="store_true",
+        help="normalise the data rows prior to fitting and predicting. "
+        "effectively the same as passing Normalizer to --data_transform_name "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-nc",
+        "--n_clusters",
+        type=int,
+        default=-1,
+        help="the number of clusters to find for clusterers which have an {n_clusters} "
+        "parameter. If {-1}, use the number of classes in the dataset "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-bt",
+        "--benchmark_time",
+        action="store_true",
+        help="run a benchmark function and save the time spent in the results file "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-rb",
+        "--refresh_benchmark",
+        action="store_true",
+        help="run the benchmark function again and update the value cached for this "
+        "host before running, rather than using a cached value for --benchmark_time "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-wa",
+        "--write_attributes",
+        action="store_true",
+        help="write the estimator attributes to file when running experiments. Will "
+        "recursively write the attributes of sub-estimators if present. "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-ams",
+        "--att_max_shape",
+        type=int,
+        default=0,
+        help="The max estimator collections shape allowed when writing attributes, at "
+        "0 no estimators in collections will be written, at 1 estimators in "
+        "one-dimensional lists will be written etc. (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-pmm",
+        "--predict_max_memory",
+        type=float,
+        help="a memory budget in GB for predicting the test data. If set, the data is "
+        "predicted in chunks sized to fit the budget. Converted to bytes when parsed "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-wu",
+        "--warm_up",
+        action="store_true",
+        help="fit and predict the estimator on a few training cases before the timed "
+        "fit to compile numba functions. The compile time is written to the results "
+        "file separately from the fit time (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-pb",
+        "--phase_budget",
+        type=float,
+        help="a wall-clock budget in minutes for every telemetry phase of the "
+        "experiment, i.e. data_loading, fit, predict and results_writing. If set, the "
+        "experiment runs in a child process which is killed when a phase exceeds the "
+        "budget, and timeout markers are written in place of the missing results "
+        "files. Not used for forecasting. Converted to seconds when parsed "
+        "(default: %(default)s).",
+    )
+    parser.add_argument(
+        "-kw",
+        "--kwargs",
+        "--kwarg",
+        action="append",
+        nargs=3,
+        metavar=("KEY", "VALUE", "TYPE"),
+        help="additional keyword arguments to pass to every estimator. Should contain "
+        "the parameter to set, the parameter value, and the type of the value i.e. "
+        "{--kwargs n_estimators 200 int}. Can be used multiple times "
+        "(default: %(default)s).",
+    )
+    args = parser.parse_args(args=args)
+    args.kwargs = _parse_kwargs(args.kwargs)
+    args.predict_max_memory = _gb_to_bytes(args.predict_max_memory)
+    args.max_memory = _gb_to_bytes(args.max_memory)
+    args.phase_budget = _minutes_to_seconds(args.phase_budget)
+    args.dataset_sizes = _load_dataset_sizes(args.dataset_sizes)
+
+    return args
+
+
+def _load_dataset_sizes(paths):
+    if paths is None:
+        return None
+
+    dataset_sizes = []
+    for path in paths:
+        sizes = {}
+        with open(path) as f:
+            for n, line in enumerate(f, start=1):
+                line = line.strip()
+                if line == "" or line.startswith("#"):
+                    continue
+
+                values = [v.strip() for v in line.split(",")]
+                if len(values) != 2:
+                    raise ValueError(
+                        f"Invalid dataset size on line {n} of {path}, expected "
+                        f"dataset_name,size: {line}"
+                    )
+                sizes[values[0]] = float(values[1])
+        dataset_sizes.append(sizes)
+    return dataset_sizes
+
+
+def _gb_to_bytes(gb):
+    return None if gb is None else int(gb * 1024**3)
+
+
+def _minutes_to_seconds(minutes):
+    return None if minutes is None else minutes * 60
+
+
+def _parse_kwargs(kwarg_list):
     kwargs = {}
-    if args.kwargs is not None:
-        for kwarg in args.kwargs:
+    if kwarg_list is not None:
+        for kwarg in kwarg_list:
             if kwarg[2] == "int":
                 kwargs[kwarg[0]] = int(kwarg[1])
             elif kwarg[2] == "float":
@@ -299,6 +793,4 @@ def parse_args(args):
                 kwargs[kwarg[0]] = kwarg[1].lower() == "true" or kwarg[1] == "1"
             else:
                 kwargs[kwarg[0]] = kwarg[1]
-    args.kwargs = kwargs
-
-    return args
+    return kwargs
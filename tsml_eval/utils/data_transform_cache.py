@@ -0,0 +1,216 @@
+"""Disk cache for the output of data transforms."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "DataTransformCache",
+]
+
+import hashlib
+import os
+import shutil
+
+import numpy as np
+
+from tsml_eval.utils.datasets import _load_collection, _save_collection
+
+_DATA_NAMES = ["X_train", "y_train", "X_test", "y_test"]
+
+
+class DataTransformCache:
+    """A size-bounded disk cache for transformed train and test data.
+
+    Entries are addressed by a hash of the dataset name, resample ID, the class and
+    ``get_params`` of each transform and the content of the input data, so the same
+    transforms applied to the same data by different experiments share an entry.
+    The transformed data is stored as .npy files and loaded using ``mmap_mode="r"``,
+    so cache hits do not copy the data and the returned arrays are read-only.
+
+    When the total size of the cache exceeds max_size, the least recently used
+    entries are removed.
+
+    Parameters
+    ----------
+    cache_path : str
+        Path to the directory to store the cache in.
+    max_size : int, default=10737418240
+        The maximum size of the cache in bytes. Defaults to 10GB.
+
+    Examples
+    --------
+    >>> from aeon.transformations.collection import Normalizer
+    >>> from tsml.datasets import load_minimal_chinatown
+    >>> from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+    >>> from tsml_eval.utils.data_transform_cache import DataTransformCache
+    >>> X_train, y_train = load_minimal_chinatown(split="train")
+    >>> X_test, y_test = load_minimal_chinatown(split="test")
+    >>> cache = DataTransformCache(f"{_TEST_OUTPUT_PATH}/transform_cache/")
+    >>> transforms = [Normalizer()]
+    >>> key = cache.key(transforms, X_train, y_train, X_test, y_test)
+    >>> if cache.get(key) is None:
+    ...     X_train_t = transforms[0].fit_transform(X_train)
+    ...     X_test_t = transforms[0].transform(X_test)
+    ...     cache.put(key, X_train_t, y_train, X_test_t, y_test)
+    >>> X_train_t, y_train_t, X_test_t, y_test_t = cache.get(key)
+    """
+
+    def __init__(self, cache_path, max_size=10 * 1024**3):
+        self.cache_path = cache_path
+        self.max_size = max_size
+
+        os.makedirs(cache_path, exist_ok=True)
+
+    def key(
+        self,
+        data_transforms,
+        X_train,
+        y_train,
+        X_test=None,
+        y_test=None,
+        dataset_name=None,
+        resample_id=None,
+    ):
+        """Return the cache key for applying transforms to input data.
+
+        Parameters
+        ----------
+        data_transforms : transformer or list of transformers
+            The transforms to be applied, in order.
+        X_train : np.ndarray or list of np.ndarray
+            The train data input to the transforms.
+        y_train : np.ndarray
+            The train labels input to the transforms.
+        X_test : np.ndarray, list of np.ndarray or None, default=None
+            The test data input to the transforms. None if the test data is not
+            transformed.
+        y_test : np.ndarray or None, default=None
+            The test labels input to the transforms.
+        dataset_name : str or None, default=None
+            The name of the dataset.
+        resample_id : int or None, default=None
+            The resample ID of the data.
+
+        Returns
+        -------
+        key : str
+            The hex digest identifying the transformed data.
+        """
+        if not isinstance(data_transforms, list):
+            data_transforms = [data_transforms]
+
+        h = hashlib.sha256()
+        h.update(f"{dataset_name}|{resample_id}".encode())
+        for transform in data_transforms:
+            params = sorted(transform.get_params().items())
+            h.update(f"|{type(transform).__qualname__}{params}".encode())
+        for X in (X_train, y_train, X_test, y_test):
+            _hash_data(h, X)
+
+        return h.hexdigest()
+
+    def get(self, key):
+        """Load the transformed data for a key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key, see ``key``.
+
+        Returns
+        -------
+        data : tuple or None
+            The (X_train, y_train, X_test, y_test) stored for the key as read-only
+            memory mapped arrays, with None for any which were not stored. None if
+            the key is not in the cache.
+        """
+        entry_path = f"{self.cache_path}/{key}"
+        if not os.path.isdir(entry_path):
+            return None
+
+        try:
+            data = tuple(
+                (
+                    _load_collection(entry_path, name)
+                    if os.path.exists(f"{entry_path}/{name}.npy")
+                    else None
+                )
+                for name in _DATA_NAMES
+            )
+            # the modification time of an entry records when it was last used
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            # the entry was evicted by another process while being read
+            return None
+
+        return data
+
+    def put(self, key, X_train, y_train, X_test=None, y_test=None):
+        """Store transformed data for a key, evicting old entries if required.
+
+        Parameters
+        ----------
+        key : str
+            The cache key, see ``key``.
+        X_train : np.ndarray or list of np.ndarray
+            The transformed train data.
+        y_train : np.ndarray
+            The transformed train labels.
+        X_test : np.ndarray, list of np.ndarray or None, default=None
+            The transformed test data.
+        y_test : np.ndarray or None, default=None
+            The transformed test labels.
+        """
+        entry_path = f"{self.cache_path}/{key}"
+        if os.path.isdir(entry_path):
+            return
+
+        # written to a temporary directory and renamed so readers never see a
+        # partial entry
+        tmp_path = f"{self.cache_path}/.tmp-{os.getpid()}-{key}"
+        try:
+            os.makedirs(tmp_path, exist_ok=True)
+            for name, X in zip(_DATA_NAMES, (X_train, y_train, X_test, y_test)):
+                if X is not None:
+                    _save_collection(
+                        tmp_path, name, X if isinstance(X, list) else np.asarray(X)
+                    )
+            os.rename(tmp_path, entry_path)
+        except (OSError, ValueError):
+            # i.e. another process stored the entry first or the data contains
+            # objects which cannot be saved without pickling
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.cache_path):
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                entries.append((entry.stat().st_mtime, size, entry.path))
+            except OSError:
+                continue
+            total_size += size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+
+def _hash_data(h, X):
+    if X is None:
+        h.update(b"|None")
+    elif isinstance(X, list):
+        h.update(f"|list{len(X)}".encode())
+        for x in X:
+            _hash_data(h, x)
+    else:
+        X = np.ascontiguousarray(X)
+        h.update(f"|{X.shape}{X.dtype.str}".encode())
+        h.update(X.data if X.dtype != object else str(X.tolist()).encode())
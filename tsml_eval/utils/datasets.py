@@ -3,24 +3,35 @@
 __maintainer__ = ["MatthewMiddlehurst"]
 __all__ = [
     "load_experiment_data",
+    "load_cached_ts_file",
+    "ExperimentDataset",
     "copy_dataset_ts_files",
     "save_merged_dataset_splits",
 ]
 
+import hashlib
+import json
 import os
 import shutil
+from multiprocessing import shared_memory
 from os.path import exists
 from typing import Optional, Union
 
 import numpy as np
 from aeon.datasets import load_from_ts_file, write_to_ts_file
 
+from tsml_eval.utils.resampling import (
+    resample_data_indices,
+    stratified_resample_data_indices,
+)
+
 
 def load_experiment_data(
     problem_path: str,
     dataset: str,
     resample_id: int,
     predefined_resample: bool,
+    use_cache: bool = False,
 ):
     """Load data for experiments.
 
@@ -34,6 +45,10 @@ def load_experiment_data(
         Id of the data resample to use.
     predefined_resample : boolean
         If True, use the predefined resample.
+    use_cache : boolean, default=False
+        If True, load the data from a binary cache of each .ts file, creating the
+        cache if it does not exist or the .ts file has changed. See
+        ``load_cached_ts_file``. The returned arrays are read-only memory maps.
 
     Returns
     -------
@@ -48,30 +63,424 @@ def load_experiment_data(
     resample : boolean
         If True, the data is to be resampled.
     """
+    load = load_cached_ts_file if use_cache else load_from_ts_file
+
     if resample_id is not None and predefined_resample:
         resample_str = "" if resample_id is None else str(resample_id)
 
-        X_train, y_train = load_from_ts_file(
+        X_train, y_train = load(
             f"{problem_path}/{dataset}/{dataset}{resample_str}_TRAIN.ts"
         )
-        X_test, y_test = load_from_ts_file(
+        X_test, y_test = load(
             f"{problem_path}/{dataset}/{dataset}{resample_str}_TEST.ts"
         )
 
         resample_data = False
     else:
-        X_train, y_train = load_from_ts_file(
-            f"{problem_path}/{dataset}/{dataset}_TRAIN.ts"
-        )
-        X_test, y_test = load_from_ts_file(
-            f"{problem_path}/{dataset}/{dataset}_TEST.ts"
-        )
+        X_train, y_train = load(f"{problem_path}/{dataset}/{dataset}_TRAIN.ts")
+        X_test, y_test = load(f"{problem_path}/{dataset}/{dataset}_TEST.ts")
 
         resample_data = True if resample_id != 0 else False
 
     return X_train, y_train, X_test, y_test, resample_data
 
 
+_CACHE_VERSION = 1
+
+
+def load_cached_ts_file(file_path: str):
+    """Load a .ts file through a binary cache stored alongside it.
+
+    On first use the .ts file is parsed and its data written to a ``{file}.cache``
+    directory next to it as .npy files, with a small JSON metadata file recording the
+    modification time, size and SHA-1 hash of the source file. Later calls open the
+    .npy files with ``mmap_mode="r"`` instead of parsing the text file, so concurrent
+    processes loading the same dataset share the operating system's page cache.
+
+    The cache is rebuilt if the source file has changed. The modification time and
+    size are checked first, and the file is only hashed if these do not match.
+
+    Equal length data is stored as a single 3D array. Unequal length data is stored
+    as one 2D array of all series concatenated along the time axis alongside an
+    array of offsets to the start of each series, and returned as a list of views.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the .ts file.
+
+    Returns
+    -------
+    X : np.ndarray or list of np.ndarray
+        The time series data as a read-only 3D array or list of 2D arrays.
+    y : np.ndarray
+        The target labels or values.
+
+    Examples
+    --------
+    >>> from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+    >>> from tsml_eval.utils.datasets import copy_dataset_ts_files, load_cached_ts_file
+    >>> copy_dataset_ts_files(
+    ...     ["MinimalChinatown"], _TEST_DATA_PATH, f"{_TEST_OUTPUT_PATH}/cache/"
+    ... )
+    >>> X, y = load_cached_ts_file(
+    ...     f"{_TEST_OUTPUT_PATH}/cache/MinimalChinatown/MinimalChinatown_TRAIN.ts"
+    ... )
+    """
+    cache_path = f"{file_path}.cache"
+    stat = os.stat(file_path)
+
+    metadata = _read_cache_metadata(cache_path)
+    valid = (
+        metadata is not None
+        and metadata["mtime_ns"] == stat.st_mtime_ns
+        and metadata["size"] == stat.st_size
+    )
+
+    if not valid:
+        file_hash = _file_hash(file_path)
+        if metadata is not None and metadata["sha1"] == file_hash:
+            # the file was touched or copied but its content is unchanged
+            metadata["mtime_ns"] = stat.st_mtime_ns
+            metadata["size"] = stat.st_size
+            _write_cache_metadata(cache_path, metadata)
+        else:
+            X, y = load_from_ts_file(file_path)
+            metadata = _write_ts_cache(cache_path, X, y, stat, file_hash)
+
+    return _load_collection(cache_path, "X"), _load_collection(cache_path, "y")
+
+
+def _file_hash(file_path):
+    sha1 = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def _read_cache_metadata(cache_path):
+    try:
+        with open(f"{cache_path}/metadata.json") as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return metadata if metadata.get("version") == _CACHE_VERSION else None
+
+
+def _write_cache_metadata(cache_path, metadata):
+    # written to a temporary file and renamed so readers never see a partial file
+    tmp_file = f"{cache_path}/metadata.json.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(metadata, f)
+    os.replace(tmp_file, f"{cache_path}/metadata.json")
+
+
+def _write_ts_cache(cache_path, X, y, stat, file_hash):
+    os.makedirs(cache_path, exist_ok=True)
+    _save_collection(cache_path, "X", X)
+    _save_collection(cache_path, "y", np.asarray(y))
+
+    metadata = {
+        "version": _CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha1": file_hash,
+        "equal_length": isinstance(X, np.ndarray),
+        "n_cases": len(y),
+    }
+    _write_cache_metadata(cache_path, metadata)
+    return metadata
+
+
+def _save_collection(path, name, X):
+    """Save an array or list of 2D arrays as .npy files which can be memory mapped.
+
+    A list of unequal length series is saved as the series concatenated along the
+    time axis alongside the offsets of the start of each series.
+    """
+    if isinstance(X, np.ndarray):
+        arrays = {name: X}
+        if os.path.exists(f"{path}/{name}_offsets.npy"):
+            os.remove(f"{path}/{name}_offsets.npy")
+    else:
+        arrays = {
+            name: np.concatenate(X, axis=1),
+            f"{name}_offsets": np.cumsum([0] + [x.shape[1] for x in X], dtype=np.int64),
+        }
+
+    for file_name, array in arrays.items():
+        tmp_file = f"{path}/{file_name}.{os.getpid()}.tmp.npy"
+        np.save(tmp_file, array, allow_pickle=False)
+        os.replace(tmp_file, f"{path}/{file_name}.npy")
+
+
+def _load_collection(path, name):
+    """Memory map an array or list of 2D arrays saved by _save_collection."""
+    values = np.load(f"{path}/{name}.npy", mmap_mode="r", allow_pickle=False)
+    if not os.path.exists(f"{path}/{name}_offsets.npy"):
+        return values
+
+    offsets = np.load(f"{path}/{name}_offsets.npy", allow_pickle=False)
+    return [values[:, offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+class _SharedArray:
+    """An array in a shared memory block, pickled as the name of the block.
+
+    Only the process which created the block unlinks it in close.
+    """
+
+    def __init__(self, shape, dtype):
+        dtype = np.dtype(dtype)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+        )
+        self._owner = True
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+
+    @classmethod
+    def from_array(cls, array):
+        """Copy an array into a new shared memory block."""
+        shared = cls(array.shape, array.dtype)
+        shared.array[:] = array
+        return shared
+
+    def close(self):
+        """Release the shared memory block, unlinking it if this is the creator."""
+        if self._shm is not None:
+            self.array = None
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+    def __getstate__(self):
+        """Pickle the name of the shared memory block rather than the data."""
+        return {
+            "name": self._shm.name,
+            "shape": self.array.shape,
+            "dtype": self.array.dtype.str,
+        }
+
+    def __setstate__(self, state):
+        """Attach to the shared memory block of the pickled array."""
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner = False
+        self.array = np.ndarray(
+            state["shape"], dtype=np.dtype(state["dtype"]), buffer=self._shm.buf
+        )
+
+
+class ExperimentDataset:
+    """Load a dataset once and create resamples of it from indices.
+
+    The TRAIN and TEST files are loaded a single time. Resamples are created by
+    indexing the combined TRAIN and TEST data using
+    ``stratified_resample_data_indices`` or ``resample_data_indices``, producing the
+    same data as ``stratified_resample_data`` and ``resample_data`` with at most one
+    copy of the data per resample. Resample 0 returns the original split.
+
+    Equal length data is kept as the loaded TRAIN and TEST arrays, and resamples
+    gather their cases from both. With ``use_cache`` these are the read-only memory
+    maps of the cache, so workers loading the same dataset share the operating
+    system's page cache and only the cases of each resample are copied.
+
+    Equal length data can optionally be stored in shared memory instead. Pickling an
+    ExperimentDataset using shared memory (i.e. to send it to a worker process)
+    only transfers the name of the memory block, not the data itself.
+
+    Parameters
+    ----------
+    problem_path : str
+        Path to the problem folder.
+    dataset : str
+        Name of the dataset.
+    predefined_resample : bool, default=False
+        If True, each resample is loaded from its own predefined resample files
+        instead of being created from the default split. No data is shared between
+        resamples in this case.
+    stratify : bool, default=True
+        If True, resamples keep the class distribution of the original split i.e. for
+        classification and clustering. If False, cases are resampled without regard
+        to their label i.e. for regression.
+    use_shared_memory : bool, default=False
+        If True, equal length data is stored in a shared memory block. Call ``close``
+        or use the object as a context manager to release it.
+    use_cache : bool, default=False
+        If True, the .ts files are read through a binary cache. See
+        ``load_cached_ts_file``.
+
+    Attributes
+    ----------
+    X : np.ndarray or list of np.ndarray
+        The combined TRAIN and TEST data, with train cases first. For equal length
+        data not stored in shared memory, the combined array is created when
+        accessed.
+    y : np.ndarray
+        The combined TRAIN and TEST labels.
+    n_train_cases : int
+        The number of cases in the TRAIN file.
+
+    Examples
+    --------
+    >>> from tsml_eval.testing.testing_utils import _TEST_DATA_PATH
+    >>> from tsml_eval.utils.datasets import ExperimentDataset
+    >>> with ExperimentDataset(_TEST_DATA_PATH, "MinimalChinatown") as data:
+    ...     for resample_id in range(3):
+    ...         X_train, y_train, X_test, y_test = data.get_resample(resample_id)
+    """
+
+    def __init__(
+        self,
+        problem_path,
+        dataset,
+        predefined_resample=False,
+        stratify=True,
+        use_shared_memory=False,
+        use_cache=False,
+    ):
+        self.problem_path = problem_path
+        self.dataset = dataset
+        self.predefined_resample = predefined_resample
+        self.stratify = stratify
+        self.use_shared_memory = use_shared_memory
+        self.use_cache = use_cache
+
+        self.y = None
+        self.n_train_cases = None
+
+        self._X = None
+        # the (TRAIN, TEST) arrays of equal length data not in shared memory
+        self._X_splits = None
+        self._shared = None
+
+        if not predefined_resample:
+            self._load()
+
+    def get_resample(self, resample_id):
+        """Return the train and test split for a resample of the dataset.
+
+        Parameters
+        ----------
+        resample_id : int
+            The resample ID. 0 returns the default TRAIN/TEST split, other values are
+            used as the random state for resampling.
+
+        Returns
+        -------
+        X_train : np.ndarray or list of np.ndarray
+            Train data in a 2d or 3d ndarray or list of arrays.
+        y_train : np.ndarray
+            Train data labels.
+        X_test : np.ndarray or list of np.ndarray
+            Test data in a 2d or 3d ndarray or list of arrays.
+        y_test : np.ndarray
+            Test data labels.
+        """
+        if self.predefined_resample:
+            X_train, y_train, X_test, y_test, _ = load_experiment_data(
+                self.problem_path,
+                self.dataset,
+                resample_id,
+                True,
+                use_cache=self.use_cache,
+            )
+            return X_train, y_train, X_test, y_test
+
+        n = self.n_train_cases
+        if resample_id == 0:
+            if self._X_splits is not None:
+                return self._X_splits[0], self.y[:n], self._X_splits[1], self.y[n:]
+            return self._X[:n], self.y[:n], self._X[n:], self.y[n:]
+
+        if self.stratify:
+            train_indices, test_indices = stratified_resample_data_indices(
+                self.y[:n], self.y[n:], random_state=resample_id
+            )
+        else:
+            train_indices, test_indices = resample_data_indices(
+                self.y[:n], self.y[n:], random_state=resample_id
+            )
+
+        if self._X_splits is not None:
+            X_train = self._take(train_indices)
+            X_test = self._take(test_indices)
+        elif isinstance(self._X, np.ndarray):
+            X_train = self._X[train_indices]
+            X_test = self._X[test_indices]
+        else:
+            X_train = [self._X[i] for i in train_indices]
+            X_test = [self._X[i] for i in test_indices]
+
+        return X_train, self.y[train_indices], X_test, self.y[test_indices]
+
+    @property
+    def X(self):
+        """The combined TRAIN and TEST data, with train cases first."""
+        if self._X_splits is not None:
+            return np.concatenate(self._X_splits, axis=0)
+        return self._X
+
+    def close(self):
+        """Release the shared memory block if one is in use."""
+        if self._shared is not None:
+            self._X = None
+            self._shared.close()
+            self._shared = None
+
+    def __enter__(self):
+        """Return self for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the shared memory block when exiting the context."""
+        self.close()
+
+    def __getstate__(self):
+        """Pickle the shared memory block name rather than the data if possible."""
+        state = self.__dict__.copy()
+        if self._shared is not None:
+            state["_X"] = None
+        return state
+
+    def __setstate__(self, state):
+        """Attach to the shared memory block of the pickled object if used."""
+        self.__dict__.update(state)
+        if self._shared is not None:
+            self._X = self._shared.array
+
+    def _load(self):
+        X_train, y_train, X_test, y_test, _ = load_experiment_data(
+            self.problem_path, self.dataset, 0, False, use_cache=self.use_cache
+        )
+        self.n_train_cases = len(y_train)
+        self.y = np.concatenate((y_train, y_test), axis=None)
+
+        if isinstance(X_train, np.ndarray) and self.use_shared_memory:
+            shape = (len(self.y),) + X_train.shape[1:]
+            self._shared = _SharedArray(shape, np.result_type(X_train, X_test))
+            self._X = self._shared.array
+            self._X[: self.n_train_cases] = X_train
+            self._X[self.n_train_cases :] = X_test
+        elif isinstance(X_train, np.ndarray):
+            # kept as loaded, i.e. the memory maps of the cache, rather than copied
+            self._X_splits = (X_train, X_test)
+        else:
+            self._X = X_train + X_test
+
+    def _take(self, indices):
+        """Copy the cases at indices of the combined data from the split arrays."""
+        X_train, X_test = self._X_splits
+        is_train = indices < self.n_train_cases
+        X = np.empty(
+            (len(indices),) + X_train.shape[1:], dtype=np.result_type(X_train, X_test)
+        )
+        X[is_train] = X_train[indices[is_train]]
+        X[~is_train] = X_test[indices[~is_train] - self.n_train_cases]
+        return X
+
+
 def copy_dataset_ts_files(
     datasets: Union[list[str], str],
     source_path: str,
@@ -4,21 +4,41 @@ __maintainer__ = ["MatthewMiddlehurst"]
 __all__ = [
     "assign_gpu",
     "timing_benchmark",
+    "cached_timing_benchmark",
     "estimator_attributes_to_file",
 ]
 
+import json
+import multiprocessing
 import os
+import platform
+import socket
+import threading
 import time
 from collections.abc import Sequence
+from contextlib import contextmanager
 
-import gpustat
 import numpy as np
 from sklearn.base import BaseEstimator
 from sklearn.utils import check_random_state
 
+from tsml_eval.utils.watchdog import timeout_marker_path
+
+
+def _results_present(
+    path, estimator, dataset, resample_id=None, split="TEST", catalogue=None
+):
+    """Check if results are present already.
+
+    Results which timed out (see tsml_eval.utils.watchdog) count as present. If a
+    ResultsCatalogue of path is passed (see tsml_eval.utils.results_catalogue), it
+    is queried instead of checking for the files.
+    """
+    if catalogue is not None:
+        return catalogue.results_present(
+            estimator, dataset, resample_id=resample_id, split=split
+        )
 
-def _results_present(path, estimator, dataset, resample_id=None, split="TEST"):
-    """Check if results are present already."""
     resample_str = "Results" if resample_id is None else f"Resample{resample_id}"
     path = f"{path}/{estimator}/Predictions/{dataset}/"
 
@@ -26,7 +46,9 @@ def _results_present(path, estimator, dataset, resample_id=None, split="TEST"):
         full_path = f"{path}test{resample_str}.csv"
         full_path2 = f"{path}train{resample_str}.csv"
 
-        if os.path.exists(full_path) and os.path.exists(full_path2):
+        if _result_or_timeout_exists(full_path) and _result_or_timeout_exists(
+            full_path2
+        ):
             return True
     else:
         if split is None or split == "" or split == "NONE":
@@ -38,7 +60,7 @@ def _results_present(path, estimator, dataset, resample_id=None, split="TEST"):
         else:
             raise ValueError(f"Unknown split value: {split}")
 
-        if os.path.exists(full_path):
+        if _result_or_timeout_exists(full_path):
             return True
 
     return False
@@ -52,8 +74,16 @@ def _check_existing_results(
     overwrite,
     build_test_file,
     build_train_file,
+    catalogue=None,
 ):
-    """Check if results are present already and if they should be overwritten."""
+    """Check if results are present already and if they should be overwritten.
+
+    Results which timed out (see tsml_eval.utils.watchdog) are not run again unless
+    overwriting. If a ResultsCatalogue of results_path is passed (see
+    tsml_eval.utils.results_catalogue), results in the catalogue are present without
+    checking for the files. Results missing from the catalogue are checked for on
+    disk, as they may have been written since it was last scanned.
+    """
     if not overwrite:
         resample_str = "Result" if resample_id is None else f"Resample{resample_id}"
 
@@ -63,7 +93,9 @@ def _check_existing_results(
                 f"/test{resample_str}.csv"
             )
 
-            if os.path.exists(full_path):
+            if _catalogued_or_exists(
+                catalogue, full_path, estimator_name, dataset, resample_id, "TEST"
+            ):
                 build_test_file = False
 
         if build_train_file:
@@ -72,12 +104,75 @@ def _check_existing_results(
                 f"/train{resample_str}.csv"
             )
 
-            if os.path.exists(full_path):
+            if _catalogued_or_exists(
+                catalogue, full_path, estimator_name, dataset, resample_id, "TRAIN"
+            ):
                 build_train_file = False
 
     return build_test_file, build_train_file
 
 
+def _catalogued_or_exists(catalogue, file_path, estimator, dataset, resample_id, split):
+    if catalogue is not None and catalogue.results_present(
+        estimator, dataset, resample_id=resample_id, split=split
+    ):
+        return True
+    return _result_or_timeout_exists(file_path)
+
+
+def _result_or_timeout_exists(file_path):
+    # results converted to the npz format are also present
+    return (
+        os.path.exists(file_path)
+        or os.path.exists(f"{os.path.splitext(file_path)[0]}.npz")
+        or os.path.exists(timeout_marker_path(file_path))
+    )
+
+
+def _start_method():
+    """Return the start method for worker processes.
+
+    Forking a process which has already started numba/OpenMP threads can deadlock,
+    so workers are started from a clean server process where available.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def _init_worker():
+    """Limit a worker process to a single thread, parallelism comes from the pool."""
+    import numba
+    from aeon.utils.validation._dependencies import _check_soft_dependencies
+
+    numba.set_num_threads(1)
+    if _check_soft_dependencies("torch", severity="none"):  # pragma: no cover
+        import torch
+
+        torch.set_num_threads(1)
+
+
+@contextmanager
+def _single_threaded():
+    """Limit this process to a single thread as in _init_worker, then restore it."""
+    import numba
+    from aeon.utils.validation._dependencies import _check_soft_dependencies
+
+    numba_threads = numba.get_num_threads()
+    torch_threads = None
+    if _check_soft_dependencies("torch", severity="none"):  # pragma: no cover
+        import torch
+
+        torch_threads = torch.get_num_threads()
+
+    _init_worker()
+    try:
+        yield
+    finally:
+        numba.set_num_threads(numba_threads)
+        if torch_threads is not None:  # pragma: no cover
+            torch.set_num_threads(torch_threads)
+
+
 def assign_gpu(set_environ=False):  # pragma: no cover
     """Assign a GPU to the current process.
 
@@ -94,6 +189,8 @@ def assign_gpu(set_environ=False):  # pragma: no cover
     gpu : int
         The GPU assigned to the current process.
     """
+    import gpustat
+
     stats = gpustat.GPUStatCollection.new_query()
     pairs = [
         [
@@ -153,6 +250,113 @@ def timing_benchmark(num_arrays=1000, array_size=20000, random_state=None):
     return int(round(total_time * 1000))
 
 
+def cached_timing_benchmark(
+    cache_path=None,
+    expiry_hours=24 * 7,
+    refresh=False,
+    background_refresh=False,
+):
+    """Return the timing benchmark for this host, using a local cache if possible.
+
+    The result of ``timing_benchmark`` is stored in a JSON file keyed by the host
+    name and CPU model, so it is run once per host rather than once per experiment.
+    Cached values older than expiry_hours are recomputed.
+
+    Parameters
+    ----------
+    cache_path : str or None, default=None
+        Path to the cache file. If None, the TSML_EVAL_BENCHMARK_CACHE environment
+        variable is used if set, otherwise "tsml_eval/timing_benchmark.json" in the
+        user cache directory (XDG_CACHE_HOME or ~/.cache).
+    expiry_hours : float, default=168
+        The number of hours a cached benchmark is valid for.
+    refresh : bool, default=False
+        If True, run the benchmark and update the cache regardless of any cached
+        value.
+    background_refresh : bool, default=False
+        If True and the cached value has expired, return the expired value and
+        recompute the benchmark in a background thread. Note the background
+        benchmark will compete with anything else running for CPU time.
+
+    Returns
+    -------
+    time_taken : int
+        Time taken to sort the benchmark arrays in milliseconds.
+    from_cache : bool
+        Whether the returned value was read from the cache.
+
+    Examples
+    --------
+    >>> from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+    >>> from tsml_eval.utils.experiments import cached_timing_benchmark
+    >>> benchmark, from_cache = cached_timing_benchmark(
+    ...     cache_path=f"{_TEST_OUTPUT_PATH}/benchmark/doctest_benchmark.json"
+    ... )
+    """
+    if cache_path is None:
+        cache_path = os.getenv("TSML_EVAL_BENCHMARK_CACHE")
+    if cache_path is None:
+        cache_dir = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        cache_path = f"{cache_dir}/tsml_eval/timing_benchmark.json"
+
+    key = _benchmark_host_key()
+    entry = None if refresh else _read_benchmark_cache(cache_path).get(key)
+
+    if entry is not None:
+        if time.time() - entry["timestamp"] < expiry_hours * 3600:
+            return entry["benchmark"], True
+        elif background_refresh:
+            threading.Thread(
+                target=_update_benchmark_cache, args=(cache_path, key), daemon=True
+            ).start()
+            return entry["benchmark"], True
+
+    return _update_benchmark_cache(cache_path, key), False
+
+
+def _benchmark_host_key():
+    """Return a key identifying the host and its CPU model."""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    cpu = line.split(":", 1)[1].strip()
+                    break
+    except OSError:  # pragma: no cover
+        pass
+    return f"{socket.gethostname()}|{cpu}|{os.cpu_count()}"
+
+
+def _read_benchmark_cache(cache_path):
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _update_benchmark_cache(cache_path, key):
+    benchmark = timing_benchmark()
+
+    # re-read the cache so entries written by other hosts sharing it are kept
+    cache = _read_benchmark_cache(cache_path)
+    cache[key] = {"benchmark": benchmark, "timestamp": time.time()}
+
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=1)
+        os.replace(tmp_path, cache_path)
+    except OSError:  # pragma: no cover
+        # failing to write the cache should not stop an experiment
+        pass
+
+    return benchmark
+
+
 def estimator_attributes_to_file(
     estimator, dir_path, estimator_name=None, max_depth=np.inf, max_list_shape=np.inf
 ):
@@ -2,6 +2,7 @@
 
 __all__ = [
     "str_in_nested_list",
+    "nested_list_index",
     "pair_list_to_dict",
     "time_to_milliseconds",
     "rank_array",
@@ -20,6 +21,44 @@ def str_in_nested_list(nested_list, item):
         )
 
 
+def nested_list_index(nested_lists):
+    """Map every str in a collection of nested lists to a value.
+
+    Used to find the item matching a name in O(1) rather than searching each nested
+    list with str_in_nested_list. Keys are casefolded. If a str is in more than one
+    nested list, the value of the first is kept.
+
+    Parameters
+    ----------
+    nested_lists : list of tuple
+        List of (nested_list, value) pairs. Every str in nested_list is mapped to
+        value.
+
+    Returns
+    -------
+    index : dict
+        Dictionary with str keys and the value of their nested list.
+
+    Examples
+    --------
+    >>> from tsml_eval.utils.functions import nested_list_index
+    >>> nested_list_index([(["a", ["b", "B2"]], 1), (["c"], 2)])
+    {'a': 1, 'b': 1, 'b2': 1, 'c': 2}
+    """
+    index = {}
+
+    def _add(nested_list, value):
+        for item in nested_list:
+            if isinstance(item, list):
+                _add(item, value)
+            elif isinstance(item, str):
+                index.setdefault(item.casefold(), value)
+
+    for nested_list, value in nested_lists:
+        _add(nested_list, value)
+    return index
+
+
 def pair_list_to_dict(pl):
     """Convert a 2d list of pairs to a dict.
 
@@ -0,0 +1,120 @@
+"""Recording of the time spent importing modules in experiment processes."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "ImportTimeRecorder",
+]
+
+import builtins
+import importlib.util
+import sys
+import time
+
+import psutil
+
+
+class ImportTimeRecorder:
+    """Record the time spent on the first import of each module.
+
+    While recording, the built-in import function is wrapped so that the first
+    import of each module is timed. The time of a module includes the
+    imports it triggers (cumulative) and is also recorded without them (self), in the
+    same way as the "python -X importtime" option. The time between the creation of
+    the process and the start of recording, which includes interpreter startup and
+    the module level imports of the experiment script, is recorded as the startup
+    time.
+
+    Modules imported before recording started are not timed. Use "python -X
+    importtime" to get a full breakdown of the imports made at startup.
+
+    Examples
+    --------
+    >>> from tsml_eval.utils.import_time import ImportTimeRecorder
+    >>> with ImportTimeRecorder() as recorder:
+    ...     import colorsys
+    >>> recorder.startup_time > 0
+    True
+    >>> "colorsys" in recorder.imports
+    True
+    """
+
+    def __init__(self):
+        self.startup_time = None
+        self.imports = {}
+
+        self._import = None
+        self._stack = []
+
+    def start(self):
+        """Start recording imports."""
+        if self._import is not None:
+            raise RuntimeError("ImportTimeRecorder is already recording.")
+
+        self.startup_time = (
+            time.time() - psutil.Process().create_time()
+        ) * 1000  # milliseconds
+        self._import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self):
+        """Stop recording imports."""
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    def __enter__(self):
+        """Start recording imports when entering the context."""
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop recording imports when exiting the context."""
+        self.stop()
+
+    def report(self, n_modules=20):
+        """Return a report of the startup time and the slowest recorded imports.
+
+        Parameters
+        ----------
+        n_modules : int, default=20
+            The number of modules to list, ordered by decreasing cumulative time.
+
+        Returns
+        -------
+        report : str
+            The report, with times in milliseconds.
+        """
+        total = sum(
+            self_time for self_time, _ in self.imports.values()
+        )  # self times do not overlap
+        lines = [
+            f"startup time [ms]: {self.startup_time:.0f}",
+            f"recorded import time [ms]: {total:.0f} ({len(self.imports)} modules)",
+            f"{'self [ms]':>10} | {'cumulative [ms]':>15} | module",
+        ]
+        ordered = sorted(self.imports.items(), key=lambda x: x[1][1], reverse=True)
+        for name, (self_time, cumulative) in ordered[:n_modules]:
+            lines.append(f"{self_time:>10.1f} | {cumulative:>15.1f} | {name}")
+        return "\n".join(lines)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module = name
+        if level > 0:
+            package = (globals or {}).get("__package__")
+            if not package:
+                return self._import(name, globals, locals, fromlist, level)
+            module = importlib.util.resolve_name("." * level + name, package)
+        if module in sys.modules:
+            return self._import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = (time.perf_counter() - start) * 1000
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += cumulative
+            if module in sys.modules and module not in self.imports:
+                self.imports[module] = (cumulative - nested, cumulative)
@@ -1,17 +1,39 @@
 """Utility for recording the maximum memory usage of a function."""
 
+__all__ = [
+    "record_max_memory",
+    "MEMORY_RECORDING_METHODS",
+]
+
+import sys
 import time
-from threading import Thread
+import tracemalloc
+from threading import Event, RLock, Thread
 
 import psutil
 
+MEMORY_RECORDING_METHODS = ["sampling", "ru_maxrss", "tracemalloc"]
+
+# tracemalloc traces the whole process, so recordings from different threads would
+# reset and stop each other's traces
+_TRACEMALLOC_LOCK = RLock()
+
 
 def record_max_memory(
-    function, args=None, kwargs=None, interval=0.1, return_func_time=False
+    function,
+    args=None,
+    kwargs=None,
+    interval=0.1,
+    return_func_time=False,
+    method="sampling",
+    include_children=True,
 ):
     """
     Record the maximum memory usage of a function.
 
+    The function is run in the calling thread and the recorder returns as soon as it
+    finishes, regardless of the sampling interval.
+
     Parameters
     ----------
     function : function
@@ -21,9 +43,30 @@ def record_max_memory(
     kwargs : dict, default=None
         The keyword arguments to pass to the function.
     interval : float, default=0.1
-        The interval (in seconds) to check the memory usage.
+        The interval (in seconds) to sample the memory usage when using the
+        "sampling" method. Peaks shorter than this interval may be missed.
     return_func_time : bool, default=False
         Whether to return the function's runtime.
+    method : str, default="sampling"
+        The method used to measure memory usage, one of:
+
+        - "sampling": a background thread samples the resident set size (RSS) of
+          the process every interval seconds.
+        - "ru_maxrss": the increase in the peak RSS reported by the operating system
+          through ``resource.getrusage``. Catches all peaks, but only increases over
+          the largest peak reached before the function was run are counted. Not
+          available on Windows.
+        - "tracemalloc": the peak memory allocated by Python and libraries which
+          report to ``tracemalloc`` i.e. numpy, ignoring memory allocated elsewhere.
+          Catches all peaks but slows down allocation heavy functions and cannot
+          include child processes. Recordings in different threads run one at a
+          time, and allocations made by other threads during a recording are
+          counted.
+    include_children : bool, default=True
+        Whether to include the memory usage of child processes i.e. those started by
+        joblib/loky. For "sampling" the RSS of all child processes alive at each
+        sample is added to the process RSS. For "ru_maxrss" the largest peak RSS of
+        any finished child process is added.
 
     Returns
     -------
@@ -37,51 +80,144 @@ def record_max_memory(
     >>> def f(n):
     ...     return [i for i in range(n)]
     >>> max_mem = record_max_memory(f, args=[10000])
+    >>> max_mem = record_max_memory(f, args=[10000], method="tracemalloc")
     """
-    process = psutil.Process()
-    start_memory = process.memory_info().rss
+    if method not in MEMORY_RECORDING_METHODS:
+        raise ValueError(
+            f"Unknown memory recording method: {method}. Must be one of "
+            f"{MEMORY_RECORDING_METHODS}."
+        )
+
+    args = args if args is not None else []
+    kwargs = kwargs if kwargs is not None else {}
+
+    if method == "sampling":
+        recorder = _SamplingRecorder(interval, include_children)
+    elif method == "ru_maxrss":
+        recorder = _RusageRecorder(include_children)
+    else:
+        recorder = _TracemallocRecorder()
+
+    recorder.start()
+    start = time.perf_counter()
+    try:
+        function(*args, **kwargs)
+    finally:
+        function_time = int(round((time.perf_counter() - start) * 1000))
+        max_memory = recorder.stop()
+
+    if return_func_time:
+        return max_memory, function_time
+    else:
+        return max_memory
+
+
+def _process_rss(process, include_children):
+    """Return the RSS of a process and optionally its children."""
+    mem = process.memory_info().rss
+    if include_children:
+        for child in process.children(recursive=True):
+            try:
+                mem += child.memory_info().rss
+            except psutil.Error:
+                # the child may have exited since it was listed
+                pass
+    return mem
+
+
+class _SamplingRecorder(Thread):
+    """Thread that samples the RSS of the process until stopped."""
+
+    def __init__(self, interval, include_children):
+        self.interval = interval
+        self.include_children = include_children
+
+        self._process = psutil.Process()
+        self._stop_event = Event()
+        self._start_memory = 0
+        self._max_memory = 0
 
-    thread = _FunctionThread(function, args, kwargs)
-    thread.start()
+        super().__init__(daemon=True)
 
-    max_memory = process.memory_info().rss
+    def start(self):
+        """Record the starting memory usage and start sampling."""
+        self._start_memory = _process_rss(self._process, self.include_children)
+        self._max_memory = self._start_memory
+        super().start()
 
-    while True:
-        time.sleep(interval)
+    def run(self):
+        """Overloads the threading.Thread.run."""
+        # wait returns early when stopped, so there is no latency after the function
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def stop(self):
+        """Stop sampling and return the maximum memory increase."""
+        self._stop_event.set()
+        self.join()
+        self._sample()
+        return self._max_memory - self._start_memory
+
+    def _sample(self):
+        try:
+            mem = _process_rss(self._process, self.include_children)
+        except psutil.Error:  # pragma: no cover
+            return
+        if mem > self._max_memory:
+            self._max_memory = mem
 
-        mem = process.memory_info().rss
-        if mem > max_memory:
-            max_memory = mem
 
-        if not thread.is_alive():
-            if thread.exception is not None:
-                raise thread.exception
+class _RusageRecorder:
+    """Recorder using the peak RSS reported by the operating system."""
 
-            if return_func_time:
-                return max_memory - start_memory, thread.function_time
-            else:
-                return max_memory - start_memory
+    def __init__(self, include_children):
+        if sys.platform == "win32":  # pragma: no cover
+            raise ValueError("The ru_maxrss method is not available on Windows.")
 
+        self.include_children = include_children
+        self._start_memory = 0
 
-class _FunctionThread(Thread):
-    """Thread that runs a function with arguments."""
+    def start(self):
+        """Record the starting peak memory usage."""
+        self._start_memory = self._max_rss()
 
-    def __init__(self, function, args=None, kwargs=None):
-        self.function = function
-        self.args = args if args is not None else []
-        self.kwargs = kwargs if kwargs is not None else {}
+    def stop(self):
+        """Return the increase in peak memory usage."""
+        return max(0, self._max_rss() - self._start_memory)
 
-        self.function_time = -1
-        self.exception = None
+    def _max_rss(self):
+        import resource
 
-        super().__init__(daemon=True)
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        scale = 1 if sys.platform == "darwin" else 1024
+        mem = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        if self.include_children:
+            mem += resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+        return mem
 
-    def run(self):
-        """Overloads the threading.Thread.run."""
-        start = int(round(time.time() * 1000))
+
+class _TracemallocRecorder:
+    """Recorder using the peak memory traced by tracemalloc."""
+
+    def __init__(self):
+        self._was_tracing = False
+        self._start_memory = 0
+
+    def start(self):
+        """Start tracing and reset the traced peak."""
+        _TRACEMALLOC_LOCK.acquire()
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._start_memory = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        """Return the peak traced memory increase and stop tracing."""
         try:
-            self.function(*self.args, **self.kwargs)
-        except Exception as e:
-            self.exception = e
-        end = int(round(time.time() * 1000))
-        self.function_time = end - start
+            peak = tracemalloc.get_traced_memory()[1]
+            if not self._was_tracing:
+                tracemalloc.stop()
+        finally:
+            _TRACEMALLOC_LOCK.release()
+        return max(0, peak - self._start_memory)
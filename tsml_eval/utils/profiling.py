@@ -0,0 +1,180 @@
+"""Profiling of the fit and predict phases of experiments."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "ExperimentProfiler",
+    "profile_path",
+]
+
+import cProfile
+import os
+import sys
+import threading
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+
+
+class ExperimentProfiler:
+    """Profile the phases of an experiment with cProfile and a stack sampler.
+
+    Each profiled phase is run under its own cProfile profiler, written as a
+    <phase>.pstats file which can be read using the pstats module or tools such as
+    snakeviz. At the same time, a thread samples the call stack of the profiled
+    thread at a fixed interval. The samples of all phases are written to a
+    stacks.collapsed file in the collapsed stack format read by flame graph tools
+    such as flamegraph.pl and speedscope, with the phase name as the root frame.
+
+    Profiling slows down the profiled code, so the fit and predict times of profiled
+    experiments should not be compared to those of experiments which are not.
+
+    Parameters
+    ----------
+    enabled : bool, default=True
+        Whether to profile phases. If False, phase does nothing, so the profiler can
+        be used unconditionally.
+    interval : float, default=0.005
+        The time in seconds between call stack samples.
+
+    Examples
+    --------
+    >>> from tsml_eval.utils.profiling import ExperimentProfiler
+    >>> profiler = ExperimentProfiler()
+    >>> with profiler.phase("fit"):
+    ...     x = sorted(range(100000), key=lambda i: -i)
+    >>> list(profiler.stats)
+    ['fit']
+    """
+
+    def __init__(self, enabled=True, interval=0.005):
+        self.enabled = enabled
+        self.interval = interval
+
+        self.stats = {}
+        self.stacks = Counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Profile a phase of the experiment run inside the context.
+
+        Phases with the same name are combined.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase, i.e. "fit" or "predict".
+        """
+        if not self.enabled:
+            yield
+            return
+
+        # the frame containing the with statement, samples only include its callees
+        base_depth = _frame_depth(sys._getframe().f_back.f_back)
+
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(threading.get_ident(), name, base_depth, stop),
+            daemon=True,
+        )
+
+        if name not in self.stats:
+            self.stats[name] = cProfile.Profile()
+        profiler = self.stats[name]
+        try:
+            profiler.enable()
+        except ValueError:  # pragma: no cover
+            # only one profiler can be active at a time in Python 3.12+
+            warnings.warn(
+                f"Unable to start cProfile for the {name} phase, another profiler is "
+                "active. Only call stack samples will be recorded.",
+                stacklevel=3,
+            )
+            profiler = None
+
+        sampler.start()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            stop.set()
+            sampler.join()
+
+    def write(self, path):
+        """Write the profile of each phase and the sampled call stacks to a directory.
+
+        Parameters
+        ----------
+        path : str
+            The directory to write <phase>.pstats files and a stacks.collapsed file
+            to. Any required directories will be created.
+        """
+        if not self.enabled:
+            return
+
+        os.makedirs(path, exist_ok=True)
+        for name, profiler in self.stats.items():
+            profiler.dump_stats(f"{path}/{name}.pstats")
+
+        with open(f"{path}/stacks.collapsed", "w") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def _sample(self, ident, name, base_depth, stop):
+        while not stop.wait(self.interval):
+            frame = sys._current_frames().get(ident)
+            stack = []
+            while frame is not None:
+                stack.append(frame)
+                frame = frame.f_back
+
+            labels = [name] + [_frame_label(f) for f in reversed(stack)][base_depth:]
+            self.stacks[";".join(labels)] += 1
+
+
+def profile_path(results_path, estimator_name, dataset_name, resample_id):
+    """Return the directory profiles are written to for an experiment.
+
+    Profiles are written to the Workspace directory of the estimator, i.e.
+    <results_path>/<estimator_name>/Workspace/<dataset_name>/
+    profileResample<resample_id>/.
+
+    Parameters
+    ----------
+    results_path : str
+        Location of the results.
+    estimator_name : str
+        Name of the estimator.
+    dataset_name : str
+        Name of the dataset.
+    resample_id : int or None
+        The resample ID of the experiment.
+
+    Returns
+    -------
+    path : str
+        The directory to write profiles to.
+    """
+    d = (
+        ""
+        if dataset_name is None or dataset_name == "" or dataset_name == "N/A"
+        else f"{dataset_name}/"
+    )
+    fname = "profileResults" if resample_id is None else f"profileResample{resample_id}"
+    return f"{results_path}/{estimator_name}/Workspace/{d}{fname}/"
+
+
+def _frame_depth(frame):
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def _frame_label(frame):
+    # ";" separates frames and " " the count in the collapsed format
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename).replace(";", "_")
+    return f"{code.co_name}({filename}:{code.co_firstlineno})".replace(" ", "_")
@@ -0,0 +1,508 @@
+"""A catalogue of the results files in a results directory, stored in SQLite."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "ResultsCatalogue",
+]
+
+import os
+import re
+import sqlite3
+import time
+
+import pandas as pd
+
+from tsml_eval.evaluation.storage.estimator_results import _read_results_header
+from tsml_eval.evaluation.storage.results_summary import _summary_from_header
+
+# {split}Resample{resample_id} or {split}Results files, written as CSV, NPZ or as a
+# timeout marker, see tsml_eval.utils.watchdog
+_RESULTS_FILE_PATTERN = re.compile(
+    r"^(train|test)?(?:Resample(\d+)|Results|results)\.(csv|npz|timeout)$"
+)
+
+# directories modified more recently than this when scanned may still be changing
+# within the resolution of the file system timestamps, so are rescanned next time
+_RECENT_CHANGE_NS = 2 * 10**9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT PRIMARY KEY,
+    estimator TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    split TEXT NOT NULL,
+    resample_id INTEGER,
+    file_format TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    task TEXT,
+    statistic REAL,
+    fit_time REAL,
+    predict_time REAL,
+    benchmark_time REAL,
+    memory_usage REAL,
+    time_unit TEXT,
+    third_line TEXT
+);
+CREATE INDEX IF NOT EXISTS results_by_experiment
+    ON results (estimator, dataset, split, resample_id);
+"""
+
+_SUMMARY_COLUMNS = [
+    "estimator",
+    "dataset",
+    "split",
+    "resample_id",
+    "file_format",
+    "path",
+    "mtime_ns",
+    "size",
+    "task",
+    "statistic",
+    "fit_time",
+    "predict_time",
+    "benchmark_time",
+    "memory_usage",
+    "time_unit",
+    "third_line",
+]
+
+
+class ResultsCatalogue:
+    """
+    A catalogue of the results files in a results directory, stored in SQLite.
+
+    Indexes the results files of the standard tsml-eval file structure of
+    {estimator}/Predictions/{dataset}/{split}Resample{resample}.csv, including NPZ
+    results files and timeout markers. For each file the catalogue stores its
+    modification time, size and the summary written to the third line of the file,
+    i.e. accuracy, timings and memory usage for classification.
+
+    The catalogue is updated by scan. The modification time of each directory is
+    stored, and only directories which have changed since the last scan are listed
+    again. Queries for the presence of results and their summaries are answered from
+    the catalogue without accessing the results files.
+
+    Adding or removing a file changes the modification time of its directory, but
+    overwriting an existing file does not. Use scan(full=True) to check every file
+    after results have been overwritten.
+
+    Parameters
+    ----------
+    results_path : str
+        The results directory to catalogue, containing a directory for each
+        estimator.
+    catalogue_path : str or None, default=None
+        The SQLite database file to store the catalogue in. If None, the catalogue is
+        stored in results_catalogue.sqlite in results_path. If the file exists, the
+        existing catalogue is used and updated.
+
+    Examples
+    --------
+    >>> from tsml_eval.utils.results_catalogue import ResultsCatalogue
+    >>> from tsml_eval.testing.testing_utils import _TEST_RESULTS_PATH
+    >>> catalogue = ResultsCatalogue(
+    ...     _TEST_RESULTS_PATH + "/classification/", catalogue_path=":memory:"
+    ... )
+    >>> catalogue.scan() > 0
+    True
+    >>> catalogue.results_present("ROCKET", "Chinatown", resample_id=0)
+    True
+    >>> catalogue.close()
+    """
+
+    def __init__(self, results_path, catalogue_path=None):
+        self.results_path = results_path
+        self.catalogue_path = (
+            os.path.join(results_path, "results_catalogue.sqlite")
+            if catalogue_path is None
+            else catalogue_path
+        )
+
+        if self.catalogue_path != ":memory:":
+            os.makedirs(os.path.dirname(self.catalogue_path) or ".", exist_ok=True)
+        # wait for other processes updating a shared catalogue
+        self._connection = sqlite3.connect(self.catalogue_path, timeout=60)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the connection to the catalogue database."""
+        self._connection.close()
+
+    def __getstate__(self):
+        """Pickle the catalogue paths, the database connection is reopened."""
+        if self.catalogue_path == ":memory:":
+            raise TypeError("A ResultsCatalogue stored in memory cannot be pickled.")
+        return {
+            "results_path": self.results_path,
+            "catalogue_path": self.catalogue_path,
+        }
+
+    def __setstate__(self, state):
+        """Reopen the catalogue database from the pickled paths."""
+        self.__init__(state["results_path"], catalogue_path=state["catalogue_path"])
+
+    def scan(self, full=False):
+        """
+        Update the catalogue with the results files changed since the last scan.
+
+        Estimator, Predictions and dataset directories are only listed if their
+        modification time has changed, and only new or changed results files are
+        read.
+
+        Parameters
+        ----------
+        full : bool, default=False
+            If True, every directory is listed and the modification time and size of
+            every results file are checked, i.e. to find results files which were
+            overwritten in place.
+
+        Returns
+        -------
+        n_changed : int
+            The number of results files added, updated or removed.
+        """
+        with self._connection:
+            directories = dict(
+                self._connection.execute("SELECT path, mtime_ns FROM directories")
+            )
+
+            estimators, n_changed = self._subdirectories("", directories, full)
+            for estimator in estimators:
+                predictions = f"{estimator}/Predictions"
+                subdirectories, n_removed = self._subdirectories(
+                    estimator, directories, full, only=["Predictions"]
+                )
+                n_changed += n_removed
+                if predictions not in subdirectories:
+                    continue
+
+                datasets, n_removed = self._subdirectories(
+                    predictions, directories, full
+                )
+                n_changed += n_removed
+                for dataset_path in datasets:
+                    n_changed += self._scan_dataset(dataset_path, directories, full)
+
+        return n_changed
+
+    def results_present(self, estimator, dataset, resample_id=None, split="TEST"):
+        """
+        Check if results are present in the catalogue.
+
+        Follows the checks of results files for experiments, where results which
+        timed out count as present (see tsml_eval.utils.watchdog).
+
+        Parameters
+        ----------
+        estimator : str
+            The name of the estimator.
+        dataset : str
+            The name of the dataset.
+        resample_id : int or None, default=None
+            The resample ID of the results. If None, {split}Results files are checked.
+        split : str or None, default="TEST"
+            The split of the results, one of "TEST", "TRAIN", "BOTH" for both test
+            and train results, or None for results without a split.
+
+        Returns
+        -------
+        present : bool
+            True if the results are present.
+        """
+        if split == "BOTH":
+            splits = ["test", "train"]
+        elif split is None or split == "" or split == "NONE":
+            splits = [""]
+        elif split == "TEST" or split == "TRAIN":
+            splits = [split.lower()]
+        else:
+            raise ValueError(f"Unknown split value: {split}")
+
+        return all(
+            self._find(estimator, dataset, s, resample_id) is not None for s in splits
+        )
+
+    def results_file(self, estimator, dataset, split="test", resample_id=None):
+        """
+        Return the path of a results file in the catalogue.
+
+        Parameters
+        ----------
+        estimator : str
+            The name of the estimator.
+        dataset : str
+            The name of the dataset.
+        split : str, default="test"
+            The split of the results, i.e. "test" or "train".
+        resample_id : int or None, default=None
+            The resample ID of the results.
+
+        Returns
+        -------
+        file_path : str
+            The path of the results file. If both are present, the CSV file is
+            returned over the NPZ file. If the experiment timed out, the path of the
+            CSV file it would have written is returned, which raises an
+            ExperimentTimeoutError when loaded.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the results are not in the catalogue.
+        """
+        row = self._find(estimator, dataset, split.lower(), resample_id)
+        if row is None:
+            raise FileNotFoundError(
+                f"Results for {estimator} on {dataset} {split} resample "
+                f"{resample_id} are not in the catalogue."
+            )
+
+        file_path = os.path.join(self.results_path, row[0])
+        if row[1] == "timeout":
+            # loading the results file raises an ExperimentTimeoutError
+            file_path = f"{os.path.splitext(file_path)[0]}.csv"
+        return file_path
+
+    def summaries(self, estimators=None, datasets=None, split=None):
+        """
+        Return the catalogued results files and their summaries.
+
+        Parameters
+        ----------
+        estimators : list of str or None, default=None
+            Only return results for these estimators. If None, all are returned.
+        datasets : list of str or None, default=None
+            Only return results for these datasets. If None, all are returned.
+        split : str or None, default=None
+            Only return results for this split, i.e. "test". If None, all are
+            returned.
+
+        Returns
+        -------
+        summaries : pd.DataFrame
+            One row per results file or timeout marker with the "estimator",
+            "dataset", "split", "resample_id", "file_format" ("csv", "npz" or
+            "timeout"), "path" (relative to results_path), "mtime_ns", "size" and
+            "task" of the file. The "statistic" (i.e. accuracy for classification),
+            "fit_time", "predict_time", "benchmark_time", "memory_usage",
+            "time_unit" and "third_line" are read from the file header, and are
+            missing for timeout markers and files which could not be read.
+        """
+        conditions = []
+        values = []
+        for column, selection in [("estimator", estimators), ("dataset", datasets)]:
+            if selection is not None:
+                conditions.append(f"{column} IN ({','.join('?' * len(selection))})")
+                values.extend(selection)
+        if split is not None:
+            conditions.append("split = ?")
+            values.append(split.lower())
+
+        query = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM results"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY estimator, dataset, split, resample_id"
+
+        return pd.DataFrame(
+            self._connection.execute(query, values).fetchall(),
+            columns=_SUMMARY_COLUMNS,
+        )
+
+    def count_complete(self, estimators, datasets, resamples, split="test"):
+        """
+        Count the datasets each estimator has results for all resamples on.
+
+        Parameters
+        ----------
+        estimators : list of str
+            The names of the estimators.
+        datasets : list of str
+            The names of the datasets.
+        resamples : int
+            The number of resamples a dataset requires to be complete.
+        split : str, default="test"
+            The split of the results to count.
+
+        Returns
+        -------
+        counts : pd.Series
+            The number of complete datasets, indexed by estimator.
+        """
+        summaries = self.summaries(
+            estimators=estimators, datasets=datasets, split=split
+        )
+        summaries = summaries[summaries["file_format"] != "timeout"]
+        n_resamples = summaries.groupby(["estimator", "dataset"])[
+            "resample_id"
+        ].nunique()
+
+        return pd.Series(
+            [
+                int((n_resamples.get(e, pd.Series(dtype=int)) >= resamples).sum())
+                for e in estimators
+            ],
+            index=estimators,
+        )
+
+    def _subdirectories(self, path, directories, full, only=None):
+        """Return the subdirectories of a directory and the number of files removed.
+
+        The directory is only listed if it has changed since the last scan.
+        """
+        full_path = os.path.join(self.results_path, path)
+        try:
+            mtime_ns = os.stat(full_path).st_mtime_ns
+        except FileNotFoundError:
+            return [], self._remove(path)
+
+        if not full and directories.get(path, None) == mtime_ns:
+            known = [p for p in directories if p != "" and os.path.dirname(p) == path]
+            return (
+                sorted(p for p in known if only is None or os.path.basename(p) in only),
+                0,
+            )
+
+        subdirectories = sorted(
+            os.path.join(path, entry.name).replace(os.sep, "/")
+            for entry in os.scandir(full_path)
+            if entry.is_dir() and (only is None or entry.name in only)
+        )
+        # directories removed since the last scan
+        n_removed = 0
+        for p in directories:
+            if p != "" and os.path.dirname(p) == path and p not in subdirectories:
+                n_removed += self._remove(p)
+
+        self._set_directory(path, mtime_ns)
+        return subdirectories, n_removed
+
+    def _scan_dataset(self, path, directories, full):
+        """Update the results files of a dataset directory if it has changed."""
+        full_path = os.path.join(self.results_path, path)
+        try:
+            mtime_ns = os.stat(full_path).st_mtime_ns
+        except FileNotFoundError:
+            return self._remove(path)
+
+        if not full and directories.get(path, None) == mtime_ns:
+            return 0
+
+        estimator = path.split("/")[0]
+        dataset = path.split("/")[-1]
+        known = dict(
+            (row[0], (row[1], row[2]))
+            for row in self._connection.execute(
+                "SELECT path, mtime_ns, size FROM results WHERE estimator = ? AND "
+                "dataset = ?",
+                (estimator, dataset),
+            )
+            if os.path.dirname(row[0]) == path
+        )
+
+        n_changed = 0
+        present = set()
+        for entry in os.scandir(full_path):
+            match = _RESULTS_FILE_PATTERN.match(entry.name)
+            if match is None or not entry.is_file():
+                continue
+
+            file_path = f"{path}/{entry.name}"
+            present.add(file_path)
+            stat = entry.stat()
+            if known.get(file_path, None) == (stat.st_mtime_ns, stat.st_size):
+                continue
+
+            split, resample_id, file_format = match.groups()
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO results ({', '.join(_SUMMARY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_SUMMARY_COLUMNS))})",
+                [
+                    estimator,
+                    dataset,
+                    "" if split is None else split,
+                    None if resample_id is None else int(resample_id),
+                    file_format,
+                    file_path,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    *self._read_summary(entry.path, file_format),
+                ],
+            )
+            n_changed += 1
+
+        for file_path in known:
+            if file_path not in present:
+                self._connection.execute(
+                    "DELETE FROM results WHERE path = ?", (file_path,)
+                )
+                n_changed += 1
+
+        self._set_directory(path, mtime_ns)
+        return n_changed
+
+    def _read_summary(self, file_path, file_format):
+        """Read the task and header values of a results file for the catalogue."""
+        if file_format == "timeout":
+            return [None] * 8
+
+        try:
+            lines = _read_results_header(file_path)
+            rs = _summary_from_header(lines)
+        except (ValueError, IndexError, OSError):
+            # files which cannot be read are catalogued, but have no summary
+            return [None] * 8
+
+        statistic = next(iter(rs.task_statistics[rs.task]))
+        return [
+            rs.task,
+            rs.__dict__[statistic],
+            rs.fit_time,
+            rs.predict_time,
+            rs.benchmark_time,
+            rs.memory_usage,
+            rs.time_unit,
+            lines[2].strip(),
+        ]
+
+    def _find(self, estimator, dataset, split, resample_id):
+        """Return the path and format of the results of an experiment, or None."""
+        row = self._connection.execute(
+            "SELECT path, file_format FROM results WHERE estimator = ? AND "
+            "dataset = ? AND split = ? AND resample_id IS ? "
+            "ORDER BY CASE file_format WHEN 'csv' THEN 0 WHEN 'npz' THEN 1 ELSE 2 END",
+            (estimator, dataset, split, resample_id),
+        ).fetchone()
+        return row
+
+    def _set_directory(self, path, mtime_ns):
+        # a directory changed very recently could change again without its
+        # modification time changing, store an invalid time so it is listed again
+        if time.time_ns() - mtime_ns < _RECENT_CHANGE_NS:
+            mtime_ns = -1
+        self._connection.execute(
+            "INSERT OR REPLACE INTO directories (path, mtime_ns) VALUES (?, ?)",
+            (path, mtime_ns),
+        )
+
+    def _remove(self, path):
+        """Remove a directory and everything in it from the catalogue."""
+        if path == "":
+            n_removed = self._connection.execute("DELETE FROM results").rowcount
+            self._connection.execute("DELETE FROM directories")
+            return n_removed
+
+        # compare prefixes rather than using LIKE, where _ in names is a wildcard
+        prefix = f"{path}/"
+        n_removed = self._connection.execute(
+            "DELETE FROM results WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+        ).rowcount
+        self._connection.execute(
+            "DELETE FROM directories WHERE path = ? OR substr(path, 1, ?) = ?",
+            (path, len(prefix), prefix),
+        )
+        return n_removed
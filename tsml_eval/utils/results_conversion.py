@@ -0,0 +1,146 @@
+"""Utility functions for converting results files between formats."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+
+__all__ = [
+    "convert_results_file",
+    "convert_results_directory",
+]
+
+import os
+import re
+
+import numpy as np
+
+from tsml_eval.evaluation.storage.estimator_results import (
+    _read_results_file,
+    _read_results_header,
+)
+from tsml_eval.evaluation.storage.results_summary import _results_task
+from tsml_eval.utils.results_writing import _RESULTS_FILE_FORMATS, _write_results_file
+
+# the index of the number of probabilities per case in the third line of a file
+_N_PROBABILITIES_INDEX = {"classification": 5, "clustering": 6}
+
+
+def convert_results_file(file_path, file_format="npz", remove_original=False):
+    """Convert a results file between the tsml CSV and the binary NPZ format.
+
+    The converted file is written alongside the original with the extension of the
+    new format, i.e. testResample0.npz for testResample0.csv. The header lines are
+    copied unchanged and the values of each case are converted, so the results
+    loaded from either file are the same.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the results file to convert.
+    file_format : {"csv", "npz"}, default="npz"
+        The format to convert the results file to.
+    remove_original : bool, default=False
+        If True, the original results file is deleted after conversion.
+
+    Returns
+    -------
+    converted_path : str
+        The path of the converted results file.
+    """
+    if file_format not in _RESULTS_FILE_FORMATS:
+        raise ValueError(
+            f"Unknown file_format {file_format}, should be one of "
+            f"{_RESULTS_FILE_FORMATS}."
+        )
+
+    root, ext = os.path.splitext(file_path)
+    if ext == f".{file_format}":
+        raise ValueError(f"Results file {file_path} is already in the {ext} format.")
+    converted_path = f"{root}.{file_format}"
+
+    task = _results_task(_read_results_header(file_path)[2])
+    lines, cases = _read_results_file(
+        file_path, n_probabilities_index=_N_PROBABILITIES_INDEX.get(task, None)
+    )
+    labels, predictions, probabilities, pred_times, pred_descriptions = cases
+    if callable(probabilities):
+        probabilities = probabilities()
+
+    # values are read from CSV files as floats, keep integer values as integers
+    if task in _N_PROBABILITIES_INDEX:
+        predictions = predictions.astype(int)
+        if not np.isnan(labels).any():
+            labels = labels.astype(int)
+    if pred_times is not None and np.array_equal(pred_times, np.round(pred_times)):
+        pred_times = pred_times.astype(np.int64)
+
+    _write_results_file(
+        converted_path,
+        [line.rstrip("\n") for line in lines],
+        labels,
+        predictions,
+        probabilities=probabilities,
+        pred_times=pred_times,
+        pred_descriptions=pred_descriptions,
+    )
+
+    if remove_original:
+        os.remove(file_path)
+
+    return converted_path
+
+
+def convert_results_directory(
+    path, file_format="npz", remove_original=False, overwrite=False
+):
+    """Convert every results file in a directory between the CSV and NPZ formats.
+
+    Searches the directory and its subdirectories for results files in the other
+    format, named as in the tsml file structure, i.e.
+    {estimator}/Predictions/{dataset}/{split}Resample{resample}.csv. Each is converted
+    using convert_results_file.
+
+    Parameters
+    ----------
+    path : str
+        The directory to search for results files.
+    file_format : {"csv", "npz"}, default="npz"
+        The format to convert the results files to.
+    remove_original : bool, default=False
+        If True, the original results files are deleted after conversion.
+    overwrite : bool, default=False
+        If True, results files which already exist in the new format are converted
+        again. If False, they are skipped.
+
+    Returns
+    -------
+    converted_paths : list of str
+        The paths of the converted results files.
+    """
+    if file_format not in _RESULTS_FILE_FORMATS:
+        raise ValueError(
+            f"Unknown file_format {file_format}, should be one of "
+            f"{_RESULTS_FILE_FORMATS}."
+        )
+
+    other_format = "csv" if file_format == "npz" else "npz"
+    pattern = re.compile(
+        rf"^(train|test)?(Resample\d+|Results|results)\.{other_format}$"
+    )
+
+    converted_paths = []
+    for root, _, files in os.walk(path):
+        for file in sorted(files):
+            if pattern.match(file) is None:
+                continue
+
+            file_path = os.path.join(root, file)
+            converted_path = f"{os.path.splitext(file_path)[0]}.{file_format}"
+            if not overwrite and os.path.exists(converted_path):
+                continue
+
+            converted_paths.append(
+                convert_results_file(
+                    file_path, file_format=file_format, remove_original=remove_original
+                )
+            )
+
+    return converted_paths
@@ -18,7 +18,9 @@ from tsml_eval.evaluation.storage import (
     load_clusterer_results,
     load_forecaster_results,
     load_regressor_results,
+    load_results_summary,
 )
+from tsml_eval.evaluation.storage.estimator_results import _read_results_header
 from tsml_eval.utils.results_validation import (
     _check_classification_third_line,
     _check_clustering_third_line,
@@ -27,7 +29,9 @@ from tsml_eval.utils.results_validation import (
 )
 
 
-def load_estimator_results(file_path, calculate_stats=True, verify_values=True):
+def load_estimator_results(
+    file_path, calculate_stats=True, verify_values=True, header_only=False
+):
     """
     Load and return estimator results from a specified file.
 
@@ -39,19 +43,27 @@ def load_estimator_results(file_path, calculate_stats=True, verify_values=True):
     ----------
     file_path : str
         The path to the file from which estimator results should be loaded. The file
-        should be a tsml formatted estimator results file.
+        should be a tsml formatted estimator results file, either CSV or NPZ.
     calculate_stats : bool, default=True
         Whether to calculate performance statistics from the loaded results.
     verify_values : bool, default=True
         If the function should perform verification of the loaded values.
+    header_only : bool, default=False
+        If True, only the first three lines of the file are read and a
+        ResultsSummary is returned. The summary contains the timings, memory usage
+        and performance statistic written to the file header, but no predictions.
+        calculate_stats and verify_values are ignored.
 
     Returns
     -------
-    er : EstimatorResults
-        A EstimatorResults object containing the results loaded from the file.
+    er : EstimatorResults or ResultsSummary
+        A EstimatorResults object containing the results loaded from the file, or
+        a ResultsSummary of the file header if header_only is True.
     """
-    with open(file_path) as f:
-        lines = [next(f) for _ in range(3)]
+    if header_only:
+        return load_results_summary(file_path)
+
+    lines = _read_results_header(file_path)
 
     if _check_classification_third_line(lines[2]):
         return load_classifier_results(
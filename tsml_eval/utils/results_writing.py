@@ -14,6 +14,13 @@ import os
 
 import numpy as np
 
+from tsml_eval.utils.watchdog import timeout_marker_path
+
+# the number of cases formatted at once when writing results lines
+_WRITE_CHUNK_SIZE = 10000
+
+_RESULTS_FILE_FORMATS = ["csv", "npz"]
+
 
 def write_classification_results(
     predictions,
@@ -38,6 +45,8 @@ def write_classification_results(
     train_estimate_method="",
     train_estimate_time=-1,
     fit_and_estimate_time=-1,
+    compile_time=-1,
+    file_format="csv",
 ):
     """Write the predictions for a classification experiment in the format used by tsml.
 
@@ -105,6 +114,15 @@ def write_classification_results(
         i.e. if an estimate requires the model to be fit, fit_time would be
         included in the train_estimate_time value. In this case fit_time +
         train_estimate_time would time fitting the model twice.
+    compile_time : int, default=-1
+        The time taken to compile just-in-time code (i.e. numba functions) in a
+        warm-up run before the classifier was fit, which is not included in fit_time.
+        Only written if not -1, so files from experiments without a warm-up keep the
+        standard tsml format.
+    file_format : {"csv", "npz"}, default="csv"
+        The format of the results file. "csv" writes the standard tsml text format,
+        "npz" writes the same header lines and values to a binary NumPy archive. See
+        write_results_to_tsml_format.
     """
     if len(predictions) != probabilities.shape[0] != len(class_labels):
         raise IndexError(
@@ -129,6 +147,8 @@ def write_classification_results(
         f"{train_estimate_time},"
         f"{fit_and_estimate_time}"
     )
+    if compile_time != -1:
+        third_line += f",{compile_time}"
 
     write_results_to_tsml_format(
         predictions,
@@ -145,6 +165,7 @@ def write_classification_results(
         first_line_comment=first_line_comment,
         second_line=parameter_info,
         third_line=third_line,
+        file_format=file_format,
     )
 
 
@@ -169,6 +190,8 @@ def write_regression_results(
     train_estimate_method="",
     train_estimate_time=-1,
     fit_and_estimate_time=-1,
+    compile_time=-1,
+    file_format="csv",
 ):
     """Write the predictions for a regression experiment in the format used by tsml.
 
@@ -231,6 +254,15 @@ def write_regression_results(
         i.e. if an estimate requires the model to be fit, fit_time would be
         included in the train_estimate_time value. In this case fit_time +
         train_estimate_time would time fitting the model twice.
+    compile_time : int, default=-1
+        The time taken to compile just-in-time code (i.e. numba functions) in a
+        warm-up run before the regressor was fit, which is not included in fit_time.
+        Only written if not -1, so files from experiments without a warm-up keep the
+        standard tsml format.
+    file_format : {"csv", "npz"}, default="csv"
+        The format of the results file. "csv" writes the standard tsml text format,
+        "npz" writes the same header lines and values to a binary NumPy archive. See
+        write_results_to_tsml_format.
     """
     third_line = (
         f"{mse},"
@@ -242,6 +274,8 @@ def write_regression_results(
         f"{train_estimate_time},"
         f"{fit_and_estimate_time}"
     )
+    if compile_time != -1:
+        third_line += f",{compile_time}"
 
     write_results_to_tsml_format(
         predictions,
@@ -257,6 +291,7 @@ def write_regression_results(
         first_line_comment=first_line_comment,
         second_line=parameter_info,
         third_line=third_line,
+        file_format=file_format,
     )
 
 
@@ -281,6 +316,8 @@ def write_clustering_results(
     memory_usage=-1,
     n_classes=-1,
     n_clusters=-1,
+    compile_time=-1,
+    file_format="csv",
 ):
     """Write the predictions for a clustering experiment in the format used by tsml.
 
@@ -339,6 +376,15 @@ def write_clustering_results(
         The number of classes in the dataset.
     n_clusters : int, default=-1
         The number of clusters founds by the clusterer.
+    compile_time : int, default=-1
+        The time taken to compile just-in-time code (i.e. numba functions) in a
+        warm-up run before the clusterer was fit, which is not included in fit_time.
+        Only written if not -1, so files from experiments without a warm-up keep the
+        standard tsml format.
+    file_format : {"csv", "npz"}, default="csv"
+        The format of the results file. "csv" writes the standard tsml text format,
+        "npz" writes the same header lines and values to a binary NumPy archive. See
+        write_results_to_tsml_format.
     """
     if len(cluster_predictions) != cluster_probabilities.shape[0] != len(class_labels):
         raise IndexError(
@@ -361,6 +407,8 @@ def write_clustering_results(
         f"{n_classes},"
         f"{n_clusters}"
     )
+    if compile_time != -1:
+        third_line += f",{compile_time}"
 
     write_results_to_tsml_format(
         cluster_predictions,
@@ -377,6 +425,7 @@ def write_clustering_results(
         first_line_comment=first_line_comment,
         second_line=parameter_info,
         third_line=third_line,
+        file_format=file_format,
     )
 
 
@@ -399,6 +448,9 @@ def write_forecasting_results(
     predict_time=-1,
     benchmark_time=-1,
     memory_usage=-1,
+    pred_times=None,
+    pred_descriptions=None,
+    file_format="csv",
 ):
     """Write the predictions for a forecasting experiment in the format used by tsml.
 
@@ -450,6 +502,14 @@ def write_forecasting_results(
         A benchmark time for the hardware used to scale other timings.
     memory_usage : int, default=-1
         The memory usage of the forecaster.
+    pred_times : array-like or None, default=None
+        The time taken to make each prediction, written after each predicted value.
+    pred_descriptions : list of str or None, default=None
+        A description of each prediction, written at the end of each line.
+    file_format : {"csv", "npz"}, default="csv"
+        The format of the results file. "csv" writes the standard tsml text format,
+        "npz" writes the same header lines and values to a binary NumPy archive. See
+        write_results_to_tsml_format.
     """
     third_line = (
         f"{mape},"
@@ -474,6 +534,9 @@ def write_forecasting_results(
         first_line_comment=first_line_comment,
         second_line=parameter_info,
         third_line=third_line,
+        pred_times=pred_times,
+        pred_descriptions=pred_descriptions,
+        file_format=file_format,
     )
 
 
@@ -492,6 +555,9 @@ def write_results_to_tsml_format(
     first_line_comment=None,
     second_line="No Parameter Info",
     third_line="N/A",
+    pred_times=None,
+    pred_descriptions=None,
+    file_format="csv",
 ):
     """Write the predictions for an experiment in the standard format used by tsml.
 
@@ -538,12 +604,32 @@ def write_results_to_tsml_format(
         values from the model build.
     third_line : str, default = "N/A"
         Summary performance information, what values are written depends on the task.
+    pred_times : array-like or None, default=None
+        The time taken to make each prediction. If passed, these are written after the
+        predicted values and probabilities for each case.
+    pred_descriptions : list of str or None, default=None
+        A description of each prediction. If passed, these are written at the end of
+        the line for each case. Requires pred_times.
+    file_format : {"csv", "npz"}, default="csv"
+        The format of the results file. "csv" writes the standard tsml text format to
+        a ".csv" file. "npz" writes the three header lines and the values of each
+        column as typed arrays to an uncompressed NumPy ".npz" archive, which is
+        smaller and faster to load. Results files in either format can be loaded by
+        the tsml_eval.evaluation.storage loaders and converted between formats using
+        tsml_eval.utils.results_conversion.
     """
     if len(predictions) != len(labels):
         raise IndexError(
             "The number of predicted values is not the same as the number of actual "
             "labels."
         )
+    if pred_descriptions is not None and pred_times is None:
+        raise ValueError("pred_times must be passed to write pred_descriptions.")
+    if file_format not in _RESULTS_FILE_FORMATS:
+        raise ValueError(
+            f"Unknown file_format {file_format}, should be one of "
+            f"{_RESULTS_FILE_FORMATS}."
+        )
 
     # If the full directory path is not passed, make the standard structure
     if not full_path:
@@ -571,26 +657,65 @@ def write_results_to_tsml_format(
     if first_line_estimator_name is None:
         first_line_estimator_name = estimator_name
 
-    with open(f"{file_path}/{fname}.csv", "w") as file:
-        # the first line of the output file is in the form of:
-        first_line = (
-            f"{dataset_name},"
-            f"{first_line_estimator_name},"
-            f"{'No split' if split == '' else split.upper()},"
-            f"{'None' if resample_id is None else resample_id},"
-            f"{time_unit.upper()},"
-            f"{'' if first_line_comment is None else first_line_comment}"
-        )
-        file.write(first_line + "\n")
+    # results replace any timeout marker left by a previous attempt
+    marker_path = timeout_marker_path(f"{file_path}/{fname}.csv")
+    if os.path.exists(marker_path):
+        os.remove(marker_path)
+
+    # the first line of the output file is in the form of:
+    first_line = (
+        f"{dataset_name},"
+        f"{first_line_estimator_name},"
+        f"{'No split' if split == '' else split.upper()},"
+        f"{'None' if resample_id is None else resample_id},"
+        f"{time_unit.upper()},"
+        f"{'' if first_line_comment is None else first_line_comment}"
+    )
+
+    # the second line of the output is free form and estimator-specific; usually
+    # this will record info such as paramater options used, any constituent model
+    # names for ensembles, etc.
+    #
+    # the third line of the file depends on the task i.e. classification or
+    # regression
+    _write_results_file(
+        f"{file_path}/{fname}.{file_format}",
+        [first_line, str(second_line), str(third_line)],
+        labels,
+        predictions,
+        probabilities=predicted_probabilities,
+        pred_times=pred_times,
+        pred_descriptions=pred_descriptions,
+    )
 
-        # the second line of the output is free form and estimator-specific; usually
-        # this will record info such as paramater options used, any constituent model
-        # names for ensembles, etc.
-        file.write(str(second_line) + "\n")
 
-        # the third line of the file depends on the task i.e. classification or
-        # regression
-        file.write(str(third_line) + "\n")
+def _write_results_file(
+    file_path,
+    header,
+    labels,
+    predictions,
+    probabilities=None,
+    pred_times=None,
+    pred_descriptions=None,
+):
+    """Write the header lines and values of a results file in the format of its path.
+
+    Files ending in ".npz" are written as a NumPy archive, any other as tsml CSV.
+    """
+    if file_path.endswith(".npz"):
+        _write_results_npz(
+            file_path,
+            header,
+            labels,
+            predictions,
+            probabilities,
+            pred_times,
+            pred_descriptions,
+        )
+        return
+
+    with open(file_path, "w") as file:
+        file.write("".join([line + "\n" for line in header]))
 
         # from line 4 onwards each line should include the actual and predicted class
         # labels (comma-separated). If present, for each case, the probabilities of
@@ -605,14 +730,81 @@ def write_results_to_tsml_format(
         # if predict_proba data IS NOT provided for case i:
         #   labels[i], preds[i]
         #
+        # If present, the prediction time and a description of the prediction follow,
+        # each after an empty value:
+        #   labels[i], preds[i],,pred_time[i],,description[i]
+        #
         # If labels[i] is NaN (if clustering), labels[i] is replaced with ? to indicate
         # missing
-        for i in range(0, len(predictions)):
-            label = "?" if np.isnan(labels[i]) else labels[i]
-            file.write(f"{label},{predictions[i]}")
-
-            if predicted_probabilities is not None:
-                file.write(",")
-                for j in predicted_probabilities[i]:
-                    file.write(f",{j}")
-            file.write("\n")
+        #
+        # Lines are formatted in chunks of cases with NumPy rather than value by value
+        for i in range(0, len(predictions), _WRITE_CHUNK_SIZE):
+            cases = slice(i, i + _WRITE_CHUNK_SIZE)
+            file.write(
+                _format_results_lines(
+                    labels[cases],
+                    predictions[cases],
+                    None if probabilities is None else probabilities[cases],
+                    None if pred_times is None else pred_times[cases],
+                    None if pred_descriptions is None else pred_descriptions[cases],
+                )
+            )
+
+
+def _format_results_lines(
+    labels, predictions, probabilities, pred_times, pred_descriptions
+):
+    """Format the lines of a results file for a chunk of cases as one string."""
+    label_values = _format_values(labels)
+    for i in np.flatnonzero(np.isnan(np.asarray(labels, dtype=float))):
+        label_values[i] = "?"
+
+    # each optional column is preceded by an empty value
+    columns = [label_values, _format_values(predictions)]
+    if probabilities is not None:
+        if isinstance(probabilities, np.ndarray):
+            probabilities = probabilities.tolist()
+        columns.append([",".join(["", *_format_values(p)]) for p in probabilities])
+    if pred_times is not None:
+        columns.append(["," + v for v in _format_values(pred_times)])
+        if pred_descriptions is not None:
+            columns.append(["," + v for v in _format_values(pred_descriptions)])
+
+    return "".join([",".join(line) + "\n" for line in zip(*columns)])
+
+
+def _format_values(values):
+    """Format values as strings, the same as formatting each in an f-string.
+
+    NumPy arrays are converted to lists of Python scalars first, which format to the
+    same strings but faster than NumPy scalars.
+    """
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    return list(map(format, values))
+
+
+def _write_results_npz(
+    file_path, header, labels, predictions, probabilities, pred_times, pred_descriptions
+):
+    """Write the header lines and values of a results file to a NumPy archive.
+
+    The header lines are stored as in the CSV format in "header", and each column of
+    values as a typed array. Optional columns are only stored if present. Arrays are
+    not compressed so each can be read without decompressing the file.
+    """
+    arrays = {
+        "header": np.array(header, dtype=str),
+        "labels": np.asarray(labels),
+        "predictions": np.asarray(predictions),
+    }
+    if probabilities is not None:
+        arrays["probabilities"] = np.asarray(probabilities, dtype=float)
+    if pred_times is not None:
+        arrays["pred_times"] = np.asarray(pred_times)
+        if pred_descriptions is not None:
+            arrays["pred_descriptions"] = np.array(pred_descriptions, dtype=str)
+
+    # np.savez appends .npz to paths without the extension
+    with open(file_path, "wb") as file:
+        np.savez(file, **arrays)
@@ -0,0 +1,209 @@
+"""Per-phase timing and memory telemetry for experiments."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "ExperimentTelemetry",
+    "telemetry_file_path",
+    "set_phase_listener",
+]
+
+import copy
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import psutil
+
+# called with ("start" or "end", name, detail) at the start and end of every phase,
+# see set_phase_listener. The lock is held while the listener is set or called, so
+# events from phases run in different threads are not interleaved
+_phase_listener = None
+_phase_listener_lock = threading.Lock()
+
+
+class ExperimentTelemetry:
+    """Record the wall time, CPU time and memory usage of the phases of an experiment.
+
+    Each phase records its wall time and CPU time in milliseconds, the resident set
+    size (RSS) of the process at its end and the peak RSS of the process at its end
+    in bytes, and the increase in peak RSS during the phase. The peak RSS is the
+    largest reached by the process so far, so only phases which set a new peak have
+    a non-zero increase.
+
+    CPU time and memory are measured for the whole process, so include other threads
+    running at the same time. Work done in child processes, i.e. cross-validation
+    folds run in parallel, counts towards wall time but not CPU time or memory.
+
+    Examples
+    --------
+    >>> from tsml_eval.utils.telemetry import ExperimentTelemetry
+    >>> telemetry = ExperimentTelemetry()
+    >>> with telemetry.phase("fit"):
+    ...     x = sum(range(1000))
+    >>> telemetry.phases[0]["phase"]
+    'fit'
+    """
+
+    def __init__(self):
+        self.phases = []
+
+        self._process = psutil.Process()
+
+    @contextmanager
+    def phase(self, name, detail=None):
+        """Record a phase of the experiment run inside the context.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase, i.e. "fit" or "predict".
+        detail : str or None, default=None
+            Additional information to separate phases with the same name, i.e. the
+            name of the data transform for "data_transform" phases.
+        """
+        start_peak = _peak_rss(self._process)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        _notify_phase_listener("start", name, detail)
+        try:
+            yield
+        finally:
+            _notify_phase_listener("end", name, detail)
+            end_peak = _peak_rss(self._process)
+            self.phases.append(
+                {
+                    "phase": name,
+                    "detail": detail,
+                    "wall_time": (time.perf_counter() - start_wall) * 1000,
+                    "cpu_time": (time.process_time() - start_cpu) * 1000,
+                    "rss": self._process.memory_info().rss,
+                    "peak_rss": end_peak,
+                    "peak_rss_increase": max(0, end_peak - start_peak),
+                }
+            )
+
+    def copy(self):
+        """Return a copy with the phases recorded so far.
+
+        Used to share phases such as data loading between experiments which use the
+        same data.
+
+        Returns
+        -------
+        telemetry : ExperimentTelemetry
+            A new ExperimentTelemetry object containing a copy of the phases.
+        """
+        telemetry = ExperimentTelemetry()
+        telemetry.phases = copy.deepcopy(self.phases)
+        return telemetry
+
+    def to_dict(self, **info):
+        """Return the recorded phases and their totals as a dictionary.
+
+        Parameters
+        ----------
+        **info
+            Additional items to include in the dictionary, i.e. the dataset name.
+
+        Returns
+        -------
+        telemetry : dict
+            Dictionary with the items of info and "phases", "total_wall_time",
+            "total_cpu_time" and "peak_rss" keys.
+        """
+        return {
+            **info,
+            "total_wall_time": sum(p["wall_time"] for p in self.phases),
+            "total_cpu_time": sum(p["cpu_time"] for p in self.phases),
+            "peak_rss": max((p["peak_rss"] for p in self.phases), default=0),
+            "phases": self.phases,
+        }
+
+    def write(self, file_path, **info):
+        """Write the recorded phases to a JSON file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file to write. Any required directories will be created.
+        **info
+            Additional items to write, see to_dict.
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            json.dump(self.to_dict(**info), f, indent=2)
+
+
+def telemetry_file_path(results_path, estimator_name, dataset_name, resample_id):
+    """Return the path of the telemetry file for an experiment.
+
+    The file is written alongside the predictions files, i.e.
+    <results_path>/<estimator_name>/Predictions/<dataset_name>/
+    telemetryResample<resample_id>.json.
+
+    Parameters
+    ----------
+    results_path : str
+        Location of the results.
+    estimator_name : str
+        Name of the estimator.
+    dataset_name : str
+        Name of the dataset.
+    resample_id : int or None
+        The resample ID of the experiment.
+
+    Returns
+    -------
+    file_path : str
+        The path of the telemetry file.
+    """
+    d = (
+        ""
+        if dataset_name is None or dataset_name == "" or dataset_name == "N/A"
+        else f"{dataset_name}/"
+    )
+    fname = (
+        "telemetryResults" if resample_id is None else f"telemetryResample{resample_id}"
+    )
+    return f"{results_path}/{estimator_name}/Predictions/{d}{fname}.json"
+
+
+def set_phase_listener(listener):
+    """Set a function to call at the start and end of every telemetry phase.
+
+    Used to follow the progress of an experiment from outside, i.e. by the watchdog
+    in tsml_eval.utils.watchdog which enforces time budgets for phases. Only one
+    listener can be set per process. The listener is called by one thread at a time,
+    and must not set the listener itself.
+
+    Parameters
+    ----------
+    listener : callable or None
+        Called with the event ("start" or "end"), the name and the detail of the
+        phase. If None, removes the current listener.
+    """
+    global _phase_listener
+    with _phase_listener_lock:
+        _phase_listener = listener
+
+
+def _notify_phase_listener(event, name, detail):
+    """Call the phase listener with an event if one is set."""
+    with _phase_listener_lock:
+        if _phase_listener is not None:
+            _phase_listener(event, name, detail)
+
+
+def _peak_rss(process):
+    """Return the peak RSS of the process in bytes."""
+    if sys.platform == "win32":  # pragma: no cover
+        return process.memory_info().peak_wset
+
+    import resource
+
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
@@ -58,6 +58,8 @@ def test_kw_args():
         "--n_jobs",
         "4",
         "-tr",
+        "-pb",
+        "1.5",
         "--kwargs",
         "key1",
         "value1",
@@ -77,6 +79,7 @@ def test_kw_args():
     assert args.random_seed == 10
     assert args.n_jobs == 4
     assert args.train_fold is True
+    assert args.phase_budget == 90
     assert args.kwargs["key1"] == "value1"
     assert args.kwargs["key2"] == "value2"
 
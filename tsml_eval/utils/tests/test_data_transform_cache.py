@@ -0,0 +1,114 @@
+"""Tests for the data transform cache."""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+from aeon.transformations.collection import Normalizer, Padder
+from tsml.dummy import DummyClassifier
+
+from tsml_eval.experiments import run_classification_experiment
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.data_transform_cache import DataTransformCache
+from tsml_eval.utils.datasets import load_experiment_data
+
+
+@pytest.mark.parametrize("dataset", ["MinimalChinatown", "UnequalMinimalChinatown"])
+def test_data_transform_cache(dataset):
+    """Test storing and loading transformed data."""
+    cache_path = f"{_TEST_OUTPUT_PATH}/transform_cache/{dataset}/"
+    shutil.rmtree(cache_path, ignore_errors=True)
+    cache = DataTransformCache(cache_path)
+
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, dataset, 0, False
+    )
+    key = cache.key(Normalizer(), X_train, y_train, X_test, y_test, dataset, 0)
+    assert cache.get(key) is None
+
+    # the key depends on the transform parameters, data and resample
+    assert key != cache.key(Padder(), X_train, y_train, X_test, y_test, dataset, 0)
+    assert key != cache.key(Normalizer(), X_train, y_train, None, None, dataset, 0)
+    assert key != cache.key(Normalizer(), X_train, y_train, X_test, y_test, dataset, 1)
+    assert key == cache.key(
+        [Normalizer()], X_train, y_train, X_test, y_test, dataset, 0
+    )
+
+    X_train_t = Normalizer().fit_transform(X_train)
+    X_test_t = Normalizer().fit_transform(X_test)
+    cache.put(key, X_train_t, y_train, X_test_t, y_test)
+
+    cached = cache.get(key)
+    expected = (X_train_t, y_train, X_test_t, y_test)
+    for i in (0, 2):
+        assert len(cached[i]) == len(expected[i])
+        for a, b in zip(cached[i], expected[i]):
+            np.testing.assert_array_almost_equal(a, b)
+    for i in (1, 3):
+        np.testing.assert_array_equal(cached[i], expected[i])
+
+    key = cache.key(Normalizer(), X_train, y_train, None, None, dataset, 0)
+    cache.put(key, X_train_t, y_train)
+    cached = cache.get(key)
+    assert cached[2] is None and cached[3] is None
+
+
+def test_data_transform_cache_eviction():
+    """Test the least recently used entries are evicted."""
+    cache_path = f"{_TEST_OUTPUT_PATH}/transform_cache/eviction/"
+    shutil.rmtree(cache_path, ignore_errors=True)
+    # fits two of the entries below, but not three
+    cache = DataTransformCache(cache_path, max_size=20000)
+
+    X = np.zeros((10, 1, 100))
+    y = np.zeros(10)
+    for key in ["a", "b"]:
+        cache.put(key, X, y)
+    os.utime(f"{cache_path}/a", (0, 0))
+    os.utime(f"{cache_path}/b", (1, 1))
+
+    # using "a" makes "b" the least recently used
+    assert cache.get("a") is not None
+    cache.put("c", X, y)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_experiment_transform_cache():
+    """Test experiments load transformed data from the cache."""
+    cache_path = f"{_TEST_OUTPUT_PATH}/transform_cache/experiment/"
+    shutil.rmtree(cache_path, ignore_errors=True)
+    cache = DataTransformCache(cache_path)
+
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, "MinimalChinatown", 0, False
+    )
+
+    results = []
+    for i in range(2):
+        results_path = f"{_TEST_OUTPUT_PATH}/transform_cache/results{i}/"
+        run_classification_experiment(
+            X_train,
+            y_train,
+            X_test,
+            y_test,
+            DummyClassifier(),
+            results_path,
+            dataset_name="MinimalChinatown",
+            resample_id=0,
+            data_transforms=[Normalizer()],
+            benchmark_time=False,
+            transform_cache=cache,
+        )
+        assert len(os.listdir(cache_path)) == 1
+
+        with open(
+            f"{results_path}/DummyClassifier/Predictions/MinimalChinatown/"
+            "testResample0.csv"
+        ) as f:
+            results.append(f.readlines()[3:])
+
+    assert results[0] == results[1]
@@ -1,13 +1,24 @@
 """Test dataset utilities."""
 
+import json
 import os
+import pickle
+import shutil
 
+import numpy as np
 import pytest
 from aeon.datasets import load_from_ts_file
 
 from tsml_eval.datasets._test_data._data_sizes import DATA_TEST_SIZES, DATA_TRAIN_SIZES
 from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
-from tsml_eval.utils.datasets import copy_dataset_ts_files, save_merged_dataset_splits
+from tsml_eval.utils.datasets import (
+    ExperimentDataset,
+    copy_dataset_ts_files,
+    load_cached_ts_file,
+    load_experiment_data,
+    save_merged_dataset_splits,
+)
+from tsml_eval.utils.resampling import resample_data, stratified_resample_data
 
 
 def test_copy_dataset_ts_files():
@@ -82,3 +93,137 @@ def test_save_merged_dataset_splits(save_path):
     os.remove(f"{copy_path}/MinimalChinatown/MinimalChinatown_TRAIN.ts")
     os.remove(f"{copy_path}/MinimalChinatown/MinimalChinatown_TEST.ts")
     os.remove(f"{save_path}/MinimalChinatown/MinimalChinatown.ts")
+
+
+@pytest.mark.parametrize(
+    "dataset,stratify",
+    [
+        ("MinimalChinatown", True),
+        ("UnequalMinimalChinatown", True),
+        ("MinimalChinatown", False),
+        ("MinimalGasPrices", False),
+    ],
+)
+def test_experiment_dataset(dataset, stratify):
+    """Test ExperimentDataset resamples match the resampling functions."""
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        _TEST_DATA_PATH, dataset, 0, False
+    )
+
+    with ExperimentDataset(_TEST_DATA_PATH, dataset, stratify=stratify) as data:
+        for resample_id in range(3):
+            if resample_id == 0:
+                expected = (X_train, y_train, X_test, y_test)
+            elif stratify:
+                expected = stratified_resample_data(
+                    X_train, y_train, X_test, y_test, random_state=resample_id
+                )
+            else:
+                expected = resample_data(
+                    X_train, y_train, X_test, y_test, random_state=resample_id
+                )
+
+            resample = data.get_resample(resample_id)
+            for i in (0, 2):
+                assert len(resample[i]) == len(expected[i])
+                for a, b in zip(resample[i], expected[i]):
+                    np.testing.assert_array_equal(a, b)
+            for i in (1, 3):
+                np.testing.assert_array_equal(resample[i], expected[i])
+
+
+def test_experiment_dataset_shared_memory():
+    """Test ExperimentDataset shared memory storage and pickling."""
+    data = ExperimentDataset(
+        _TEST_DATA_PATH, "MinimalChinatown", use_shared_memory=True
+    )
+    expected = data.get_resample(1)
+
+    # the pickled object attaches to the same block rather than copying the data
+    attached = pickle.loads(pickle.dumps(data))
+    assert attached._shared._shm.name == data._shared._shm.name
+    for a, b in zip(attached.get_resample(1), expected):
+        np.testing.assert_array_equal(a, b)
+
+    attached.close()
+    data.close()
+    assert data.X is None and data._shared is None
+
+
+def test_experiment_dataset_cache_memory_map():
+    """Test ExperimentDataset keeps the cached data as read-only memory maps."""
+    path = f"{_TEST_OUTPUT_PATH}/cache_experiment_dataset/"
+    copy_dataset_ts_files(["MinimalChinatown"], _TEST_DATA_PATH, path)
+    expected = ExperimentDataset(_TEST_DATA_PATH, "MinimalChinatown")
+
+    for _ in range(2):  # creating then reading the cache
+        data = ExperimentDataset(path, "MinimalChinatown", use_cache=True)
+        X_train, _, X_test, _ = data.get_resample(0)
+        assert isinstance(X_train, np.memmap) and isinstance(X_test, np.memmap)
+        assert not X_train.flags.writeable
+
+        # resamples copy their cases into writable arrays
+        for a, b in zip(data.get_resample(1), expected.get_resample(1)):
+            np.testing.assert_array_equal(a, b)
+        assert data.get_resample(1)[0].flags.writeable
+        np.testing.assert_array_equal(data.X, expected.X)
+
+
+def test_experiment_dataset_predefined_resample():
+    """Test ExperimentDataset with predefined resample files."""
+    data = ExperimentDataset(
+        f"{_TEST_DATA_PATH}/_test_data/",
+        "PredefinedChinatown",
+        predefined_resample=True,
+    )
+    assert data.X is None
+
+    X_train, y_train, X_test, y_test = data.get_resample(5)
+    X_train2, y_train2, X_test2, y_test2, _ = load_experiment_data(
+        f"{_TEST_DATA_PATH}/_test_data/", "PredefinedChinatown", 5, True
+    )
+    np.testing.assert_array_equal(X_train, X_train2)
+    np.testing.assert_array_equal(y_test, y_test2)
+
+
+@pytest.mark.parametrize("dataset", ["MinimalChinatown", "UnequalMinimalChinatown"])
+def test_load_cached_ts_file(dataset):
+    """Test loading .ts files through the binary cache."""
+    copy_path = f"{_TEST_OUTPUT_PATH}/datasets/cached/"
+    copy_dataset_ts_files([dataset], _TEST_DATA_PATH, copy_path)
+    file_path = f"{copy_path}/{dataset}/{dataset}_TRAIN.ts"
+    shutil.rmtree(f"{file_path}.cache", ignore_errors=True)
+
+    X, y = load_from_ts_file(file_path)
+    for _ in range(2):
+        X_cached, y_cached = load_cached_ts_file(file_path)
+        assert os.path.exists(f"{file_path}.cache/metadata.json")
+
+        np.testing.assert_array_equal(y_cached, y)
+        assert len(X_cached) == len(X)
+        for a, b in zip(X_cached, X):
+            np.testing.assert_array_equal(a, b)
+            assert not a.flags.writeable
+
+    # touching the file without changing it keeps the cache
+    os.utime(file_path, ns=(0, 0))
+    load_cached_ts_file(file_path)
+    with open(f"{file_path}.cache/metadata.json") as f:
+        assert json.load(f)["mtime_ns"] == 0
+
+    # changing the file rebuilds the cache
+    X_train, y_train, X_test, y_test, _ = load_experiment_data(
+        copy_path, dataset, 0, False
+    )
+    shutil.copy(f"{copy_path}/{dataset}/{dataset}_TEST.ts", file_path)
+    X_cached, y_cached = load_cached_ts_file(file_path)
+    np.testing.assert_array_equal(y_cached, y_test)
+    assert len(X_cached) == len(X_test)
+
+    X_train2, y_train2, X_test2, y_test2, _ = load_experiment_data(
+        copy_path, dataset, 0, False, use_cache=True
+    )
+    np.testing.assert_array_equal(y_train2, y_test)
+    np.testing.assert_array_equal(y_test2, y_test)
+
+    shutil.rmtree(f"{copy_path}/{dataset}")
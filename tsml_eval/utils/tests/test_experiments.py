@@ -1,6 +1,8 @@
 """Test experiment utilities."""
 
+import json
 import os
+import time
 
 import pytest
 from aeon.classification.shapelet_based import ShapeletTransformClassifier
@@ -10,6 +12,7 @@ from tsml.datasets import load_minimal_chinatown
 from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
 from tsml_eval.utils.experiments import (
     _results_present,
+    cached_timing_benchmark,
     estimator_attributes_to_file,
     timing_benchmark,
 )
@@ -41,6 +44,35 @@ def test_timing_benchmark_invalid_input():
         timing_benchmark(random_state="invalid")
 
 
+def test_cached_timing_benchmark():
+    """Test the timing benchmark is cached and refreshed."""
+    cache_path = f"{_TEST_OUTPUT_PATH}/benchmark/test_cached_benchmark.json"
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    benchmark, from_cache = cached_timing_benchmark(cache_path=cache_path)
+    assert isinstance(benchmark, int) and not from_cache
+    assert cached_timing_benchmark(cache_path=cache_path) == (benchmark, True)
+
+    assert not cached_timing_benchmark(cache_path=cache_path, refresh=True)[1]
+    assert not cached_timing_benchmark(cache_path=cache_path, expiry_hours=0)[1]
+
+    with open(cache_path) as f:
+        timestamp = list(json.load(f).values())[0]["timestamp"]
+
+    # expired values are returned while the cache is updated in the background
+    assert cached_timing_benchmark(
+        cache_path=cache_path, expiry_hours=0, background_refresh=True
+    )[1]
+    for _ in range(100):
+        with open(cache_path) as f:
+            if list(json.load(f).values())[0]["timestamp"] > timestamp:
+                break
+        time.sleep(0.1)
+    else:
+        raise AssertionError("Benchmark cache was not refreshed in the background.")
+
+
 def test_estimator_attributes_to_file():
     """Test writing estimator attributes to file."""
     estimator = ShapeletTransformClassifier(
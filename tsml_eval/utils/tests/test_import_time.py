@@ -0,0 +1,54 @@
+"""Tests for the import time recorder."""
+
+import builtins
+import sys
+
+import pytest
+
+from tsml_eval.experiments import classification_experiments
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.import_time import ImportTimeRecorder
+
+
+def test_import_time_recorder():
+    """Test recording nested first imports and restoring the import function."""
+    original = builtins.__import__
+    for name in ["json", "json.decoder", "json.scanner", "json.encoder"]:
+        sys.modules.pop(name, None)
+
+    recorder = ImportTimeRecorder()
+    with recorder:
+        import json  # noqa: F401
+
+        with pytest.raises(RuntimeError, match="already recording"):
+            recorder.start()
+
+    assert builtins.__import__ is original
+    assert "json" in recorder.imports
+    assert "json.decoder" in recorder.imports
+    self_time, cumulative = recorder.imports["json"]
+    assert 0 <= self_time <= cumulative
+    assert cumulative >= recorder.imports["json.decoder"][1]
+
+    report = recorder.report(n_modules=1).splitlines()
+    assert report[0].startswith("startup time [ms]:")
+    assert len(report) == 4
+    assert report[3].endswith("| json")
+
+
+def test_import_time_argument(capsys):
+    """Test the import time report is printed by the experiment scripts."""
+    args = [
+        _TEST_DATA_PATH,
+        f"{_TEST_OUTPUT_PATH}/import_time/",
+        "DummyClassifier-tsml",
+        "MinimalChinatown",
+        "0",
+        "-ow",
+        "-it",
+    ]
+    classification_experiments.run_experiment(args)
+
+    out = capsys.readouterr().out
+    assert "startup time [ms]:" in out
+    assert "cumulative [ms]" in out
@@ -0,0 +1,101 @@
+"""Tests for the memory recorder."""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from joblib import Parallel, delayed
+
+from tsml_eval.utils.memory_recorder import MEMORY_RECORDING_METHODS, record_max_memory
+
+
+def _allocate(n_bytes, sleep=0.0):
+    a = np.ones(n_bytes // 8)
+    time.sleep(sleep)
+    return a.sum()
+
+
+@pytest.mark.parametrize("method", MEMORY_RECORDING_METHODS)
+def test_record_max_memory(method):
+    """Test recording the memory usage of a function with each method."""
+    if method == "ru_maxrss" and sys.platform == "win32":
+        pytest.skip("ru_maxrss is not available on Windows.")
+
+    expected = n_bytes = 1024 * 1024 * 256
+    if method == "ru_maxrss":
+        import resource
+
+        import psutil
+
+        # only increases over the previous peak are seen, so allocate past it
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        n_bytes += max(0, peak - psutil.Process().memory_info().rss)
+
+    # hold the allocation for longer than the sampling interval
+    mem, runtime = record_max_memory(
+        _allocate, args=(n_bytes, 0.3), method=method, return_func_time=True
+    )
+
+    assert mem >= expected * 0.9
+    assert runtime >= 0
+
+
+def test_record_max_memory_no_latency():
+    """Test the recorder returns when the function finishes, not after an interval."""
+    start = time.perf_counter()
+    record_max_memory(time.sleep, args=(0.1,), interval=10)
+    assert time.perf_counter() - start < 5
+
+
+def test_record_max_memory_children():
+    """Test the sampling method includes the memory of child processes."""
+    n_bytes = 1024 * 1024 * 256
+
+    def run_in_children():
+        Parallel(n_jobs=2, backend="loky")(
+            delayed(_allocate)(n_bytes, 1) for _ in range(2)
+        )
+
+    # start the workers first so their base memory is not counted
+    Parallel(n_jobs=2, backend="loky")(delayed(_allocate)(8) for _ in range(2))
+
+    mem = record_max_memory(run_in_children, interval=0.05)
+    mem_no_children = record_max_memory(
+        run_in_children, interval=0.05, include_children=False
+    )
+
+    assert mem >= n_bytes * 0.9
+    assert mem_no_children < n_bytes * 0.9
+
+
+def test_record_max_memory_exception():
+    """Test exceptions in the function are raised by the recorder."""
+
+    def f():
+        raise ValueError("test error")
+
+    with pytest.raises(ValueError, match="test error"):
+        record_max_memory(f)
+
+    with pytest.raises(ValueError, match="Unknown memory recording method"):
+        record_max_memory(f, method="invalid")
+
+
+def test_record_max_memory_tracemalloc_threads():
+    """Test tracemalloc recordings in different threads do not stop each other."""
+    n_bytes = 1024 * 1024 * 8
+    with ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(
+                record_max_memory,
+                _allocate,
+                args=(n_bytes, 0.05 * i),
+                method="tracemalloc",
+            )
+            for i in range(4)
+        ]
+        mems = [f.result() for f in futures]
+
+    assert all(mem >= n_bytes * 0.9 for mem in mems)
@@ -0,0 +1,84 @@
+"""Tests for the experiment profiler."""
+
+import os
+import pstats
+import time
+
+from tsml_eval.experiments import classification_experiments
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.profiling import ExperimentProfiler, profile_path
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    x = 0
+    while time.perf_counter() < end:
+        x += 1
+    return x
+
+
+def test_experiment_profiler():
+    """Test profiling phases and writing the profiles."""
+    profiler = ExperimentProfiler()
+    with profiler.phase("fit"):
+        _busy(0.1)
+    with profiler.phase("predict"):
+        _busy(0.05)
+    with profiler.phase("predict"):
+        _busy(0.05)
+
+    path = f"{_TEST_OUTPUT_PATH}/profiler/"
+    profiler.write(path)
+
+    assert sorted(os.listdir(path)) == [
+        "fit.pstats",
+        "predict.pstats",
+        "stacks.collapsed",
+    ]
+    stats = pstats.Stats(f"{path}/predict.pstats")
+    assert any(func[2] == "_busy" for func in stats.stats)
+
+    with open(f"{path}/stacks.collapsed") as f:
+        lines = f.read().splitlines()
+    assert len(lines) > 0
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        frames = stack.split(";")
+        assert frames[0] in ["fit", "predict"]
+        # frames outside the with statement are not included
+        assert not any("test_experiment_profiler" in frame for frame in frames)
+        assert int(count) > 0
+    assert any("_busy" in line for line in lines)
+
+
+def test_disabled_experiment_profiler():
+    """Test a disabled profiler records and writes nothing."""
+    profiler = ExperimentProfiler(enabled=False)
+    with profiler.phase("fit"):
+        _busy(0.01)
+
+    path = f"{_TEST_OUTPUT_PATH}/disabled_profiler/"
+    profiler.write(path)
+    assert len(profiler.stats) == 0 and len(profiler.stacks) == 0
+    assert not os.path.exists(path)
+
+
+def test_profile_experiment_cli():
+    """Test the --profile option writes profiles to the results Workspace."""
+    result_path = f"{_TEST_OUTPUT_PATH}/profile_cli/"
+
+    args = [
+        _TEST_DATA_PATH,
+        result_path,
+        "DummyClassifier",
+        "MinimalChinatown",
+        "0",
+        "--profile",
+        "-ow",
+    ]
+    classification_experiments.run_experiment(args)
+
+    path = profile_path(result_path, "DummyClassifier", "MinimalChinatown", 0)
+    assert os.path.exists(f"{path}/fit.pstats")
+    assert os.path.exists(f"{path}/predict.pstats")
+    assert os.path.exists(f"{path}/stacks.collapsed")
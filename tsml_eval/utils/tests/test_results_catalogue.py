@@ -0,0 +1,211 @@
+"""Tests for the results catalogue."""
+
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from tsml_eval.evaluation import evaluate_classifiers_by_problem
+from tsml_eval.evaluation.storage import load_results_summary
+from tsml_eval.experiments.batch_experiments import (
+    experiment_job_grid,
+    run_batch_experiments,
+)
+from tsml_eval.testing.testing_utils import (
+    _TEST_DATA_PATH,
+    _TEST_OUTPUT_PATH,
+    _TEST_RESULTS_PATH,
+)
+from tsml_eval.utils import results_catalogue
+from tsml_eval.utils.experiments import _check_existing_results, _results_present
+from tsml_eval.utils.results_catalogue import ResultsCatalogue
+from tsml_eval.utils.watchdog import ExperimentTimeoutError, write_timeout_marker
+
+_CLASSIFIERS = ["ROCKET", "TSF"]
+_DATASETS = ["Chinatown", "ItalyPowerDemand", "Trace"]
+
+
+def _copy_results(name):
+    path = f"{_TEST_OUTPUT_PATH}/results_catalogue/{name}/"
+    shutil.rmtree(path, ignore_errors=True)
+    for classifier in _CLASSIFIERS:
+        shutil.copytree(
+            f"{_TEST_RESULTS_PATH}/classification/{classifier}/",
+            f"{path}/{classifier}/",
+        )
+    return path
+
+
+def test_results_catalogue_import():
+    """Test the results catalogue module can be imported on its own."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from tsml_eval.utils.results_catalogue import ResultsCatalogue",
+        ],
+        check=True,
+    )
+
+
+def test_results_catalogue_queries():
+    """Test the catalogue against the results files it indexes."""
+    path = _copy_results("queries")
+    catalogue = ResultsCatalogue(path)
+    assert catalogue.scan() > 0
+    assert catalogue.scan() == 0
+
+    for classifier in _CLASSIFIERS + ["DrCIF"]:
+        for dataset in _DATASETS + ["Unknown"]:
+            for resample_id in [0, 2, 5]:
+                for split in ["TEST", "TRAIN", "BOTH"]:
+                    assert catalogue.results_present(
+                        classifier, dataset, resample_id=resample_id, split=split
+                    ) == _results_present(
+                        path, classifier, dataset, resample_id=resample_id, split=split
+                    )
+
+    summaries = catalogue.summaries(estimators=["ROCKET"], split="test")
+    assert len(summaries) == 10
+    for _, row in summaries.iterrows():
+        rs = load_results_summary(os.path.join(path, row["path"]))
+        assert row["task"] == "classification"
+        assert row["statistic"] == rs.accuracy
+        assert row["fit_time"] == rs.fit_time
+        assert row["memory_usage"] == rs.memory_usage
+
+    counts = catalogue.count_complete(_CLASSIFIERS, _DATASETS, 3)
+    assert counts.to_dict() == {"ROCKET": 3, "TSF": 3}
+    counts = catalogue.count_complete(_CLASSIFIERS, _DATASETS, 4)
+    assert counts.to_dict() == {"ROCKET": 0, "TSF": 0}
+
+    with pytest.raises(FileNotFoundError):
+        catalogue.results_file("ROCKET", "Chinatown", resample_id=5)
+    catalogue.close()
+
+
+def test_results_catalogue_incremental_scan(monkeypatch):
+    """Test the catalogue is updated with the changes to a results directory."""
+    monkeypatch.setattr(results_catalogue, "_RECENT_CHANGE_NS", 0)
+    path = _copy_results("incremental")
+    dataset_path = f"{path}/ROCKET/Predictions/Chinatown"
+    catalogue = ResultsCatalogue(path)
+    catalogue.scan()
+
+    shutil.copy(
+        f"{dataset_path}/testResample0.csv", f"{dataset_path}/testResample3.csv"
+    )
+    os.remove(f"{dataset_path}/trainResample1.csv")
+    write_timeout_marker(
+        f"{dataset_path}/testResample4.csv",
+        {"phase": "fit", "detail": None, "budget": 1, "elapsed": 1.5},
+    )
+    n_trace = len(os.listdir(f"{path}/TSF/Predictions/Trace"))
+    shutil.rmtree(f"{path}/TSF/Predictions/Trace")
+
+    assert catalogue.scan() == 3 + n_trace
+    assert catalogue.results_present("ROCKET", "Chinatown", resample_id=3)
+    assert not catalogue.results_present(
+        "ROCKET", "Chinatown", resample_id=1, split="TRAIN"
+    )
+    assert catalogue.results_present("ROCKET", "Chinatown", resample_id=4)
+    assert not catalogue.results_present("TSF", "Trace", resample_id=0)
+
+    with pytest.raises(ExperimentTimeoutError):
+        load_results_summary(
+            catalogue.results_file("ROCKET", "Chinatown", resample_id=4)
+        )
+    counts = catalogue.count_complete(_CLASSIFIERS, _DATASETS, 4)
+    assert counts.to_dict() == {"ROCKET": 1, "TSF": 0}
+    catalogue.close()
+
+    # the stored catalogue is reused
+    catalogue = ResultsCatalogue(path)
+    assert catalogue.scan() == 0
+    assert catalogue.results_present("ROCKET", "Chinatown", resample_id=3)
+    catalogue.close()
+
+
+def test_evaluate_by_problem_with_catalogue():
+    """Test evaluating results files found using the catalogue."""
+    path = _copy_results("evaluation")
+    evaluate_classifiers_by_problem(
+        path,
+        _CLASSIFIERS,
+        _DATASETS,
+        f"{_TEST_OUTPUT_PATH}/eval/results_catalogue/",
+        resamples=3,
+        load_train_results=True,
+        eval_name="catalogue",
+        use_catalogue=True,
+    )
+    assert os.path.exists(f"{path}/results_catalogue.sqlite")
+
+
+def test_check_existing_results_with_catalogue():
+    """Test existing results are found using the catalogue and on disk."""
+    path = _copy_results("existing")
+    catalogue = ResultsCatalogue(path)
+    catalogue.scan()
+
+    # results written since the scan are still found
+    dataset_path = f"{path}/ROCKET/Predictions/Chinatown"
+    shutil.copy(
+        f"{dataset_path}/testResample0.csv", f"{dataset_path}/testResample3.csv"
+    )
+    for resample_id, expected in [(0, (False, False)), (3, (False, True))]:
+        assert (
+            _check_existing_results(
+                path, "ROCKET", "Chinatown", resample_id, False, True, True, catalogue
+            )
+            == expected
+        )
+
+    # catalogued results are present without checking the files
+    os.remove(f"{dataset_path}/trainResample0.csv")
+    assert _check_existing_results(
+        path, "ROCKET", "Chinatown", 0, False, True, True, catalogue
+    ) == (False, False)
+
+    unpickled = pickle.loads(pickle.dumps(catalogue))
+    assert unpickled.results_present("ROCKET", "Chinatown", resample_id=1)
+    unpickled.close()
+    catalogue.close()
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_run_batch_experiments_with_catalogue(n_jobs):
+    """Test running a batch of experiments using the catalogue."""
+    jobs = experiment_job_grid(["DummyClassifier-tsml"], ["MinimalChinatown"], 2)
+    path = f"{_TEST_OUTPUT_PATH}/results_catalogue/batch{n_jobs}/"
+    shutil.rmtree(path, ignore_errors=True)
+
+    status = run_batch_experiments(
+        _TEST_DATA_PATH,
+        path,
+        jobs,
+        n_jobs=n_jobs,
+        train_fold=True,
+        benchmark_time=False,
+        use_catalogue=True,
+        verbose=False,
+    )
+    assert all(s == "completed" for s in status.values())
+
+    status = run_batch_experiments(
+        _TEST_DATA_PATH, path, jobs, n_jobs=n_jobs, use_catalogue=True, verbose=False
+    )
+    assert all(s == "skipped" for s in status.values())
+
+    catalogue = ResultsCatalogue(path)
+    assert catalogue.scan() == 0
+    assert (
+        catalogue.count_complete(["DummyClassifier-tsml"], ["MinimalChinatown"], 2)[
+            "DummyClassifier-tsml"
+        ]
+        == 1
+    )
+    catalogue.close()
@@ -0,0 +1,38 @@
+"""Tests for the results conversion functions."""
+
+import os
+import shutil
+
+from tsml_eval.evaluation import evaluate_classifiers_by_problem
+from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH, _TEST_RESULTS_PATH
+from tsml_eval.utils.experiments import _results_present
+from tsml_eval.utils.results_conversion import convert_results_directory
+
+
+def test_convert_results_directory():
+    """Test converting a directory of results and evaluating the NPZ files."""
+    path = f"{_TEST_OUTPUT_PATH}/results_conversion/"
+    shutil.rmtree(path, ignore_errors=True)
+    for classifier in ["ROCKET", "TSF", "1NN-DTW"]:
+        shutil.copytree(
+            f"{_TEST_RESULTS_PATH}/classification/{classifier}/",
+            f"{path}/{classifier}/",
+        )
+
+    converted = convert_results_directory(path, remove_original=True)
+    assert len(converted) > 0
+    assert all(p.endswith(".npz") and os.path.exists(p) for p in converted)
+    assert convert_results_directory(path) == []
+    assert _results_present(path, "ROCKET", "Chinatown", resample_id=0)
+
+    evaluate_classifiers_by_problem(
+        path,
+        ["ROCKET", "TSF", "1NN-DTW"],
+        ["Chinatown", "ItalyPowerDemand", "Trace"],
+        f"{_TEST_OUTPUT_PATH}/eval/results_conversion/",
+        resamples=3,
+        load_train_results=True,
+        eval_name="npz",
+    )
+
+    assert len(convert_results_directory(path, file_format="csv")) == len(converted)
@@ -3,6 +3,7 @@
 __maintainer__ = ["MatthewMiddlehurst"]
 
 import os
+import time
 
 import numpy as np
 import pytest
@@ -13,6 +14,8 @@ from tsml_eval.experiments.tests import (
     _FORECASTER_RESULTS_PATH,
     _REGRESSOR_RESULTS_PATH,
 )
+from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+from tsml_eval.utils import results_writing
 from tsml_eval.utils.results_validation import (
     _check_classification_third_line,
     _check_clustering_third_line,
@@ -252,3 +255,131 @@ def test_write_results_to_tsml_format_invalid():
             "test_output",
             split="invalid",
         )
+
+
+# allowed time of the results writers relative to writing each value separately.
+# Loose, as the benchmark only needs to catch the writers becoming much slower
+WRITE_TIME_RATIO = 2.0
+RESULTS_TASKS = ["classification", "regression", "clustering", "forecasting"]
+
+
+def _write_results_lines_by_value(
+    file,
+    labels,
+    predictions,
+    probabilities=None,
+    pred_times=None,
+    pred_descriptions=None,
+):
+    """Write results lines one value at a time, as the writers used to."""
+    for i in range(0, len(predictions)):
+        label = "?" if np.isnan(labels[i]) else labels[i]
+        file.write(f"{label},{predictions[i]}")
+
+        if probabilities is not None:
+            file.write(",")
+            for j in probabilities[i]:
+                file.write(f",{j}")
+
+        if pred_times is not None:
+            file.write(f",,{pred_times[i]}")
+            if pred_descriptions is not None:
+                file.write(f",,{pred_descriptions[i]}")
+        file.write("\n")
+
+
+def _generate_task_results(task, n_cases, n_classes=3, random_state=0):
+    """Generate results for a task and a function writing them to a directory."""
+    rng = np.random.RandomState(random_state)
+    columns = {}
+
+    if task in ("classification", "clustering"):
+        labels = rng.randint(0, n_classes, n_cases).astype(float)
+        predictions = rng.randint(0, n_classes, n_cases)
+        probabilities = rng.dirichlet(np.ones(n_classes), n_cases)
+        probabilities[::5] = np.round(probabilities[::5], 1)
+        columns["probabilities"] = probabilities
+        if task == "classification":
+            writer = write_classification_results
+        else:
+            labels[::7] = np.nan
+            writer = write_clustering_results
+
+        def write(file_path):
+            writer(predictions, probabilities, labels, "Test", "Test", file_path)
+
+    elif task == "regression":
+        labels = rng.normal(size=n_cases) * 10.0 ** rng.randint(-8, 20, n_cases)
+        predictions = rng.normal(size=n_cases).astype(np.float32)
+
+        def write(file_path):
+            write_regression_results(predictions, labels, "Test", "Test", file_path)
+
+    else:
+        labels = list(rng.normal(size=n_cases))
+        predictions = rng.normal(size=n_cases)
+        columns["pred_times"] = rng.randint(0, 10**9, n_cases)
+        columns["pred_descriptions"] = [f"Origin: {i}." for i in range(n_cases)]
+
+        def write(file_path):
+            write_forecasting_results(
+                predictions, labels, "Test", "Test", file_path, **columns
+            )
+
+    return write, labels, predictions, columns
+
+
+@pytest.mark.parametrize("task", RESULTS_TASKS)
+@pytest.mark.parametrize("n_cases, chunk_size", [(50, 7), (20000, None)])
+def test_results_lines_identical(task, n_cases, chunk_size, monkeypatch):
+    """Test results lines are byte-identical to writing each value separately."""
+    if chunk_size is not None:
+        monkeypatch.setattr(results_writing, "_WRITE_CHUNK_SIZE", chunk_size)
+    write, labels, predictions, columns = _generate_task_results(
+        task, n_cases, n_classes=10
+    )
+    file_path = f"{_TEST_OUTPUT_PATH}/results_writing/{task}{n_cases}/"
+    write(file_path)
+
+    with open(f"{file_path}/by_value.csv", "w") as f:
+        _write_results_lines_by_value(f, labels, predictions, **columns)
+
+    with open(f"{file_path}/results.csv", "rb") as f:
+        lines = f.read().split(b"\n", 3)[3]
+    with open(f"{file_path}/by_value.csv", "rb") as f:
+        expected = f.read()
+
+    assert lines == expected
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("task", RESULTS_TASKS)
+def test_results_writing_benchmark(task):
+    """Benchmark the results writers against writing each value separately.
+
+    Fails if writing a results file takes more than WRITE_TIME_RATIO times the time
+    to write its lines one value at a time. Only run with pytest --benchmarks.
+    """
+    write, labels, predictions, columns = _generate_task_results(
+        task, 20000, n_classes=10
+    )
+    file_path = f"{_TEST_OUTPUT_PATH}/results_writing_benchmark/{task}/"
+    os.makedirs(file_path, exist_ok=True)
+
+    write_times = []
+    by_value_times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        write(file_path)
+        write_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with open(f"{file_path}/by_value.csv", "w") as f:
+            _write_results_lines_by_value(f, labels, predictions, **columns)
+        by_value_times.append(time.perf_counter() - start)
+
+    assert min(write_times) <= min(by_value_times) * WRITE_TIME_RATIO, (
+        f"Writing {task} results took {min(write_times):.3f}s, more than "
+        f"{WRITE_TIME_RATIO} times the {min(by_value_times):.3f}s to write each "
+        "value separately."
+    )
@@ -0,0 +1,124 @@
+"""Tests for the experiment telemetry."""
+
+import json
+import os
+import threading
+import time
+
+from tsml.datasets import load_minimal_chinatown
+from tsml.dummy import DummyClassifier
+
+from tsml_eval.experiments import run_classification_experiment
+from tsml_eval.testing.testing_utils import _TEST_OUTPUT_PATH
+from tsml_eval.utils.telemetry import (
+    ExperimentTelemetry,
+    set_phase_listener,
+    telemetry_file_path,
+)
+
+
+def test_experiment_telemetry():
+    """Test recording phases and copying the telemetry."""
+    telemetry = ExperimentTelemetry()
+    with telemetry.phase("data_loading"):
+        sum(range(10000))
+    with telemetry.phase("data_transform", detail="Normalizer"):
+        pass
+
+    copy = telemetry.copy()
+    with copy.phase("fit"):
+        pass
+
+    assert [p["phase"] for p in telemetry.phases] == ["data_loading", "data_transform"]
+    assert [p["phase"] for p in copy.phases] == [
+        "data_loading",
+        "data_transform",
+        "fit",
+    ]
+    assert telemetry.phases[1]["detail"] == "Normalizer"
+    for p in copy.phases:
+        assert p["wall_time"] >= 0 and p["cpu_time"] >= 0
+        assert p["peak_rss"] > 0 and p["peak_rss_increase"] >= 0
+
+    d = copy.to_dict(dataset_name="Test")
+    assert d["dataset_name"] == "Test"
+    assert d["total_wall_time"] == sum(p["wall_time"] for p in copy.phases)
+
+
+def test_experiment_telemetry_file():
+    """Test a telemetry file is written alongside the experiment results."""
+    X_train, y_train = load_minimal_chinatown(split="train")
+    X_test, y_test = load_minimal_chinatown(split="test")
+    results_path = f"{_TEST_OUTPUT_PATH}/telemetry/"
+
+    run_classification_experiment(
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        DummyClassifier(),
+        results_path,
+        classifier_name="TelemetryDummy",
+        dataset_name="MinimalChinatown",
+        resample_id=0,
+        build_train_file=True,
+        benchmark_time=False,
+    )
+
+    file_path = telemetry_file_path(
+        results_path, "TelemetryDummy", "MinimalChinatown", 0
+    )
+    assert os.path.exists(file_path)
+
+    with open(file_path) as f:
+        telemetry = json.load(f)
+
+    assert telemetry["estimator_name"] == "TelemetryDummy"
+    phases = {p["phase"] for p in telemetry["phases"]}
+    for phase in [
+        "label_encoding",
+        "train_estimate",
+        "fit",
+        "predict",
+        "metrics",
+        "results_writing",
+    ]:
+        assert phase in phases
+
+
+def test_phase_listener_threads():
+    """Test phase events from concurrent threads are not interleaved."""
+    events = []
+    active = []
+
+    def listener(event, name, detail):
+        active.append(name)
+        assert len(active) == 1
+        time.sleep(0.001)
+        events.append((event, name))
+        active.pop()
+
+    def run_phases(name):
+        telemetry = ExperimentTelemetry()
+        for _ in range(20):
+            with telemetry.phase(name):
+                pass
+
+    set_phase_listener(listener)
+    try:
+        threads = [
+            threading.Thread(target=run_phases, args=(f"phase{i}",)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        # changing the listener while phases are running is safe
+        set_phase_listener(listener)
+        for thread in threads:
+            thread.join()
+    finally:
+        set_phase_listener(None)
+
+    assert len(events) == 160
+    for i in range(4):
+        assert events.count(("start", f"phase{i}")) == 20
+        assert events.count(("end", f"phase{i}")) == 20
@@ -0,0 +1,115 @@
+"""Tests for the experiment watchdog and timeout markers."""
+
+import os
+import threading
+import time
+
+import pytest
+from tsml.dummy import DummyClassifier
+
+from tsml_eval.evaluation import evaluate_classifiers_by_problem
+from tsml_eval.evaluation.storage import load_classifier_results
+from tsml_eval.experiments import load_and_run_classification_experiment
+from tsml_eval.testing.testing_utils import _TEST_DATA_PATH, _TEST_OUTPUT_PATH
+from tsml_eval.utils.experiments import _results_present
+from tsml_eval.utils.telemetry import ExperimentTelemetry
+from tsml_eval.utils.watchdog import (
+    ExperimentTimeoutError,
+    read_timeout_marker,
+    run_with_watchdog,
+    timeout_marker_path,
+)
+
+
+class SlowClassifier(DummyClassifier):
+    """Dummy classifier which takes a long time to fit."""
+
+    def fit(self, X, y):
+        """Sleep then fit the dummy classifier."""
+        time.sleep(60)
+        return super().fit(X, y)
+
+
+def _interleaved_phases():
+    """Run a slow phase which starts after and outlasts a phase in another thread."""
+    quick_started = threading.Event()
+    slow_started = threading.Event()
+
+    def quick():
+        with ExperimentTelemetry().phase("quick"):
+            quick_started.set()
+            slow_started.wait()
+
+    def slow():
+        quick_started.wait()
+        with ExperimentTelemetry().phase("slow"):
+            slow_started.set()
+            time.sleep(10)
+
+    threads = [threading.Thread(target=quick), threading.Thread(target=slow)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_run_with_watchdog():
+    """Test completed and failed functions run under the watchdog."""
+    assert run_with_watchdog(time.sleep, args=(0,), phase_budget=1) is None
+
+    with pytest.raises(RuntimeError, match="ValueError"):
+        run_with_watchdog(int, args=("a",))
+
+
+def test_phase_budget_threads():
+    """Test phases ending out of order in different threads keep their budgets."""
+    timeout = run_with_watchdog(_interleaved_phases, phase_budget={"slow": 1})
+    assert timeout is not None
+    assert timeout["phase"] == "slow" and timeout["elapsed"] < 10
+
+
+def test_phase_budget_timeout():
+    """Test a timed out experiment writes markers which are treated as results."""
+    results_path = f"{_TEST_OUTPUT_PATH}/watchdog/"
+    file_path = f"{results_path}/Slow/Predictions/MinimalChinatown/testResample0.csv"
+
+    start = time.perf_counter()
+    with pytest.warns(UserWarning, match="exceeded the 2s budget of its fit phase"):
+        load_and_run_classification_experiment(
+            _TEST_DATA_PATH,
+            results_path,
+            "MinimalChinatown",
+            SlowClassifier(),
+            classifier_name="Slow",
+            overwrite=True,
+            phase_budget={"fit": 2},
+        )
+    assert time.perf_counter() - start < 60
+
+    timeout = read_timeout_marker(file_path)
+    assert timeout["phase"] == "fit" and timeout["elapsed"] >= 2
+    assert not os.path.exists(file_path)
+    assert _results_present(results_path, "Slow", "MinimalChinatown", resample_id=0)
+
+    with pytest.raises(ExperimentTimeoutError, match="timed out"):
+        load_classifier_results(file_path)
+    with pytest.raises(ExperimentTimeoutError, match="test resample 0 timed out"):
+        evaluate_classifiers_by_problem(
+            results_path,
+            ["Slow"],
+            ["MinimalChinatown"],
+            f"{_TEST_OUTPUT_PATH}/eval/watchdog/",
+            resamples=1,
+        )
+
+    # writing the results replaces the marker
+    load_and_run_classification_experiment(
+        _TEST_DATA_PATH,
+        results_path,
+        "MinimalChinatown",
+        DummyClassifier(),
+        classifier_name="Slow",
+        overwrite=True,
+    )
+    assert os.path.exists(file_path)
+    assert not os.path.exists(timeout_marker_path(file_path))
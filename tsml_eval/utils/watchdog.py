@@ -0,0 +1,236 @@
+"""Wall-clock budgets for experiment phases and timeout marker files."""
+
+__maintainer__ = ["MatthewMiddlehurst"]
+__all__ = [
+    "ExperimentTimeoutError",
+    "run_with_watchdog",
+    "timeout_marker_path",
+    "write_timeout_marker",
+    "read_timeout_marker",
+]
+
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+
+from tsml_eval.utils import telemetry
+
+
+class ExperimentTimeoutError(FileNotFoundError):
+    """Results file is missing because the experiment exceeded its time budget.
+
+    A subclass of FileNotFoundError, so code which skips missing results also skips
+    timed out ones.
+    """
+
+
+def timeout_marker_path(file_path):
+    """Return the path of the timeout marker for a results file.
+
+    The marker replaces the ".csv" extension of the results file with ".timeout",
+    i.e. testResample0.timeout for testResample0.csv.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the results file.
+
+    Returns
+    -------
+    marker_path : str
+        The path of the timeout marker file.
+
+    Examples
+    --------
+    >>> from tsml_eval.utils.watchdog import timeout_marker_path
+    >>> timeout_marker_path("results/ROCKET/Predictions/Chinatown/testResample0.csv")
+    'results/ROCKET/Predictions/Chinatown/testResample0.timeout'
+    """
+    return f"{os.path.splitext(file_path)[0]}.timeout"
+
+
+def write_timeout_marker(file_path, timeout):
+    """Write a timeout marker in place of a results file which was not written.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the results file the experiment would have written. Any required
+        directories will be created.
+    timeout : dict
+        Information on the timeout returned by run_with_watchdog, written to the
+        marker as JSON alongside the host name and the time of writing.
+    """
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(timeout_marker_path(file_path), "w") as f:
+        json.dump(
+            {**timeout, "host": socket.gethostname(), "time": time.time()},
+            f,
+            indent=2,
+        )
+
+
+def read_timeout_marker(file_path):
+    """Read the timeout marker for a results file.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the results file.
+
+    Returns
+    -------
+    timeout : dict or None
+        The contents of the timeout marker, or None if the results file exists or
+        there is no marker.
+    """
+    marker_path = timeout_marker_path(file_path)
+    if os.path.exists(file_path) or not os.path.exists(marker_path):
+        return None
+
+    with open(marker_path) as f:
+        return json.load(f)
+
+
+def _check_timeout_marker(file_path):
+    """Raise an ExperimentTimeoutError if a results file timed out."""
+    timeout = read_timeout_marker(file_path)
+    if timeout is not None:
+        raise ExperimentTimeoutError(
+            f"Results for {file_path} timed out, the {timeout['phase']} phase "
+            f"exceeded its {timeout['budget']}s budget."
+        )
+
+
+def run_with_watchdog(function, args=(), kwargs=None, phase_budget=None):
+    """Run a function in a child process and kill it if a phase exceeds its budget.
+
+    Phases are the ExperimentTelemetry phases recorded while the function runs, i.e.
+    "fit" and "predict". The child process reports the start and end of each phase,
+    and is killed as soon as a phase has run for longer than its budget. Phases
+    can be nested or run at the same time in different threads, in which case the
+    budget of each open phase is enforced.
+
+    Parameters
+    ----------
+    function : callable
+        The function to run. The function and its arguments must be picklable, i.e.
+        a module level function such as load_and_run_classification_experiment.
+    args : tuple, default=()
+        Positional arguments for function.
+    kwargs : dict or None, default=None
+        Keyword arguments for function.
+    phase_budget : float, dict or None, default=None
+        The wall-clock budget of a phase in seconds. A float applies to every phase,
+        a dict maps phase names to budgets and phases not in the dict have no budget.
+        If None, no phases have a budget and the function is only run in a child
+        process.
+
+    Returns
+    -------
+    timeout : dict or None
+        None if the function completed. If a phase exceeded its budget, a dict with
+        "phase", "detail", "budget" and "elapsed" keys, where "elapsed" is the time in
+        seconds the phase ran for before the child process was killed.
+
+    Raises
+    ------
+    RuntimeError
+        If the function raised an exception or the child process exited without
+        completing it. The traceback of the child process is included in the
+        message.
+    """
+    from tsml_eval.utils.experiments import _start_method
+
+    context = multiprocessing.get_context(_start_method())
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_supervised_process,
+        args=(sender, function, args, {} if kwargs is None else kwargs),
+    )
+    process.start()
+    sender.close()
+
+    # open phases as (thread id, name, detail, budget, start time)
+    phases = []
+    try:
+        while True:
+            deadlines = [
+                start + budget
+                for _, _, _, budget, start in phases
+                if budget is not None
+            ]
+            wait = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+            if receiver.poll(wait):
+                try:
+                    event, name, detail, thread = receiver.recv()
+                except EOFError:
+                    process.join()
+                    raise RuntimeError(
+                        f"Watchdog child process exited with code {process.exitcode} "
+                        "before completing."
+                    ) from None
+
+                if event == "start":
+                    phases.append(
+                        (
+                            thread,
+                            name,
+                            detail,
+                            _budget(phase_budget, name),
+                            time.monotonic(),
+                        )
+                    )
+                elif event == "end":
+                    # phases in different threads can end in any order
+                    for i in range(len(phases) - 1, -1, -1):
+                        if phases[i][:3] == (thread, name, detail):
+                            del phases[i]
+                            break
+                elif event == "error":
+                    raise RuntimeError(f"Watchdog child process failed:\n{name}")
+                else:
+                    process.join()
+                    return None
+            else:
+                now = time.monotonic()
+                for _, name, detail, budget, start in phases:
+                    if budget is not None and now - start >= budget:
+                        return {
+                            "phase": name,
+                            "detail": detail,
+                            "budget": budget,
+                            "elapsed": now - start,
+                        }
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+
+def _budget(phase_budget, name):
+    if isinstance(phase_budget, dict):
+        return phase_budget.get(name, None)
+    return phase_budget
+
+
+def _supervised_process(sender, function, args, kwargs):
+    telemetry.set_phase_listener(
+        lambda event, name, detail: sender.send(
+            (event, name, detail, threading.get_ident())
+        )
+    )
+    try:
+        function(*args, **kwargs)
+    except Exception:
+        sender.send(("error", traceback.format_exc(), None, None))
+    else:
+        sender.send(("done", None, None, None))
+    finally:
+        sender.close()